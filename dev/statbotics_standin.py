@@ -0,0 +1,153 @@
+# bbe/dev/statbotics_standin.py
+"""
+Local stand-in for the Statbotics v3 endpoints Matchpoint calls, for tests
+and offline development.
+
+    python dev/statbotics_standin.py --port 8090 [--fixture team_events.json] [--latency 0.05]
+    STATBOTICS_BASE_URL=http://localhost:8090/v3 python -m matchpoint.server
+
+Serves
+    /v3/team_events?event=<key>&limit=<n>&offset=<n>   (paged, like the real API)
+    /v3/team_event/<team>/<event>
+
+from a fixture (a JSON list of team_event records) or, for events the
+fixture does not have, from deterministic synthetic records. Responses
+carry an ETag and answer If-None-Match with 304. Every request is counted
+per path at /stats.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+MAX_LIMIT = 1000
+
+
+def synthetic_team_events(event_key: str, n_teams: int = 60) -> list:
+    """`n_teams` team_event records for an event, the same on every call."""
+    rng = random.Random(event_key)
+    records = []
+    for team in sorted(rng.sample(range(1, 10000), n_teams)):
+        auto, teleop, endgame = rng.uniform(5, 25), rng.uniform(10, 50), rng.uniform(0, 15)
+        records.append({
+            "team": team,
+            "event": event_key,
+            "epa": {
+                "norm": round(rng.uniform(1400, 2000), 1),
+                "breakdown": {
+                    "total_points": round(auto + teleop + endgame, 2),
+                    "auto_points": round(auto, 2),
+                    "teleop_points": round(teleop, 2),
+                    "endgame_points": round(endgame, 2),
+                },
+                "ranks": {"total": {"rank": rng.randint(1, 3500)}},
+            },
+            "record": {"winrate": round(rng.random(), 4)},
+        })
+    return records
+
+
+class StandinState:
+    def __init__(self, fixture: list, n_teams: int, latency: float):
+        self.events = defaultdict(list)
+        for record in fixture:
+            self.events[record["event"]].append(record)
+        self.n_teams = n_teams
+        self.latency = latency
+        self.requests = Counter()
+        self.lock = threading.Lock()
+
+    def team_events(self, event_key: str) -> list:
+        with self.lock:
+            if event_key not in self.events:
+                self.events[event_key] = synthetic_team_events(event_key, self.n_teams)
+            return self.events[event_key]
+
+
+def make_handler(state: StandinState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, payload) -> None:
+            body = json.dumps(payload).encode()
+            etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+            if status == 200 and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if status == 200:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            parts = [part for part in url.path.split("/") if part]
+            with state.lock:
+                state.requests[url.path] += 1
+            if state.latency:
+                time.sleep(state.latency)
+
+            if parts == ["stats"]:
+                with state.lock:
+                    return self._send_json(200, dict(state.requests))
+            if parts[:1] != ["v3"]:
+                return self._send_json(404, {"detail": "Not Found"})
+
+            if parts[1:] == ["team_events"]:
+                query = parse_qs(url.query)
+                event_key = query.get("event", [""])[0]
+                limit = min(int(query.get("limit", [MAX_LIMIT])[0]), MAX_LIMIT)
+                offset = int(query.get("offset", [0])[0])
+                return self._send_json(200, state.team_events(event_key)[offset:offset + limit])
+
+            if len(parts) == 4 and parts[1] == "team_event":
+                team, event_key = parts[2], parts[3]
+                for record in state.team_events(event_key):
+                    if str(record["team"]) == team:
+                        return self._send_json(200, record)
+                return self._send_json(404, {"detail": "Team Event not found"})
+
+            return self._send_json(404, {"detail": "Not Found"})
+
+    return Handler
+
+
+def serve(port: int = 8090, fixture: list = (), n_teams: int = 60, latency: float = 0.0) -> ThreadingHTTPServer:
+    """Starts the stand-in on a background thread and returns the server (port 0 picks a free one)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(StandinState(list(fixture), n_teams, latency)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--fixture", help="JSON list of team_event records")
+    parser.add_argument("--teams", type=int, default=60, help="Teams per synthetic event")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    args = parser.parse_args()
+
+    fixture = []
+    if args.fixture:
+        with open(args.fixture) as f:
+            fixture = json.load(f)
+    server = serve(args.port, fixture, args.teams, args.latency)
+    print(f"Statbotics stand-in on http://127.0.0.1:{server.server_address[1]}/v3")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
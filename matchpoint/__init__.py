@@ -1,7 +1,12 @@
-# Package level imports
-from .third_parties.fetcher import Fetcher
-from .services import MatchpointPredictor
-from . import server
+# Package level exports, imported on first access so that importing the
+# package (or any submodule) does not load gRPC, the services or the models
+from ._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Fetcher': '.third_parties.fetcher',
+    'MatchpointPredictor': '.services.mp_prediction',
+    'server': '.server',
+})
 
 # Define what should be available when someone does 'from matchpoint import *'
 __all__ = [
@@ -12,4 +17,4 @@ __all__ = [
 
 # You can also add package metadata
 __version__ = '0.1.0'
-__author__ = 'Armando Mac Beath'
\ No newline at end of file
+__author__ = 'Armando Mac Beath'
@@ -0,0 +1,28 @@
+# bbe/matchpoint/_lazy.py
+import importlib
+from typing import Callable, Dict, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Module-level __getattr__/__dir__ (PEP 562) that import a package's public
+    names on first access instead of at package import.
+
+    Args:
+        package (str): The package's __name__.
+        exports (Dict[str, str]): Public name -> relative module defining it.
+                                  A name equal to its module's last component
+                                  exports the submodule itself.
+    """
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(exports[name], package)
+        if exports[name].rsplit(".", 1)[-1] == name:
+            return module
+        return getattr(module, name)
+
+    def __dir__():
+        return sorted(exports)
+
+    return __getattr__, __dir__
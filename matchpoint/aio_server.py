@@ -0,0 +1,228 @@
+# bbe/matchpoint/aio_server.py
+import asyncio
+import functools
+import signal
+from concurrent import futures
+from typing import Callable, Optional
+import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+from .generated import prediction_pb2
+from .generated import prediction_pb2_grpc
+from .server import PredictorServicer, SERVICE_NAME, _warm_up
+from .services.mp_prediction import MatchpointPredictor
+from .third_parties.async_clients import AsyncFetcher
+from .config import SERVER_PORT, SERVER_THREADS, SERVER_GRACE_PERIOD
+
+_DONE = object()
+
+
+class _ThreadContext:
+    """
+    The subset of grpc.ServicerContext the synchronous handlers use, for
+    running them on a worker thread on behalf of a grpc.aio call. The status
+    they set is applied to the aio context back on the event loop.
+    """
+
+    def __init__(self, context: grpc.aio.ServicerContext):
+        self._context = context
+        self.code: Optional[grpc.StatusCode] = None
+        self.details: Optional[str] = None
+
+    def set_code(self, code: grpc.StatusCode) -> None:
+        self.code = code
+
+    def set_details(self, details: str) -> None:
+        self.details = details
+
+    def is_active(self) -> bool:
+        return not self._context.done()
+
+    def time_remaining(self) -> Optional[float]:
+        return self._context.time_remaining()
+
+    def apply(self) -> None:
+        if self.code is not None:
+            self._context.set_code(self.code)
+        if self.details is not None:
+            self._context.set_details(self.details)
+
+
+class AsyncPredictorServicer(prediction_pb2_grpc.MatchpointServicer):
+    """
+    grpc.aio implementation of the Matchpoint service.
+
+    Requests wait on upstream data as coroutines: TBA and Statbotics are
+    queried through AsyncFetcher's bounded aiohttp sessions, so a slow
+    upstream holds no threads. CPU-bound work (inference, SHAP, simulations)
+    runs on `executor`. Single-match inference goes through the shared
+    InferenceBatcher, awaited without blocking the loop. The simulation RPCs
+    load the event's snapshot on the loop first and then run
+    PredictorServicer's handlers on the executor; those read the snapshot
+    from the shared event_snapshots cache and the Statbotics stats from the
+    local dataset, so they do not wait on the network either.
+    """
+
+    def __init__(self, executor: futures.Executor):
+        self.executor = executor
+        self.servicer = PredictorServicer()
+        self.fetcher = AsyncFetcher(executor)
+
+    async def _offload(self, fn: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def _offload_handler(self, handler: Callable, request, context):
+        """Runs a synchronous unary handler on the executor."""
+        thread_context = _ThreadContext(context)
+        try:
+            return await self._offload(handler, request, thread_context)
+        finally:
+            thread_context.apply()
+
+    async def _load_event(self, event_key: str, context) -> bool:
+        """
+        Loads an event's snapshot into the shared cache before a synchronous
+        handler asks Fetcher.events for it, so the executor thread is not
+        blocked on TBA. Returns False (with the status set) on failure.
+        """
+        try:
+            await self.fetcher.events.get(event_key)
+            return True
+        except Exception as e:
+            print(f"FATAL ERROR loading event {event_key}: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("An internal server error occurred while loading the event.")
+            return False
+
+    async def GetMatchPrediction(self, request, context):
+        """See PredictorServicer.GetMatchPrediction."""
+        match_key = str(request.match_key)
+        print(f"Received gRPC request for match: {match_key}")
+
+        try:
+            features = await self.fetcher.get_match_feature_vector(match_key)
+            if features is None:
+                raise ValueError(f"Could not fetch features for match {match_key}")
+
+            batcher = MatchpointPredictor.batcher
+            if batcher.enabled:
+                batched = await asyncio.wrap_future(batcher.submit(features, shap=True))
+            else:
+                # Unbatched submits predict on the calling thread
+                batched = await self._offload(batcher.predict, features, True)
+            prediction_object = MatchpointPredictor.prediction_from_batched(match_key, batched)
+            return self.servicer._prediction_proto(prediction_object)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return prediction_pb2.MatchPredictionResponse()
+        except Exception as e:
+            print(f"FATAL ERROR processing {match_key}: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("An internal server error occurred.")
+            return prediction_pb2.MatchPredictionResponse()
+
+    async def PredictAllEventMatches(self, request, context):
+        """See PredictorServicer.PredictAllEventMatches."""
+        event_key = request.event_key
+        print(f"Received gRPC batch prediction request for event: {event_key}")
+
+        try:
+            # Loads the event's snapshot; the matches below come from the same one
+            all_team_features = await self.fetcher.get_all_team_features_for_event(event_key)
+            if not all_team_features:
+                print("Could not fetch team features, aborting prediction.")
+                return prediction_pb2.EventPredictionResponse()
+            event = await self.fetcher.events.get(event_key)
+            all_matches, event_week = list(event.matches), event.week
+
+            prediction_list = await self._offload(
+                functools.partial(
+                    self.servicer.predictor.predict_event_matches,
+                    all_team_features,
+                    all_matches,
+                    event_week,
+                    include_shap=request.include_shap,
+                )
+            )
+            return self.servicer._event_prediction_response(prediction_list)
+        except Exception as e:
+            print(f"FATAL ERROR during batch processing for {event_key}: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("An internal server error occurred during batch prediction.")
+            return prediction_pb2.EventPredictionResponse()
+
+    async def SimulatePlayoffs(self, request, context):
+        """See PredictorServicer.SimulatePlayoffs."""
+        if not await self._load_event(request.event_key, context):
+            return prediction_pb2.SimulationResult()
+        return await self._offload_handler(self.servicer.SimulatePlayoffs, request, context)
+
+    async def SimulateQualifications(self, request, context):
+        """See PredictorServicer.SimulateQualifications."""
+        if not await self._load_event(request.event_key, context):
+            return prediction_pb2.QualificationSimulationResult()
+        return await self._offload_handler(self.servicer.SimulateQualifications, request, context)
+
+    async def OptimizeAlliancePick(self, request, context):
+        """See PredictorServicer.OptimizeAlliancePick."""
+        if not await self._load_event(request.event_key, context):
+            return prediction_pb2.AllianceSelectionResult()
+        return await self._offload_handler(self.servicer.OptimizeAlliancePick, request, context)
+
+    async def StreamSimulatePlayoffs(self, request, context):
+        """
+        See PredictorServicer.StreamSimulatePlayoffs. Each snapshot is
+        computed on the executor and written from the loop.
+        """
+        if not await self._load_event(request.event_key, context):
+            return
+        thread_context = _ThreadContext(context)
+        # A cancelled call stops the generator through is_active()
+        snapshots = self.servicer.StreamSimulatePlayoffs(request, thread_context)
+        try:
+            while True:
+                snapshot = await self._offload(next, snapshots, _DONE)
+                if snapshot is _DONE:
+                    break
+                yield snapshot
+        finally:
+            thread_context.apply()
+
+    async def close(self) -> None:
+        await self.fetcher.close()
+
+
+async def serve_async(reuse_port: bool, on_ready: Callable[[dict], None]) -> None:
+    """
+    Runs the grpc.aio server until SIGTERM/SIGINT.
+
+    Health reports NOT_SERVING while the models warm up (on the executor, so
+    health checks are answered meanwhile), then SERVING.
+
+    Args:
+        reuse_port (bool): Whether to bind the port with SO_REUSEPORT (pre-forked workers).
+        on_ready (Callable[[dict], None]): Called with the startup timings once serving.
+    """
+    executor = futures.ThreadPoolExecutor(max_workers=SERVER_THREADS, thread_name_prefix="matchpoint-cpu")
+    server = grpc.aio.server(options=[("grpc.so_reuseport", 1 if reuse_port else 0)])
+    servicer = AsyncPredictorServicer(executor)
+    prediction_pb2_grpc.add_MatchpointServicer_to_server(servicer, server)
+    health_servicer = health.aio.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    for service in ("", SERVICE_NAME):
+        await health_servicer.set(service, health_pb2.HealthCheckResponse.NOT_SERVING)
+    server.add_insecure_port(f"[::]:{SERVER_PORT}")
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, lambda: loop.create_task(server.stop(SERVER_GRACE_PERIOD)))
+
+    await server.start()
+    timings = await loop.run_in_executor(executor, _warm_up)
+    for service in ("", SERVICE_NAME):
+        await health_servicer.set(service, health_pb2.HealthCheckResponse.SERVING)
+    on_ready(timings)
+
+    await server.wait_for_termination()
+    await servicer.close()
+    executor.shutdown(wait=False)
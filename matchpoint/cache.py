@@ -0,0 +1,342 @@
+# bbe/matchpoint/cache.py
+import asyncio
+import dataclasses
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, NamedTuple, Optional
+from .config import CACHE_REFRESH_WORKERS
+from .singleflight import SingleFlight
+
+
+def stable_hash(*parts: Any) -> str:
+    """
+    Hashes JSON-like data (dicts, lists, numbers, strings) into a short hex digest.
+
+    Dict keys are sorted, so the digest only depends on the content. Values
+    json cannot encode (e.g. NumPy scalars) are hashed by their str().
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate memory held by `value` in bytes: JSON-like containers,
+    dataclasses and objects are walked, NumPy arrays count their buffer.
+    Objects reachable more than once are counted once.
+    """
+    size, seen, stack = 0, set(), [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        nbytes = getattr(obj, "nbytes", None)
+        if isinstance(nbytes, int):
+            size += nbytes
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            stack.extend(getattr(obj, field.name) for field in dataclasses.fields(obj))
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(vars(obj))
+    return size
+
+
+class _Entry(NamedTuple):
+    expires_at: Optional[float]  # time.monotonic() after which the entry is stale; None = never
+    dead_at: Optional[float]  # ... and after which it is dropped
+    size: int
+    value: Any
+
+
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _refresher() -> ThreadPoolExecutor:
+    """The threads running background refreshes, created on first use (after a pre-fork)."""
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=CACHE_REFRESH_WORKERS, thread_name_prefix="cache-refresh"
+            )
+        return _refresh_executor
+
+
+class TTLCache:
+    """
+    A thread-safe LRU cache whose entries also expire after `ttl` seconds.
+
+    Least recently used entries are evicted once `maxsize` is reached, or
+    once the values (by estimate_size) exceed `max_bytes`. ttl=None disables
+    expiry.
+
+    get only returns fresh entries. get_or_load also serves an entry for
+    `stale_ttl` seconds past its TTL, while a background thread (or task,
+    for get_or_load_async) reloads it: requests never wait on the refresh of
+    an entry they can still be served (stale-while-revalidate). Misses are
+    loaded by the caller, once for all concurrent callers (see SingleFlight).
+    """
+
+    _MISSING = object()
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+        stale_ttl: float = 0.0,
+        max_bytes: Optional[int] = None,
+        name: Optional[str] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.name = name
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        # Bumped by invalidations, so loads started before one are not stored
+        self._generation = 0
+        self._refreshing: set = set()
+        self._tasks: set = set()
+        self.flights = SingleFlight(f"cache_{name}" if name else "cache")
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refresh_errors = 0
+
+    def _lookup(self, key: Hashable, now: float) -> Optional[_Entry]:
+        """The entry of `key` unless it is dead (dropped then). Caller holds the lock."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry.dead_at is not None and entry.dead_at <= now:
+            self._drop(key)
+            return None
+        return entry
+
+    def _drop(self, key: Hashable) -> None:
+        self._bytes -= self._data.pop(key).size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value for `key`, or `default` if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is not None and (entry.expires_at is None or entry.expires_at > now):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores `value`, evicting the least recently used entries if full."""
+        size = self._size(value)
+        with self._lock:
+            self._store(key, value, size)
+
+    def _size(self, value: Any) -> int:
+        return estimate_size(value) if self.max_bytes is not None else 0
+
+    def _store(self, key: Hashable, value: Any, size: int) -> None:
+        """set, with the lock held."""
+        now = time.monotonic()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        dead_at = expires_at + self.stale_ttl if expires_at is not None else None
+        if key in self._data:
+            self._drop(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+        self._data[key] = _Entry(expires_at, dead_at, size, value)
+        self._bytes += size
+        while len(self._data) > self.maxsize or (self.max_bytes is not None and self._bytes > self.max_bytes):
+            self._drop(next(iter(self._data)))
+
+    def _store_if_current(self, key: Hashable, value: Any, generation: int) -> None:
+        """Stores a loaded value unless the cache was invalidated while it loaded."""
+        size = self._size(value)
+        with self._lock:
+            if self._generation == generation:
+                self._store(key, value, size)
+
+    def _probe(self, key: Hashable) -> tuple:
+        """(value or _MISSING, whether it is stale, the current generation), counting the access."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is None:
+                self.misses += 1
+                return self._MISSING, False, self._generation
+            self._data.move_to_end(key)
+            stale = entry.expires_at is not None and entry.expires_at <= now
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            return entry.value, stale, self._generation
+
+    def _start_refresh(self, key: Hashable) -> bool:
+        """Claims the refresh of `key`; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _refresh_failed(self, key: Hashable, error: BaseException) -> None:
+        with self._lock:
+            self.refresh_errors += 1
+        print(f"WARN: Refreshing {self.name or 'cache'} entry {key!r} failed, serving the stale copy: {error}")
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Returns the value of `key`, calling `load()` for it on a miss.
+
+        Stale entries are returned as they are while load() runs on a
+        background thread.
+
+        Raises:
+            Exception: Whatever load() raised, on a miss.
+        """
+        value, stale, generation = self._probe(key)
+        if value is self._MISSING:
+            return self.flights.do(key, self._load, key, load, generation)
+        if stale and self._start_refresh(key):
+            _refresher().submit(self._refresh, key, load, generation)
+        return value
+
+    def _load(self, key: Hashable, load: Callable[[], Any], generation: int) -> Any:
+        """Calls load() and stores its value; run once per flight, not by every waiter."""
+        value = load()
+        self._store_if_current(key, value, generation)
+        return value
+
+    def _refresh(self, key: Hashable, load: Callable[[], Any], generation: int) -> None:
+        try:
+            self.flights.do(key, self._load, key, load, generation)
+        except Exception as e:
+            self._refresh_failed(key, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def get_or_load_async(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        get_or_load for coroutines: misses await load(), stale entries are
+        refreshed by a background task on the running loop.
+        """
+        value, stale, generation = self._probe(key)
+        if value is self._MISSING:
+            return await self.flights.do_async(key, self._load_async, key, load, generation)
+        if stale and self._start_refresh(key):
+            task = asyncio.ensure_future(self._refresh_async(key, load, generation))
+            self._tasks.add(task)  # Referenced until done, or it may be collected mid-flight
+            task.add_done_callback(self._tasks.discard)
+        return value
+
+    async def _load_async(self, key: Hashable, load: Callable[[], Awaitable[Any]], generation: int) -> Any:
+        value = await load()
+        self._store_if_current(key, value, generation)
+        return value
+
+    async def _refresh_async(self, key: Hashable, load: Callable[[], Awaitable[Any]], generation: int) -> None:
+        try:
+            await self.flights.do_async(key, self._load_async, key, load, generation)
+        except Exception as e:
+            self._refresh_failed(key, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drops the entry of `key`. Returns whether there was one."""
+        return self.invalidate_where(lambda k: k == key) > 0
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drops every entry whose key satisfies `predicate`. Returns how many."""
+        with self._lock:
+            self._generation += 1
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                self._drop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters, the current size and the bytes held (if limited)."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refresh_errors": self.refresh_errors,
+                "size": len(self._data),
+                "bytes": self._bytes,
+            }
+
+
+_namespaces: Dict[str, TTLCache] = {}
+_namespaces_lock = threading.Lock()
+
+
+def namespace(
+    name: str,
+    maxsize: int = 128,
+    ttl: Optional[float] = None,
+    stale_ttl: float = 0.0,
+    max_bytes: Optional[int] = None,
+) -> TTLCache:
+    """
+    Returns the process-wide cache `name`, creating it with these settings
+    on first use. Namespaced caches are reached by invalidate_event and stats.
+    """
+    with _namespaces_lock:
+        if name not in _namespaces:
+            _namespaces[name] = TTLCache(maxsize, ttl, stale_ttl, max_bytes, name=name)
+        return _namespaces[name]
+
+
+def _mentions(key: Hashable, event_key: str) -> bool:
+    return key == event_key or (isinstance(key, tuple) and event_key in key)
+
+
+def invalidate_event(event_key: str, namespaces: Optional[Iterable[str]] = None) -> int:
+    """
+    Drops everything cached about an event: the entries whose key is the
+    event key, or a tuple containing it, in every namespace (or only in
+    `namespaces`). Loads in flight when it is called are not stored.
+
+    Returns:
+        int: The number of entries dropped.
+    """
+    with _namespaces_lock:
+        caches = [cache for name, cache in _namespaces.items() if namespaces is None or name in namespaces]
+    return sum(cache.invalidate_where(lambda key: _mentions(key, event_key)) for cache in caches)
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    """TTLCache.stats of every namespace, by name."""
+    with _namespaces_lock:
+        caches = dict(_namespaces)
+    return {name: cache.stats() for name, cache in caches.items()}
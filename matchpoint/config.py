@@ -7,14 +7,86 @@ load_dotenv()
 # API Config
 TBA_API_KEY = os.getenv("TBA_API_KEY")
 TBA_BASE_URL = "https://www.thebluealliance.com/api/v3"
-STATBOTICS_BASE_URL = "https://api.statbotics.io/v3"
+STATBOTICS_BASE_URL = os.getenv("STATBOTICS_BASE_URL", "https://api.statbotics.io/v3")  # Point at dev/statbotics_standin.py to test offline
 TBA_HEADER = {"X-TBA-Auth-Key": TBA_API_KEY}
 
+# Statbotics Config
+STATBOTICS_PAGE_SIZE = 100  # team_events records per bulk API request (a 60-team event is one request)
+STATBOTICS_FALLBACK_WORKERS = 10  # Threads fetching the teams the bulk request did not return, one request per team
+STATBOTICS_EVENT_CACHE_SIZE = 32  # Events whose parsed API stats are kept
+STATBOTICS_EVENT_CACHE_TTL = float(os.getenv("STATBOTICS_EVENT_CACHE_TTL", "300"))  # Seconds before an event's API stats are fetched again
+STATBOTICS_EVENT_STALE_TTL = float(os.getenv("STATBOTICS_EVENT_STALE_TTL", "600"))  # Seconds past the TTL they are still served while refetched in the background
+STATBOTICS_EVENT_CACHE_BYTES = 32 * 2**20  # Memory budget of the kept API stats
+STATBOTICS_DATASET_PATH = os.getenv(
+    "STATBOTICS_DATASET_PATH", os.path.join(os.path.dirname(__file__), "data", "dataset.csv")
+)  # Local Statbotics export; converted to memory-mapped .npy files next to it on first use
+STATBOTICS_DATASET_CHECK_INTERVAL = 5.0  # Seconds between checks of the CSV for changes
+
 # Model Config
 MODEL_PATH = os.path.join(os.getcwd(), "models")
 CLASSIFIER_PATH = os.path.join(MODEL_PATH, "classification.json")
 RED_REGRESSOR_PATH = os.path.join(MODEL_PATH, "red_model.json")
 BLUE_REGRESSOR_PATH = os.path.join(MODEL_PATH, "blue_model.json")
+MODEL_FORMAT = os.getenv("MODEL_FORMAT", "json")  # "json", or "ubj" to load the binary UBJSON twins (faster to parse; python -m matchpoint.models.convert)
+MODEL_BACKEND = os.getenv("MODEL_BACKEND", "xgboost")  # "xgboost", or the compiled tree evaluator: "numpy" / "numba"
+MODEL_COMPILED_MAX_ROWS = 256  # Larger batches go to XGBoost, whose overhead they amortize
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "4096"))  # Feature vectors whose model outputs (and SHAP) are memoized
+SHAP_BACKEND = os.getenv("SHAP_BACKEND", "native")  # "native" (XGBoost pred_contribs) or "shap" (shap.TreeExplainer, imported on first use)
+INFERENCE_BATCH_WINDOW = float(os.getenv("INFERENCE_BATCH_WINDOW", "0.002"))  # Seconds a single-match prediction waits to share a model call; 0 disables batching
+INFERENCE_MAX_BATCH_SIZE = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "64"))  # Queued predictions that close a batch before the window ends
+
+# Server Config
+SERVER_PORT = int(os.getenv("SERVER_PORT", "50051"))
+SERVER_THREADS = 10  # gRPC handler threads per serving process
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))  # Forked serving processes sharing the port (SO_REUSEPORT); 1 = single process
+SERVER_RESTART_BACKOFF = 1.0  # Seconds a worker must have lived to be restarted right away
+SERVER_GRACE_PERIOD = 5.0  # Seconds in-flight RPCs get to finish on shutdown
+SERVER_MODE = os.getenv("SERVER_MODE", "threads")  # "threads" (one handler thread per RPC) or "aio" (grpc.aio event loop, async upstream clients)
+STATS_LOG_INTERVAL = float(os.getenv("STATS_LOG_INTERVAL", "60"))  # Seconds between JSON stats lines (cache, upstream and histogram counters) per serving process; 0 disables them
+UPSTREAM_TIMEOUT = 10.0  # Seconds a TBA/Statbotics request may take
+UPSTREAM_POOL_SIZE = 16  # Keep-alive connections kept per upstream host (sync clients)
+UPSTREAM_CACHE_DIR = os.getenv("UPSTREAM_CACHE_DIR", os.path.join(os.getcwd(), ".cache", "http"))  # ETag/Last-Modified response cache; "" disables it
+UPSTREAM_CACHE_MAX_BYTES = int(os.getenv("UPSTREAM_CACHE_MAX_BYTES", str(256 * 2**20)))  # Disk budget of the response cache; the least recently used files are deleted past it
+UPSTREAM_CACHE_MAX_AGE = float(os.getenv("UPSTREAM_CACHE_MAX_AGE", str(7 * 24 * 3600)))  # Seconds a cached response may go unused before its file is deleted
+TBA_MAX_CONCURRENCY = int(os.getenv("TBA_MAX_CONCURRENCY", "16"))  # TBA requests in flight at once per process (aio mode)
+STATBOTICS_MAX_CONCURRENCY = int(os.getenv("STATBOTICS_MAX_CONCURRENCY", "8"))  # Statbotics requests in flight at once per process (aio mode)
+
+# Cache Config (per namespace, see matchpoint.cache)
+CACHE_REFRESH_WORKERS = 4  # Threads per process reloading stale entries in the background
+EVENT_SNAPSHOT_TTL = float(os.getenv("EVENT_SNAPSHOT_TTL", "60"))  # Seconds an event's TBA snapshot (info, teams, matches, OPRs, alliances, rankings) is served before it is reloaded
+EVENT_SNAPSHOT_STALE_TTL = float(os.getenv("EVENT_SNAPSHOT_STALE_TTL", "600"))  # Seconds past the TTL a snapshot is still served while it is reloaded in the background
+EVENT_SNAPSHOT_CACHE_SIZE = 32  # Events whose snapshots are kept
+EVENT_SNAPSHOT_CACHE_BYTES = 128 * 2**20  # Memory budget of the kept snapshots
+TEAM_FEATURES_TTL = float(os.getenv("TEAM_FEATURES_TTL", "60"))  # Seconds merged team features are reused (they are also rebuilt for every new snapshot version)
+TEAM_FEATURES_STALE_TTL = 600.0  # Seconds past the TTL they are still served while rebuilt in the background
+TEAM_FEATURES_CACHE_SIZE = 64  # Event snapshot versions whose team features are kept
+TEAM_FEATURES_CACHE_BYTES = 32 * 2**20  # Memory budget of the kept team features
+TBA_OPRS_CACHE_SIZE = 64  # Events whose OPRs TBAService keeps (TTL and stale window of the snapshots)
+
+# Simulation Config
+SIMULATION_SHRINK_ALPHA = 0.2  # Pull match probabilities toward 0.5 to soften model overconfidence
+SIMULATION_BATCH_SIZE = 65536  # Max brackets held in memory at once by the vectorized engine
+SIMULATION_WORKERS = int(os.getenv("SIMULATION_WORKERS", "1"))  # Processes used to shard large runs
+SIMULATION_SHARD_MIN_SIMS = 200000  # Below this, sharding costs more than it saves
+SIMULATION_DEFAULT_SIMS = 1000  # Used when a request does not set n_sims
+SIMULATION_MAX_SIMS = 5000000  # Upper bound accepted from a single request
+SIMULATION_SNAPSHOT_INTERVAL = 10000  # Simulations between streamed snapshots
+SIMULATION_CI_Z = 1.96  # z-score of the reported confidence intervals (95%)
+SIMULATION_DEADLINE_MARGIN = 0.25  # Seconds kept in reserve before the gRPC deadline
+SIMULATION_CACHE_SIZE = int(os.getenv("SIMULATION_CACHE_SIZE", "256"))  # Memoized simulation results
+SIMULATION_CACHE_TTL = float(os.getenv("SIMULATION_CACHE_TTL", "300"))  # Seconds a memoized result stays valid
+
+# Qualification Simulation Config
+QUALS_WIN_RP = 3  # Ranking points for a qualification win (2025 rules)
+QUALS_MAX_BONUS_RP = 3  # Bonus ranking points an alliance can earn per match (2025 rules)
+QUALS_DEFAULT_TOP_N = 8  # Cut-off reported as top_n_probability (alliance captains)
+QUALS_BATCH_SIZE = 8192  # Schedules held in memory at once by the qualification engine
+
+# Alliance Selection Config
+SELECTION_DEFAULT_ALLIANCES = 8  # Alliances assumed when a request does not name a bracket
+SELECTION_MAX_BEAM_WIDTH = 8  # Upper bound on the beam accepted from a single request
+SELECTION_MATCHUP_CACHE_SIZE = 16  # Events whose pairing probabilities are kept between requests
+SELECTION_MATCHUP_PAIRINGS = 16384  # Pairing probabilities kept per event (least recently used dropped first)
 
 
 FEATURE_ORDER = [
@@ -0,0 +1,264 @@
+import functools
+from dataclasses import dataclass
+from typing import Dict, Tuple
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Slot:
+    """
+    Where one side of a match comes from.
+
+    kind is "seed" (ref = alliance number), "winner" or "loser"
+    (ref = name of an earlier match).
+    """
+    kind: str
+    ref: object
+
+
+def Seed(alliance_number: int) -> Slot:
+    return Slot("seed", alliance_number)
+
+
+def Winner(match_name: str) -> Slot:
+    return Slot("winner", match_name)
+
+
+def Loser(match_name: str) -> Slot:
+    return Slot("loser", match_name)
+
+
+@dataclass(frozen=True)
+class BracketMatch:
+    """A node of the bracket. best_of > 1 describes a series (first to a majority)."""
+    name: str
+    red: Slot
+    blue: Slot
+    round: int
+    best_of: int = 1
+
+
+@dataclass(frozen=True)
+class BracketFormat:
+    """
+    Declarative description of a playoff bracket.
+
+    Matches must be listed in play order; the winner of the last match is the
+    champion. round_names[i] labels the matches whose round is i.
+    """
+    name: str
+    num_alliances: int
+    round_names: Tuple[str, ...]
+    matches: Tuple[BracketMatch, ...]
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledBracket:
+    """
+    Flat integer plan of a BracketFormat.
+
+    Slot ids 0..num_alliances-1 hold the seeds; match k writes its winner to
+    slot num_alliances + 2k and its loser to num_alliances + 2k + 1. Each step
+    is (red_slot, blue_slot, best_of, draw_offset): the match consumes
+    best_of columns of the draw matrix starting at draw_offset.
+    """
+    name: str
+    num_alliances: int
+    n_slots: int
+    n_draws: int
+    steps: Tuple[Tuple[int, int, int, int], ...]
+    plan: np.ndarray
+    match_rounds: np.ndarray
+    eliminates: np.ndarray
+    round_names: Tuple[str, ...]
+    champion_slot: int
+    finalist_slots: Tuple[int, int]
+
+
+def compile_bracket_format(bracket: BracketFormat) -> CompiledBracket:
+    """
+    Validates a BracketFormat and flattens it into a CompiledBracket.
+
+    Raises:
+        ValueError: If a match references an unknown or later match, an
+                    alliance outside the format, or has an even series length.
+    """
+    num_alliances = bracket.num_alliances
+    match_index: Dict[str, int] = {}
+    steps = []
+    match_rounds = []
+    consumed_losers = set()
+    draw_offset = 0
+
+    def resolve(slot: Slot, match_name: str) -> int:
+        if slot.kind == "seed":
+            if not 1 <= slot.ref <= num_alliances:
+                raise ValueError(f"{bracket.name}/{match_name}: alliance {slot.ref} out of range")
+            return slot.ref - 1
+        if slot.ref not in match_index:
+            raise ValueError(f"{bracket.name}/{match_name}: '{slot.ref}' is not an earlier match")
+        k = match_index[slot.ref]
+        if slot.kind == "winner":
+            return num_alliances + 2 * k
+        if slot.kind == "loser":
+            consumed_losers.add(k)
+            return num_alliances + 2 * k + 1
+        raise ValueError(f"{bracket.name}/{match_name}: unknown slot kind '{slot.kind}'")
+
+    for match in bracket.matches:
+        if match.name in match_index:
+            raise ValueError(f"{bracket.name}: duplicate match name '{match.name}'")
+        if match.best_of < 1 or match.best_of % 2 == 0:
+            raise ValueError(f"{bracket.name}/{match.name}: best_of must be a positive odd number")
+        if not 0 <= match.round < len(bracket.round_names):
+            raise ValueError(f"{bracket.name}/{match.name}: round {match.round} has no name")
+
+        red_slot = resolve(match.red, match.name)
+        blue_slot = resolve(match.blue, match.name)
+        steps.append((red_slot, blue_slot, match.best_of, draw_offset))
+        match_rounds.append(match.round)
+        match_index[match.name] = len(steps) - 1
+        draw_offset += match.best_of
+
+    if not steps:
+        raise ValueError(f"{bracket.name}: a bracket needs at least one match")
+
+    n_matches = len(steps)
+    # A loser nobody plays again is out of the tournament
+    eliminates = np.array([k not in consumed_losers for k in range(n_matches)], dtype=bool)
+    plan = np.array(steps, dtype=np.intp)
+    plan.setflags(write=False)
+    match_rounds = np.array(match_rounds, dtype=np.intp)
+    match_rounds.setflags(write=False)
+    eliminates.setflags(write=False)
+
+    return CompiledBracket(
+        name=bracket.name,
+        num_alliances=num_alliances,
+        n_slots=num_alliances + 2 * n_matches,
+        n_draws=draw_offset,
+        steps=tuple(steps),
+        plan=plan,
+        match_rounds=match_rounds,
+        eliminates=eliminates,
+        round_names=bracket.round_names,
+        champion_slot=num_alliances + 2 * (n_matches - 1),
+        finalist_slots=(steps[-1][0], steps[-1][1]),
+    )
+
+
+# 2023+ FRC double elimination, 8 alliances
+DOUBLE_ELIM_8 = BracketFormat(
+    name="double_elim_8",
+    num_alliances=8,
+    round_names=("Round 1", "Round 2", "Round 3", "Round 4", "Round 5", "Finals"),
+    matches=(
+        BracketMatch("M1", Seed(1), Seed(8), round=0),
+        BracketMatch("M2", Seed(4), Seed(5), round=0),
+        BracketMatch("M3", Seed(3), Seed(6), round=0),
+        BracketMatch("M4", Seed(2), Seed(7), round=0),
+        BracketMatch("M5", Loser("M1"), Loser("M2"), round=1),
+        BracketMatch("M6", Loser("M3"), Loser("M4"), round=1),
+        BracketMatch("M7", Winner("M1"), Winner("M2"), round=1),
+        BracketMatch("M8", Winner("M3"), Winner("M4"), round=1),
+        BracketMatch("M9", Loser("M7"), Winner("M6"), round=2),
+        BracketMatch("M10", Loser("M8"), Winner("M5"), round=2),
+        BracketMatch("M11", Winner("M10"), Winner("M9"), round=3),
+        BracketMatch("M12", Winner("M7"), Winner("M8"), round=3),
+        BracketMatch("M13", Loser("M12"), Winner("M11"), round=4),
+        BracketMatch("F", Winner("M12"), Winner("M13"), round=5, best_of=3),
+    ),
+)
+
+# 6-alliance double elimination: alliances 1 and 2 get a first-round bye
+DOUBLE_ELIM_6 = BracketFormat(
+    name="double_elim_6",
+    num_alliances=6,
+    round_names=("Round 1", "Round 2", "Round 3", "Round 4", "Round 5", "Finals"),
+    matches=(
+        BracketMatch("M1", Seed(4), Seed(5), round=0),
+        BracketMatch("M2", Seed(3), Seed(6), round=0),
+        BracketMatch("M3", Seed(1), Winner("M1"), round=1),
+        BracketMatch("M4", Seed(2), Winner("M2"), round=1),
+        BracketMatch("M5", Loser("M1"), Loser("M2"), round=1),
+        BracketMatch("M6", Winner("M3"), Winner("M4"), round=2),
+        BracketMatch("M7", Loser("M4"), Winner("M5"), round=2),
+        BracketMatch("M8", Loser("M3"), Winner("M7"), round=3),
+        BracketMatch("M9", Loser("M6"), Winner("M8"), round=4),
+        BracketMatch("F", Winner("M6"), Winner("M9"), round=5, best_of=3),
+    ),
+)
+
+# 4-alliance district double elimination
+DOUBLE_ELIM_4 = BracketFormat(
+    name="double_elim_4",
+    num_alliances=4,
+    round_names=("Round 1", "Round 2", "Round 3", "Finals"),
+    matches=(
+        BracketMatch("M1", Seed(1), Seed(4), round=0),
+        BracketMatch("M2", Seed(2), Seed(3), round=0),
+        BracketMatch("M3", Loser("M1"), Loser("M2"), round=1),
+        BracketMatch("M4", Winner("M1"), Winner("M2"), round=1),
+        BracketMatch("M5", Loser("M4"), Winner("M3"), round=2),
+        BracketMatch("F", Winner("M4"), Winner("M5"), round=3, best_of=3),
+    ),
+)
+
+# Pre-2023 elimination ladder: every round is a best-of-3 series
+LADDER_BO3_8 = BracketFormat(
+    name="ladder_bo3_8",
+    num_alliances=8,
+    round_names=("Quarterfinals", "Semifinals", "Finals"),
+    matches=(
+        BracketMatch("QF1", Seed(1), Seed(8), round=0, best_of=3),
+        BracketMatch("QF2", Seed(4), Seed(5), round=0, best_of=3),
+        BracketMatch("QF3", Seed(2), Seed(7), round=0, best_of=3),
+        BracketMatch("QF4", Seed(3), Seed(6), round=0, best_of=3),
+        BracketMatch("SF1", Winner("QF1"), Winner("QF2"), round=1, best_of=3),
+        BracketMatch("SF2", Winner("QF3"), Winner("QF4"), round=1, best_of=3),
+        BracketMatch("F", Winner("SF1"), Winner("SF2"), round=2, best_of=3),
+    ),
+)
+
+LADDER_BO3_4 = BracketFormat(
+    name="ladder_bo3_4",
+    num_alliances=4,
+    round_names=("Semifinals", "Finals"),
+    matches=(
+        BracketMatch("SF1", Seed(1), Seed(4), round=0, best_of=3),
+        BracketMatch("SF2", Seed(2), Seed(3), round=0, best_of=3),
+        BracketMatch("F", Winner("SF1"), Winner("SF2"), round=1, best_of=3),
+    ),
+)
+
+BRACKET_FORMATS: Dict[str, BracketFormat] = {
+    bracket.name: bracket
+    for bracket in (DOUBLE_ELIM_8, DOUBLE_ELIM_6, DOUBLE_ELIM_4, LADDER_BO3_8, LADDER_BO3_4)
+}
+
+# Format used when a request does not name one, by number of alliances
+DEFAULT_BRACKET_BY_ALLIANCES: Dict[int, str] = {
+    8: "double_elim_8",
+    6: "double_elim_6",
+    4: "double_elim_4",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_bracket_plan(name: str) -> CompiledBracket:
+    """
+    Returns the compiled plan of a registered format, compiling it only once.
+
+    Raises:
+        KeyError: If the format is not registered in BRACKET_FORMATS.
+    """
+    if name not in BRACKET_FORMATS:
+        raise KeyError(f"Unknown bracket format '{name}'. Available: {sorted(BRACKET_FORMATS)}")
+    return compile_bracket_format(BRACKET_FORMATS[name])
+
+
+def default_bracket_name(num_alliances: int) -> str:
+    """Picks the registered format for the given number of alliances."""
+    if num_alliances not in DEFAULT_BRACKET_BY_ALLIANCES:
+        raise ValueError(f"No default bracket format for {num_alliances} alliances")
+    return DEFAULT_BRACKET_BY_ALLIANCES[num_alliances]
@@ -0,0 +1,197 @@
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from ..config import FEATURE_ORDER
+
+
+class FeatureSchema:
+    """
+    Mapa entre los nombres de features del modelo y sus columnas.
+
+    - Los vectores de features son filas de buffers float32 contiguos,
+      creados con `empty` y llenados en su lugar con `write_team` /
+      `write_match`, sin diccionarios ni DataFrames intermedios.
+    - Las columnas de cada equipo se resuelven una sola vez: `red1_epa`,
+      `red1_opr`, ... quedan indexadas por (color, posición, stat).
+    - Las features que nadie escribe valen 0.0 (igual que antes con
+      `raw_features.get(feature, 0.0)`) y un valor None se guarda como NaN,
+      que XGBoost trata como faltante.
+    - Para muchos partidos a la vez, `gather` copia las stats de una
+      TeamStatsMatrix con un solo indexado de NumPy.
+    """
+
+    # Orden de las columnas del arreglo de equipos de `gather`
+    TEAM_SLOTS: Tuple[Tuple[str, int], ...] = (
+        ("red", 1), ("red", 2), ("red", 3), ("blue", 1), ("blue", 2), ("blue", 3),
+    )
+
+    def __init__(self, names: Sequence[str]):
+        self.names: Tuple[str, ...] = tuple(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.week_column: Optional[int] = self.index.get("week")
+
+        # (color, posición 1-based) -> {stat: columna}
+        self._team_columns: Dict[Tuple[str, int], Dict[str, int]] = {}
+        for column, name in enumerate(self.names):
+            prefix, _, stat = name.partition("_")
+            for color in ("red", "blue"):
+                if prefix.startswith(color) and prefix[len(color):].isdigit() and stat:
+                    position = int(prefix[len(color):])
+                    self._team_columns.setdefault((color, position), {})[stat] = column
+
+        # Stats por equipo, en el orden en que aparecen por primera vez
+        self.team_stats: Tuple[str, ...] = tuple(
+            dict.fromkeys(stat for columns in self._team_columns.values() for stat in columns)
+        )
+        # stats de la matriz -> (columnas, slot de equipo, columna de la matriz)
+        self._gather_plans: Dict[Tuple[str, ...], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def empty(self, n_rows: int = 1) -> np.ndarray:
+        """Buffer (n_rows x features) float32 C-contiguo inicializado en 0."""
+        return np.zeros((n_rows, len(self.names)), dtype=np.float32)
+
+    def write_team(self, row: np.ndarray, color: str, position: int, stats: Mapping) -> None:
+        """Escribe las stats de un equipo en las columnas `{color}{position}_{stat}`."""
+        columns = self._team_columns.get((color, position), {})
+        for stat, value in stats.items():
+            column = columns.get(stat)
+            if column is not None:
+                row[column] = np.nan if value is None else value
+
+    def write_match(
+        self,
+        row: np.ndarray,
+        week: int,
+        red_stats: Sequence[Mapping],
+        blue_stats: Sequence[Mapping],
+    ) -> np.ndarray:
+        """
+        Llena una fila con la semana y las stats de los equipos de cada alianza,
+        en el orden de posición (red1, red2, red3). Devuelve la misma fila.
+        """
+        row[:] = 0.0
+        if self.week_column is not None:
+            row[self.week_column] = week
+        for position, stats in enumerate(red_stats, start=1):
+            self.write_team(row, "red", position, stats)
+        for position, stats in enumerate(blue_stats, start=1):
+            self.write_team(row, "blue", position, stats)
+        return row
+
+    def _gather_plan(self, stats: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        plan = self._gather_plans.get(stats)
+        if plan is None:
+            stat_index = {stat: j for j, stat in enumerate(stats)}
+            columns, slots, stat_columns = [], [], []
+            for slot, key in enumerate(self.TEAM_SLOTS):
+                for stat, column in self._team_columns.get(key, {}).items():
+                    if stat in stat_index:
+                        columns.append(column)
+                        slots.append(slot)
+                        stat_columns.append(stat_index[stat])
+            plan = tuple(np.array(a, dtype=np.intp) for a in (columns, slots, stat_columns))
+            self._gather_plans[stats] = plan
+        return plan
+
+    def gather(
+        self,
+        team_stats: "TeamStatsMatrix",
+        team_rows: np.ndarray,
+        week: int,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Construye las features de muchos partidos con un solo gather.
+
+        `team_rows` es un arreglo (partidos x 6) de filas de `team_stats` en el
+        orden de TEAM_SLOTS (red1..red3, blue1..blue3), como lo devuelve
+        TeamStatsMatrix.rows; una fila -1 (equipo desconocido) deja sus
+        features en 0.0, igual que write_match con un dict vacío.
+        """
+        team_rows = np.asarray(team_rows, dtype=np.intp).reshape(-1, len(self.TEAM_SLOTS))
+        columns, slots, stat_columns = self._gather_plan(team_stats.stats)
+        features = self.empty(len(team_rows)) if out is None else out
+        features[:] = 0.0
+        if self.week_column is not None:
+            features[:, self.week_column] = week
+        features[:, columns] = team_stats.values[team_rows[:, slots], stat_columns]
+        return features
+
+    def missing_rows(self, features: np.ndarray) -> np.ndarray:
+        """Máscara booleana de las filas con alguna feature faltante (NaN)."""
+        return np.isnan(features).any(axis=1)
+
+    def from_mapping(self, features: Mapping[str, float], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Convierte un dict {nombre: valor} en una fila; faltantes = 0.0, None = NaN."""
+        row = self.empty(1)[0] if out is None else out
+        for name, value in features.items():
+            column = self.index.get(name)
+            if column is not None:
+                row[column] = np.nan if value is None else value
+        return row
+
+    def to_dict(self, row: np.ndarray) -> Dict[str, float]:
+        """Convierte una fila en un dict {nombre: valor} en el orden del schema."""
+        return dict(zip(self.names, row.tolist()))
+
+    def missing(self, row: np.ndarray) -> list:
+        """Nombres de las features faltantes (NaN) de una fila."""
+        return [self.names[column] for column in np.flatnonzero(np.isnan(row))]
+
+
+class TeamStatsMatrix:
+    """
+    Stats de los equipos de un evento como matriz (equipo x stat) float32.
+
+    - Se arma una vez por evento a partir de los dicts por equipo
+      (Statbotics, TBA, ...); las llaves que no son stats del modelo
+      ("team", "event", ...) se descartan aquí y no en cada partido.
+    - `index` lleva el número de equipo (como str) a su fila; `rows` traduce
+      alineaciones completas a índices para FeatureSchema.gather.
+    - La última fila de `values` es de ceros y es la que toma el índice -1
+      de un equipo desconocido. Una stat que falta vale 0.0 y None es NaN,
+      como en FeatureSchema.write_team.
+    """
+
+    def __init__(self, teams: Sequence, stats: Sequence[str], values: np.ndarray):
+        self.teams: Tuple[str, ...] = tuple(str(team) for team in teams)
+        self.index: Dict[str, int] = {team: row for row, team in enumerate(self.teams)}
+        self.stats: Tuple[str, ...] = tuple(stats)
+        self.values = values
+
+    @classmethod
+    def from_team_stats(
+        cls, *sources: Mapping, stats: Optional[Sequence[str]] = None
+    ) -> "TeamStatsMatrix":
+        """
+        Arma la matriz desde uno o más dicts {equipo: {stat: valor}}; las
+        fuentes posteriores tienen precedencia (p. ej. Statbotics y luego TBA).
+        Por defecto las columnas son FEATURE_SCHEMA.team_stats.
+        """
+        stats = tuple(FEATURE_SCHEMA.team_stats if stats is None else stats)
+        stat_index = {stat: j for j, stat in enumerate(stats)}
+        teams = list(dict.fromkeys(str(team) for source in sources for team in source))
+        index = {team: row for row, team in enumerate(teams)}
+
+        values = np.zeros((len(teams) + 1, len(stats)), dtype=np.float32)
+        for source in sources:
+            for team, team_stats in source.items():
+                row = values[index[str(team)]]
+                for stat, value in (team_stats or {}).items():
+                    column = stat_index.get(stat)
+                    if column is not None:
+                        row[column] = np.nan if value is None else value
+        return cls(teams, stats, values)
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def rows(self, teams: Iterable) -> np.ndarray:
+        """Filas de `teams` (números o str), -1 para los equipos desconocidos."""
+        index = self.index
+        return np.array([index.get(str(team), -1) for team in teams], dtype=np.intp)
+
+
+FEATURE_SCHEMA = FeatureSchema(FEATURE_ORDER)
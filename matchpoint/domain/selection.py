@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+
+@dataclass(frozen=True)
+class PickCandidate:
+    """
+    Un equipo que el capitán puede elegir y la probabilidad de campeonato
+    que le deja a su alianza.
+
+    `projected_alliance` es la alianza final con la que se obtuvo esa
+    probabilidad: capitán, esta elección y las elecciones futuras sugeridas.
+    """
+    team: int
+    win_probability: float
+    projected_alliance: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class AllianceSelectionResult:
+    """
+    Resultado del optimizador de selección de alianzas para una elección.
+
+    `candidates` está ordenado de mayor a menor probabilidad de campeonato.
+    """
+    event_key: str
+    alliance_number: int
+    pick_number: int
+    exact: bool
+    candidates: List[PickCandidate] = field(default_factory=list)
+    lineups_evaluated: int = 0
+    model_evaluations: int = 0
+
+    @property
+    def best(self) -> PickCandidate:
+        return self.candidates[0]
+
+    def __str__(self) -> str:
+        header = [
+            f"\n--- Alliance Selection: {self.event_key} ---",
+            f"Alliance {self.alliance_number}, pick {self.pick_number} "
+            f"({'exact' if self.exact else 'Monte Carlo'}, {self.lineups_evaluated} lineups, "
+            f"{self.model_evaluations} model evaluations)",
+            "Team   | Win Probability | Projected Alliance",
+            "-----------------------------------------------",
+        ]
+        rows = []
+        for candidate in self.candidates:
+            lineup = ", ".join(map(str, candidate.projected_alliance))
+            rows.append(f"{candidate.team:<6} | {candidate.win_probability:<15.2%} | {lineup}")
+        return "\n".join(header + rows)
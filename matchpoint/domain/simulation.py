@@ -1,6 +1,9 @@
 import json
+import math
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, Any
+import numpy as np
 
 ResultItem = Dict[str, Any]
 ResultsSource = Union[str, Dict[str, Any], Sequence[ResultItem], Iterable[ResultItem]]
@@ -8,7 +11,11 @@ ResultsSource = Union[str, Dict[str, Any], Sequence[ResultItem], Iterable[Result
 class SimulationTracker:
     """
     Clase mutable para trackear resultados de simulaciones.
-    - Mantiene _alliances y _win_counts como antes.
+    - Los conteos viven en arrays de NumPy de tamaño fijo (memoria O(1) por corrida):
+      campeonatos, finales jugadas, histograma de ronda de eliminación por alianza
+      y enfrentamientos de la final.
+    - Un lote completo del motor vectorizado se agrega con `add_batch` y los
+      trackers de shards paralelos se combinan con `merge`.
     - Exposición de `results` (lista de dicts) y soporte para iterar sobre el objeto.
     - Se puede cargar resultados desde JSON/string, dict con clave "results",
       lista/iterable de items, o un generator.
@@ -19,11 +26,13 @@ class SimulationTracker:
         total_simulations: int = 0,
         event_key: str = "",
         results: Optional[ResultsSource] = None,
+        round_names: Sequence[str] = (),
     ):
         self._total_sims: int = total_simulations
         self.event_key: str = event_key
+        self.round_names: Tuple[str, ...] = tuple(round_names)
         self._alliances: List[List[int]] = alliances or []
-        self._win_counts: Dict[int, int] = {i + 1: 0 for i in range(len(self._alliances))}
+        self._allocate(len(self._alliances))
         # Raw results source (could be JSON string, list, iterable, etc.)
         self._raw_results: Optional[ResultsSource] = None
         # Internal cached results list (normalized list[dict])
@@ -35,22 +44,54 @@ class SimulationTracker:
             # Build normalized results from alliances/win_counts if possible
             self._normalized_results = None  # lazy build
 
+    # -----------------------
+    # Storage
+    # -----------------------
+    def _allocate(self, num_alliances: int) -> None:
+        """Crea los arrays de conteo vacíos para `num_alliances` alianzas."""
+        n_columns = len(self.round_names) + 1
+        self._win_counts = np.zeros(num_alliances, dtype=np.int64)
+        self._finalist_counts = np.zeros(num_alliances, dtype=np.int64)
+        # [alianza, ronda] = veces eliminada en esa ronda; última columna = campeona
+        self._elimination_counts = np.zeros((num_alliances, n_columns), dtype=np.int64)
+        # [roja, azul] = veces que esa pareja jugó la final
+        self._final_matchups = np.zeros((num_alliances, num_alliances), dtype=np.int64)
+
+    def _grow(self, num_alliances: int) -> None:
+        """Agranda los arrays (y _alliances) si llega una alianza desconocida."""
+        current = len(self._win_counts)
+        if num_alliances <= current:
+            return
+        extra = num_alliances - current
+        self._win_counts = np.pad(self._win_counts, (0, extra))
+        self._finalist_counts = np.pad(self._finalist_counts, (0, extra))
+        self._elimination_counts = np.pad(self._elimination_counts, ((0, extra), (0, 0)))
+        self._final_matchups = np.pad(self._final_matchups, ((0, extra), (0, extra)))
+        while len(self._alliances) < num_alliances:
+            self._alliances.append([])
+
     # -----------------------
     # Utility / parsing
     # -----------------------
     def _build_results_from_internal(self) -> List[ResultItem]:
-        """Construye la estructura de results a partir de alliances + win_counts."""
+        """Construye la estructura de results a partir de alliances + conteos."""
         data: List[ResultItem] = []
+        has_rounds = bool(self.round_names) and self._elimination_counts.sum() > 0
         for i, teams in enumerate(self._alliances):
             alliance_num = i + 1
-            win_count = self._win_counts.get(alliance_num, 0)
+            win_count = int(self._win_counts[i]) if i < len(self._win_counts) else 0
             win_probability = (win_count / self._total_sims) if self._total_sims > 0 else 0.0
-            data.append({
+            item = {
                 "alliance_number": alliance_num,
                 "teams": teams,
                 "wins": win_count,
                 "win_probability": round(win_probability, 4)
-            })
+            }
+            if has_rounds:
+                item["finalist_count"] = int(self._finalist_counts[i])
+                item["elimination_round_counts"] = self._elimination_counts[i].tolist()
+                item["round_advancement"] = self.advancement_probabilities(i)
+            data.append(item)
         return data
 
     def _normalize_results_source(self, source: ResultsSource) -> List[ResultItem]:
@@ -137,7 +178,9 @@ class SimulationTracker:
             # Reconstruir estructuras internas para que sean consistentes
             max_idx = max(rebuilt_counts.keys())
             self._alliances = [rebuilt_alliances.get(i + 1, []) for i in range(max_idx)]
-            self._win_counts = {i + 1: rebuilt_counts.get(i + 1, 0) for i in range(max_idx)}
+            self._allocate(max_idx)
+            for an, wins in rebuilt_counts.items():
+                self._win_counts[an - 1] = wins
             # NOTA: total_sims no lo inferimos automáticamente (puede permanecer igual)
             # invalidar cache de normalized (la dejamos)
             # si quieres inferir total sims podrías sumar wins pero no lo hacemos por defecto
@@ -165,17 +208,104 @@ class SimulationTracker:
     # -----------------------
     def add_win(self, alliance_number: int) -> None:
         """Incrementa el contador de victorias para una alianza dada."""
-        if alliance_number in self._win_counts:
-            self._win_counts[alliance_number] += 1
-        else:
-            # Si la alianza no existe, la creamos (comportamiento opcional)
-            self._win_counts[alliance_number] = 1
-            # asegurar suficiente espacio en alliances (listas vacías para equipos desconocidos)
-            while len(self._alliances) < alliance_number:
-                self._alliances.append([])
+        # Si la alianza no existe, la creamos (listas vacías para equipos desconocidos)
+        self._grow(alliance_number)
+        self._win_counts[alliance_number - 1] += 1
+        # invalidar cache de results para que se regenere
+        self._normalized_results = None
+
+    def add_win_counts(self, counts: Sequence[int], simulations: int = 0) -> None:
+        """
+        Suma en bloque los campeonatos de un lote de simulaciones.
+        `counts[i]` corresponde a la alianza i + 1 (p. ej. salida de np.bincount).
+        `simulations` se suma al total cuando el tracker se llena por lotes
+        (p. ej. en simulaciones en streaming).
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        self._grow(len(counts))
+        self._win_counts[: len(counts)] += counts
+        self._total_sims += simulations
         # invalidar cache de results para que se regenere
         self._normalized_results = None
 
+    def add_batch(
+        self,
+        simulations: int,
+        champion_counts: np.ndarray,
+        finalist_counts: np.ndarray,
+        elimination_counts: np.ndarray,
+        final_matchups: np.ndarray,
+    ) -> None:
+        """
+        Agrega en una sola llamada los conteos de un lote del motor vectorizado.
+        Las formas deben coincidir con las del tracker (ver `_allocate`).
+        """
+        self._grow(len(champion_counts))
+        if elimination_counts.shape[1] != self._elimination_counts.shape[1]:
+            raise ValueError(
+                f"Batch has {elimination_counts.shape[1] - 1} rounds, tracker has {len(self.round_names)}"
+            )
+        self._win_counts += champion_counts
+        self._finalist_counts += finalist_counts
+        self._elimination_counts += elimination_counts
+        self._final_matchups += final_matchups
+        self._total_sims += simulations
+        self._normalized_results = None
+
+    def merge(self, other: "SimulationTracker") -> None:
+        """Combina los conteos de otro tracker (p. ej. de un shard paralelo)."""
+        self.add_batch(
+            other._total_sims,
+            other._win_counts,
+            other._finalist_counts,
+            other._elimination_counts,
+            other._final_matchups,
+        )
+
+    @property
+    def total_simulations(self) -> int:
+        return self._total_sims
+
+    def confidence_intervals(self, z: float = 1.96) -> List[Tuple[float, float]]:
+        """
+        Intervalo de Wilson para la probabilidad de campeonato de cada alianza.
+        Devuelve una lista de (low, high) alineada con las alianzas.
+        """
+        n = self._total_sims
+        intervals: List[Tuple[float, float]] = []
+        for i in range(len(self._alliances)):
+            if n <= 0:
+                intervals.append((0.0, 1.0))
+                continue
+            p = int(self._win_counts[i]) / n
+            denominator = 1 + z * z / n
+            center = (p + z * z / (2 * n)) / denominator
+            half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+            intervals.append((max(0.0, center - half_width), min(1.0, center + half_width)))
+        return intervals
+
+    def advancement_probabilities(self, alliance_index: int) -> List[float]:
+        """Probabilidad estimada de superar cada ronda (la última es ganar el evento)."""
+        if self._total_sims <= 0:
+            return [0.0] * len(self.round_names)
+        eliminated = np.cumsum(self._elimination_counts[alliance_index, :-1])
+        return [round(1.0 - int(e) / self._total_sims, 6) for e in eliminated]
+
+    @property
+    def final_matchups(self) -> List[ResultItem]:
+        """Parejas que jugaron la final, de la más a la menos frecuente."""
+        red, blue = np.nonzero(self._final_matchups)
+        matchups = [
+            {
+                "red_alliance": int(r) + 1,
+                "blue_alliance": int(b) + 1,
+                "count": int(self._final_matchups[r, b]),
+                "probability": round(int(self._final_matchups[r, b]) / self._total_sims, 6),
+            }
+            for r, b in zip(red, blue)
+        ]
+        return sorted(matchups, key=lambda m: m["count"], reverse=True)
+
     def to_json(self, indent: int = 4) -> str:
         """Exporta a JSON (manteniendo el formato anterior)."""
         results_data = self.results  # ya normalizado
@@ -187,6 +317,10 @@ class SimulationTracker:
             },
             "results": results_data
         }
+        if self.round_names:
+            output_dict["round_names"] = list(self.round_names)
+        if self._final_matchups.any():
+            output_dict["final_matchups"] = self.final_matchups
         return json.dumps(output_dict, indent=indent)
 
     def __str__(self) -> str:
@@ -200,9 +334,168 @@ class SimulationTracker:
         rows = []
         for i, teams in enumerate(self._alliances):
             alliance_num = i + 1
-            count = self._win_counts.get(alliance_num, 0)
+            count = int(self._win_counts[i]) if i < len(self._win_counts) else 0
             probability = (count / self._total_sims) if self._total_sims > 0 else 0
             teams_str = ", ".join(map(str, teams))
             rows.append(f"{alliance_num:<8} | {teams_str:<22} | {count:<4} | {probability:.2%}")
 
         return "\n".join(header + rows)
+
+
+
+@dataclass(frozen=True)
+class PlayoffOdds:
+    """
+    Probabilidades exactas de un playoff (sin Monte Carlo).
+
+    `elimination_probabilities[i][r]` es la probabilidad de que la alianza i + 1
+    quede eliminada en la ronda r; la última columna es la de ser campeona.
+    Expone `results` con la misma forma que SimulationTracker para que el
+    servidor pueda serializar ambos igual.
+    """
+    event_key: str
+    alliances: List[List[int]]
+    round_names: Tuple[str, ...]
+    elimination_probabilities: List[List[float]] = field(default_factory=list)
+
+    def advancement_probabilities(self, alliance_index: int) -> List[float]:
+        """Probabilidad de superar cada ronda (la última es ganar el evento)."""
+        row = self.elimination_probabilities[alliance_index]
+        advancement = []
+        eliminated = 0.0
+        for round_index in range(len(self.round_names)):
+            eliminated += row[round_index]
+            advancement.append(round(max(0.0, 1.0 - eliminated), 6))
+        return advancement
+
+    @property
+    def results(self) -> List[ResultItem]:
+        data: List[ResultItem] = []
+        for i, teams in enumerate(self.alliances):
+            data.append({
+                "alliance_number": i + 1,
+                "teams": teams,
+                "wins": 0,
+                "win_probability": round(self.elimination_probabilities[i][-1], 6),
+                "round_advancement": self.advancement_probabilities(i),
+            })
+        return data
+
+    def __iter__(self) -> Iterator[ResultItem]:
+        for item in self.results:
+            yield item
+
+    def __str__(self) -> str:
+        header = [
+            f"\n--- Exact Playoff Odds: {self.event_key} ---",
+            "Alliance | Teams                  | Win Probability",
+            "---------------------------------------------------"
+        ]
+        rows = []
+        for item in self.results:
+            teams_str = ", ".join(map(str, item["teams"]))
+            rows.append(f"{item['alliance_number']:<8} | {teams_str:<22} | {item['win_probability']:.2%}")
+        return "\n".join(header + rows)
+
+
+class QualificationRankings:
+    """
+    Distribución de rankings finales de clasificación (qm) obtenida por Monte Carlo.
+
+    - `rank_counts[t, r]` cuenta las simulaciones en que el equipo `teams[t]`
+      terminó en la posición r + 1.
+    - Los lotes del motor vectorizado se agregan con `add_batch`.
+    - `results` expone una lista de dicts ordenada por ranking esperado.
+    """
+    def __init__(
+        self,
+        teams: Sequence[int],
+        event_key: str = "",
+        current_ranks: Optional[Sequence[int]] = None,
+        current_ranking_scores: Optional[Sequence[float]] = None,
+        remaining_matches: int = 0,
+        top_n: int = 8,
+    ):
+        self.event_key: str = event_key
+        self.teams: List[int] = [int(team) for team in teams]
+        num_teams = len(self.teams)
+        # 0 = el equipo todavía no aparece en los rankings de TBA
+        self.current_ranks: List[int] = list(current_ranks or [0] * num_teams)
+        self.current_ranking_scores: List[float] = list(current_ranking_scores or [0.0] * num_teams)
+        self.remaining_matches: int = remaining_matches
+        self.top_n: int = top_n
+        self._total_sims: int = 0
+        self.rank_counts = np.zeros((num_teams, num_teams), dtype=np.int64)
+        self._ranking_score_sums = np.zeros(num_teams, dtype=np.float64)
+
+    def add_batch(self, ranks: np.ndarray, ranking_scores: np.ndarray) -> None:
+        """
+        Agrega un lote de simulaciones.
+
+        `ranks` y `ranking_scores` tienen forma (N, equipos); `ranks` es 0-based.
+        """
+        simulations, num_teams = ranks.shape
+        flat = (np.arange(num_teams, dtype=np.int64) * num_teams)[None, :] + ranks
+        self.rank_counts += np.bincount(
+            flat.ravel(), minlength=num_teams * num_teams
+        ).reshape(num_teams, num_teams)
+        self._ranking_score_sums += ranking_scores.sum(axis=0)
+        self._total_sims += simulations
+
+    @property
+    def total_simulations(self) -> int:
+        return self._total_sims
+
+    def rank_probabilities(self) -> np.ndarray:
+        """Matriz (equipos, posiciones) con la probabilidad de cada posición final."""
+        return self.rank_counts / max(self._total_sims, 1)
+
+    def top_n_probabilities(self, top_n: Optional[int] = None) -> np.ndarray:
+        """Probabilidad de que cada equipo termine entre los `top_n` primeros."""
+        top_n = self.top_n if top_n is None else top_n
+        return self.rank_counts[:, :top_n].sum(axis=1) / max(self._total_sims, 1)
+
+    def mean_ranks(self) -> np.ndarray:
+        """Posición final esperada (1-based) de cada equipo."""
+        positions = np.arange(1, len(self.teams) + 1, dtype=np.float64)
+        return self.rank_counts @ positions / max(self._total_sims, 1)
+
+    @property
+    def results(self) -> List[ResultItem]:
+        probabilities = self.rank_probabilities()
+        top_n = self.top_n_probabilities()
+        mean_ranks = self.mean_ranks()
+        expected_scores = self._ranking_score_sums / max(self._total_sims, 1)
+
+        data: List[ResultItem] = []
+        for t, team in enumerate(self.teams):
+            data.append({
+                "team": team,
+                "current_rank": self.current_ranks[t],
+                "current_ranking_score": round(float(self.current_ranking_scores[t]), 4),
+                "mean_rank": round(float(mean_ranks[t]), 4),
+                "top_n_probability": round(float(top_n[t]), 6),
+                "rank_probabilities": [round(float(p), 6) for p in probabilities[t]],
+                "expected_ranking_score": round(float(expected_scores[t]), 4),
+            })
+        data.sort(key=lambda item: item["mean_rank"])
+        return data
+
+    def __iter__(self) -> Iterator[ResultItem]:
+        for item in self.results:
+            yield item
+
+    def __str__(self) -> str:
+        header = [
+            f"\n--- Qualification Rankings: {self.event_key} ---",
+            f"Remaining matches: {self.remaining_matches} | Total Simulations: {self._total_sims}",
+            f"Team   | Now | Mean Rank | Top {self.top_n}",
+            "----------------------------------",
+        ]
+        rows = []
+        for item in self.results:
+            current = item["current_rank"] or "-"
+            rows.append(
+                f"{item['team']:<6} | {current:<3} | {item['mean_rank']:<9.2f} | {item['top_n_probability']:.2%}"
+            )
+        return "\n".join(header + rows)
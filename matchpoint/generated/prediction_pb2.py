@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10prediction.proto\x12\nmatchpoint\x1a\x1fgoogle/protobuf/timestamp.proto\"+\n\x16\x45ventPredictionRequest\x12\x11\n\tevent_key\x18\x01 \x01(\t\"S\n\x17\x45ventPredictionResponse\x12\x38\n\x0bpredictions\x18\x01 \x03(\x0b\x32#.matchpoint.MatchPredictionResponse\"+\n\x16MatchPredictionRequest\x12\x11\n\tmatch_key\x18\x01 \x01(\t\"\xe3\x01\n\x17MatchPredictionResponse\x12\x11\n\tmatch_key\x18\x01 \x01(\t\x12\x18\n\x10predicted_winner\x18\x02 \x01(\t\x12\x33\n\x0fwin_probability\x18\x03 \x01(\x0b\x32\x1a.matchpoint.WinProbability\x12\x35\n\x10predicted_scores\x18\x04 \x01(\x0b\x32\x1b.matchpoint.PredictedScores\x12/\n\rshap_analysis\x18\x05 \x01(\x0b\x32\x18.matchpoint.ShapAnalysis\"_\n\x0cShapAnalysis\x12\x12\n\nbase_value\x18\x01 \x01(\x02\x12\x0e\n\x06values\x18\x02 \x03(\x02\x12\x15\n\rfeature_names\x18\x03 \x03(\t\x12\x14\n\x0c\x66\x65\x61ture_data\x18\x04 \x03(\x02\"+\n\x0eWinProbability\x12\x0b\n\x03red\x18\x01 \x01(\x02\x12\x0c\n\x04\x62lue\x18\x02 \x01(\x02\",\n\x0fPredictedScores\x12\x0b\n\x03red\x18\x01 \x01(\x05\x12\x0c\n\x04\x62lue\x18\x02 \x01(\x05\"\xee\x02\n\x10SimulationResult\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12M\n\x13simulation_metadata\x18\x02 \x01(\x0b\x32\x30.matchpoint.SimulationResult.Simulation_metadata\x12\x35\n\x07results\x18\x03 \x03(\x0b\x32$.matchpoint.SimulationResult.Results\x1ag\n\x13Simulation_metadata\x12\x1d\n\x15total_simulations_run\x18\x01 \x01(\r\x12\x31\n\rtimestamp_utc\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1aX\n\x07Results\x12\x17\n\x0f\x61lliance_number\x18\x01 \x01(\r\x12\r\n\x05teams\x18\x02 \x03(\r\x12\x0c\n\x04wins\x18\x03 \x01(\r\x12\x17\n\x0fwin_probability\x18\x04 \x01(\x01\"6\n\x11SimulationRequest\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12\x0e\n\x06n_sims\x18\x02 \x01(\r2\xa5\x02\n\nMatchpoint\x12_\n\x12GetMatchPrediction\x12\".matchpoint.MatchPredictionRequest\x1a#.matchpoint.MatchPredictionResponse\"\x00\x12\x63\n\x16PredictAllEventMatches\x12\".matchpoint.EventPredictionRequest\x1a#.matchpoint.EventPredictionResponse\"\x00\x12Q\n\x10SimulatePlayoffs\x12\x1d.matchpoint.SimulationRequest\x1a\x1c.matchpoint.SimulationResult\"\x00\x42\x1bZ\x19\x62lue-banner-engine/protosb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10prediction.proto\x12\nmatchpoint\x1a\x1fgoogle/protobuf/timestamp.proto\"A\n\x16\x45ventPredictionRequest\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12\x14\n\x0cinclude_shap\x18\x02 \x01(\x08\"S\n\x17\x45ventPredictionResponse\x12\x38\n\x0bpredictions\x18\x01 \x03(\x0b\x32#.matchpoint.MatchPredictionResponse\"+\n\x16MatchPredictionRequest\x12\x11\n\tmatch_key\x18\x01 \x01(\t\"\xe3\x01\n\x17MatchPredictionResponse\x12\x11\n\tmatch_key\x18\x01 \x01(\t\x12\x18\n\x10predicted_winner\x18\x02 \x01(\t\x12\x33\n\x0fwin_probability\x18\x03 \x01(\x0b\x32\x1a.matchpoint.WinProbability\x12\x35\n\x10predicted_scores\x18\x04 \x01(\x0b\x32\x1b.matchpoint.PredictedScores\x12/\n\rshap_analysis\x18\x05 \x01(\x0b\x32\x18.matchpoint.ShapAnalysis\"_\n\x0cShapAnalysis\x12\x12\n\nbase_value\x18\x01 \x01(\x02\x12\x0e\n\x06values\x18\x02 \x03(\x02\x12\x15\n\rfeature_names\x18\x03 \x03(\t\x12\x14\n\x0c\x66\x65\x61ture_data\x18\x04 \x03(\x02\"+\n\x0eWinProbability\x12\x0b\n\x03red\x18\x01 \x01(\x02\x12\x0c\n\x04\x62lue\x18\x02 \x01(\x02\",\n\x0fPredictedScores\x12\x0b\n\x03red\x18\x01 \x01(\x05\x12\x0c\n\x04\x62lue\x18\x02 \x01(\x05\"\xc3\x05\n\x10SimulationResult\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12M\n\x13simulation_metadata\x18\x02 \x01(\x0b\x32\x30.matchpoint.SimulationResult.Simulation_metadata\x12\x35\n\x07results\x18\x03 \x03(\x0b\x32$.matchpoint.SimulationResult.Results\x12\x13\n\x0bround_names\x18\x04 \x03(\t\x12\x41\n\x0e\x66inal_matchups\x18\x05 \x03(\x0b\x32).matchpoint.SimulationResult.FinalMatchup\x1a\x8b\x01\n\x13Simulation_metadata\x12\x1d\n\x15total_simulations_run\x18\x01 \x01(\r\x12\x31\n\rtimestamp_utc\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05\x65xact\x18\x03 \x01(\x08\x12\x13\n\x0bstop_reason\x18\x04 \x01(\t\x1a\xce\x01\n\x07Results\x12\x17\n\x0f\x61lliance_number\x18\x01 \x01(\r\x12\r\n\x05teams\x18\x02 \x03(\r\x12\x0c\n\x04wins\x18\x03 \x01(\r\x12\x17\n\x0fwin_probability\x18\x04 \x01(\x01\x12\x19\n\x11round_advancement\x18\x05 \x03(\x01\x12\x0e\n\x06\x63i_low\x18\x06 \x01(\x01\x12\x0f\n\x07\x63i_high\x18\x07 \x01(\x01\x12\x16\n\x0e\x66inalist_count\x18\x08 \x01(\r\x12 \n\x18\x65limination_round_counts\x18\t \x03(\r\x1a_\n\x0c\x46inalMatchup\x12\x14\n\x0cred_alliance\x18\x01 \x01(\r\x12\x15\n\rblue_alliance\x18\x02 \x01(\r\x12\r\n\x05\x63ount\x18\x03 \x01(\r\x12\x13\n\x0bprobability\x18\x04 \x01(\x01\"\xa7\x01\n\x11SimulationRequest\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12\x0e\n\x06n_sims\x18\x02 \x01(\r\x12\x11\n\x04seed\x18\x03 \x01(\x04H\x00\x88\x01\x01\x12\x16\n\x0e\x62racket_format\x18\x04 \x01(\t\x12\r\n\x05\x65xact\x18\x05 \x01(\x08\x12\x11\n\ttolerance\x18\x06 \x01(\x01\x12\x19\n\x11snapshot_interval\x18\x07 \x01(\rB\x07\n\x05_seed\"n\n\x1eQualificationSimulationRequest\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12\x0e\n\x06n_sims\x18\x02 \x01(\r\x12\x11\n\x04seed\x18\x03 \x01(\x04H\x00\x88\x01\x01\x12\r\n\x05top_n\x18\x04 \x01(\rB\x07\n\x05_seed\"\xb1\x03\n\x1dQualificationSimulationResult\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12M\n\x13simulation_metadata\x18\x02 \x01(\x0b\x32\x30.matchpoint.SimulationResult.Simulation_metadata\x12\x19\n\x11remaining_matches\x18\x03 \x01(\r\x12\r\n\x05top_n\x18\x04 \x01(\r\x12G\n\x08rankings\x18\x05 \x03(\x0b\x32\x35.matchpoint.QualificationSimulationResult.TeamRanking\x1a\xba\x01\n\x0bTeamRanking\x12\x0c\n\x04team\x18\x01 \x01(\r\x12\x14\n\x0c\x63urrent_rank\x18\x02 \x01(\r\x12\x1d\n\x15\x63urrent_ranking_score\x18\x03 \x01(\x01\x12\x11\n\tmean_rank\x18\x04 \x01(\x01\x12\x19\n\x11top_n_probability\x18\x05 \x01(\x01\x12\x1a\n\x12rank_probabilities\x18\x06 \x03(\x01\x12\x1e\n\x16\x65xpected_ranking_score\x18\x07 \x01(\x01\"\x1f\n\x0e\x41llianceLineup\x12\r\n\x05teams\x18\x01 \x03(\r\"\xca\x01\n\x18\x41llianceSelectionRequest\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12\x14\n\x0cranked_teams\x18\x02 \x03(\r\x12-\n\talliances\x18\x03 \x03(\x0b\x32\x1a.matchpoint.AllianceLineup\x12\x16\n\x0e\x62racket_format\x18\x04 \x01(\t\x12\x12\n\nbeam_width\x18\x05 \x01(\r\x12\x0e\n\x06n_sims\x18\x06 \x01(\r\x12\x11\n\x04seed\x18\x07 \x01(\x04H\x00\x88\x01\x01\x42\x07\n\x05_seed\"\xb2\x02\n\x17\x41llianceSelectionResult\x12\x11\n\tevent_key\x18\x01 \x01(\t\x12\x17\n\x0f\x61lliance_number\x18\x02 \x01(\r\x12\x13\n\x0bpick_number\x18\x03 \x01(\r\x12\r\n\x05\x65xact\x18\x04 \x01(\x08\x12\x41\n\ncandidates\x18\x05 \x03(\x0b\x32-.matchpoint.AllianceSelectionResult.Candidate\x12\x19\n\x11lineups_evaluated\x18\x06 \x01(\r\x12\x19\n\x11model_evaluations\x18\x07 \x01(\r\x1aN\n\tCandidate\x12\x0c\n\x04team\x18\x01 \x01(\r\x12\x17\n\x0fwin_probability\x18\x02 \x01(\x01\x12\x1a\n\x12projected_alliance\x18\x03 \x03(\r2\xd8\x04\n\nMatchpoint\x12_\n\x12GetMatchPrediction\x12\".matchpoint.MatchPredictionRequest\x1a#.matchpoint.MatchPredictionResponse\"\x00\x12\x63\n\x16PredictAllEventMatches\x12\".matchpoint.EventPredictionRequest\x1a#.matchpoint.EventPredictionResponse\"\x00\x12Q\n\x10SimulatePlayoffs\x12\x1d.matchpoint.SimulationRequest\x1a\x1c.matchpoint.SimulationResult\"\x00\x12Y\n\x16StreamSimulatePlayoffs\x12\x1d.matchpoint.SimulationRequest\x1a\x1c.matchpoint.SimulationResult\"\x00\x30\x01\x12q\n\x16SimulateQualifications\x12*.matchpoint.QualificationSimulationRequest\x1a).matchpoint.QualificationSimulationResult\"\x00\x12\x63\n\x14OptimizeAlliancePick\x12$.matchpoint.AllianceSelectionRequest\x1a#.matchpoint.AllianceSelectionResult\"\x00\x42\x1bZ\x19\x62lue-banner-engine/protosb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,27 +34,43 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'Z\031blue-banner-engine/protos'
   _globals['_EVENTPREDICTIONREQUEST']._serialized_start=65
-  _globals['_EVENTPREDICTIONREQUEST']._serialized_end=108
-  _globals['_EVENTPREDICTIONRESPONSE']._serialized_start=110
-  _globals['_EVENTPREDICTIONRESPONSE']._serialized_end=193
-  _globals['_MATCHPREDICTIONREQUEST']._serialized_start=195
-  _globals['_MATCHPREDICTIONREQUEST']._serialized_end=238
-  _globals['_MATCHPREDICTIONRESPONSE']._serialized_start=241
-  _globals['_MATCHPREDICTIONRESPONSE']._serialized_end=468
-  _globals['_SHAPANALYSIS']._serialized_start=470
-  _globals['_SHAPANALYSIS']._serialized_end=565
-  _globals['_WINPROBABILITY']._serialized_start=567
-  _globals['_WINPROBABILITY']._serialized_end=610
-  _globals['_PREDICTEDSCORES']._serialized_start=612
-  _globals['_PREDICTEDSCORES']._serialized_end=656
-  _globals['_SIMULATIONRESULT']._serialized_start=659
-  _globals['_SIMULATIONRESULT']._serialized_end=1025
-  _globals['_SIMULATIONRESULT_SIMULATION_METADATA']._serialized_start=832
-  _globals['_SIMULATIONRESULT_SIMULATION_METADATA']._serialized_end=935
-  _globals['_SIMULATIONRESULT_RESULTS']._serialized_start=937
-  _globals['_SIMULATIONRESULT_RESULTS']._serialized_end=1025
-  _globals['_SIMULATIONREQUEST']._serialized_start=1027
-  _globals['_SIMULATIONREQUEST']._serialized_end=1081
-  _globals['_MATCHPOINT']._serialized_start=1084
-  _globals['_MATCHPOINT']._serialized_end=1377
+  _globals['_EVENTPREDICTIONREQUEST']._serialized_end=130
+  _globals['_EVENTPREDICTIONRESPONSE']._serialized_start=132
+  _globals['_EVENTPREDICTIONRESPONSE']._serialized_end=215
+  _globals['_MATCHPREDICTIONREQUEST']._serialized_start=217
+  _globals['_MATCHPREDICTIONREQUEST']._serialized_end=260
+  _globals['_MATCHPREDICTIONRESPONSE']._serialized_start=263
+  _globals['_MATCHPREDICTIONRESPONSE']._serialized_end=490
+  _globals['_SHAPANALYSIS']._serialized_start=492
+  _globals['_SHAPANALYSIS']._serialized_end=587
+  _globals['_WINPROBABILITY']._serialized_start=589
+  _globals['_WINPROBABILITY']._serialized_end=632
+  _globals['_PREDICTEDSCORES']._serialized_start=634
+  _globals['_PREDICTEDSCORES']._serialized_end=678
+  _globals['_SIMULATIONRESULT']._serialized_start=681
+  _globals['_SIMULATIONRESULT']._serialized_end=1388
+  _globals['_SIMULATIONRESULT_SIMULATION_METADATA']._serialized_start=943
+  _globals['_SIMULATIONRESULT_SIMULATION_METADATA']._serialized_end=1082
+  _globals['_SIMULATIONRESULT_RESULTS']._serialized_start=1085
+  _globals['_SIMULATIONRESULT_RESULTS']._serialized_end=1291
+  _globals['_SIMULATIONRESULT_FINALMATCHUP']._serialized_start=1293
+  _globals['_SIMULATIONRESULT_FINALMATCHUP']._serialized_end=1388
+  _globals['_SIMULATIONREQUEST']._serialized_start=1391
+  _globals['_SIMULATIONREQUEST']._serialized_end=1558
+  _globals['_QUALIFICATIONSIMULATIONREQUEST']._serialized_start=1560
+  _globals['_QUALIFICATIONSIMULATIONREQUEST']._serialized_end=1670
+  _globals['_QUALIFICATIONSIMULATIONRESULT']._serialized_start=1673
+  _globals['_QUALIFICATIONSIMULATIONRESULT']._serialized_end=2106
+  _globals['_QUALIFICATIONSIMULATIONRESULT_TEAMRANKING']._serialized_start=1920
+  _globals['_QUALIFICATIONSIMULATIONRESULT_TEAMRANKING']._serialized_end=2106
+  _globals['_ALLIANCELINEUP']._serialized_start=2108
+  _globals['_ALLIANCELINEUP']._serialized_end=2139
+  _globals['_ALLIANCESELECTIONREQUEST']._serialized_start=2142
+  _globals['_ALLIANCESELECTIONREQUEST']._serialized_end=2344
+  _globals['_ALLIANCESELECTIONRESULT']._serialized_start=2347
+  _globals['_ALLIANCESELECTIONRESULT']._serialized_end=2653
+  _globals['_ALLIANCESELECTIONRESULT_CANDIDATE']._serialized_start=2575
+  _globals['_ALLIANCESELECTIONRESULT_CANDIDATE']._serialized_end=2653
+  _globals['_MATCHPOINT']._serialized_start=2656
+  _globals['_MATCHPOINT']._serialized_end=3256
 # @@protoc_insertion_point(module_scope)
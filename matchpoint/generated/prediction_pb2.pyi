@@ -8,10 +8,12 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class EventPredictionRequest(_message.Message):
-    __slots__ = ("event_key",)
+    __slots__ = ("event_key", "include_shap")
     EVENT_KEY_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_SHAP_FIELD_NUMBER: _ClassVar[int]
     event_key: str
-    def __init__(self, event_key: _Optional[str] = ...) -> None: ...
+    include_shap: bool
+    def __init__(self, event_key: _Optional[str] = ..., include_shap: bool = ...) -> None: ...
 
 class EventPredictionResponse(_message.Message):
     __slots__ = ("predictions",)
@@ -68,37 +70,170 @@ class PredictedScores(_message.Message):
     def __init__(self, red: _Optional[int] = ..., blue: _Optional[int] = ...) -> None: ...
 
 class SimulationResult(_message.Message):
-    __slots__ = ("event_key", "simulation_metadata", "results")
+    __slots__ = ("event_key", "simulation_metadata", "results", "round_names", "final_matchups")
     class Simulation_metadata(_message.Message):
-        __slots__ = ("total_simulations_run", "timestamp_utc")
+        __slots__ = ("total_simulations_run", "timestamp_utc", "exact", "stop_reason")
         TOTAL_SIMULATIONS_RUN_FIELD_NUMBER: _ClassVar[int]
         TIMESTAMP_UTC_FIELD_NUMBER: _ClassVar[int]
+        EXACT_FIELD_NUMBER: _ClassVar[int]
+        STOP_REASON_FIELD_NUMBER: _ClassVar[int]
         total_simulations_run: int
         timestamp_utc: _timestamp_pb2.Timestamp
-        def __init__(self, total_simulations_run: _Optional[int] = ..., timestamp_utc: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+        exact: bool
+        stop_reason: str
+        def __init__(self, total_simulations_run: _Optional[int] = ..., timestamp_utc: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., exact: bool = ..., stop_reason: _Optional[str] = ...) -> None: ...
     class Results(_message.Message):
-        __slots__ = ("alliance_number", "teams", "wins", "win_probability")
+        __slots__ = ("alliance_number", "teams", "wins", "win_probability", "round_advancement", "ci_low", "ci_high", "finalist_count", "elimination_round_counts")
         ALLIANCE_NUMBER_FIELD_NUMBER: _ClassVar[int]
         TEAMS_FIELD_NUMBER: _ClassVar[int]
         WINS_FIELD_NUMBER: _ClassVar[int]
         WIN_PROBABILITY_FIELD_NUMBER: _ClassVar[int]
+        ROUND_ADVANCEMENT_FIELD_NUMBER: _ClassVar[int]
+        CI_LOW_FIELD_NUMBER: _ClassVar[int]
+        CI_HIGH_FIELD_NUMBER: _ClassVar[int]
+        FINALIST_COUNT_FIELD_NUMBER: _ClassVar[int]
+        ELIMINATION_ROUND_COUNTS_FIELD_NUMBER: _ClassVar[int]
         alliance_number: int
         teams: _containers.RepeatedScalarFieldContainer[int]
         wins: int
         win_probability: float
-        def __init__(self, alliance_number: _Optional[int] = ..., teams: _Optional[_Iterable[int]] = ..., wins: _Optional[int] = ..., win_probability: _Optional[float] = ...) -> None: ...
+        round_advancement: _containers.RepeatedScalarFieldContainer[float]
+        ci_low: float
+        ci_high: float
+        finalist_count: int
+        elimination_round_counts: _containers.RepeatedScalarFieldContainer[int]
+        def __init__(self, alliance_number: _Optional[int] = ..., teams: _Optional[_Iterable[int]] = ..., wins: _Optional[int] = ..., win_probability: _Optional[float] = ..., round_advancement: _Optional[_Iterable[float]] = ..., ci_low: _Optional[float] = ..., ci_high: _Optional[float] = ..., finalist_count: _Optional[int] = ..., elimination_round_counts: _Optional[_Iterable[int]] = ...) -> None: ...
+    class FinalMatchup(_message.Message):
+        __slots__ = ("red_alliance", "blue_alliance", "count", "probability")
+        RED_ALLIANCE_FIELD_NUMBER: _ClassVar[int]
+        BLUE_ALLIANCE_FIELD_NUMBER: _ClassVar[int]
+        COUNT_FIELD_NUMBER: _ClassVar[int]
+        PROBABILITY_FIELD_NUMBER: _ClassVar[int]
+        red_alliance: int
+        blue_alliance: int
+        count: int
+        probability: float
+        def __init__(self, red_alliance: _Optional[int] = ..., blue_alliance: _Optional[int] = ..., count: _Optional[int] = ..., probability: _Optional[float] = ...) -> None: ...
     EVENT_KEY_FIELD_NUMBER: _ClassVar[int]
     SIMULATION_METADATA_FIELD_NUMBER: _ClassVar[int]
     RESULTS_FIELD_NUMBER: _ClassVar[int]
+    ROUND_NAMES_FIELD_NUMBER: _ClassVar[int]
+    FINAL_MATCHUPS_FIELD_NUMBER: _ClassVar[int]
     event_key: str
     simulation_metadata: SimulationResult.Simulation_metadata
     results: _containers.RepeatedCompositeFieldContainer[SimulationResult.Results]
-    def __init__(self, event_key: _Optional[str] = ..., simulation_metadata: _Optional[_Union[SimulationResult.Simulation_metadata, _Mapping]] = ..., results: _Optional[_Iterable[_Union[SimulationResult.Results, _Mapping]]] = ...) -> None: ...
+    round_names: _containers.RepeatedScalarFieldContainer[str]
+    final_matchups: _containers.RepeatedCompositeFieldContainer[SimulationResult.FinalMatchup]
+    def __init__(self, event_key: _Optional[str] = ..., simulation_metadata: _Optional[_Union[SimulationResult.Simulation_metadata, _Mapping]] = ..., results: _Optional[_Iterable[_Union[SimulationResult.Results, _Mapping]]] = ..., round_names: _Optional[_Iterable[str]] = ..., final_matchups: _Optional[_Iterable[_Union[SimulationResult.FinalMatchup, _Mapping]]] = ...) -> None: ...
 
 class SimulationRequest(_message.Message):
-    __slots__ = ("event_key", "n_sims")
+    __slots__ = ("event_key", "n_sims", "seed", "bracket_format", "exact", "tolerance", "snapshot_interval")
     EVENT_KEY_FIELD_NUMBER: _ClassVar[int]
     N_SIMS_FIELD_NUMBER: _ClassVar[int]
+    SEED_FIELD_NUMBER: _ClassVar[int]
+    BRACKET_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    EXACT_FIELD_NUMBER: _ClassVar[int]
+    TOLERANCE_FIELD_NUMBER: _ClassVar[int]
+    SNAPSHOT_INTERVAL_FIELD_NUMBER: _ClassVar[int]
     event_key: str
     n_sims: int
-    def __init__(self, event_key: _Optional[str] = ..., n_sims: _Optional[int] = ...) -> None: ...
+    seed: int
+    bracket_format: str
+    exact: bool
+    tolerance: float
+    snapshot_interval: int
+    def __init__(self, event_key: _Optional[str] = ..., n_sims: _Optional[int] = ..., seed: _Optional[int] = ..., bracket_format: _Optional[str] = ..., exact: bool = ..., tolerance: _Optional[float] = ..., snapshot_interval: _Optional[int] = ...) -> None: ...
+
+class QualificationSimulationRequest(_message.Message):
+    __slots__ = ("event_key", "n_sims", "seed", "top_n")
+    EVENT_KEY_FIELD_NUMBER: _ClassVar[int]
+    N_SIMS_FIELD_NUMBER: _ClassVar[int]
+    SEED_FIELD_NUMBER: _ClassVar[int]
+    TOP_N_FIELD_NUMBER: _ClassVar[int]
+    event_key: str
+    n_sims: int
+    seed: int
+    top_n: int
+    def __init__(self, event_key: _Optional[str] = ..., n_sims: _Optional[int] = ..., seed: _Optional[int] = ..., top_n: _Optional[int] = ...) -> None: ...
+
+class QualificationSimulationResult(_message.Message):
+    __slots__ = ("event_key", "simulation_metadata", "remaining_matches", "top_n", "rankings")
+    class TeamRanking(_message.Message):
+        __slots__ = ("team", "current_rank", "current_ranking_score", "mean_rank", "top_n_probability", "rank_probabilities", "expected_ranking_score")
+        TEAM_FIELD_NUMBER: _ClassVar[int]
+        CURRENT_RANK_FIELD_NUMBER: _ClassVar[int]
+        CURRENT_RANKING_SCORE_FIELD_NUMBER: _ClassVar[int]
+        MEAN_RANK_FIELD_NUMBER: _ClassVar[int]
+        TOP_N_PROBABILITY_FIELD_NUMBER: _ClassVar[int]
+        RANK_PROBABILITIES_FIELD_NUMBER: _ClassVar[int]
+        EXPECTED_RANKING_SCORE_FIELD_NUMBER: _ClassVar[int]
+        team: int
+        current_rank: int
+        current_ranking_score: float
+        mean_rank: float
+        top_n_probability: float
+        rank_probabilities: _containers.RepeatedScalarFieldContainer[float]
+        expected_ranking_score: float
+        def __init__(self, team: _Optional[int] = ..., current_rank: _Optional[int] = ..., current_ranking_score: _Optional[float] = ..., mean_rank: _Optional[float] = ..., top_n_probability: _Optional[float] = ..., rank_probabilities: _Optional[_Iterable[float]] = ..., expected_ranking_score: _Optional[float] = ...) -> None: ...
+    EVENT_KEY_FIELD_NUMBER: _ClassVar[int]
+    SIMULATION_METADATA_FIELD_NUMBER: _ClassVar[int]
+    REMAINING_MATCHES_FIELD_NUMBER: _ClassVar[int]
+    TOP_N_FIELD_NUMBER: _ClassVar[int]
+    RANKINGS_FIELD_NUMBER: _ClassVar[int]
+    event_key: str
+    simulation_metadata: SimulationResult.Simulation_metadata
+    remaining_matches: int
+    top_n: int
+    rankings: _containers.RepeatedCompositeFieldContainer[QualificationSimulationResult.TeamRanking]
+    def __init__(self, event_key: _Optional[str] = ..., simulation_metadata: _Optional[_Union[SimulationResult.Simulation_metadata, _Mapping]] = ..., remaining_matches: _Optional[int] = ..., top_n: _Optional[int] = ..., rankings: _Optional[_Iterable[_Union[QualificationSimulationResult.TeamRanking, _Mapping]]] = ...) -> None: ...
+
+class AllianceLineup(_message.Message):
+    __slots__ = ("teams",)
+    TEAMS_FIELD_NUMBER: _ClassVar[int]
+    teams: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, teams: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class AllianceSelectionRequest(_message.Message):
+    __slots__ = ("event_key", "ranked_teams", "alliances", "bracket_format", "beam_width", "n_sims", "seed")
+    EVENT_KEY_FIELD_NUMBER: _ClassVar[int]
+    RANKED_TEAMS_FIELD_NUMBER: _ClassVar[int]
+    ALLIANCES_FIELD_NUMBER: _ClassVar[int]
+    BRACKET_FORMAT_FIELD_NUMBER: _ClassVar[int]
+    BEAM_WIDTH_FIELD_NUMBER: _ClassVar[int]
+    N_SIMS_FIELD_NUMBER: _ClassVar[int]
+    SEED_FIELD_NUMBER: _ClassVar[int]
+    event_key: str
+    ranked_teams: _containers.RepeatedScalarFieldContainer[int]
+    alliances: _containers.RepeatedCompositeFieldContainer[AllianceLineup]
+    bracket_format: str
+    beam_width: int
+    n_sims: int
+    seed: int
+    def __init__(self, event_key: _Optional[str] = ..., ranked_teams: _Optional[_Iterable[int]] = ..., alliances: _Optional[_Iterable[_Union[AllianceLineup, _Mapping]]] = ..., bracket_format: _Optional[str] = ..., beam_width: _Optional[int] = ..., n_sims: _Optional[int] = ..., seed: _Optional[int] = ...) -> None: ...
+
+class AllianceSelectionResult(_message.Message):
+    __slots__ = ("event_key", "alliance_number", "pick_number", "exact", "candidates", "lineups_evaluated", "model_evaluations")
+    class Candidate(_message.Message):
+        __slots__ = ("team", "win_probability", "projected_alliance")
+        TEAM_FIELD_NUMBER: _ClassVar[int]
+        WIN_PROBABILITY_FIELD_NUMBER: _ClassVar[int]
+        PROJECTED_ALLIANCE_FIELD_NUMBER: _ClassVar[int]
+        team: int
+        win_probability: float
+        projected_alliance: _containers.RepeatedScalarFieldContainer[int]
+        def __init__(self, team: _Optional[int] = ..., win_probability: _Optional[float] = ..., projected_alliance: _Optional[_Iterable[int]] = ...) -> None: ...
+    EVENT_KEY_FIELD_NUMBER: _ClassVar[int]
+    ALLIANCE_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    PICK_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    EXACT_FIELD_NUMBER: _ClassVar[int]
+    CANDIDATES_FIELD_NUMBER: _ClassVar[int]
+    LINEUPS_EVALUATED_FIELD_NUMBER: _ClassVar[int]
+    MODEL_EVALUATIONS_FIELD_NUMBER: _ClassVar[int]
+    event_key: str
+    alliance_number: int
+    pick_number: int
+    exact: bool
+    candidates: _containers.RepeatedCompositeFieldContainer[AllianceSelectionResult.Candidate]
+    lineups_evaluated: int
+    model_evaluations: int
+    def __init__(self, event_key: _Optional[str] = ..., alliance_number: _Optional[int] = ..., pick_number: _Optional[int] = ..., exact: bool = ..., candidates: _Optional[_Iterable[_Union[AllianceSelectionResult.Candidate, _Mapping]]] = ..., lineups_evaluated: _Optional[int] = ..., model_evaluations: _Optional[int] = ...) -> None: ...
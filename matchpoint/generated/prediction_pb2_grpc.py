@@ -51,6 +51,21 @@ class MatchpointStub(object):
                 request_serializer=prediction__pb2.SimulationRequest.SerializeToString,
                 response_deserializer=prediction__pb2.SimulationResult.FromString,
                 _registered_method=True)
+        self.StreamSimulatePlayoffs = channel.unary_stream(
+                '/matchpoint.Matchpoint/StreamSimulatePlayoffs',
+                request_serializer=prediction__pb2.SimulationRequest.SerializeToString,
+                response_deserializer=prediction__pb2.SimulationResult.FromString,
+                _registered_method=True)
+        self.SimulateQualifications = channel.unary_unary(
+                '/matchpoint.Matchpoint/SimulateQualifications',
+                request_serializer=prediction__pb2.QualificationSimulationRequest.SerializeToString,
+                response_deserializer=prediction__pb2.QualificationSimulationResult.FromString,
+                _registered_method=True)
+        self.OptimizeAlliancePick = channel.unary_unary(
+                '/matchpoint.Matchpoint/OptimizeAlliancePick',
+                request_serializer=prediction__pb2.AllianceSelectionRequest.SerializeToString,
+                response_deserializer=prediction__pb2.AllianceSelectionResult.FromString,
+                _registered_method=True)
 
 
 class MatchpointServicer(object):
@@ -76,6 +91,29 @@ class MatchpointServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamSimulatePlayoffs(self, request, context):
+        """Igual que SimulatePlayoffs, pero envía resultados parciales cada snapshot_interval
+        simulaciones y se detiene al converger o antes de vencer el deadline.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SimulateQualifications(self, request, context):
+        """Simula los partidos de clasificación restantes y predice el ranking final.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def OptimizeAlliancePick(self, request, context):
+        """Evalúa cada equipo que el siguiente capitán puede elegir por la probabilidad
+        de campeonato que le deja a su alianza.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MatchpointServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -94,6 +132,21 @@ def add_MatchpointServicer_to_server(servicer, server):
                     request_deserializer=prediction__pb2.SimulationRequest.FromString,
                     response_serializer=prediction__pb2.SimulationResult.SerializeToString,
             ),
+            'StreamSimulatePlayoffs': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamSimulatePlayoffs,
+                    request_deserializer=prediction__pb2.SimulationRequest.FromString,
+                    response_serializer=prediction__pb2.SimulationResult.SerializeToString,
+            ),
+            'SimulateQualifications': grpc.unary_unary_rpc_method_handler(
+                    servicer.SimulateQualifications,
+                    request_deserializer=prediction__pb2.QualificationSimulationRequest.FromString,
+                    response_serializer=prediction__pb2.QualificationSimulationResult.SerializeToString,
+            ),
+            'OptimizeAlliancePick': grpc.unary_unary_rpc_method_handler(
+                    servicer.OptimizeAlliancePick,
+                    request_deserializer=prediction__pb2.AllianceSelectionRequest.FromString,
+                    response_serializer=prediction__pb2.AllianceSelectionResult.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'matchpoint.Matchpoint', rpc_method_handlers)
@@ -186,3 +239,84 @@ class Matchpoint(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamSimulatePlayoffs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/matchpoint.Matchpoint/StreamSimulatePlayoffs',
+            prediction__pb2.SimulationRequest.SerializeToString,
+            prediction__pb2.SimulationResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SimulateQualifications(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/matchpoint.Matchpoint/SimulateQualifications',
+            prediction__pb2.QualificationSimulationRequest.SerializeToString,
+            prediction__pb2.QualificationSimulationResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def OptimizeAlliancePick(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/matchpoint.Matchpoint/OptimizeAlliancePick',
+            prediction__pb2.AllianceSelectionRequest.SerializeToString,
+            prediction__pb2.AllianceSelectionResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,70 @@
+# bbe/matchpoint/metrics.py
+import bisect
+import threading
+from typing import Dict, Sequence, Tuple
+
+
+def powers_of_two(limit: int) -> Tuple[int, ...]:
+    """Bucket bounds 1, 2, 4, ... up to the first power of two >= limit."""
+    bounds, bound = [1], 1
+    while bound < limit:
+        bound *= 2
+        bounds.append(bound)
+    return tuple(bounds)
+
+
+class Histogram:
+    """
+    A thread-safe histogram of non-negative observations over fixed buckets.
+
+    `bounds` are the inclusive upper edges of the buckets; larger values land
+    in a final "+Inf" bucket. Counts are cumulative over the process lifetime.
+    """
+
+    def __init__(self, name: str, bounds: Sequence[float]):
+        self.name = name
+        self.bounds = tuple(sorted(bounds))
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> Dict:
+        """Returns count, sum, mean, max and the per-bucket counts."""
+        with self._lock:
+            labels = [f"<={bound:g}" for bound in self.bounds] + ["+Inf"]
+            return {
+                "count": self._count,
+                "sum": self._sum,
+                "mean": self._sum / self._count if self._count else 0.0,
+                "max": self._max,
+                "buckets": dict(zip(labels, self._counts)),
+            }
+
+
+_registry: Dict[str, Histogram] = {}
+_registry_lock = threading.Lock()
+
+
+def histogram(name: str, bounds: Sequence[float]) -> Histogram:
+    """Returns the process-wide histogram `name`, creating it on first use."""
+    with _registry_lock:
+        if name not in _registry:
+            _registry[name] = Histogram(name, bounds)
+        return _registry[name]
+
+
+def snapshot() -> Dict[str, Dict]:
+    """Snapshots of every registered histogram, by name."""
+    with _registry_lock:
+        histograms = list(_registry.values())
+    return {h.name: h.snapshot() for h in histograms}
@@ -0,0 +1,47 @@
+# bbe/matchpoint/models/convert.py
+"""
+Writes a binary UBJSON copy next to every JSON model artifact.
+
+    python -m matchpoint.models.convert
+
+Set MODEL_FORMAT=ubj to have ModelLoader load the copies.
+"""
+import os
+import time
+from typing import List
+from .. import config
+
+
+def convert(json_paths: List[str]) -> List[str]:
+    """
+    Re-saves each model as UBJSON (same trees and attributes, e.g.
+    best_iteration) and reports how long each format takes to parse.
+
+    Returns:
+        List[str]: The written .ubj paths.
+    """
+    import xgboost as xgb
+
+    written = []
+    for json_path in json_paths:
+        ubj_path = os.path.splitext(json_path)[0] + ".ubj"
+        booster = xgb.Booster()
+        booster.load_model(json_path)
+        booster.save_model(ubj_path)
+
+        timings = {}
+        for path in (json_path, ubj_path):
+            started = time.perf_counter()
+            xgb.Booster().load_model(path)
+            timings[path] = time.perf_counter() - started
+        print(
+            f"{os.path.basename(json_path)} -> {os.path.basename(ubj_path)}: "
+            f"{os.path.getsize(json_path) / 1e6:.1f} MB -> {os.path.getsize(ubj_path) / 1e6:.1f} MB, "
+            f"parse {timings[json_path] * 1e3:.0f} ms -> {timings[ubj_path] * 1e3:.0f} ms"
+        )
+        written.append(ubj_path)
+    return written
+
+
+if __name__ == "__main__":
+    convert([config.CLASSIFIER_PATH, config.RED_REGRESSOR_PATH, config.BLUE_REGRESSOR_PATH])
@@ -1,25 +1,273 @@
-import xgboost as xgb
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, Tuple, Union
+import numpy as np
 from .. import config 
-import shap
+
+# A (rows x features) float32 array in FEATURE_ORDER, as built with
+# FEATURE_SCHEMA; DataFrames with the FEATURE_ORDER columns are also accepted
+Features = Union[np.ndarray, Any]
 
 class ModelLoader:
+    """
+    Singleton holding the classifier, both regressors and their compiled form.
+
+    Created on first use through `loader` (xgboost is only imported then), so
+    importing the package does not parse any model. The server calls
+    warm_up() before it reports itself as serving.
+    """
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(ModelLoader, cls).__new__(cls)
-            
-            cls._instance.classifier = xgb.XGBClassifier()
-            cls._instance.classifier.load_model(config.CLASSIFIER_PATH)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(ModelLoader, cls).__new__(cls)
+                    instance._load()
+                    cls._instance = instance
+        return cls._instance
 
-            cls._instance.red_regressor = xgb.XGBRegressor()
-            cls._instance.red_regressor.load_model(config.RED_REGRESSOR_PATH)
+    def _load(self) -> None:
+        self.startup_timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        import xgboost as xgb
 
-            cls._instance.blue_regressor = xgb.XGBRegressor()
-            cls._instance.blue_regressor.load_model(config.BLUE_REGRESSOR_PATH)
+        paths = [
+            self._artifact_path(path)
+            for path in (config.CLASSIFIER_PATH, config.RED_REGRESSOR_PATH, config.BLUE_REGRESSOR_PATH)
+        ]
+
+        self.classifier = xgb.XGBClassifier()
+        self.classifier.load_model(paths[0])
+
+        self.red_regressor = xgb.XGBRegressor()
+        self.red_regressor.load_model(paths[1])
+
+        self.blue_regressor = xgb.XGBRegressor()
+        self.blue_regressor.load_model(paths[2])
+
+        self._shap_explainer = None
+
+        self.model_version = self._digest_files(*paths)
+
+        self._boosters = {
+            name: (model.get_booster(), self._iteration_range(model), self._column_order(model))
+            for name, model in (
+                ("classifier", self.classifier),
+                ("red", self.red_regressor),
+                ("blue", self.blue_regressor),
+            )
+        }
+        self.startup_timings["load"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self._compile(config.MODEL_BACKEND)
+        self.startup_timings["compile"] = time.perf_counter() - started
+
+    @staticmethod
+    def _artifact_path(json_path: str) -> str:
+        """The UBJSON twin of a JSON model when MODEL_FORMAT is "ubj" and it exists."""
+        if config.MODEL_FORMAT == "json":
+            return json_path
+        if config.MODEL_FORMAT != "ubj":
+            raise ValueError(f"Unknown MODEL_FORMAT '{config.MODEL_FORMAT}'; use json or ubj")
+        ubj_path = os.path.splitext(json_path)[0] + ".ubj"
+        if os.path.exists(ubj_path):
+            return ubj_path
+        print(f"WARN: {ubj_path} not found, loading {json_path} (see matchpoint.models.convert).")
+        return json_path
+
+    def _compile(self, backend: str) -> None:
+        """
+        Selects the inference backend and, for "numpy"/"numba", flattens the
+        boosters into CompiledTreeEnsembles: one fusing all three models (column
+        0 = classifier, 1 = red score, 2 = blue score) and one with only the
+        classifier for calls that need just the win probability.
+        """
+        if backend not in ("xgboost", "numpy", "numba"):
+            raise ValueError(f"Unknown MODEL_BACKEND '{backend}'; use xgboost, numpy or numba")
+
+        self.backend = backend
+        self.compiled = None
+        self.compiled_classifier = None
+        if backend == "xgboost":
+            return
+
+        from . import tree_ensemble
+
+        if backend == "numba" and tree_ensemble.numba is None:
+            print("WARN: numba is not installed, using the numpy tree evaluator.")
+            self.backend = "numpy"
+
+        boosters = [
+            self.classifier.get_booster(),
+            self.red_regressor.get_booster(),
+            self.blue_regressor.get_booster(),
+        ]
+        self.compiled = tree_ensemble.CompiledTreeEnsemble.from_boosters(boosters, config.FEATURE_ORDER)
+        self.compiled_classifier = tree_ensemble.CompiledTreeEnsemble.from_boosters(
+            boosters[:1], config.FEATURE_ORDER
+        )
+
+    def set_threads(self, n_threads: int) -> None:
+        """Caps the threads XGBoost (and numba, if used) run each prediction with."""
+        for booster, _, _ in self._boosters.values():
+            booster.set_param({"nthread": n_threads})
+        if self.backend == "numba":
+            import numba
+
+            numba.set_num_threads(min(n_threads, numba.config.NUMBA_NUM_THREADS))
+
+    def warm_up(self) -> Dict[str, float]:
+        """
+        Runs every inference path once on dummy rows, so the first request
+        does not pay for lazy initialization (XGBoost's predictor, numba's
+        JIT compilation, the SHAP backend).
+
+        Returns:
+            Dict[str, float]: Seconds spent loading (including the xgboost
+                              import), compiling and warming up.
+        """
+        started = time.perf_counter()
+        n_features = len(config.FEATURE_ORDER)
+        # One row takes the compiled path (if any), a large batch the XGBoost one
+        for n_rows in (1, config.MODEL_COMPILED_MAX_ROWS + 1):
+            X = np.zeros((n_rows, n_features), dtype=np.float32)
+            self.predict(X)
+            self.predict_red_win_probabilities(X)
+        X = np.zeros((1, n_features), dtype=np.float32)
+        if config.SHAP_BACKEND == "shap":
+            self.shap_explainer(X)
+        else:
+            self.classifier_contributions(X)
+        self.startup_timings["warm_up"] = time.perf_counter() - started
+        return dict(self.startup_timings)
+
+    def _use_compiled(self, n_rows: int) -> bool:
+        # Large batches amortize XGBoost's per-call overhead and use its threads
+        return self.compiled is not None and n_rows <= config.MODEL_COMPILED_MAX_ROWS
+
+    @staticmethod
+    def _iteration_range(model) -> Tuple[int, int]:
+        """Trees used by the sklearn wrapper's predict: up to best_iteration when early-stopped."""
+        try:
+            return 0, model.best_iteration + 1
+        except AttributeError:
+            return 0, 0
+
+    @staticmethod
+    def _column_order(model):
+        """Buffer columns in the booster's feature order, or None when it is FEATURE_ORDER."""
+        names = model.get_booster().feature_names
+        if names is None or list(names) == list(config.FEATURE_ORDER):
+            return None
+        index = {name: i for i, name in enumerate(config.FEATURE_ORDER)}
+        return np.array([index[name] for name in names], dtype=np.intp)
+
+    @staticmethod
+    def _as_matrix(features: Features) -> np.ndarray:
+        if hasattr(features, "columns"):
+            return features[config.FEATURE_ORDER].to_numpy(dtype=np.float32, na_value=np.nan)
+        return np.ascontiguousarray(features, dtype=np.float32)
+
+    def _inplace_predict(self, name: str, X: np.ndarray) -> np.ndarray:
+        # Predicts straight from the float32 buffer, without building a DMatrix
+        booster, iteration_range, columns = self._boosters[name]
+        if columns is not None:
+            X = np.ascontiguousarray(X[:, columns])
+        return booster.inplace_predict(
+            X, iteration_range=iteration_range, validate_features=False
+        ).astype(np.float64)
+
+    def predict(self, features: Features) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Runs the classifier and both regressors on a batch of feature rows.
+
+        Args:
+            features (Features): A (rows x features) float32 array in
+                                 FEATURE_ORDER (see FEATURE_SCHEMA.empty).
+
+        Returns:
+            tuple: (probability that red wins, red score, blue score), one
+                   float64 array entry per row.
+        """
+        X = self._as_matrix(features)
+        # The classifier's positive class (1) is a blue win
+        if self._use_compiled(len(X)):
+            out = self.compiled.predict(X, self.backend)
+            return 1.0 - out[:, 0], out[:, 1], out[:, 2]
+
+        return (
+            1.0 - self._inplace_predict("classifier", X),
+            self._inplace_predict("red", X),
+            self._inplace_predict("blue", X),
+        )
+
+    def classifier_contributions(self, features: Features) -> np.ndarray:
+        """
+        SHAP values of the classifier from XGBoost's native TreeSHAP
+        (pred_contribs), for a whole batch in one call.
+
+        Returns:
+            np.ndarray: (rows x features + 1) contributions to the log-odds of
+                        the positive class (a blue win), in FEATURE_ORDER; the
+                        last column is the bias (expected value).
+        """
+        import xgboost as xgb
+
+        booster, iteration_range, columns = self._boosters["classifier"]
+        X = self._as_matrix(features)
+        if columns is not None:
+            X = X[:, columns]
+        contributions = booster.predict(
+            xgb.DMatrix(X, feature_names=booster.feature_names, missing=np.nan),
+            pred_contribs=True,
+            iteration_range=iteration_range,
+        ).astype(np.float64)
+        if columns is not None:
+            ordered = np.empty_like(contributions)
+            ordered[:, columns] = contributions[:, :-1]
+            ordered[:, -1] = contributions[:, -1]
+            contributions = ordered
+        return contributions
+
+    @property
+    def shap_explainer(self):
+        """shap.TreeExplainer of the classifier, built on first use (SHAP_BACKEND="shap")."""
+        if self._shap_explainer is None:
+            import shap
+
+            self._shap_explainer = shap.TreeExplainer(self.classifier)
+        return self._shap_explainer
+
+    def predict_red_win_probabilities(self, features: Features) -> np.ndarray:
+        """Classifier only: the probability that red wins, one entry per row."""
+        X = self._as_matrix(features)
+        if self._use_compiled(len(X)):
+            return 1.0 - self.compiled_classifier.predict(X, self.backend)[:, 0]
+        return 1.0 - self._inplace_predict("classifier", X)
+
+    @staticmethod
+    def _digest_files(*paths: str) -> str:
+        """Content hash of the model artifacts, used to key caches of model outputs."""
+        digest = hashlib.blake2b(digest_size=8)
+        for path in paths:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+class _LazyModelLoader:
+    """Stands in for the ModelLoader singleton, which is created on first attribute access."""
+
+    @property
+    def loaded(self) -> bool:
+        return ModelLoader._instance is not None
+
+    def __getattr__(self, name: str):
+        return getattr(ModelLoader(), name)
 
-            cls._instance.shap_explainer = shap.TreeExplainer(cls._instance.classifier)
-            
-        return cls._instance
 
-loader = ModelLoader()
\ No newline at end of file
+loader = _LazyModelLoader()
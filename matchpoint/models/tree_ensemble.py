@@ -0,0 +1,252 @@
+# bbe/matchpoint/models/tree_ensemble.py
+import functools
+import json
+import math
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+import numpy as np
+import xgboost as xgb
+
+try:
+    import numba
+    from numba import prange
+except ImportError:  # numba is optional; the NumPy kernel is used without it
+    numba = None
+    prange = range
+
+# Output transforms of the supported objectives (margin -> prediction)
+_TRANSFORMS = {
+    "binary:logistic": "sigmoid",
+    "reg:logistic": "sigmoid",
+    "reg:squarederror": "identity",
+    "reg:squaredlogerror": "identity",
+    "reg:absoluteerror": "identity",
+    "reg:pseudohubererror": "identity",
+    "count:poisson": "exp",
+    "reg:gamma": "exp",
+    "reg:tweedie": "exp",
+}
+
+
+def _parse_base_score(value: str) -> float:
+    """base_score is stored as '5E-1' or, since XGBoost 3, as '[5E-1]'."""
+    return float(str(value).strip("[]").split(",")[0])
+
+
+def _evaluate_rows(X, feature, threshold, left, right, default_left, value, roots, tree_output, out):
+    """
+    Row-by-row kernel: walks every tree for every row and adds the leaf value
+    to the row's output column. Jitted with numba when it is installed, with
+    rows spread across threads.
+    """
+    for i in prange(X.shape[0]):
+        for t in range(roots.shape[0]):
+            node = roots[t]
+            while left[node] != -1:
+                x = X[i, feature[node]]
+                if math.isnan(x):
+                    node = left[node] if default_left[node] else right[node]
+                elif x < threshold[node]:
+                    node = left[node]
+                else:
+                    node = right[node]
+            out[i, tree_output[t]] += value[node]
+    return out
+
+
+_evaluate_rows_jit = (
+    numba.njit(cache=True, nogil=True, parallel=True)(_evaluate_rows) if numba is not None else None
+)
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledTreeEnsemble:
+    """
+    Several XGBoost tree boosters flattened into one set of node arrays.
+
+    Node k splits on input column feature[k]: rows with x < threshold[k] go to
+    left[k], the rest to right[k], and missing values (NaN) follow
+    default_left[k]. Leaves have left == right == -1 and carry value[k].
+    Tree t starts at roots[t] and adds its leaf to output column
+    tree_output[t], so one pass over the input produces every model's
+    margin; base_margin and transforms turn margins into predictions the way
+    XGBoost does. Feature indices refer to the column order given at compile
+    time, not to each booster's own order.
+    """
+    feature: np.ndarray
+    threshold: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    default_left: np.ndarray
+    value: np.ndarray
+    roots: np.ndarray
+    tree_output: np.ndarray
+    base_margin: np.ndarray
+    transforms: Tuple[str, ...]
+    max_depth: int
+
+    @classmethod
+    def from_boosters(
+        cls, boosters: Sequence[xgb.Booster], feature_order: Sequence[str]
+    ) -> "CompiledTreeEnsemble":
+        """
+        Compiles boosters, one output column each, against a shared column order.
+
+        Raises:
+            ValueError: If a booster is not a plain gbtree model with numerical
+                        splits and a supported objective, or uses a feature
+                        missing from feature_order.
+        """
+        column = {name: i for i, name in enumerate(feature_order)}
+        arrays = {name: [] for name in ("feature", "threshold", "left", "right", "default_left", "value")}
+        roots: List[int] = []
+        tree_output: List[int] = []
+        base_margin: List[float] = []
+        transforms: List[str] = []
+        max_depth = 0
+        offset = 0
+
+        for output, booster in enumerate(boosters):
+            learner = json.loads(booster.save_raw(raw_format="json"))["learner"]
+            gbm = learner["gradient_booster"]
+            if gbm["name"] != "gbtree":
+                raise ValueError(f"Unsupported booster '{gbm['name']}'; only gbtree can be compiled")
+            objective = learner["objective"]["name"]
+            if objective not in _TRANSFORMS:
+                raise ValueError(f"Unsupported objective '{objective}'")
+            if int(learner["learner_model_param"].get("num_target", "1")) > 1 or int(
+                learner["learner_model_param"].get("num_class", "0")
+            ) > 1:
+                raise ValueError("Multi-output and multi-class boosters cannot be compiled")
+
+            names = learner.get("feature_names") or list(feature_order)
+            missing = [name for name in names if name not in column]
+            if missing:
+                raise ValueError(f"Booster features not in the feature order: {missing}")
+            remap = np.array([column[name] for name in names], dtype=np.intp)
+
+            trees = gbm["model"]["trees"]
+            # Same trees as the sklearn wrapper, which stops at best_iteration
+            best_iteration = learner.get("attributes", {}).get("best_iteration")
+            if best_iteration is not None:
+                per_iteration = int(gbm["model"]["gbtree_model_param"].get("num_parallel_tree", "1"))
+                trees = trees[: (int(best_iteration) + 1) * per_iteration]
+
+            for tree in trees:
+                if any(tree.get("split_type", [])):
+                    raise ValueError("Categorical splits cannot be compiled")
+                left = np.array(tree["left_children"], dtype=np.intp)
+                right = np.array(tree["right_children"], dtype=np.intp)
+                is_leaf = left == -1
+
+                arrays["feature"].append(remap[np.array(tree["split_indices"], dtype=np.intp)])
+                arrays["threshold"].append(np.array(tree["split_conditions"], dtype=np.float32))
+                arrays["left"].append(np.where(is_leaf, -1, left + offset))
+                arrays["right"].append(np.where(is_leaf, -1, right + offset))
+                arrays["default_left"].append(np.array(tree["default_left"], dtype=bool))
+                # Leaves keep their value in split_conditions
+                arrays["value"].append(
+                    np.where(is_leaf, np.array(tree["split_conditions"], dtype=np.float64), 0.0)
+                )
+                roots.append(offset)
+                tree_output.append(output)
+                max_depth = max(max_depth, cls._depth(left, right))
+                offset += len(left)
+
+            base_score = _parse_base_score(learner["learner_model_param"]["base_score"])
+            transform = _TRANSFORMS[objective]
+            if transform == "sigmoid":
+                base_score = math.log(base_score / (1.0 - base_score))
+            elif transform == "exp":
+                base_score = math.log(base_score)
+            base_margin.append(base_score)
+            transforms.append(transform)
+
+        def frozen(parts, dtype):
+            array = np.ascontiguousarray(np.concatenate(parts), dtype=dtype)
+            array.setflags(write=False)
+            return array
+
+        return cls(
+            feature=frozen(arrays["feature"], np.intp),
+            threshold=frozen(arrays["threshold"], np.float32),
+            left=frozen(arrays["left"], np.intp),
+            right=frozen(arrays["right"], np.intp),
+            default_left=frozen(arrays["default_left"], bool),
+            value=frozen(arrays["value"], np.float64),
+            roots=frozen([roots], np.intp),
+            tree_output=frozen([tree_output], np.intp),
+            base_margin=frozen([base_margin], np.float64),
+            transforms=tuple(transforms),
+            max_depth=max_depth,
+        )
+
+    @functools.cached_property
+    def _output_matrix(self) -> np.ndarray:
+        """(trees x models) one-hot matrix of tree_output."""
+        matrix = np.zeros((len(self.roots), len(self.transforms)), dtype=np.float64)
+        matrix[np.arange(len(self.roots)), self.tree_output] = 1.0
+        return matrix
+
+    @staticmethod
+    def _depth(left: np.ndarray, right: np.ndarray) -> int:
+        depth, level = 0, [0]
+        while True:
+            level = [child for node in level for child in (left[node], right[node]) if child != -1]
+            if not level:
+                return depth
+            depth += 1
+
+    def predict_margin(self, X: np.ndarray, backend: str = "numpy") -> np.ndarray:
+        """
+        Raw margins of every model.
+
+        Args:
+            X (np.ndarray): (rows x features) matrix in the compile-time column
+                            order. NaN marks a missing value.
+            backend (str): "numba" for the jitted row kernel (falls back to
+                           "numpy" if numba is not installed) or "numpy" for
+                           the level-by-level vectorized kernel.
+
+        Returns:
+            np.ndarray: (rows x models) margins.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_rows = X.shape[0]
+        n_outputs = len(self.transforms)
+
+        if backend == "numba" and _evaluate_rows_jit is not None:
+            out = np.zeros((n_rows, n_outputs), dtype=np.float64)
+            _evaluate_rows_jit(
+                X, self.feature, self.threshold, self.left, self.right,
+                self.default_left, self.value, self.roots, self.tree_output, out,
+            )
+            return out + self.base_margin
+
+        # Advance every (row, tree) pair one level at a time; leaves stay put
+        node = np.broadcast_to(self.roots, (n_rows, len(self.roots))).copy()
+        rows = np.arange(n_rows)[:, None]
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[node]]
+            go_left = np.where(np.isnan(x), self.default_left[node], x < self.threshold[node])
+            child = np.where(go_left, self.left[node], self.right[node])
+            node = np.where(child == -1, node, child)
+
+        # (rows x trees) leaf values summed into their model's column
+        return self.value[node] @ self._output_matrix + self.base_margin
+
+    def predict(self, X: np.ndarray, backend: str = "numpy") -> np.ndarray:
+        """
+        Predictions of every model, transformed like XGBoost's predict
+        (probability of class 1 for binary:logistic).
+
+        Returns:
+            np.ndarray: (rows x models) predictions.
+        """
+        margins = self.predict_margin(X, backend)
+        for output, transform in enumerate(self.transforms):
+            if transform == "sigmoid":
+                margins[:, output] = 1.0 / (1.0 + np.exp(-margins[:, output]))
+            elif transform == "exp":
+                margins[:, output] = np.exp(margins[:, output])
+        return margins
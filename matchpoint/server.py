@@ -1,14 +1,52 @@
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+import asyncio
+import gc
 import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
 import grpc
 import traceback
 import sys
+import threading
+from typing import Optional
 from datetime import datetime, timezone
 from concurrent import futures
 from google.protobuf.timestamp_pb2 import Timestamp
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 from .generated import prediction_pb2
 from .generated import prediction_pb2_grpc
+from . import cache, metrics
 from .services.mp_prediction import MatchpointPredictor, MatchPrediction
+from .services.prediction_cache import prediction_cache
 from .services.simulator import Simulator
+from .domain.bracket import BRACKET_FORMATS
+from .config import (
+    SIMULATION_DEFAULT_SIMS,
+    SIMULATION_MAX_SIMS,
+    SIMULATION_SNAPSHOT_INTERVAL,
+    SIMULATION_CI_Z,
+    QUALS_DEFAULT_TOP_N,
+    SELECTION_DEFAULT_ALLIANCES,
+    SELECTION_MAX_BEAM_WIDTH,
+    SERVER_PORT,
+    SERVER_THREADS,
+    SERVER_WORKERS,
+    SERVER_RESTART_BACKOFF,
+    SERVER_GRACE_PERIOD,
+    SERVER_MODE,
+    STATS_LOG_INTERVAL,
+)
+from .models.model_loader import loader
+from .third_parties.statbotics_dataset import statbotics_dataset
+from .third_parties.upstream import upstream_stats
+
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+SERVICE_NAME = prediction_pb2.DESCRIPTOR.services_by_name["Matchpoint"].full_name
 
 class PredictorServicer(prediction_pb2_grpc.MatchpointServicer):
     """
@@ -50,28 +88,8 @@ class PredictorServicer(prediction_pb2_grpc.MatchpointServicer):
                 )
                 return prediction_pb2.MatchPredictionResponse()
 
-            # Convert the SHAP analysis data object to its protobuf representation
-            shap_proto = prediction_pb2.ShapAnalysis(
-                base_value=prediction_object.shap_analysis.base_value,
-                values=prediction_object.shap_analysis.values,
-                feature_names=prediction_object.shap_analysis.feature_names,
-                feature_data=prediction_object.shap_analysis.feature_data,
-            )
-
             # Build and return the final protobuf response
-            return prediction_pb2.MatchPredictionResponse(
-                match_key=prediction_object.match_key,
-                predicted_winner=prediction_object.predicted_winner,
-                win_probability=prediction_pb2.WinProbability(
-                    red=prediction_object.win_probability["red"],
-                    blue=prediction_object.win_probability["blue"],
-                ),
-                predicted_scores=prediction_pb2.PredictedScores(
-                    red=prediction_object.predicted_scores["red"],
-                    blue=prediction_object.predicted_scores["blue"],
-                ),
-                shap_analysis=shap_proto
-            )
+            return self._prediction_proto(prediction_object)
         except ValueError as e:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             context.set_details(str(e))
@@ -84,44 +102,56 @@ class PredictorServicer(prediction_pb2_grpc.MatchpointServicer):
         
     def SimulatePlayoffs(self, request, context):
         """
-        Handles a gRPC request for predicting all matches in an event.
+        Handles a gRPC request for simulating an event's playoffs.
 
         Args:
-            request: The incoming gRPC request (prediction_pb2.EventPredictionRequest).
+            request: The incoming gRPC request (prediction_pb2.SimulationRequest).
             context: The gRPC context object.
 
         Returns:
-            A prediction_pb2.EventPredictionResponse containing a list of match predictions.
+            A prediction_pb2.SimulationResult with each alliance's championship
+            and round advancement probabilities.
         """
         event_key = request.event_key
-        n_sims = request.n_sims
+        n_sims = request.n_sims or SIMULATION_DEFAULT_SIMS
+        seed = request.seed if request.HasField("seed") else None
         print(f"Received playoff simulation request event: {event_key}")
 
+        error = self._validate_simulation_request(request, n_sims)
+        if error:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(error)
+            return prediction_pb2.SimulationResult()
+
         try:
-            # Call the batch prediction method
             sim = Simulator()
-            alliance = sim.simulate_n_playoffs(event_key, 1000)
+            if request.exact:
+                odds = sim.compute_exact_playoff_odds(
+                    event_key, bracket=request.bracket_format or None
+                )
+                print(odds)
+                return self._build_simulation_result(odds, total_simulations=0, exact=True)
+
+            alliance = sim.simulate_n_playoffs(
+                event_key, n_sims, seed=seed, bracket=request.bracket_format or None
+            )
             # alliance = alliance.to_json()
             print(alliance)
-            response = prediction_pb2.SimulationResult()
-            response.event_key = alliance.event_key
-            response.simulation_metadata.total_simulations_run = alliance._total_sims
-            
-            new_ts = datetime.now(timezone.utc)   # preferible: timezone-aware UTC
-            response.simulation_metadata.timestamp_utc.FromDatetime(new_ts)
-            
-            for result in alliance.results:
-                result_response = prediction_pb2.SimulationResult.Results()
-                result_response.alliance_number = result["alliance_number"]
-                for team in result["teams"]:
-                    result_response.teams.append(int(team))
-                result_response.wins = result["wins"]
-                result_response.win_probability = result["win_probability"]
-                response.results.append(result_response)
-            
+            response = self._build_simulation_result(
+                alliance,
+                total_simulations=alliance.total_simulations,
+                exact=False,
+                intervals=alliance.confidence_intervals(SIMULATION_CI_Z),
+                stop_reason="max_sims",
+            )
             print(response)
             return response
 
+        except ValueError as e:
+            # A known bracket format that does not fit the event (see Simulator._resolve_plan)
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return prediction_pb2.SimulationResult()
         except Exception as e:
             template = "An exception of type {0} occurred when simulating. Arguments:\n{1!r}"
             message = template.format(type(e).__name__, e.args)
@@ -134,9 +164,307 @@ class PredictorServicer(prediction_pb2_grpc.MatchpointServicer):
             # Optionally, print the full traceback for more context
             traceback.print_exc()
             context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details("An internal server error occurred during batch prediction.")
-            return prediction_pb2.EventPredictionResponse()
+            context.set_details("An internal server error occurred during simulation.")
+            return prediction_pb2.SimulationResult()
         
+    def StreamSimulatePlayoffs(self, request, context):
+        """
+        Handles a server-streaming gRPC request for a playoff simulation.
+
+        Yields a SimulationResult snapshot every `snapshot_interval` simulations,
+        including confidence intervals. The run ends after `n_sims`, once every
+        interval is narrower than `tolerance`, or just before the call's
+        deadline; the last snapshot carries the stop reason.
+
+        Args:
+            request: The incoming gRPC request (prediction_pb2.SimulationRequest).
+            context: The gRPC context object.
+
+        Yields:
+            prediction_pb2.SimulationResult messages.
+        """
+        event_key = request.event_key
+        n_sims = request.n_sims or SIMULATION_DEFAULT_SIMS
+        seed = request.seed if request.HasField("seed") else None
+        print(f"Received streaming playoff simulation request event: {event_key}")
+
+        error = self._validate_simulation_request(request, n_sims)
+        if error:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(error)
+            return
+
+        try:
+            sim = Simulator()
+            if request.exact:
+                odds = sim.compute_exact_playoff_odds(
+                    event_key, bracket=request.bracket_format or None
+                )
+                yield self._build_simulation_result(odds, total_simulations=0, exact=True)
+                return
+
+            snapshots = sim.iter_simulate_n_playoffs(
+                event_key,
+                n_sims,
+                snapshot_interval=request.snapshot_interval or SIMULATION_SNAPSHOT_INTERVAL,
+                tolerance=request.tolerance,
+                seed=seed,
+                bracket=request.bracket_format or None,
+                time_remaining=context.time_remaining,
+            )
+            for tracker, stop_reason in snapshots:
+                if not context.is_active():
+                    print(f"Client cancelled streaming simulation for {event_key}")
+                    return
+                yield self._build_simulation_result(
+                    tracker,
+                    total_simulations=tracker.total_simulations,
+                    exact=False,
+                    intervals=tracker.confidence_intervals(SIMULATION_CI_Z),
+                    stop_reason=stop_reason or "",
+                )
+            print(f"Streaming simulation for {event_key} finished: {tracker.total_simulations} sims, {stop_reason}")
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+        except Exception as e:
+            print(f"FATAL ERROR during streaming simulation for {event_key}: {e}")
+            traceback.print_exc()
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("An internal server error occurred during simulation.")
+
+    def SimulateQualifications(self, request, context):
+        """
+        Handles a gRPC request for predicting an event's final qualification rankings.
+
+        Args:
+            request: The incoming gRPC request (prediction_pb2.QualificationSimulationRequest).
+            context: The gRPC context object.
+
+        Returns:
+            A prediction_pb2.QualificationSimulationResult with the rank
+            distribution of every team, ordered by expected rank.
+        """
+        event_key = request.event_key
+        n_sims = request.n_sims or SIMULATION_DEFAULT_SIMS
+        seed = request.seed if request.HasField("seed") else None
+        top_n = request.top_n or QUALS_DEFAULT_TOP_N
+        print(f"Received qualification simulation request event: {event_key}")
+
+        if n_sims > SIMULATION_MAX_SIMS:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"n_sims exceeds the limit of {SIMULATION_MAX_SIMS}")
+            return prediction_pb2.QualificationSimulationResult()
+
+        try:
+            rankings = Simulator().simulate_qualifications(event_key, n_sims, seed=seed, top_n=top_n)
+
+            response = prediction_pb2.QualificationSimulationResult(
+                event_key=event_key,
+                remaining_matches=rankings.remaining_matches,
+                top_n=rankings.top_n,
+            )
+            response.simulation_metadata.total_simulations_run = rankings.total_simulations
+            response.simulation_metadata.timestamp_utc.FromDatetime(datetime.now(timezone.utc))
+            response.simulation_metadata.stop_reason = "max_sims"
+            for item in rankings.results:
+                response.rankings.append(
+                    prediction_pb2.QualificationSimulationResult.TeamRanking(**item)
+                )
+            return response
+
+        except Exception as e:
+            print(f"FATAL ERROR during qualification simulation for {event_key}: {e}")
+            traceback.print_exc()
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("An internal server error occurred during simulation.")
+            return prediction_pb2.QualificationSimulationResult()
+
+    def OptimizeAlliancePick(self, request, context):
+        """
+        Handles a gRPC request to rank the candidates for the next alliance pick.
+
+        Args:
+            request: The incoming gRPC request (prediction_pb2.AllianceSelectionRequest).
+            context: The gRPC context object.
+
+        Returns:
+            A prediction_pb2.AllianceSelectionResult with every candidate and
+            the championship probability it leaves the picking alliance.
+        """
+        event_key = request.event_key
+        alliances = [list(alliance.teams) for alliance in request.alliances]
+        print(f"Received alliance selection request event: {event_key}")
+
+        error = self._validate_selection_request(request, alliances)
+        if error:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(error)
+            return prediction_pb2.AllianceSelectionResult()
+
+        try:
+            selection = Simulator().optimize_alliance_pick(
+                event_key,
+                ranked_teams=list(request.ranked_teams),
+                alliances=alliances,
+                bracket=request.bracket_format or None,
+                beam_width=request.beam_width or 1,
+                n_sims=request.n_sims,
+                seed=request.seed if request.HasField("seed") else None,
+            )
+
+            response = prediction_pb2.AllianceSelectionResult(
+                event_key=selection.event_key,
+                alliance_number=selection.alliance_number,
+                pick_number=selection.pick_number,
+                exact=selection.exact,
+                lineups_evaluated=selection.lineups_evaluated,
+                model_evaluations=selection.model_evaluations,
+            )
+            for candidate in selection.candidates:
+                response.candidates.append(
+                    prediction_pb2.AllianceSelectionResult.Candidate(
+                        team=candidate.team,
+                        win_probability=candidate.win_probability,
+                        projected_alliance=candidate.projected_alliance,
+                    )
+                )
+            return response
+
+        except ValueError as e:
+            # An invalid lineup, a finished draft or too few teams left to pick
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return prediction_pb2.AllianceSelectionResult()
+        except Exception as e:
+            print(f"FATAL ERROR during alliance selection for {event_key}: {e}")
+            traceback.print_exc()
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("An internal server error occurred during alliance selection.")
+            return prediction_pb2.AllianceSelectionResult()
+
+    @staticmethod
+    def _validate_selection_request(request, alliances: list) -> Optional[str]:
+        """Returns an error message if the alliance selection request is invalid, else None."""
+        if request.bracket_format and request.bracket_format not in BRACKET_FORMATS:
+            return f"Unknown bracket format '{request.bracket_format}'"
+        num_alliances = (
+            BRACKET_FORMATS[request.bracket_format].num_alliances
+            if request.bracket_format
+            else SELECTION_DEFAULT_ALLIANCES
+        )
+        if len(alliances) > num_alliances:
+            return f"At most {num_alliances} alliances can be given"
+        if any(len(alliance) > 3 for alliance in alliances):
+            return "Alliances have at most 3 teams"
+        picked = [team for alliance in alliances for team in alliance]
+        if len(picked) != len(set(picked)):
+            return "A team appears in more than one alliance slot"
+        if len(alliances) == num_alliances and all(len(alliance) == 3 for alliance in alliances):
+            return "Alliance selection is already complete"
+        if request.beam_width > SELECTION_MAX_BEAM_WIDTH:
+            return f"beam_width exceeds the limit of {SELECTION_MAX_BEAM_WIDTH}"
+        if request.n_sims > SIMULATION_MAX_SIMS:
+            return f"n_sims exceeds the limit of {SIMULATION_MAX_SIMS}"
+        return None
+
+    @staticmethod
+    def _validate_simulation_request(request, n_sims: int) -> Optional[str]:
+        """Returns an error message if the simulation request is invalid, else None."""
+        if request.bracket_format and request.bracket_format not in BRACKET_FORMATS:
+            return f"Unknown bracket format '{request.bracket_format}'"
+        if n_sims > SIMULATION_MAX_SIMS:
+            return f"n_sims exceeds the limit of {SIMULATION_MAX_SIMS}"
+        if request.tolerance < 0:
+            return "tolerance must be non-negative"
+        return None
+
+    @staticmethod
+    def _shap_proto(shap_result) -> prediction_pb2.ShapAnalysis:
+        """Converts a ShapResult into its protobuf message."""
+        return prediction_pb2.ShapAnalysis(
+            base_value=shap_result.base_value,
+            values=shap_result.values,
+            feature_names=shap_result.feature_names,
+            feature_data=shap_result.feature_data,
+        )
+
+    @staticmethod
+    def _prediction_proto(prediction: MatchPrediction) -> prediction_pb2.MatchPredictionResponse:
+        """Converts a MatchPrediction into its protobuf message."""
+        return prediction_pb2.MatchPredictionResponse(
+            match_key=prediction.match_key,
+            predicted_winner=prediction.predicted_winner,
+            win_probability=prediction_pb2.WinProbability(
+                red=prediction.win_probability["red"],
+                blue=prediction.win_probability["blue"],
+            ),
+            predicted_scores=prediction_pb2.PredictedScores(
+                red=prediction.predicted_scores["red"],
+                blue=prediction.predicted_scores["blue"],
+            ),
+            # Event predictions only carry it when the request sets include_shap
+            shap_analysis=(
+                PredictorServicer._shap_proto(prediction.shap_analysis)
+                if prediction.shap_analysis is not None
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _event_prediction_response(
+        prediction_list: list[MatchPrediction],
+    ) -> prediction_pb2.EventPredictionResponse:
+        """Converts the predictions of an event into the batch response message."""
+        response = prediction_pb2.EventPredictionResponse()
+        for prediction_obj in prediction_list:
+            response.predictions.append(PredictorServicer._prediction_proto(prediction_obj))
+        return response
+
+    @staticmethod
+    def _build_simulation_result(
+        result,
+        total_simulations: int,
+        exact: bool,
+        intervals=None,
+        stop_reason: str = "",
+    ):
+        """
+        Converts a SimulationTracker or PlayoffOdds into a SimulationResult message.
+        """
+        response = prediction_pb2.SimulationResult()
+        response.event_key = result.event_key
+        response.simulation_metadata.total_simulations_run = total_simulations
+        response.simulation_metadata.exact = exact
+        response.simulation_metadata.stop_reason = stop_reason
+        response.round_names.extend(result.round_names)
+
+        new_ts = datetime.now(timezone.utc)   # preferible: timezone-aware UTC
+        response.simulation_metadata.timestamp_utc.FromDatetime(new_ts)
+
+        for i, result_item in enumerate(result.results):
+            result_response = prediction_pb2.SimulationResult.Results()
+            result_response.alliance_number = result_item["alliance_number"]
+            for team in result_item["teams"]:
+                result_response.teams.append(int(team))
+            result_response.wins = result_item["wins"]
+            result_response.win_probability = result_item["win_probability"]
+            result_response.round_advancement.extend(result_item.get("round_advancement", []))
+            if intervals is not None and i < len(intervals):
+                result_response.ci_low, result_response.ci_high = intervals[i]
+            result_response.finalist_count = result_item.get("finalist_count", 0)
+            result_response.elimination_round_counts.extend(
+                result_item.get("elimination_round_counts", [])
+            )
+            response.results.append(result_response)
+
+        for matchup in getattr(result, "final_matchups", []):
+            response.final_matchups.append(
+                prediction_pb2.SimulationResult.FinalMatchup(**matchup)
+            )
+
+        return response
+
     def PredictAllEventMatches(self, request, context):
         """
         Handles a gRPC request for predicting all matches in an event.
@@ -153,28 +481,11 @@ class PredictorServicer(prediction_pb2_grpc.MatchpointServicer):
 
         try:
             # Call the batch prediction method
-            prediction_list: list[MatchPrediction] = self.predictor.predict_all_matches_for_event(event_key)
-
-            # Create the main response message
-            response = prediction_pb2.EventPredictionResponse()
-            # Iterate over the Python objects and convert them to protobuf messages
-            for prediction_obj in prediction_list:
-                proto_prediction = prediction_pb2.MatchPredictionResponse(
-                    match_key=prediction_obj.match_key,
-                    predicted_winner=prediction_obj.predicted_winner,
-                    win_probability=prediction_pb2.WinProbability(
-                        red=prediction_obj.win_probability['red'],
-                        blue=prediction_obj.win_probability['blue']
-                    ),
-                    predicted_scores=prediction_pb2.PredictedScores(
-                        red=prediction_obj.predicted_scores['red'],
-                        blue=prediction_obj.predicted_scores['blue']
-                    )
-                    # Note: SHAP analysis is not included in the batch response for efficiency
-                )
-                response.predictions.append(proto_prediction)
-            
-            return response
+            prediction_list: list[MatchPrediction] = self.predictor.predict_all_matches_for_event(
+                event_key, include_shap=request.include_shap
+            )
+
+            return self._event_prediction_response(prediction_list)
 
         except Exception as e:
             print(f"FATAL ERROR during batch processing for {event_key}: {e}")
@@ -184,16 +495,212 @@ class PredictorServicer(prediction_pb2_grpc.MatchpointServicer):
         
         
 
+def _create_server(reuse_port: bool) -> tuple:
+    """
+    Builds (but does not start) the gRPC server with the Matchpoint and
+    health services; health reports NOT_SERVING until set_serving.
+    """
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=SERVER_THREADS),
+        options=[("grpc.so_reuseport", 1 if reuse_port else 0)],
+    )
+    prediction_pb2_grpc.add_MatchpointServicer_to_server(PredictorServicer(), server)
+    health_servicer = health.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    _set_health(health_servicer, health_pb2.HealthCheckResponse.NOT_SERVING)
+    server.add_insecure_port(f"[::]:{SERVER_PORT}")
+    return server, health_servicer
+
+def _set_health(health_servicer, status) -> None:
+    for service in ("", SERVICE_NAME):
+        health_servicer.set(service, status)
+
+def _load_dataset() -> float:
+    """Maps the Statbotics dataset (converting the CSV if needed); returns the seconds taken."""
+    started = time.perf_counter()
+    try:
+        statbotics_dataset.load()
+    except (OSError, KeyError) as e:
+        print(f"WARN: Statbotics dataset not loaded: {e}")
+    return time.perf_counter() - started
+
+def _warm_up() -> dict:
+    """Warms the models up and maps the Statbotics dataset; returns the startup timings."""
+    timings = dict(loader.warm_up())
+    timings["dataset"] = _load_dataset()
+    return timings
+
+def _startup_report(started: float, timings: dict) -> str:
+    return (
+        f"ready in {(time.perf_counter() - started + _IMPORT_SECONDS) * 1e3:.0f} ms "
+        f"(imports {_IMPORT_SECONDS * 1e3:.0f} ms, model load {timings['load'] * 1e3:.0f} ms, "
+        f"compile {timings['compile'] * 1e3:.0f} ms, warm-up {timings['warm_up'] * 1e3:.0f} ms, "
+        f"dataset {timings['dataset'] * 1e3:.0f} ms)"
+    )
+
+def _stats_report() -> dict:
+    """
+    The process's counters: every cache namespace plus the prediction
+    cache, the upstream clients (with their coalesced requests) and the
+    metrics histograms (inference queue depth and batch size, singleflight
+    callers).
+    """
+    caches = cache.stats()
+    caches.update({f"prediction_{name}": stats for name, stats in prediction_cache.stats().items()})
+    return {"caches": caches, "upstream": upstream_stats(), "histograms": metrics.snapshot()}
+
+def _start_stats_log(label: str) -> None:
+    """Prints _stats_report as one JSON line every STATS_LOG_INTERVAL seconds, from a daemon thread."""
+    if STATS_LOG_INTERVAL <= 0:
+        return
+
+    def log_stats() -> None:
+        while True:
+            time.sleep(STATS_LOG_INTERVAL)
+            try:
+                print(f"{label} stats {json.dumps(_stats_report(), separators=(',', ':'))}", flush=True)
+            except Exception as e:
+                print(f"WARN: Could not report stats: {e}")
+
+    threading.Thread(target=log_stats, name="stats-log", daemon=True).start()
+
 def serve():
     """
     Initializes and starts the gRPC server.
+
+    The standard gRPC health service reports NOT_SERVING until the models are
+    loaded and warmed up, then SERVING. With SERVER_WORKERS > 1 the server
+    runs as a pre-forked pool instead (see serve_prefork). SERVER_MODE="aio"
+    serves with grpc.aio (see aio_server) instead of a handler thread pool.
+    Every serving process logs its counters as one JSON line every
+    STATS_LOG_INTERVAL seconds (see _stats_report).
     """
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    prediction_pb2_grpc.add_MatchpointServicer_to_server(PredictorServicer(), server)
-    server.add_insecure_port("[::]:50051")
-    print("gRPC Matchpoint server started on port 50051.")
+    if SERVER_WORKERS > 1:
+        serve_prefork(SERVER_WORKERS)
+        return
+
+    started = time.perf_counter()
+    _start_stats_log("Matchpoint")
+    if SERVER_MODE == "aio":
+        from .aio_server import serve_async
+
+        print(f"gRPC Matchpoint aio server starting on port {SERVER_PORT}, warming up.")
+        asyncio.run(serve_async(
+            reuse_port=False,
+            on_ready=lambda timings: print(f"Matchpoint {_startup_report(started, timings)}"),
+        ))
+        return
+
+    server, health_servicer = _create_server(reuse_port=False)
+    server.start()
+    print(f"gRPC Matchpoint server started on port {SERVER_PORT}, warming up.")
+
+    timings = _warm_up()
+    _set_health(health_servicer, health_pb2.HealthCheckResponse.SERVING)
+    print(f"Matchpoint {_startup_report(started, timings)}")
+    server.wait_for_termination()
+
+def _serve_worker(worker: int, n_threads: int) -> None:
+    """Body of a forked worker: its own gRPC server on the shared port."""
+    # gRPC, OpenMP and numba threads must be created after the fork, so the
+    # worker builds its server and warms the models up itself
+    started = time.perf_counter()
+    loader.set_threads(n_threads)
+    _start_stats_log(f"Matchpoint worker {worker}")
+
+    def report(timings: dict) -> None:
+        print(
+            f"Matchpoint worker {worker} (pid {os.getpid()}) ready in "
+            f"{(time.perf_counter() - started) * 1e3:.0f} ms (warm-up {timings['warm_up'] * 1e3:.0f} ms)"
+        )
+
+    if SERVER_MODE == "aio":
+        from .aio_server import serve_async
+
+        asyncio.run(serve_async(reuse_port=True, on_ready=report))
+        return
+
+    server, health_servicer = _create_server(reuse_port=True)
+
+    def stop(signum, frame):
+        server.stop(SERVER_GRACE_PERIOD)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
     server.start()
+    timings = _warm_up()
+    _set_health(health_servicer, health_pb2.HealthCheckResponse.SERVING)
+    report(timings)
     server.wait_for_termination()
 
+def serve_prefork(workers: int) -> None:
+    """
+    Runs `workers` forked serving processes on one port.
+
+    The parent parses the models and maps the Statbotics dataset once,
+    before forking, so every worker shares their memory copy-on-write
+    instead of holding its own copy. Each
+    worker binds the port with SO_REUSEPORT, letting the kernel spread
+    connections across them, so GIL-bound work runs in parallel on separate
+    cores. Dead workers are restarted (after SERVER_RESTART_BACKOFF seconds
+    if they crashed right after starting); SIGTERM/SIGINT stop them all.
+    """
+    loader.model_version  # Loads the models in the parent
+    timings = loader.startup_timings
+    dataset_seconds = _load_dataset()
+    print(
+        f"Models loaded (imports {_IMPORT_SECONDS * 1e3:.0f} ms, model load {timings['load'] * 1e3:.0f} ms, "
+        f"compile {timings['compile'] * 1e3:.0f} ms, dataset {dataset_seconds * 1e3:.0f} ms), "
+        f"forking {workers} workers."
+    )
+    # Keep the collector from touching (and so copying) the inherited objects
+    gc.freeze()
+
+    context = multiprocessing.get_context("fork")
+    n_threads = max(1, (os.cpu_count() or 1) // workers)
+    processes = {}
+    spawned_at = {}
+    stopping = False
+
+    def spawn(worker: int) -> None:
+        process = context.Process(
+            target=_serve_worker, args=(worker, n_threads), name=f"matchpoint-worker-{worker}"
+        )
+        process.start()
+        processes[worker] = process
+        spawned_at[worker] = time.monotonic()
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for worker in range(workers):
+        spawn(worker)
+    print(f"gRPC Matchpoint server started on port {SERVER_PORT} with {workers} workers, warming up.")
+
+    while processes:
+        multiprocessing.connection.wait([process.sentinel for process in processes.values()])
+        for worker, process in list(processes.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del processes[worker]
+            if stopping:
+                continue
+            print(f"WARN: worker {worker} (pid {process.pid}) exited with code {process.exitcode}, restarting.")
+            lifetime = time.monotonic() - spawned_at[worker]
+            if lifetime < SERVER_RESTART_BACKOFF:
+                time.sleep(SERVER_RESTART_BACKOFF - lifetime)
+            if not stopping:
+                spawn(worker)
+    print("Matchpoint server stopped.")
+
 if __name__ == "__main__":
-    serve()
\ No newline at end of file
+    serve()
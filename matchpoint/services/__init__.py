@@ -1,2 +1,6 @@
-from .mp_prediction import MatchpointPredictor
-from .simulator import Simulator
\ No newline at end of file
+from .._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "MatchpointPredictor": ".mp_prediction",
+    "Simulator": ".simulator",
+})
@@ -0,0 +1,350 @@
+# bbe/matchpoint/services/alliance_selection.py
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from ..cache import TTLCache
+from ..config import SIMULATION_BATCH_SIZE, SELECTION_MATCHUP_PAIRINGS
+from ..domain.bracket import CompiledBracket
+from ..domain.features import TeamStatsMatrix
+from ..domain.selection import PickCandidate
+from ..third_parties.fetcher import Fetcher
+from .playoff_engine import VectorizedPlayoffEngine, ExactPlayoffEngine
+
+Lineup = List[List[int]]
+Pairing = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+
+class MatchupProbabilityCache:
+    """
+    Red-win probabilities of alliance triples against each other.
+
+    Candidate lineups only differ in a few alliances, so most pairings are
+    shared between them. Missing pairings of a whole set of lineups are
+    assembled from the pre-fetched event data and scored with a single
+    classifier call (see prefetch). Keys keep the order of the teams inside
+    each alliance because the features are positional (red1, red2, red3).
+    At most `maxsize` pairings are kept, the least recently used dropped
+    first.
+    """
+
+    def __init__(
+        self,
+        predictor,
+        event_week: int,
+        all_sb_stats: dict,
+        all_tba_stats: dict,
+        maxsize: int = SELECTION_MATCHUP_PAIRINGS,
+    ):
+        self.predictor = predictor
+        self.event_week = event_week
+        self.all_sb_stats = all_sb_stats
+        self.all_tba_stats = all_tba_stats
+        self.team_stats = TeamStatsMatrix.from_team_stats(all_sb_stats, all_tba_stats)
+        self._probs = TTLCache(maxsize=maxsize)
+        # Held from the cache lookups to the insert, so concurrent requests
+        # never score the same pairings twice
+        self._lock = threading.Lock()
+        self.model_evaluations = 0
+
+    @staticmethod
+    def _pairings(alliances: Lineup):
+        keys = [tuple(alliance) for alliance in alliances]
+        for i in range(len(keys)):
+            for j in range(i + 1, len(keys)):
+                yield i, j, (keys[i], keys[j])
+
+    def prefetch(self, lineups: Iterable[Lineup]) -> Dict[Pairing, float]:
+        """
+        Scores every pairing of `lineups` that is not cached yet.
+
+        Returns:
+            dict: The probability of every pairing of `lineups`, for matrix
+                  (the cache may drop some of them before they are read).
+        """
+        with self._lock:
+            probs: Dict[Pairing, float] = {}
+            missing = set()
+            for alliances in lineups:
+                for _, _, key in self._pairings(alliances):
+                    if key in probs or key in missing:
+                        continue
+                    p = self._probs.get(key)
+                    if p is None:
+                        missing.add(key)
+                    else:
+                        probs[key] = p
+            if not missing:
+                return probs
+
+            missing = sorted(missing)
+            team_rows = self.team_stats.rows(
+                team for red, blue in missing for team in (*red[:3], *blue[:3])
+            ).reshape(-1, 6)
+            features = Fetcher.gather_match_features(self.team_stats, team_rows, self.event_week)
+            prob_red_wins = self.predictor.predict_red_win_probabilities(features)
+
+            for key, p in zip(missing, prob_red_wins.tolist()):
+                self._probs.set(key, p)
+                probs[key] = p
+            self.model_evaluations += len(missing)
+            return probs
+
+    def matrix(self, alliances: Lineup, probs: Dict[Pairing, float]) -> np.ndarray:
+        """
+        Builds the alliance-vs-alliance matrix of a lineup from the
+        probabilities prefetch returned, in the layout of
+        Simulator.precompute_win_probabilities.
+        """
+        num_alliances = len(alliances)
+        win_probs = np.full((num_alliances, num_alliances), 0.5, dtype=np.float64)
+        for i, j, key in self._pairings(alliances):
+            p = probs[key]
+            win_probs[i, j] = p
+            win_probs[j, i] = 1.0 - p
+        return win_probs
+
+
+class AllianceSelectionOptimizer:
+    """
+    Ranks the teams an alliance captain can pick by championship odds.
+
+    The draft follows the FRC serpentine order (first picks 1 -> N, second
+    picks N -> 1). An alliance without a captain takes the highest-ranked
+    available team when its turn comes, so a higher seed picking a future
+    captain moves everyone below up, as at a real event.
+
+    Every candidate lineup is completed with the other alliances picking the
+    strongest available team, and the resulting bracket is scored exactly
+    (ExactPlayoffEngine) or, for brackets too large for exact mode or when
+    n_sims is given, by Monte Carlo on draws shared by all lineups (common
+    random numbers keep the comparison between candidates low-noise). The
+    draws are generated batch_size rows at a time from a fixed seed per
+    batch, so memory does not grow with n_sims and every lineup still sees
+    the same numbers.
+    The captain's own later picks are refined with a beam search: the
+    beam_width best lineups are expanded with every option of the next pick.
+    """
+
+    ALLIANCE_SIZE = 3
+
+    def __init__(
+        self,
+        ranked_teams: Sequence[int],
+        alliances: Sequence[Sequence[int]],
+        strength: Dict[int, float],
+        matchups: MatchupProbabilityCache,
+        plan: CompiledBracket,
+        shrink_alpha: float = 0.0,
+        n_sims: int = 0,
+        seed: Optional[int] = None,
+        batch_size: int = SIMULATION_BATCH_SIZE,
+    ):
+        """
+        Args:
+            ranked_teams (Sequence[int]): Every team at the event, in qualification rank order.
+            alliances (Sequence[Sequence[int]]): Alliances formed so far, in seed
+                                                 order with the captain first.
+            strength (Dict[int, float]): Value used by the other alliances to
+                                         pick (e.g. EPA total points).
+            matchups (MatchupProbabilityCache): Shared triple-vs-triple probabilities.
+            plan (CompiledBracket): The playoff bracket.
+            shrink_alpha (float): See VectorizedPlayoffEngine.shrink_probability_matrix.
+            n_sims (int): Monte Carlo simulations per lineup; 0 = exact when possible.
+            seed (Optional[int]): Seed for the shared draws.
+            batch_size (int): Simulations drawn and scored at once.
+
+        Raises:
+            ValueError: If there are more alliances than the bracket seeds, an
+                        alliance is over-full or a team appears twice.
+        """
+        self.num_alliances = plan.num_alliances
+        if len(alliances) > self.num_alliances:
+            raise ValueError(f"{len(alliances)} alliances given; '{plan.name}' seeds {self.num_alliances}")
+        picked = [team for alliance in alliances for team in alliance]
+        if len(picked) != len(set(picked)):
+            raise ValueError("A team appears in more than one alliance slot")
+        if any(len(alliance) > self.ALLIANCE_SIZE for alliance in alliances):
+            raise ValueError(f"Alliances have at most {self.ALLIANCE_SIZE} teams")
+
+        self.ranked_teams = list(ranked_teams)
+        self.alliances: Lineup = [list(alliance) for alliance in alliances]
+        self.alliances += [[] for _ in range(self.num_alliances - len(self.alliances))]
+        self.strength = strength
+        self.matchups = matchups
+        self.plan = plan
+        self.shrink_alpha = shrink_alpha
+        self.exact = n_sims == 0 and len(plan.steps) <= ExactPlayoffEngine.MAX_MATCHES
+        self.n_sims = max(n_sims, 1)
+        self.batch_size = batch_size
+        # One seed per batch, fixed for the whole search (common random numbers)
+        self._batch_seeds = np.random.SeedSequence(seed).spawn(-(-self.n_sims // batch_size))
+        self._draws: Optional[np.ndarray] = None
+        self.lineups_evaluated = 0
+
+        self._pick_order = [
+            (alliance, pick)
+            for pick in range(1, self.ALLIANCE_SIZE)
+            for alliance in (
+                range(self.num_alliances) if pick % 2 == 1 else reversed(range(self.num_alliances))
+            )
+        ]
+
+    # -----------------------
+    # Draft
+    # -----------------------
+    def _next_slot(self, alliances: Lineup) -> Optional[Tuple[int, int]]:
+        """(alliance index, pick number) of the next selection, or None when done."""
+        for alliance, pick in self._pick_order:
+            if len(alliances[alliance]) <= pick:
+                return alliance, pick
+        return None
+
+    def _available(self, alliances: Lineup) -> List[int]:
+        taken = {team for alliance in alliances for team in alliance}
+        return [team for team in self.ranked_teams if team not in taken]
+
+    def _advance(self, alliances: Lineup, stop_at: Optional[int] = None) -> Optional[int]:
+        """
+        Plays the draft in place, every alliance taking the strongest
+        available team, until it is `stop_at`'s turn.
+
+        Returns:
+            Optional[int]: The pick number `stop_at` is about to make, or None
+                           once the draft is complete.
+        """
+        while True:
+            slot = self._next_slot(alliances)
+            if slot is None:
+                return None
+            alliance, pick = slot
+            available = self._available(alliances)
+            if not alliances[alliance] and available:
+                alliances[alliance].append(available.pop(0))
+            if alliance == stop_at:
+                return pick
+            if not available:
+                raise ValueError("Not enough teams left to complete the alliances")
+            alliances[alliance].append(
+                max(available, key=lambda team: self.strength.get(team, 0.0))
+            )
+
+    def _completed(self, alliances: Lineup) -> Lineup:
+        lineup = [list(alliance) for alliance in alliances]
+        self._advance(lineup)
+        return lineup
+
+    # -----------------------
+    # Scoring
+    # -----------------------
+    def _draw_batches(self) -> Iterator[np.ndarray]:
+        """
+        The Monte Carlo draws, batch_size rows at a time. Each batch is
+        regenerated from its seed, except a single batch, which is kept.
+        """
+        if self._draws is not None:
+            yield self._draws
+            return
+        for k, seed_seq in enumerate(self._batch_seeds):
+            size = min(self.batch_size, self.n_sims - k * self.batch_size)
+            draws = np.random.default_rng(seed_seq).random((size, self.plan.n_draws))
+            if len(self._batch_seeds) == 1:
+                self._draws = draws
+            yield draws
+
+    def score(self, lineups: List[Lineup], alliance_index: int) -> np.ndarray:
+        """Championship probability of `alliance_index` under each complete lineup."""
+        probs = self.matchups.prefetch(lineups)
+        prob_matrices = [
+            VectorizedPlayoffEngine.shrink_probability_matrix(
+                self.matchups.matrix(alliances, probs), self.shrink_alpha
+            )
+            for alliances in lineups
+        ]
+        self.lineups_evaluated += len(lineups)
+        if self.exact:
+            return np.array(
+                [
+                    ExactPlayoffEngine.elimination_distribution(prob_matrix, self.plan)[alliance_index, -1]
+                    for prob_matrix in prob_matrices
+                ],
+                dtype=np.float64,
+            )
+
+        # Batches outermost, so each one is drawn once per call and shared by every lineup
+        wins = np.zeros(len(lineups), dtype=np.int64)
+        for draws in self._draw_batches():
+            for k, prob_matrix in enumerate(prob_matrices):
+                champions = VectorizedPlayoffEngine.simulate_batch(prob_matrix, draws, self.plan)
+                wins[k] += np.count_nonzero(champions == alliance_index)
+        return wins / self.n_sims
+
+    # -----------------------
+    # Search
+    # -----------------------
+    def optimize(self, beam_width: int = 1) -> Tuple[int, int, List[PickCandidate]]:
+        """
+        Scores every candidate for the next pick of the draft.
+
+        Args:
+            beam_width (int): Lineups kept per level when refining the
+                              captain's later picks (1 = greedy).
+
+        Raises:
+            ValueError: If every alliance is already complete.
+
+        Returns:
+            tuple: (alliance index, pick number, candidates sorted by
+                   championship probability, best first).
+        """
+        root = [list(alliance) for alliance in self.alliances]
+        slot = self._next_slot(root)
+        if slot is None:
+            raise ValueError("Alliance selection is already complete")
+        target = slot[0]
+        pick = self._advance(root, stop_at=target)
+
+        def expand(state: Lineup) -> List[Lineup]:
+            children = []
+            for team in self._available(state):
+                child = [list(alliance) for alliance in state]
+                child[target].append(team)
+                children.append(child)
+            return children
+
+        # Every candidate for this pick, with the rest of the draft played greedily
+        beam = [(child[target][pick], child) for child in expand(root)]
+        if not beam:
+            raise ValueError("No teams left to pick")
+        completions = [self._completed(child) for _, child in beam]
+        scores = self.score(completions, target)
+        best = {
+            team: (score, tuple(lineup[target]))
+            for (team, _), score, lineup in zip(beam, scores, completions)
+        }
+        ranked = np.argsort(-scores, kind="stable")[: max(beam_width, 1)]
+        beam = [beam[k] for k in ranked]
+
+        # Refine the captain's later picks for the most promising candidates
+        while beam:
+            entries = []
+            for team, state in beam:
+                state = [list(alliance) for alliance in state]
+                if self._advance(state, stop_at=target) is None:
+                    continue
+                entries.extend((team, child) for child in expand(state))
+            if not entries:
+                break
+            completions = [self._completed(child) for _, child in entries]
+            scores = self.score(completions, target)
+            for (team, _), score, lineup in zip(entries, scores, completions):
+                if score > best[team][0]:
+                    best[team] = (score, tuple(lineup[target]))
+            ranked = np.argsort(-scores, kind="stable")[: max(beam_width, 1)]
+            beam = [entries[k] for k in ranked]
+
+        candidates = [
+            PickCandidate(team=team, win_probability=round(float(score), 6), projected_alliance=lineup)
+            for team, (score, lineup) in best.items()
+        ]
+        candidates.sort(key=lambda candidate: -candidate.win_probability)
+        return target, pick, candidates
@@ -1,42 +1,71 @@
 # bbe/matchpoint/services/analysis/shap_analyzer.py
-import pandas as pd
+from typing import List
+import numpy as np
 from ...models.model_loader import loader
+from ...domain.features import FEATURE_SCHEMA
+from ...config import SHAP_BACKEND
 from ...domain.prediction import ShapResult
 
 class ShapAnalyzer:
     """
     A utility class for performing SHAP (SHapley Additive exPlanations) analysis.
+
+    Values explain the classifier's log-odds of its positive class and come
+    from XGBoost's native TreeSHAP unless SHAP_BACKEND is "shap".
     """
     
     @staticmethod
-    def get_shap_analysis(features_df: pd.DataFrame) -> ShapResult:
+    def get_shap_analysis(features: np.ndarray) -> ShapResult:
         """
         Calculates and formats SHAP values for a single prediction.
 
         Args:
-            features_df (pd.DataFrame): A DataFrame containing the single row of
-                                        features for which to calculate SHAP values.
+            features (np.ndarray): A (1 x features) float32 matrix in FEATURE_ORDER
+                                   for which to calculate SHAP values.
 
         Returns:
             ShapResult: A data object containing the base value, SHAP values,
                         feature names, and their corresponding data.
         """
-        # The explainer is already loaded in the 'loader' instance
-        explainer = loader.shap_explainer
-        
-        # Calculate SHAP values. The result is a SHAP Explanation object.
-        explanation = explainer(features_df)
-        
-        # Extract data for the first (and only) prediction in the batch
+        return ShapAnalyzer.get_shap_analyses(features)[0]
+
+    @staticmethod
+    def get_shap_analyses(features: np.ndarray) -> List[ShapResult]:
+        """
+        Calculates and formats SHAP values for a batch of predictions with a
+        single explainer call.
+
+        Args:
+            features (np.ndarray): A (rows x features) float32 matrix in FEATURE_ORDER.
+
+        Returns:
+            List[ShapResult]: One result per row, in order.
+        """
+        if len(features) == 0:
+            return []
+
+        if SHAP_BACKEND == "shap":
+            # The explainer is built by the 'loader' instance on first use
+            explanation = loader.shap_explainer(features)
+            base_values = np.broadcast_to(explanation.base_values, (len(features),))
+            values = explanation.values
+        else:
+            # XGBoost's own TreeSHAP: one call for the whole batch, no shap import
+            contributions = loader.classifier_contributions(features)
+            base_values, values = contributions[:, -1], contributions[:, :-1]
+
         # Convert NumPy arrays to native Python lists for serialization
-        base_value = float(explanation[0].base_values)
-        values = explanation[0].values.tolist()
-        feature_data = explanation[0].data.tolist()
-        feature_names = features_df.columns.tolist()
+        base_values = base_values.tolist()
+        values = values.tolist()
+        feature_data = np.asarray(features, dtype=np.float32).tolist()
+        feature_names = list(FEATURE_SCHEMA.names)
         
-        return ShapResult(
-            base_value=base_value,
-            values=values,
-            feature_names=feature_names,
-            feature_data=feature_data
-        )
\ No newline at end of file
+        return [
+            ShapResult(
+                base_value=base_values[i],
+                values=values[i],
+                feature_names=feature_names,
+                feature_data=feature_data[i]
+            )
+            for i in range(len(features))
+        ]
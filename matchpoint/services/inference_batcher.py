@@ -0,0 +1,169 @@
+# bbe/matchpoint/services/inference_batcher.py
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, NamedTuple, Optional
+import numpy as np
+from .. import metrics
+from ..domain.features import FEATURE_SCHEMA
+from ..domain.prediction import ShapResult
+from ..models.model_loader import loader
+from .analysis.shap_analyzer import ShapAnalyzer
+from .prediction_cache import PredictionCache
+
+
+class BatchedPrediction(NamedTuple):
+    red_win_probability: float
+    red_score: float
+    blue_score: float
+    shap_analysis: Optional[ShapResult]
+
+
+class _Request(NamedTuple):
+    features: np.ndarray
+    shap: bool
+    future: Future
+    key: object = None
+
+
+class InferenceBatcher:
+    """
+    Coalesces concurrent single-match predictions into batched model calls.
+
+    Handler threads submit one feature row each and block on a Future. A
+    background thread takes the first queued row, keeps collecting rows for
+    `window` seconds or until `max_batch_size` are queued, then runs one
+    predict call (and one SHAP call for the rows that asked for it) on the
+    whole batch and scatters the results back. A burst of requests for the
+    same match therefore costs one model invocation instead of one each.
+
+    The queue depth seen when each batch starts and the size of each batch
+    are recorded in the `inference_queue_depth` and `inference_batch_size`
+    histograms (see matchpoint.metrics). window <= 0 or max_batch_size <= 1
+    disables batching: rows are predicted on the caller's thread.
+
+    With a PredictionCache, rows whose outputs are already cached resolve
+    immediately without waiting for a batch, and every computed row is stored.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        max_batch_size: int,
+        model=loader,
+        cache: Optional[PredictionCache] = None,
+    ):
+        """
+        Args:
+            window (float): Seconds the first row of a batch waits for others.
+            max_batch_size (int): Rows that close a batch before the window ends.
+            model: Object with ModelLoader.predict's signature.
+            cache (Optional[PredictionCache]): Cache consulted before queueing.
+        """
+        self.window = window
+        self.max_batch_size = max(int(max_batch_size), 1)
+        self.model = model
+        self.cache = cache
+        self.enabled = window > 0 and self.max_batch_size > 1
+        self.queue_depth = metrics.histogram(
+            "inference_queue_depth", metrics.powers_of_two(self.max_batch_size * 4)
+        )
+        self.batch_size = metrics.histogram(
+            "inference_batch_size", metrics.powers_of_two(self.max_batch_size)
+        )
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, features: np.ndarray, shap: bool = True) -> Future:
+        """
+        Queues one feature row.
+
+        Args:
+            features (np.ndarray): A (features,) or (1 x features) row in FEATURE_ORDER.
+            shap (bool): Whether the result should include the SHAP analysis.
+
+        Returns:
+            Future: Resolves to a BatchedPrediction, or raises the model's error.
+        """
+        row = np.asarray(features, dtype=np.float32).reshape(-1)
+        key = None
+        if self.cache is not None:
+            key = self.cache.row_key(row)
+            cached = self.cache.lookup(key, shap)
+            if cached is not None:
+                future = Future()
+                future.set_result(BatchedPrediction(*cached[0], shap_analysis=cached[1]))
+                return future
+
+        request = _Request(row, shap, Future(), key)
+        if not self.enabled:
+            self._run_batch([request])
+            return request.future
+
+        self._ensure_worker()
+        self._queue.put(request)
+        return request.future
+
+    def predict(self, features: np.ndarray, shap: bool = True) -> BatchedPrediction:
+        """Blocking form of submit."""
+        return self.submit(features, shap).result()
+
+    def stats(self) -> dict:
+        """Snapshots of the queue-depth and batch-size histograms."""
+        return {
+            "queue_depth": self.queue_depth.snapshot(),
+            "batch_size": self.batch_size.snapshot(),
+        }
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._loop, name="inference-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _collect(self) -> List[_Request]:
+        """Blocks for the first row, then gathers more until the window or size limit."""
+        batch = [self._queue.get()]
+        self.queue_depth.observe(self._queue.qsize() + 1)
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            self._run_batch(self._collect())
+
+    def _run_batch(self, batch: List[_Request]) -> None:
+        self.batch_size.observe(len(batch))
+        try:
+            features = FEATURE_SCHEMA.empty(len(batch))
+            for row, request in zip(features, batch):
+                row[:] = request.features
+
+            red_win_probs, red_scores, blue_scores = self.model.predict(features)
+
+            shap_rows = [i for i, request in enumerate(batch) if request.shap]
+            shap_results = dict(zip(shap_rows, ShapAnalyzer.get_shap_analyses(features[shap_rows])))
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        for i, request in enumerate(batch):
+            prediction = (float(red_win_probs[i]), float(red_scores[i]), float(blue_scores[i]))
+            if self.cache is not None:
+                self.cache.store(request.key, prediction, shap_results.get(i))
+            request.future.set_result(
+                BatchedPrediction(*prediction, shap_analysis=shap_results.get(i))
+            )
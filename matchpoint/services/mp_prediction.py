@@ -1,11 +1,12 @@
-from typing import List, Optional
-import pandas as pd
+from typing import Any, Dict, List, Mapping, Optional, Union
+import numpy as np
 import requests
-from ..models.model_loader import loader
 from ..third_parties.fetcher import Fetcher
 from ..domain.prediction import MatchPrediction
-from ..config import FEATURE_ORDER, TBA_HEADER
-from .analysis.shap_analyzer import ShapAnalyzer
+from ..domain.features import FEATURE_SCHEMA, TeamStatsMatrix
+from ..config import INFERENCE_BATCH_WINDOW, INFERENCE_MAX_BATCH_SIZE
+from .inference_batcher import BatchedPrediction, InferenceBatcher
+from .prediction_cache import prediction_cache
 
 class MatchpointPredictor:
     """
@@ -16,6 +17,12 @@ class MatchpointPredictor:
     """
     
     _instance = None
+
+    # Coalesces concurrent get_match_prediction calls into one model call;
+    # vectors predicted before (by any request) are served from the cache
+    batcher = InferenceBatcher(
+        INFERENCE_BATCH_WINDOW, INFERENCE_MAX_BATCH_SIZE, cache=prediction_cache
+    )
     
     def __new__(cls):
         if cls._instance is None:
@@ -37,22 +44,28 @@ class MatchpointPredictor:
             Optional[MatchPrediction]: A data object containing the prediction,
                                        probabilities, scores, and SHAP analysis.
         """
-        features_dict = Fetcher.get_match_features(match_key)
-        if not features_dict:
+        features = Fetcher.get_match_feature_vector(match_key)
+        if features is None:
             raise ValueError(f"Could not fetch features for match {match_key}")
-        
-        features_df = pd.DataFrame([features_dict])
 
-        # Predictions
-        win_probs = loader.classifier.predict_proba(features_df)[0]
-        red_score = loader.red_regressor.predict(features_df)[0]
-        blue_score = loader.blue_regressor.predict(features_df)[0]
-        
-        # SHAP Analysis
-        shap_result = ShapAnalyzer.get_shap_analysis(features_df)
-        
-        # Assemble result
-        prob_red_win, prob_blue_win = win_probs[0], win_probs[1]
+        # Predictions and SHAP Analysis, batched with concurrent requests
+        batched = MatchpointPredictor.batcher.predict(features, shap=True)
+        return MatchpointPredictor.prediction_from_batched(match_key, batched)
+
+    @staticmethod
+    def prediction_from_batched(match_key: str, batched: BatchedPrediction) -> MatchPrediction:
+        """
+        Assembles the MatchPrediction of a batcher result.
+
+        Args:
+            match_key (str): The key of the predicted match.
+            batched (BatchedPrediction): The batcher's result for its features.
+
+        Returns:
+            MatchPrediction: The prediction, with the SHAP analysis if computed.
+        """
+        red_score, blue_score = batched.red_score, batched.blue_score
+        prob_red_win, prob_blue_win = batched.red_win_probability, 1.0 - batched.red_win_probability
         predicted_winner = "blue" if prob_blue_win > prob_red_win else "red"
 
         return MatchPrediction(
@@ -60,131 +73,197 @@ class MatchpointPredictor:
             predicted_winner=predicted_winner,
             win_probability={"red": round(float(prob_red_win), 4), "blue": round(float(prob_blue_win), 4)},
             predicted_scores={"red": int(round(red_score)), "blue": int(round(blue_score))},
-            shap_analysis=shap_result
+            shap_analysis=batched.shap_analysis
         )
     
-    def predict_match_by_features(self, features, shap: bool=False) -> MatchPrediction:
+    def predict_match_by_features(
+        self, features: Union[Mapping[str, float], np.ndarray], shap: bool=False
+    ) -> MatchPrediction:
         """
         Predicts a match given specific match features
         
         Args:
-            features dict: A dictionary containing the inference-ready features for prediction
+            features dict | np.ndarray: The inference-ready features for prediction, either
+                                        a dictionary keyed by FEATURE_ORDER names or a
+                                        float32 vector in FEATURE_ORDER (see FEATURE_SCHEMA)
             shab bool: Whether return the prediction come with shap analysis or no
             
         Returns:
             MatchPrediction: A MatchPrediction object containing info about the inference
         """
-        features_df = pd.DataFrame([features])
+        if isinstance(features, np.ndarray):
+            features = np.asarray(features, dtype=np.float32).reshape(1, -1)
+        else:
+            features = FEATURE_SCHEMA.from_mapping(features).reshape(1, -1)
 
         # Predictions
-        win_probs = loader.classifier.predict_proba(features_df)[0]
-        red_score = loader.red_regressor.predict(features_df)[0]
-        blue_score = loader.blue_regressor.predict(features_df)[0]
+        red_win_probs, red_scores, blue_scores = prediction_cache.predict(features)
+        red_score, blue_score = red_scores[0], blue_scores[0]
         
-        prob_red_win, prob_blue_win = win_probs[0], win_probs[1]
+        prob_red_win, prob_blue_win = red_win_probs[0], 1.0 - red_win_probs[0]
         predicted_winner = "blue" if prob_blue_win > prob_red_win else "red"
         
-        mp = MatchPrediction(
+        # MatchPrediction is frozen, so the analysis is computed up front
+        shap_result = prediction_cache.shap_analyses(features)[0] if shap else None
+
+        return MatchPrediction(
             match_key="x_match",
             predicted_winner=predicted_winner,
             win_probability={"red": round(float(prob_red_win), 4), "blue": round(float(prob_blue_win), 4)},
             predicted_scores={"red": int(round(red_score)), "blue": int(round(blue_score))},
+            shap_analysis=shap_result,
         )
-        
-        if shap:
-            mp.shap_analysis = ShapAnalyzer.get_shap_analysis(features_df)
-            
-        return mp
     
-    def predict_all_matches_for_event(self, event_key: str) -> List[MatchPrediction]:
+    def predict_red_win_probabilities(
+        self, features: Union[np.ndarray, List[Mapping[str, float]]]
+    ) -> np.ndarray:
+        """
+        Scores many feature sets with a single classifier call.
+
+        Only the classifier runs; use this when the scores and SHAP analysis
+        are not needed (e.g. playoff simulations).
+
+        Args:
+            features (np.ndarray | List[dict]): A (rows x features) float32 matrix
+                                                built with Fetcher.gather_match_features,
+                                                or inference-ready feature dicts.
+
+        Returns:
+            np.ndarray: The probability that red wins, one entry per feature set.
+        """
+        if len(features) == 0:
+            return np.empty(0, dtype=np.float64)
+
+        if not isinstance(features, np.ndarray):
+            matrix = FEATURE_SCHEMA.empty(len(features))
+            for row, mapping in zip(matrix, features):
+                FEATURE_SCHEMA.from_mapping(mapping, out=row)
+            features = matrix
+        return prediction_cache.predict_red_win_probabilities(features)
+
+    def predict_all_matches_for_event(
+        self, event_key: str, matches: Optional[List[dict]] = None, include_shap: bool = False
+    ) -> List[MatchPrediction]:
         """
         Efficiently fetches, processes, and predicts all matches for an event.
         
         This method follows a multi-phase approach for efficiency:
         1. Batch Data Fetching: Gets all team data for the event in one go.
         2. In-Memory Assembly: Constructs feature sets for all matches locally.
-        3. Batch Prediction: Runs models on the complete feature DataFrame at once.
+        3. Batch Prediction: Runs models (and, if requested, SHAP) on the complete
+           feature matrix at once.
         4. Result Formatting: Assembles the prediction results into a list.
 
         Args:
             event_key (str): The key for the event (e.g., '2023cada').
+            matches (Optional[List[dict]]): TBA simple matches to predict. When
+                                            given, the event's match list is not
+                                            fetched (e.g. only the remaining
+                                            quals, see Simulator.simulate_qualifications).
+            include_shap (bool): Whether to attach the SHAP analysis of every match.
 
         Returns:
             List[MatchPrediction]: A list of prediction objects for each valid match.
         """
         
         # Call our function to get all team data at once.
-        all_team_features = Fetcher.get_all_team_features_for_event(event_key)
+        all_team_features = Fetcher.get_event_team_stats(event_key)
         if not all_team_features:
             print("Could not fetch team features, aborting prediction.")
             return []
 
-        # Get the list of all matches for the event
+        # Get the list of all matches for the event (from the snapshot the team data came from)
         try:
-            req = requests.get(f"https://www.thebluealliance.com/api/v3/event/{event_key}/matches/simple", headers=TBA_HEADER)
-            req.raise_for_status()
-            all_matches = req.json()
-            event_week = Fetcher.tba.get_event_week(event_key)
+            event = Fetcher.events.get(event_key)
         except requests.exceptions.RequestException as e:
             print(f"ERROR: Could not fetch matches for event {event_key}: {e}")
             return []
+        all_matches = list(event.matches) if matches is None else matches
+        event_week = event.week
 
-        # --- Phase 2: In-Memory Feature Assembly ---
-        features_list = []
-        valid_matches_for_prediction = [] # Store matches we could process
+        return self.predict_event_matches(all_team_features, all_matches, event_week, include_shap)
 
+    def predict_event_matches(
+        self,
+        all_team_features: Union[Dict[str, Dict[str, Any]], TeamStatsMatrix],
+        all_matches: List[dict],
+        event_week: Optional[int],
+        include_shap: bool = False,
+    ) -> List[MatchPrediction]:
+        """
+        Phases 2-4 of predict_all_matches_for_event, on already fetched data.
+        No network requests, so callers that fetch asynchronously can run it
+        on a worker thread.
+
+        Args:
+            all_team_features (Dict[str, Dict[str, Any]] | TeamStatsMatrix): Fetcher.get_all_team_features_for_event's
+                                                                            result, or its matrix (Fetcher.get_event_team_stats).
+            all_matches (List[dict]): TBA simple matches to predict.
+            event_week (Optional[int]): Week of the event; None is treated as 8.
+            include_shap (bool): Whether to attach the SHAP analysis of every match.
+
+        Returns:
+            List[MatchPrediction]: A list of prediction objects for each valid match.
+        """
+        # --- Phase 2: In-Memory Feature Assembly ---
+        # Every match becomes six rows of the event's team-stats matrix; the
+        # whole feature matrix is then built with one gather
+        team_stats = (
+            all_team_features
+            if isinstance(all_team_features, TeamStatsMatrix)
+            else TeamStatsMatrix.from_team_stats(all_team_features)
+        )
+        week = 8 if event_week is None else event_week
+        index = team_stats.index
+        unknown = -2  # Marks a team without data; -1 pads (zeros) alliances with fewer than 3 teams
+        team_rows = []
+        candidate_matches = []
         for match in all_matches:
             # Optional: filter only qualification matches
             # if match.get('comp_level') != 'qm':
             #     continue
-
             try:
-                raw_features = {'week': 8 if event_week is None else event_week}
-                
-                red_teams = [team[3:] for team in match['alliances']['red']['team_keys']]
-                blue_teams = [team[3:] for team in match['alliances']['blue']['team_keys']]
-
-                for i in range(3):
-                    # Dictionary lookups (instantaneous), not API calls
-                    red_team_stats = all_team_features[red_teams[i]]
-                    blue_team_stats = all_team_features[blue_teams[i]]
-
-                    for stat_name, value in red_team_stats.items():
-                        if stat_name not in ["team", "event"]:
-                            raw_features[f"red{i+1}_{stat_name}"] = value
-                    for stat_name, value in blue_team_stats.items():
-                        if stat_name not in ["team", "event"]:
-                            raw_features[f"blue{i+1}_{stat_name}"] = value
-                
-                ordered_features = {feat: raw_features.get(feat, 0.0) for feat in FEATURE_ORDER}
-                features_list.append(ordered_features)
-                valid_matches_for_prediction.append(match)
+                rows = []
+                for color in ("red", "blue"):
+                    alliance = [index.get(team[3:], unknown) for team in match['alliances'][color]['team_keys'][:3]]
+                    rows += alliance + [-1] * (3 - len(alliance))
             except KeyError as e:
                 print(f"WARN: Skipping match {match.get('key')} due to missing team data: {e}")
-        
-        if not features_list:
+                continue
+            team_rows.append(rows)
+            candidate_matches.append(match)
+
+        team_rows = np.array(team_rows, dtype=np.intp).reshape(-1, 6)
+        missing_team = (team_rows == unknown).any(axis=1)
+        for i in np.flatnonzero(missing_team):
+            print(f"WARN: Skipping match {candidate_matches[i].get('key')} due to missing team data")
+        valid_matches_for_prediction = [
+            match for match, missing in zip(candidate_matches, missing_team) if not missing
+        ]
+
+        if not valid_matches_for_prediction:
             print("Could not assemble features for any match.")
             return []
-            
+
+        features = FEATURE_SCHEMA.gather(team_stats, team_rows[~missing_team], week)
+
         # --- Phase 3: Batch Prediction ---
-        features_df = pd.DataFrame(features_list)
-        
-        # Call .predict() once for each model on the entire DataFrame
-        all_win_probs = loader.classifier.predict_proba(features_df)
-        all_red_scores = loader.red_regressor.predict(features_df)
-        all_blue_scores = loader.blue_regressor.predict(features_df)
+        # Run every model once on the entire matrix
+        all_red_win_probs, all_red_scores, all_blue_scores = prediction_cache.predict(features)
+        all_shap = prediction_cache.shap_analyses(features) if include_shap else None
         
         # --- Phase 4: Formatting Results ---
         predictions = []
         for i, match in enumerate(valid_matches_for_prediction):
-            prob_red_win, prob_blue_win = all_win_probs[i]
+            prob_red_win, prob_blue_win = all_red_win_probs[i], 1.0 - all_red_win_probs[i]
             predicted_winner = "blue" if prob_blue_win > prob_red_win else "red"
             
             prediction_obj = MatchPrediction(
                 match_key=match['key'],
                 predicted_winner=predicted_winner,
                 win_probability={"red": round(float(prob_red_win), 4), "blue": round(float(prob_blue_win), 4)},
-                predicted_scores={"red": int(round(all_red_scores[i])), "blue": int(round(all_blue_scores[i]))}
+                predicted_scores={"red": int(round(all_red_scores[i])), "blue": int(round(all_blue_scores[i]))},
+                shap_analysis=all_shap[i] if all_shap is not None else None
             )
             predictions.append(prediction_obj)
             
@@ -0,0 +1,373 @@
+# bbe/matchpoint/services/playoff_engine.py
+import functools
+import math
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import numpy as np
+from ..domain.bracket import CompiledBracket
+from ..domain.simulation import SimulationTracker
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the shared process pool, (re)creating it if the size changed.
+
+    Workers are started with 'spawn' so they never inherit the gRPC server's
+    threads, and are kept alive between requests to avoid paying start-up
+    cost on every simulation.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _run_shard(
+    prob_matrix: np.ndarray,
+    n_sims: int,
+    seed_seq: np.random.SeedSequence,
+    batch_size: int,
+    plan: CompiledBracket,
+) -> SimulationTracker:
+    """Process-pool entry point: simulates one shard with its own RNG stream."""
+    rng = np.random.default_rng(seed_seq)
+    tracker = SimulationTracker(
+        alliances=[[] for _ in range(plan.num_alliances)], round_names=plan.round_names
+    )
+    return VectorizedPlayoffEngine.simulate_into(
+        tracker, prob_matrix, n_sims, rng, batch_size, plan
+    )
+
+
+class VectorizedPlayoffEngine:
+    """
+    Runs many playoff brackets at once using NumPy arrays.
+
+    Brackets are executed from a CompiledBracket plan. Each simulation is a
+    row of an (N x plan.n_draws) uniform draw matrix and every match consumes
+    best_of columns of it (16 for the 2023+ 8-alliance bracket: 13 matches
+    plus a best-of-3 final). Winners are looked up from an alliance-vs-alliance
+    probability matrix with fancy indexing, so a whole batch is resolved
+    without a Python loop per simulation.
+    """
+
+    @staticmethod
+    def shrink_probability_matrix(win_probs: np.ndarray, alpha: float = 0.0) -> np.ndarray:
+        """
+        Shrinks an alliance-vs-alliance probability matrix toward 0.5.
+
+        Args:
+            win_probs (np.ndarray): Output of Simulator.precompute_win_probabilities,
+                                    where [i, j] is the probability that alliance
+                                    i + 1 beats alliance j + 1 while playing as red.
+            alpha (float): Shrink factor (see Simulator.shrink).
+
+        Returns:
+            np.ndarray: A float64 matrix with the same layout.
+        """
+        return 0.5 + (1 - alpha) * (np.asarray(win_probs, dtype=np.float64) - 0.5)
+
+    @staticmethod
+    def run_plan(prob_matrix: np.ndarray, draws: np.ndarray, plan: CompiledBracket) -> np.ndarray:
+        """
+        Executes a compiled bracket for every row of `draws`.
+
+        A series is won by the side that takes a majority of its best_of
+        draws, which is the same outcome as playing until one side reaches
+        that majority, so both engines consume the draws identically.
+
+        Args:
+            prob_matrix (np.ndarray): Output of shrink_probability_matrix.
+            draws (np.ndarray): (N x plan.n_draws) matrix of uniform [0, 1) samples.
+            plan (CompiledBracket): The bracket to play.
+
+        Returns:
+            np.ndarray: (N x plan.n_slots) matrix of 0-based alliance indices,
+                        laid out as described in CompiledBracket.
+        """
+        n = draws.shape[0]
+        slots = np.empty((n, plan.n_slots), dtype=np.intp)
+        slots[:, : plan.num_alliances] = np.arange(plan.num_alliances)
+
+        out = plan.num_alliances
+        for red_slot, blue_slot, best_of, offset in plan.steps:
+            red = slots[:, red_slot]
+            blue = slots[:, blue_slot]
+            p_red = prob_matrix[red, blue]
+            if best_of == 1:
+                red_wins = draws[:, offset] < p_red
+            else:
+                red_games = (draws[:, offset : offset + best_of] < p_red[:, None]).sum(axis=1)
+                red_wins = red_games > best_of // 2
+            slots[:, out] = np.where(red_wins, red, blue)
+            slots[:, out + 1] = np.where(red_wins, blue, red)
+            out += 2
+
+        return slots
+
+    @staticmethod
+    def simulate_batch(
+        prob_matrix: np.ndarray, draws: np.ndarray, plan: CompiledBracket
+    ) -> np.ndarray:
+        """
+        Simulates one bracket per row of `draws`.
+
+        The column order matches the order in which Simulator.simulate_frc_tournament_fast
+        consumes its draws, so both engines agree for the same draw matrix.
+
+        Returns:
+            np.ndarray: A length-N array with the 0-based index of each champion.
+        """
+        return VectorizedPlayoffEngine.run_plan(prob_matrix, draws, plan)[:, plan.champion_slot]
+
+    @staticmethod
+    def summarize_batch(slots: np.ndarray, plan: CompiledBracket) -> dict:
+        """
+        Reduces the slot matrix of a batch to fixed-size counts.
+
+        Returns:
+            dict: Keyword arguments for SimulationTracker.add_batch: champion and
+                  finalist counts per alliance, the (alliance x round) elimination
+                  histogram (last column = champion) and the (red x blue) final
+                  matchup counts.
+        """
+        num_alliances = plan.num_alliances
+        n_columns = len(plan.round_names) + 1
+        champions = slots[:, plan.champion_slot]
+        final_red = slots[:, plan.finalist_slots[0]]
+        final_blue = slots[:, plan.finalist_slots[1]]
+
+        eliminating = np.flatnonzero(plan.eliminates)
+        elimination_cells = (
+            slots[:, num_alliances + 2 * eliminating + 1] * n_columns
+            + plan.match_rounds[eliminating]
+        )
+        elimination_counts = np.bincount(
+            elimination_cells.ravel(), minlength=num_alliances * n_columns
+        ).reshape(num_alliances, n_columns)
+        champion_counts = np.bincount(champions, minlength=num_alliances)
+        elimination_counts[:, -1] += champion_counts
+
+        return {
+            "simulations": slots.shape[0],
+            "champion_counts": champion_counts,
+            "finalist_counts": np.bincount(final_red, minlength=num_alliances)
+            + np.bincount(final_blue, minlength=num_alliances),
+            "elimination_counts": elimination_counts,
+            "final_matchups": np.bincount(
+                final_red * num_alliances + final_blue, minlength=num_alliances * num_alliances
+            ).reshape(num_alliances, num_alliances),
+        }
+
+    @staticmethod
+    def simulate_into(
+        tracker: SimulationTracker,
+        prob_matrix: np.ndarray,
+        n_sims: int,
+        rng: np.random.Generator,
+        batch_size: int,
+        plan: CompiledBracket,
+    ) -> SimulationTracker:
+        """
+        Runs `n_sims` brackets in chunks of `batch_size` and adds each chunk's
+        counts to `tracker` (which must have been created with plan.round_names).
+
+        Returns:
+            SimulationTracker: The same tracker, for chaining.
+        """
+        remaining = n_sims
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            draws = rng.random((size, plan.n_draws))
+            slots = VectorizedPlayoffEngine.run_plan(prob_matrix, draws, plan)
+            tracker.add_batch(**VectorizedPlayoffEngine.summarize_batch(slots, plan))
+            remaining -= size
+        return tracker
+
+    @staticmethod
+    def simulate_sharded(
+        tracker: SimulationTracker,
+        prob_matrix: np.ndarray,
+        n_sims: int,
+        seed: Optional[int],
+        workers: int,
+        batch_size: int,
+        plan: CompiledBracket,
+    ) -> SimulationTracker:
+        """
+        Splits `n_sims` across a process pool and merges the shard trackers
+        into `tracker`.
+
+        Each shard draws from an independent stream spawned from
+        np.random.SeedSequence(seed), so the same seed and worker count always
+        produce the same counts.
+
+        Args:
+            tracker (SimulationTracker): Receives the merged counts.
+            prob_matrix (np.ndarray): Output of shrink_probability_matrix.
+            n_sims (int): Total number of brackets to simulate.
+            seed (Optional[int]): Root seed. None draws fresh OS entropy.
+            workers (int): Number of shards (and pool processes).
+            batch_size (int): Chunk size used inside each shard.
+            plan (CompiledBracket): The bracket to play.
+
+        Returns:
+            SimulationTracker: The same tracker, for chaining.
+        """
+        workers = max(1, min(workers, n_sims))
+        seed_seqs = np.random.SeedSequence(seed).spawn(workers)
+        shard_sizes = [
+            n_sims // workers + (1 if i < n_sims % workers else 0) for i in range(workers)
+        ]
+
+        if workers == 1:
+            tracker.merge(_run_shard(prob_matrix, shard_sizes[0], seed_seqs[0], batch_size, plan))
+            return tracker
+
+        pool = _get_pool(workers)
+        futures = [
+            pool.submit(_run_shard, prob_matrix, size, seed_seq, batch_size, plan)
+            for size, seed_seq in zip(shard_sizes, seed_seqs)
+        ]
+        # Merge in shard order so the result never depends on completion order
+        for future in futures:
+            tracker.merge(future.result())
+        return tracker
+
+
+class ExactPlayoffEngine:
+    """
+    Computes exact playoff outcome probabilities without sampling.
+
+    Every combination of series winners is enumerated as a path (2^matches
+    paths; 16384 for the 8-alliance double elimination). Which alliances meet
+    along each path does not depend on the probabilities, so the paths are
+    built once per compiled plan; a request only gathers series probabilities
+    and multiplies them along each path. Alliances met later in a
+    double-elimination bracket are correlated, which is why whole paths are
+    enumerated instead of propagating independent per-slot distributions.
+    """
+
+    MAX_MATCHES = 16
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _paths(plan: CompiledBracket):
+        """
+        Enumerates every path of a plan.
+
+        Returns:
+            tuple: (best_ofs, factor_index, incidence). best_ofs lists the
+                   distinct series lengths. factor_index is (matches x paths):
+                   entry [k, r] points into the flattened table
+                   [series(best_ofs), 1 - series(best_ofs)] at the probability
+                   of the outcome of match k on path r. incidence is
+                   (alliances * outcome columns x paths) and counts, for each
+                   path, the elimination round of every knocked-out alliance
+                   and the champion.
+        """
+        n_matches = len(plan.steps)
+        num_alliances = plan.num_alliances
+        n_columns = len(plan.round_names) + 1
+
+        rows = np.arange(1 << n_matches, dtype=np.int64)[:, None]
+        red_wins = ((rows >> np.arange(n_matches)) & 1).astype(bool)
+        n_paths = red_wins.shape[0]
+
+        slots = np.empty((n_paths, plan.n_slots), dtype=np.intp)
+        slots[:, :num_alliances] = np.arange(num_alliances)
+        out = num_alliances
+        for k, (red_slot, blue_slot, _, _) in enumerate(plan.steps):
+            red, blue = slots[:, red_slot], slots[:, blue_slot]
+            slots[:, out] = np.where(red_wins[:, k], red, blue)
+            slots[:, out + 1] = np.where(red_wins[:, k], blue, red)
+            out += 2
+
+        best_ofs, best_of_index = np.unique(plan.plan[:, 2], return_inverse=True)
+        table_size = len(best_ofs) * num_alliances * num_alliances
+        factor_index = (
+            best_of_index * num_alliances * num_alliances
+            + slots[:, plan.plan[:, 0]] * num_alliances
+            + slots[:, plan.plan[:, 1]]
+        )
+        factor_index = np.ascontiguousarray(
+            np.where(red_wins, factor_index, factor_index + table_size).T
+        )
+
+        eliminating = np.flatnonzero(plan.eliminates)
+        cells = np.concatenate(
+            [
+                slots[:, num_alliances + 2 * eliminating + 1] * n_columns
+                + plan.match_rounds[eliminating],
+                slots[:, [plan.champion_slot]] * n_columns + (n_columns - 1),
+            ],
+            axis=1,
+        )
+        incidence = np.zeros((num_alliances * n_columns, n_paths), dtype=np.float64)
+        np.add.at(incidence, (cells, np.arange(n_paths)[:, None]), 1.0)
+
+        for array in (best_ofs, factor_index, incidence):
+            array.setflags(write=False)
+        return best_ofs, factor_index, incidence
+
+    @staticmethod
+    def series_probability(p_red: np.ndarray, best_of: int) -> np.ndarray:
+        """Probability that red takes a majority of `best_of` independent games."""
+        if best_of == 1:
+            return p_red
+        needed = best_of // 2 + 1
+        return sum(
+            math.comb(best_of, wins) * p_red**wins * (1 - p_red) ** (best_of - wins)
+            for wins in range(needed, best_of + 1)
+        )
+
+    @staticmethod
+    def elimination_distribution(prob_matrix: np.ndarray, plan: CompiledBracket) -> np.ndarray:
+        """
+        Exact distribution of the round in which each alliance is eliminated.
+
+        Args:
+            prob_matrix (np.ndarray): Output of VectorizedPlayoffEngine.shrink_probability_matrix.
+            plan (CompiledBracket): The bracket to evaluate.
+
+        Raises:
+            ValueError: If the bracket has more than MAX_MATCHES matches.
+
+        Returns:
+            np.ndarray: (num_alliances x len(plan.round_names) + 1) matrix where
+                        [a, r] is the probability that alliance a + 1 is knocked
+                        out in round r, and the last column is the probability
+                        that it wins the event. Rows sum to 1.
+        """
+        n_matches = len(plan.steps)
+        if n_matches > ExactPlayoffEngine.MAX_MATCHES:
+            raise ValueError(
+                f"Bracket '{plan.name}' has {n_matches} matches; exact mode supports "
+                f"up to {ExactPlayoffEngine.MAX_MATCHES}"
+            )
+
+        best_ofs, factor_index, incidence = ExactPlayoffEngine._paths(plan)
+        series = np.stack(
+            [ExactPlayoffEngine.series_probability(prob_matrix, int(bo)) for bo in best_ofs]
+        ).ravel()
+        factors = np.concatenate([series, 1.0 - series])
+
+        # Probability of each path: product of its series outcomes
+        path_probs = factors[factor_index[0]].copy()
+        for k in range(1, factor_index.shape[0]):
+            path_probs *= factors[factor_index[k]]
+
+        distribution = incidence @ path_probs
+        return distribution.reshape(plan.num_alliances, len(plan.round_names) + 1)
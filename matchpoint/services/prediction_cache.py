@@ -0,0 +1,116 @@
+# bbe/matchpoint/services/prediction_cache.py
+import hashlib
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+from ..cache import TTLCache
+from ..config import PREDICTION_CACHE_SIZE
+from ..domain.prediction import ShapResult
+from ..models.model_loader import loader
+from .analysis.shap_analyzer import ShapAnalyzer
+
+Prediction = Tuple[float, float, float]
+
+
+class PredictionCache:
+    """
+    Content-addressed caches of model outputs, keyed by feature vector.
+
+    A row's key is the digest of its float32 bytes plus the model version,
+    so the same teams with the same stats snapshot and week map to the same
+    entry whichever request built them, and a new model never reads stale
+    outputs. Three LRU caches are kept: full predictions (red win
+    probability, red score, blue score), classifier-only win probabilities
+    (the simulators' pairings) and SHAP analyses. Only the rows that miss
+    are sent to the model, in one call.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int, model=loader):
+        self.model = model
+        self.predictions = TTLCache(maxsize=maxsize)
+        self.win_probabilities = TTLCache(maxsize=maxsize)
+        self.shap = TTLCache(maxsize=maxsize)
+
+    def row_key(self, row: np.ndarray) -> Hashable:
+        row = np.ascontiguousarray(row, dtype=np.float32)
+        return self.model.model_version, hashlib.blake2b(row.tobytes(), digest_size=16).digest()
+
+    def _through(
+        self,
+        cache: TTLCache,
+        features: np.ndarray,
+        compute: Callable[[np.ndarray], List],
+        keys: Optional[List[Hashable]] = None,
+    ) -> List:
+        """Looks every row up in `cache`; the misses are computed with one call and stored."""
+        X = np.ascontiguousarray(features, dtype=np.float32).reshape(len(features), -1)
+        if keys is None:
+            keys = [self.row_key(row) for row in X]
+        values = [cache.get(key, self._MISSING) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is self._MISSING]
+        if missing:
+            for i, value in zip(missing, compute(X[missing])):
+                values[i] = value
+                cache.set(keys[i], value)
+        return values
+
+    def predict(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Cached ModelLoader.predict."""
+        if len(features) == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty
+
+        def compute(X):
+            return list(zip(*(output.tolist() for output in self.model.predict(X))))
+
+        values = self._through(self.predictions, features, compute)
+        red_win_probs, red_scores, blue_scores = (np.array(column, dtype=np.float64) for column in zip(*values))
+        return red_win_probs, red_scores, blue_scores
+
+    def predict_red_win_probabilities(self, features: np.ndarray) -> np.ndarray:
+        """Cached ModelLoader.predict_red_win_probabilities."""
+        if len(features) == 0:
+            return np.empty(0, dtype=np.float64)
+
+        def compute(X):
+            return self.model.predict_red_win_probabilities(X).tolist()
+
+        return np.array(self._through(self.win_probabilities, features, compute), dtype=np.float64)
+
+    def shap_analyses(self, features: np.ndarray) -> List[ShapResult]:
+        """Cached ShapAnalyzer.get_shap_analyses."""
+        if len(features) == 0:
+            return []
+        return self._through(self.shap, features, ShapAnalyzer.get_shap_analyses)
+
+    def lookup(self, key: Hashable, shap: bool) -> Optional[Tuple[Prediction, Optional[ShapResult]]]:
+        """
+        The cached prediction (and SHAP analysis, if `shap`) of one row, or
+        None unless everything asked for is cached.
+        """
+        prediction = self.predictions.get(key)
+        if prediction is None:
+            return None
+        shap_result = None
+        if shap:
+            shap_result = self.shap.get(key)
+            if shap_result is None:
+                return None
+        return prediction, shap_result
+
+    def store(self, key: Hashable, prediction: Prediction, shap_result: Optional[ShapResult] = None) -> None:
+        self.predictions.set(key, prediction)
+        if shap_result is not None:
+            self.shap.set(key, shap_result)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters and sizes of the three caches."""
+        return {
+            "predictions": self.predictions.stats(),
+            "win_probabilities": self.win_probabilities.stats(),
+            "shap": self.shap.stats(),
+        }
+
+
+prediction_cache = PredictionCache(PREDICTION_CACHE_SIZE)
@@ -0,0 +1,280 @@
+# bbe/matchpoint/services/qualification_engine.py
+import math
+from dataclasses import dataclass
+from typing import Dict, List
+import numpy as np
+from ..domain.prediction import MatchPrediction
+from ..domain.simulation import QualificationRankings
+
+
+def _team_number(team_key: str) -> int:
+    return int(team_key[3:])
+
+
+def is_match_played(match: dict) -> bool:
+    """A TBA simple match is played once both alliances have a score (TBA uses -1 before)."""
+    red_score = match["alliances"]["red"].get("score")
+    blue_score = match["alliances"]["blue"].get("score")
+    return red_score is not None and blue_score is not None and red_score >= 0 and blue_score >= 0
+
+
+def _binomial_cdf(p: np.ndarray, n: int) -> np.ndarray:
+    """P(X <= j) for X ~ Binomial(n, p), j = 0..n-1, one row per entry of p."""
+    j = np.arange(n + 1)
+    coefficients = np.array([math.comb(n, k) for k in j], dtype=np.float64)
+    pmf = coefficients * p[:, None] ** j * (1 - p[:, None]) ** (n - j)
+    return np.cumsum(pmf, axis=1)[:, :n]
+
+
+@dataclass(frozen=True)
+class QualificationSchedule:
+    """
+    Array form of an event's qualification schedule, ready to simulate.
+
+    Teams are indexed by position in `teams`. The red/blue incidence matrices
+    are (remaining matches x teams) with a 1 for every team whose result
+    counts in that match (surrogate appearances do not). Bonus RPs are
+    sampled by inverse CDF: an alliance earns one bonus RP for every column
+    of its *_bonus_cdf row that a uniform draw exceeds.
+    """
+    teams: np.ndarray
+    current_ranks: np.ndarray
+    base_rp: np.ndarray
+    total_matches: np.ndarray
+    bonus_rates: np.ndarray
+    tiebreak: np.ndarray
+    tiebreak_levels: np.ndarray
+    remaining_keys: tuple
+    p_red: np.ndarray
+    red_incidence: np.ndarray
+    blue_incidence: np.ndarray
+    red_bonus_cdf: np.ndarray
+    blue_bonus_cdf: np.ndarray
+
+
+class QualificationEngine:
+    """
+    Monte Carlo simulation of the remaining qualification matches of an event.
+
+    Each simulation is a row of an (N x remaining matches) uniform draw
+    matrix. Ranking points are accumulated with one matrix product against
+    the schedule's incidence matrices and the final standings of the whole
+    batch come from two row-wise sorts: an argsort by tiebreak level with a
+    random jitter for exact ties, then a stable argsort of that order by
+    ranking score. There is no Python loop per simulation or per match.
+
+    Teams are ordered by ranking score (RP / matches played), then by average
+    match points and finally at random, which approximates the FRC sort
+    orders with the data TBA exposes for every season.
+    """
+
+    @staticmethod
+    def build_schedule(
+        qual_matches: List[dict],
+        rankings: Dict[int, dict],
+        predictions: Dict[str, MatchPrediction],
+        win_rp: int,
+        max_bonus_rp: int,
+        shrink_alpha: float = 0.0,
+    ) -> QualificationSchedule:
+        """
+        Turns TBA data and model predictions into a QualificationSchedule.
+
+        Args:
+            qual_matches (List[dict]): Every `qm` match of the event, as returned
+                                       by TBAService.get_event_matches.
+            rankings (Dict[int, dict]): Output of TBAService.get_event_rankings.
+            predictions (Dict[str, MatchPrediction]): Predictions of the
+                                                      remaining matches by match key.
+                                                      Missing matches count as a coin flip.
+            win_rp (int): Ranking points awarded for a win.
+            max_bonus_rp (int): Bonus ranking points an alliance can earn per match.
+            shrink_alpha (float): Shrink applied to the predicted probabilities
+                                  (see VectorizedPlayoffEngine.shrink_probability_matrix).
+
+        Returns:
+            QualificationSchedule: The arrays consumed by simulate_into.
+        """
+        team_set = set(rankings)
+        for match in qual_matches:
+            for color in ("red", "blue"):
+                team_set.update(_team_number(t) for t in match["alliances"][color]["team_keys"])
+        teams = np.array(sorted(team_set), dtype=np.int64)
+        index = {int(team): i for i, team in enumerate(teams)}
+        num_teams = len(teams)
+
+        def counted_teams(match: dict, color: str) -> List[int]:
+            surrogates = set(match["alliances"][color].get("surrogate_team_keys") or [])
+            return [
+                index[_team_number(t)]
+                for t in match["alliances"][color]["team_keys"]
+                if t not in surrogates
+            ]
+
+        played_points = np.zeros(num_teams, dtype=np.float64)
+        played_count = np.zeros(num_teams, dtype=np.float64)
+        played = [m for m in qual_matches if is_match_played(m)]
+        remaining = sorted(
+            (m for m in qual_matches if not is_match_played(m)),
+            key=lambda m: m.get("match_number", 0),
+        )
+        for match in played:
+            for color in ("red", "blue"):
+                for t in counted_teams(match, color):
+                    played_points[t] += match["alliances"][color]["score"]
+                    played_count[t] += 1
+
+        # Current standings; teams without a ranking yet start from zero
+        current_ranks = np.zeros(num_teams, dtype=np.int64)
+        base_rp = np.zeros(num_teams, dtype=np.float64)
+        ranked_played = np.zeros(num_teams, dtype=np.float64)
+        wins = np.zeros(num_teams, dtype=np.float64)
+        ties = np.zeros(num_teams, dtype=np.float64)
+        for team, entry in rankings.items():
+            t = index[team]
+            current_ranks[t] = entry["rank"]
+            base_rp[t] = entry["total_rp"]
+            ranked_played[t] = entry["matches_played"]
+            wins[t] = entry["wins"]
+            ties[t] = entry["ties"]
+
+        # Bonus RP per match so far, capped to what an alliance can earn
+        earned_bonus = np.maximum(base_rp - win_rp * wins - ties, 0.0)
+        bonus_rates = np.divide(
+            earned_bonus, ranked_played, out=np.zeros(num_teams), where=ranked_played > 0
+        )
+        bonus_rates = np.clip(bonus_rates, 0.0, max_bonus_rp)
+
+        n_remaining = len(remaining)
+        red_incidence = np.zeros((n_remaining, num_teams), dtype=np.float64)
+        blue_incidence = np.zeros((n_remaining, num_teams), dtype=np.float64)
+        p_red = np.full(n_remaining, 0.5, dtype=np.float64)
+        red_scores = np.full(n_remaining, np.nan)
+        blue_scores = np.full(n_remaining, np.nan)
+        red_bonus_p = np.zeros(n_remaining, dtype=np.float64)
+        blue_bonus_p = np.zeros(n_remaining, dtype=np.float64)
+
+        for m, match in enumerate(remaining):
+            red_teams = counted_teams(match, "red")
+            blue_teams = counted_teams(match, "blue")
+            red_incidence[m, red_teams] = 1.0
+            blue_incidence[m, blue_teams] = 1.0
+
+            # An alliance's chance at each bonus RP is its members' average rate
+            red_all = [index[_team_number(t)] for t in match["alliances"]["red"]["team_keys"]]
+            blue_all = [index[_team_number(t)] for t in match["alliances"]["blue"]["team_keys"]]
+            if max_bonus_rp > 0:
+                red_bonus_p[m] = bonus_rates[red_all].mean() / max_bonus_rp
+                blue_bonus_p[m] = bonus_rates[blue_all].mean() / max_bonus_rp
+
+            prediction = predictions.get(match["key"])
+            if prediction is not None:
+                p_red[m] = prediction.win_probability["red"]
+                red_scores[m] = prediction.predicted_scores["red"]
+                blue_scores[m] = prediction.predicted_scores["blue"]
+
+        p_red = 0.5 + (1 - shrink_alpha) * (p_red - 0.5)
+
+        # Unpredicted matches get the event's average predicted score
+        predicted = np.concatenate([red_scores, blue_scores])
+        fill = np.nanmean(predicted) if np.isfinite(predicted).any() else 0.0
+        red_scores = np.where(np.isnan(red_scores), fill, red_scores)
+        blue_scores = np.where(np.isnan(blue_scores), fill, blue_scores)
+
+        remaining_count = red_incidence.sum(axis=0) + blue_incidence.sum(axis=0)
+        total_points = played_points + red_scores @ red_incidence + blue_scores @ blue_incidence
+        total_count = played_count + remaining_count
+        tiebreak = np.divide(
+            total_points, total_count, out=np.zeros(num_teams), where=total_count > 0
+        )
+        total_matches = np.maximum(ranked_played + remaining_count, 1.0)
+        # Dense rank of the tiebreak (0 = best); equal values share a level
+        tiebreak_levels = np.unique(-tiebreak, return_inverse=True)[1].astype(np.float64)
+
+        return QualificationSchedule(
+            teams=teams,
+            current_ranks=current_ranks,
+            base_rp=base_rp,
+            total_matches=total_matches,
+            bonus_rates=bonus_rates,
+            tiebreak=tiebreak,
+            tiebreak_levels=tiebreak_levels,
+            remaining_keys=tuple(m["key"] for m in remaining),
+            p_red=p_red,
+            red_incidence=red_incidence,
+            blue_incidence=blue_incidence,
+            red_bonus_cdf=_binomial_cdf(red_bonus_p, max_bonus_rp),
+            blue_bonus_cdf=_binomial_cdf(blue_bonus_p, max_bonus_rp),
+        )
+
+    @staticmethod
+    def simulate_batch(
+        schedule: QualificationSchedule,
+        rng: np.random.Generator,
+        size: int,
+        win_rp: int,
+        max_bonus_rp: int,
+    ) -> tuple:
+        """
+        Simulates `size` completions of the schedule.
+
+        Returns:
+            tuple: (ranks, ranking_scores), both (size x teams); ranks are 0-based.
+        """
+        num_teams = len(schedule.teams)
+        n_remaining = len(schedule.p_red)
+
+        rp = np.broadcast_to(schedule.base_rp, (size, num_teams)).copy()
+        if n_remaining:
+            red_wins = (rng.random((size, n_remaining)) < schedule.p_red).astype(np.float64)
+            # Blue earns the win RP unless red wins, so one product covers both sides
+            rp += win_rp * schedule.blue_incidence.sum(axis=0)
+            rp += win_rp * (red_wins @ (schedule.red_incidence - schedule.blue_incidence))
+            if max_bonus_rp > 0:
+                draws = rng.random((2, size, n_remaining, 1))
+                red_bonus = (draws[0] > schedule.red_bonus_cdf).sum(axis=2, dtype=np.float64)
+                blue_bonus = (draws[1] > schedule.blue_bonus_cdf).sum(axis=2, dtype=np.float64)
+                rp += red_bonus @ schedule.red_incidence + blue_bonus @ schedule.blue_incidence
+
+        ranking_scores = rp / schedule.total_matches
+
+        # Order by tiebreak level with a random jitter for exact ties, then
+        # stable-sort that order by ranking score
+        by_tiebreak = np.argsort(
+            schedule.tiebreak_levels + rng.random((size, num_teams)), axis=1
+        )
+        by_score = np.argsort(
+            -np.take_along_axis(ranking_scores, by_tiebreak, axis=1), axis=1, kind="stable"
+        )
+        order = np.take_along_axis(by_tiebreak, by_score, axis=1)
+        ranks = np.empty((size, num_teams), dtype=np.int64)
+        np.put_along_axis(ranks, order, np.arange(num_teams, dtype=np.int64)[None, :], axis=1)
+
+        return ranks, ranking_scores
+
+    @staticmethod
+    def simulate_into(
+        result: QualificationRankings,
+        schedule: QualificationSchedule,
+        n_sims: int,
+        rng: np.random.Generator,
+        batch_size: int,
+        win_rp: int,
+        max_bonus_rp: int,
+    ) -> QualificationRankings:
+        """
+        Runs `n_sims` simulations in chunks of `batch_size` and adds each
+        chunk to `result`.
+
+        Returns:
+            QualificationRankings: The same object, for chaining.
+        """
+        remaining = n_sims
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            ranks, ranking_scores = QualificationEngine.simulate_batch(
+                schedule, rng, size, win_rp, max_bonus_rp
+            )
+            result.add_batch(ranks, ranking_scores)
+            remaining -= size
+        return result
@@ -1,15 +1,54 @@
 import json
 from textwrap import indent
-from matchpoint.domain.simulation import SimulationTracker
+from typing import Callable, Iterator, Optional
+import numpy as np
+from matchpoint.domain.simulation import SimulationTracker, PlayoffOdds, QualificationRankings
+from ..domain.bracket import CompiledBracket, default_bracket_name, get_bracket_plan
+from ..domain.features import TeamStatsMatrix
+from ..domain.selection import AllianceSelectionResult
+from ..cache import namespace, stable_hash
+from ..models.model_loader import loader
+from ..third_parties.event_snapshot import EventSnapshot
 from ..third_parties.fetcher import Fetcher
 from .mp_prediction import MatchpointPredictor as MP
+from .playoff_engine import VectorizedPlayoffEngine, ExactPlayoffEngine
+from .qualification_engine import QualificationEngine, is_match_played
+from .alliance_selection import AllianceSelectionOptimizer, MatchupProbabilityCache
 from ..third_parties.statbotics import SBService
 from ..third_parties.tba import TBAService
+from ..config import (
+    SIMULATION_SHRINK_ALPHA,
+    SIMULATION_BATCH_SIZE,
+    SIMULATION_WORKERS,
+    SIMULATION_SHARD_MIN_SIMS,
+    SIMULATION_SNAPSHOT_INTERVAL,
+    SIMULATION_CI_Z,
+    SIMULATION_DEADLINE_MARGIN,
+    SIMULATION_CACHE_SIZE,
+    SIMULATION_CACHE_TTL,
+    QUALS_WIN_RP,
+    QUALS_MAX_BONUS_RP,
+    QUALS_DEFAULT_TOP_N,
+    QUALS_BATCH_SIZE,
+    SELECTION_DEFAULT_ALLIANCES,
+    SELECTION_MATCHUP_CACHE_SIZE,
+)
 import random
 from time import time
 
 
 class Simulator:
+    # Shared by every Simulator instance (the server builds one per request).
+    # Keys include hashes of the alliances and stats, so new data never hits
+    # a stale entry; the TTL bounds how long superseded entries linger.
+    # Every cache is keyed by event first, so cache.invalidate_event drops them.
+    result_cache = namespace("simulation_results", maxsize=SIMULATION_CACHE_SIZE, ttl=SIMULATION_CACHE_TTL)
+    win_prob_cache = namespace("win_probs", maxsize=SIMULATION_CACHE_SIZE, ttl=SIMULATION_CACHE_TTL)
+    # MatchupProbabilityCache per event stats, reused by consecutive pick requests
+    matchup_cache = namespace(
+        "selection_matchups", maxsize=SELECTION_MATCHUP_CACHE_SIZE, ttl=SIMULATION_CACHE_TTL
+    )
+
     def __init__(self):
         self.sb = SBService()
         self.tba = TBAService()
@@ -24,11 +63,12 @@ class Simulator:
         return 0.5 + alpha * (p - 0.5)
 
     def determine_match_winner_fast(
-        self, red_alliance_number, blue_alliance_number, precomputed_probs
+        self, red_alliance_number, blue_alliance_number, precomputed_probs, draw=None
     ):
         """
         Determines a winner based on pre-computed probabilities.
         This is extremely fast as it only involves a dictionary lookup and a random check.
+        If `draw` is given it is used instead of a fresh random.random() sample.
         """
         if red_alliance_number is None:
             return blue_alliance_number
@@ -36,11 +76,14 @@ class Simulator:
             return red_alliance_number
 
         # Instant lookup of the pre-computed probability
-        prob_red_wins = precomputed_probs[(red_alliance_number, blue_alliance_number)]
+        prob_red_wins = precomputed_probs[red_alliance_number - 1, blue_alliance_number - 1]
+
+        if draw is None:
+            draw = random.random()
 
         return (
             red_alliance_number
-            if random.random() < self.shrink(prob_red_wins, 0.2)
+            if draw < self.shrink(prob_red_wins, SIMULATION_SHRINK_ALPHA)
             else blue_alliance_number
         )
 
@@ -50,139 +93,530 @@ class Simulator:
         event_week: int,
         all_sb_stats: dict,
         all_tba_stats: dict,
-    ) -> dict:
+    ) -> np.ndarray:
         """
-        Pre-calculates win probabilities by passing pre-fetched data down
-        to the feature assembly function.
+        Pre-calculates win probabilities for every alliance pairing.
+
+        The features of all pairings are assembled from the pre-fetched data
+        and scored with a single classifier call.
+
+        Returns:
+            np.ndarray: A (num_alliances x num_alliances) matrix where entry
+                        [i, j] is the probability that alliance i + 1 (red)
+                        beats alliance j + 1 (blue). The diagonal is 0.5.
         """
-        # print("Pre-computing win probabilities for all possible matchups...")
-        win_probs = {}
         num_alliances = len(alliances)
+        pairings = [
+            (i, j) for i in range(num_alliances) for j in range(i + 1, num_alliances)
+        ]
 
-        for i in range(num_alliances):
-            for j in range(i + 1, num_alliances):
-                red_alliance_number = i + 1
-                blue_alliance_number = j + 1
-
-                # Fast function to assemble features from existing data
-                ordered_features = Fetcher.get_match_features_from_prefetched_data(
-                    red_teams=alliances[i],
-                    blue_teams=alliances[j],
-                    event_week=event_week,
-                    all_sb_stats=all_sb_stats,
-                    all_tba_stats=all_tba_stats,
-                )
+        win_probs = np.full((num_alliances, num_alliances), 0.5, dtype=np.float64)
+        if not pairings:
+            return win_probs
 
-                # The prediction logic
-                prediction = self.mp.predict_match_by_features(ordered_features)
+        # Every pairing's features with one gather from the teams' stats matrix
+        team_stats = TeamStatsMatrix.from_team_stats(all_sb_stats, all_tba_stats)
+        alliance_rows = team_stats.rows(team for alliance in alliances for team in alliance[:3]).reshape(-1, 3)
+        red_idx, blue_idx = (np.array(idx) for idx in zip(*pairings))
+        features = Fetcher.gather_match_features(
+            team_stats, np.hstack([alliance_rows[red_idx], alliance_rows[blue_idx]]), event_week
+        )
 
-                prob_red_wins = prediction.win_probability["red"]
-                win_probs[(red_alliance_number, blue_alliance_number)] = prob_red_wins
-                win_probs[(blue_alliance_number, red_alliance_number)] = (
-                    1.0 - prob_red_wins
-                )
+        # One model invocation for every pairing
+        prob_red_wins = self.mp.predict_red_win_probabilities(features)
+
+        win_probs[red_idx, blue_idx] = prob_red_wins
+        win_probs[blue_idx, red_idx] = 1.0 - prob_red_wins
 
-        # print("Pre-computation complete.")
         return win_probs
 
-    def simulate_frc_tournament_fast(self, precomputed_probs):
+    def simulate_frc_tournament_fast(
+        self, precomputed_probs, draws=None, plan: Optional[CompiledBracket] = None
+    ):
         """
         Runs a full simulation using the ultra-fast winner determination function.
+
+        The bracket is executed from a compiled plan (by default the format that
+        matches the number of alliances). `draws` optionally supplies the
+        plan.n_draws uniform samples the bracket can consume; with the same
+        draws this produces the same champion as VectorizedPlayoffEngine.simulate_batch.
+
+        Returns:
+            int: The champion's alliance number.
+        """
+        if plan is None:
+            plan = get_bracket_plan(default_bracket_name(len(precomputed_probs)))
+
+        # Slot layout described in CompiledBracket, holding 1-based alliance numbers
+        slots = list(range(1, plan.num_alliances + 1)) + [0] * (plan.n_slots - plan.num_alliances)
+        out = plan.num_alliances
+
+        for red_slot, blue_slot, best_of, offset in plan.steps:
+            red_alliance_number = slots[red_slot]
+            blue_alliance_number = slots[blue_slot]
+            needed = best_of // 2 + 1
+            red_games = blue_games = 0
+            game = 0
+            while red_games < needed and blue_games < needed:
+                winner = self.determine_match_winner_fast(
+                    red_alliance_number,
+                    blue_alliance_number,
+                    precomputed_probs,
+                    draws[offset + game] if draws is not None else None,
+                )
+                if winner == red_alliance_number:
+                    red_games += 1
+                else:
+                    blue_games += 1
+                game += 1
+
+            if red_games == needed:
+                slots[out], slots[out + 1] = red_alliance_number, blue_alliance_number
+            else:
+                slots[out], slots[out + 1] = blue_alliance_number, red_alliance_number
+            out += 2
+
+        return slots[plan.champion_slot]
+
+    @staticmethod
+    def get_event_stats(event: EventSnapshot, teams: tuple) -> tuple[int, dict, dict]:
+        """
+        Looks up the event week and the Statbotics and TBA stats of `teams`.
+
+        Args:
+            event (EventSnapshot): The event, see Fetcher.events.
+            teams (tuple): Team numbers.
+
+        Returns:
+            tuple: (event_week, all_sb_stats, all_tba_stats), the sources
+                   of the TeamStatsMatrix that the pairings are gathered from.
+        """
+        event_week = event.week
+        if event_week is None:
+            event_week = 8  # Default week if not found
+
+        # Statbotics stats come from the local dataset, TBA stats from the snapshot
+        all_sb_stats = Fetcher.sb.get_all_sb_stats_for_event(event.event_key, teams)
+        all_tba_stats = event.tba_stats(tuple(teams))
+        all_tba_stats = dict(sorted(all_tba_stats.items()))  # Sort for consistency
+        # --- END OF NETWORK CALLS ---
+
+        return event_week, all_sb_stats, all_tba_stats
+
+    def get_event_win_probabilities(
+        self, event_key: str
+    ) -> tuple[list[list[int]], np.ndarray, str]:
         """
-        match_results = {}
+        Scores every alliance pairing of an event, with the alliances and the
+        stats of one snapshot of it.
+
+        The probability matrix is memoized by a fingerprint of the inputs and
+        the model version, so only changed alliances or stats trigger inference.
 
-        def play_and_record_match(
-            match_number, red_alliance_number, blue_alliance_number
-        ):
-            winner = self.determine_match_winner_fast(
-                red_alliance_number, blue_alliance_number, precomputed_probs
+        Returns:
+            tuple: The alliances (lists of team numbers), the unshrunk
+                   probability matrix from precompute_win_probabilities and the
+                   fingerprint of the inputs it was computed from.
+        """
+        event = Fetcher.events.get(event_key)
+        alliances = [list(alliance) for alliance in event.alliances]
+        event_week, all_sb_stats, all_tba_stats = self.get_event_stats(event, event.alliance_teams)
+
+        fingerprint = "{}:{}:{}".format(
+            stable_hash(alliances),
+            stable_hash(event_week, all_sb_stats, all_tba_stats),
+            loader.model_version,
+        )
+        win_probs = self.win_prob_cache.get((event_key, fingerprint))
+        if win_probs is None:
+            # Pass the pre-fetched data to the pre-computation function
+            win_probs = self.precompute_win_probabilities(
+                alliances=alliances,
+                event_week=event_week,
+                all_sb_stats=all_sb_stats,
+                all_tba_stats=all_tba_stats,
             )
-            loser = (
-                blue_alliance_number
-                if winner == red_alliance_number
-                else red_alliance_number
+            win_probs.setflags(write=False)
+            self.win_prob_cache.set((event_key, fingerprint), win_probs)
+
+        return alliances, win_probs, fingerprint
+
+    @staticmethod
+    def _resolve_plan(bracket: Optional[str], num_alliances: int) -> CompiledBracket:
+        """Returns the compiled bracket to play, checking it fits the alliances."""
+        plan = get_bracket_plan(bracket or default_bracket_name(num_alliances))
+        if plan.num_alliances != num_alliances:
+            raise ValueError(
+                f"Bracket '{plan.name}' needs {plan.num_alliances} alliances, event has {num_alliances}"
             )
-            match_results[match_number] = {"winner": winner, "loser": loser}
-
-        # The simulation logic
-        play_and_record_match("M1", 1, 8)
-        play_and_record_match("M2", 4, 5)
-        play_and_record_match("M3", 3, 6)
-        play_and_record_match("M4", 2, 7)
-        play_and_record_match(
-            "M5", match_results["M1"]["loser"], match_results["M2"]["loser"]
-        )
-        play_and_record_match(
-            "M6", match_results["M3"]["loser"], match_results["M4"]["loser"]
+        return plan
+
+    def compute_exact_playoff_odds(self, event_key: str, bracket: Optional[str] = None) -> PlayoffOdds:
+        """
+        Computes the exact championship and per-round advancement probabilities.
+
+        Uses the same shrunk probability matrix as the Monte Carlo engines, so
+        simulate_n_playoffs converges to these numbers. Results are memoized
+        like simulate_n_playoffs.
+
+        Args:
+            event_key (str): The event key (e.g., '2025iri').
+            bracket (Optional[str]): Name of a format in domain.bracket.BRACKET_FORMATS.
+
+        Returns:
+            PlayoffOdds: Exact elimination-round distribution for every alliance.
+        """
+        alliances, precomputed_win_probs, fingerprint = self.get_event_win_probabilities(event_key)
+        plan = self._resolve_plan(bracket, len(alliances))
+
+        cache_key = (event_key, fingerprint, SIMULATION_SHRINK_ALPHA, plan.name, "exact")
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        prob_matrix = VectorizedPlayoffEngine.shrink_probability_matrix(
+            precomputed_win_probs, SIMULATION_SHRINK_ALPHA
         )
-        play_and_record_match(
-            "M7", match_results["M1"]["winner"], match_results["M2"]["winner"]
+        distribution = ExactPlayoffEngine.elimination_distribution(prob_matrix, plan)
+
+        odds = PlayoffOdds(
+            event_key=event_key,
+            alliances=alliances,
+            round_names=plan.round_names,
+            elimination_probabilities=distribution.tolist(),
         )
-        play_and_record_match(
-            "M8", match_results["M3"]["winner"], match_results["M4"]["winner"]
+        self.result_cache.set(cache_key, odds)
+        return odds
+
+    def simulate_n_playoffs(
+        self,
+        event_key,
+        n_times,
+        seed: Optional[int] = None,
+        vectorized: bool = True,
+        workers: Optional[int] = None,
+        bracket: Optional[str] = None,
+    ):
+        """
+        Simulates the playoffs of an event `n_times` and tallies the champions.
+
+        Args:
+            event_key (str): The event key (e.g., '2025iri').
+            n_times (int): Number of brackets to simulate.
+            seed (Optional[int]): Seed for the random stream. The same seed gives
+                                  the same results with either engine.
+            vectorized (bool): Use the NumPy batch engine (default) instead of
+                               the per-simulation Python loop.
+            workers (Optional[int]): Processes to shard the run across. Defaults
+                                     to config.SIMULATION_WORKERS. Sharding is only
+                                     used for runs of at least
+                                     config.SIMULATION_SHARD_MIN_SIMS; results are
+                                     reproducible for a given seed and worker count.
+            bracket (Optional[str]): Name of a format in domain.bracket.BRACKET_FORMATS.
+                                     Defaults to the format for the number of alliances.
+
+        Results are memoized (see Simulator.result_cache) by the event, a
+        fingerprint of its alliances, stats and model version, and every
+        argument that changes the outcome. The returned tracker may be shared
+        with other callers and must not be modified.
+
+        Returns:
+            SimulationTracker: Championship, finalist, elimination-round and final
+                               matchup counts for every alliance (champions only
+                               when vectorized=False).
+        """
+
+        alliances, precomputed_win_probs, fingerprint = self.get_event_win_probabilities(event_key)
+        plan = self._resolve_plan(bracket, len(alliances))
+
+        workers = SIMULATION_WORKERS if workers is None else workers
+        sharded = vectorized and workers > 1 and n_times >= SIMULATION_SHARD_MIN_SIMS
+        cache_key = (
+            event_key,
+            fingerprint,
+            SIMULATION_SHRINK_ALPHA,
+            plan.name,
+            n_times,
+            seed,
+            vectorized,
+            workers if sharded else 1,
         )
-        play_and_record_match(
-            "M9", match_results["M7"]["loser"], match_results["M6"]["winner"]
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if vectorized:
+            results_tracker = SimulationTracker(
+                alliances=alliances, event_key=event_key, round_names=plan.round_names
+            )
+            prob_matrix = VectorizedPlayoffEngine.shrink_probability_matrix(
+                precomputed_win_probs, SIMULATION_SHRINK_ALPHA
+            )
+            if sharded:
+                VectorizedPlayoffEngine.simulate_sharded(
+                    results_tracker, prob_matrix, n_times, seed, workers, SIMULATION_BATCH_SIZE, plan
+                )
+            else:
+                rng = np.random.default_rng(seed)
+                VectorizedPlayoffEngine.simulate_into(
+                    results_tracker, prob_matrix, n_times, rng, SIMULATION_BATCH_SIZE, plan
+                )
+        else:
+            # The scalar engine is a cross-check: it only tallies champions
+            results_tracker = SimulationTracker(
+                alliances=alliances, total_simulations=n_times, event_key=event_key
+            )
+            rng = np.random.default_rng(seed)
+            for i in range(n_times):
+                draws = rng.random(plan.n_draws)
+                winner = self.simulate_frc_tournament_fast(precomputed_win_probs, draws, plan)
+                results_tracker.add_win(winner)
+
+        self.result_cache.set(cache_key, results_tracker)
+        return results_tracker
+
+    def iter_simulate_n_playoffs(
+        self,
+        event_key: str,
+        max_sims: int,
+        snapshot_interval: int = SIMULATION_SNAPSHOT_INTERVAL,
+        tolerance: float = 0.0,
+        seed: Optional[int] = None,
+        bracket: Optional[str] = None,
+        time_remaining: Optional[Callable[[], Optional[float]]] = None,
+    ) -> Iterator[tuple[SimulationTracker, Optional[str]]]:
+        """
+        Simulates in batches and yields a snapshot of the tally after each one.
+
+        Stops early once every alliance's confidence interval (z =
+        config.SIMULATION_CI_Z) is narrower than `tolerance`, or when
+        `time_remaining` reports that the next batch would not finish before
+        the deadline (keeping config.SIMULATION_DEADLINE_MARGIN in reserve).
+
+        Args:
+            event_key (str): The event key (e.g., '2025iri').
+            max_sims (int): Upper bound on the number of simulations.
+            snapshot_interval (int): Simulations per batch / snapshot.
+            tolerance (float): Target interval width. 0 disables early stopping.
+            seed (Optional[int]): Seed for the random stream.
+            bracket (Optional[str]): Name of a format in domain.bracket.BRACKET_FORMATS.
+            time_remaining (Optional[Callable]): Returns the seconds left before
+                                                 the caller's deadline, or None
+                                                 if there is no deadline (e.g.
+                                                 grpc context.time_remaining).
+
+        Yields:
+            tuple: The (shared, growing) SimulationTracker and the stop reason,
+                   which is None for interim snapshots and one of "converged",
+                   "deadline" or "max_sims" for the last one.
+        """
+        alliances, precomputed_win_probs, _ = self.get_event_win_probabilities(event_key)
+        plan = self._resolve_plan(bracket, len(alliances))
+        prob_matrix = VectorizedPlayoffEngine.shrink_probability_matrix(
+            precomputed_win_probs, SIMULATION_SHRINK_ALPHA
         )
-        play_and_record_match(
-            "M10", match_results["M8"]["loser"], match_results["M5"]["winner"]
+
+        results_tracker = SimulationTracker(
+            alliances=alliances, event_key=event_key, round_names=plan.round_names
         )
-        play_and_record_match(
-            "M11", match_results["M10"]["winner"], match_results["M9"]["winner"]
+        rng = np.random.default_rng(seed)
+        snapshot_interval = max(1, snapshot_interval)
+        last_batch_seconds = 0.0
+
+        while True:
+            size = min(snapshot_interval, max_sims - results_tracker.total_simulations)
+            batch_start = time()
+            VectorizedPlayoffEngine.simulate_into(
+                results_tracker, prob_matrix, size, rng, SIMULATION_BATCH_SIZE, plan
+            )
+            last_batch_seconds = time() - batch_start
+
+            stop_reason = None
+            if results_tracker.total_simulations >= max_sims:
+                stop_reason = "max_sims"
+            elif tolerance > 0 and all(
+                high - low < tolerance
+                for low, high in results_tracker.confidence_intervals(SIMULATION_CI_Z)
+            ):
+                stop_reason = "converged"
+            elif time_remaining is not None:
+                remaining = time_remaining()
+                if remaining is not None and remaining < 2 * last_batch_seconds + SIMULATION_DEADLINE_MARGIN:
+                    stop_reason = "deadline"
+
+            yield results_tracker, stop_reason
+            if stop_reason is not None:
+                return
+
+    def simulate_qualifications(
+        self,
+        event_key: str,
+        n_times: int,
+        seed: Optional[int] = None,
+        top_n: int = QUALS_DEFAULT_TOP_N,
+    ) -> QualificationRankings:
+        """
+        Predicts the final qualification rankings of an event while quals are running.
+
+        The remaining `qm` matches are scored in one batch with
+        MatchpointPredictor.predict_all_matches_for_event and the rest of the
+        schedule is simulated `n_times` on top of the current TBA rankings
+        (see QualificationEngine).
+
+        Results are memoized like simulate_n_playoffs, keyed by a fingerprint
+        of the schedule, the rankings and the model version.
+
+        Args:
+            event_key (str): The event key (e.g., '2025iri').
+            n_times (int): Number of simulations to run.
+            seed (Optional[int]): Seed for the random stream.
+            top_n (int): Cut-off reported by QualificationRankings.top_n_probabilities.
+
+        Returns:
+            QualificationRankings: Rank distribution of every team at the event.
+        """
+        event = Fetcher.events.get(event_key)
+        qual_matches = [match for match in event.matches if match.get("comp_level") == "qm"]
+        rankings = event.rankings
+
+        fingerprint = "{}:{}".format(stable_hash(qual_matches, rankings), loader.model_version)
+        cache_key = (event_key, fingerprint, SIMULATION_SHRINK_ALPHA, "quals", n_times, seed, top_n)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        remaining = [match for match in qual_matches if not is_match_played(match)]
+        predictions = {}
+        if remaining:
+            predictions = {
+                prediction.match_key: prediction
+                for prediction in self.mp.predict_all_matches_for_event(event_key, matches=remaining)
+            }
+
+        schedule = QualificationEngine.build_schedule(
+            qual_matches,
+            rankings,
+            predictions,
+            win_rp=QUALS_WIN_RP,
+            max_bonus_rp=QUALS_MAX_BONUS_RP,
+            shrink_alpha=SIMULATION_SHRINK_ALPHA,
         )
-        play_and_record_match(
-            "M12", match_results["M7"]["winner"], match_results["M8"]["winner"]
+        result = QualificationRankings(
+            teams=schedule.teams,
+            event_key=event_key,
+            current_ranks=schedule.current_ranks.tolist(),
+            current_ranking_scores=[
+                rankings.get(int(team), {}).get("ranking_score", 0.0) for team in schedule.teams
+            ],
+            remaining_matches=len(remaining),
+            top_n=top_n,
         )
-        play_and_record_match(
-            "M13", match_results["M12"]["loser"], match_results["M11"]["winner"]
+        QualificationEngine.simulate_into(
+            result,
+            schedule,
+            n_times,
+            np.random.default_rng(seed),
+            QUALS_BATCH_SIZE,
+            win_rp=QUALS_WIN_RP,
+            max_bonus_rp=QUALS_MAX_BONUS_RP,
         )
 
-        upper_champion = match_results["M12"]["winner"]
-        lower_champion = match_results["M13"]["winner"]
+        self.result_cache.set(cache_key, result)
+        return result
 
-        final_score = {upper_champion: 0, lower_champion: 0}
-        for _ in range(3):  # Max 3 final matches
-            match_winner = self.determine_match_winner_fast(
-                upper_champion, lower_champion, precomputed_probs
-            )
-            final_score[match_winner] += 1
-            if final_score[match_winner] == 2:
-                return match_winner
+    def optimize_alliance_pick(
+        self,
+        event_key: str,
+        ranked_teams: Optional[list[int]] = None,
+        alliances: Optional[list[list[int]]] = None,
+        bracket: Optional[str] = None,
+        beam_width: int = 1,
+        n_sims: int = 0,
+        seed: Optional[int] = None,
+    ) -> AllianceSelectionResult:
+        """
+        Scores every team the next captain in the draft can pick by the
+        championship odds it leaves their alliance (see AllianceSelectionOptimizer).
 
-        return max(final_score, key=final_score.get)
+        Pairing probabilities are shared between candidates and between
+        requests for the same event stats and model version, so only pairings
+        never seen before reach the model, in one batched call per search level.
 
-    def simulate_n_playoffs(self, event_key, n_times):
+        Args:
+            event_key (str): The event key (e.g., '2025iri').
+            ranked_teams (Optional[list[int]]): Teams in qualification rank order.
+                                                Defaults to the current TBA rankings.
+            alliances (Optional[list[list[int]]]): Alliances formed so far, captain first.
+            bracket (Optional[str]): Name of a format in domain.bracket.BRACKET_FORMATS.
+                                     Defaults to the format for
+                                     config.SELECTION_DEFAULT_ALLIANCES alliances.
+            beam_width (int): Lineups kept while refining the captain's later picks.
+            n_sims (int): Monte Carlo simulations per lineup; 0 = exact odds.
+            seed (Optional[int]): Seed for the Monte Carlo draws.
 
-        all_teams_flat, alliances = self.tba.get_alliances(event_key)
+        Raises:
+            ValueError: If the lineup is invalid or the draft is already complete.
 
-        event_week = Fetcher.tba.get_event_week(event_key)
-        if event_week is None:
-            event_week = 8  # Default week if not found
+        Returns:
+            AllianceSelectionResult: The candidates, best first.
+        """
+        alliances = [list(alliance) for alliance in alliances or []]
+        event = Fetcher.events.get(event_key)
+        if not ranked_teams:
+            rankings = event.rankings
+            ranked_teams = sorted(rankings, key=lambda team: rankings[team]["rank"])
+        ranked_teams = [int(team) for team in ranked_teams]
+        # Teams already picked still need stats even if missing from the ranking list
+        teams = tuple(dict.fromkeys(ranked_teams + [t for a in alliances for t in a]))
 
-        # Get all team stats from both sources concurrently
-        all_sb_stats = Fetcher.sb.get_all_sb_stats_for_event(event_key, all_teams_flat)
-        all_tba_stats = Fetcher.tba.get_all_tba_stats_for_event_from_single_call(
-            event_key, all_teams_flat
-        )
-        all_tba_stats = dict(sorted(all_tba_stats.items()))  # Sort for consistency
-        # --- END OF NETWORK CALLS ---
-        # print(all_tba_stats)
-        # Pass the pre-fetched data to the pre-computation function
-        precomputed_win_probs = self.precompute_win_probabilities(
-            alliances=alliances,
-            event_week=event_week,
-            all_sb_stats=all_sb_stats,
-            all_tba_stats=all_tba_stats,
+        event_week, all_sb_stats, all_tba_stats = self.get_event_stats(event, teams)
+        fingerprint = "{}:{}".format(
+            stable_hash(event_week, all_sb_stats, all_tba_stats), loader.model_version
         )
+        plan = get_bracket_plan(bracket or default_bracket_name(SELECTION_DEFAULT_ALLIANCES))
 
-        results_tracker = SimulationTracker(
-            alliances=alliances, total_simulations=n_times, event_key=event_key
+        cache_key = (
+            event_key, fingerprint, SIMULATION_SHRINK_ALPHA, "selection",
+            tuple(ranked_teams), tuple(map(tuple, alliances)), plan.name, beam_width, n_sims, seed,
         )
-        initial_time = time()
-        for i in range(n_times):
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-            winner = self.simulate_frc_tournament_fast(precomputed_win_probs)
-            results_tracker.add_win(winner)
-        end_time = time() - initial_time
+        matchups = self.matchup_cache.get((event_key, fingerprint))
+        if matchups is None:
+            matchups = MatchupProbabilityCache(self.mp, event_week, all_sb_stats, all_tba_stats)
+            self.matchup_cache.set((event_key, fingerprint), matchups)
+        evaluations_before = matchups.model_evaluations
 
-        return results_tracker
+        # Other alliances pick by EPA total points, falling back to OPR
+        strength = {
+            team: (all_sb_stats.get(team) or {}).get("total_points")
+            or (all_tba_stats.get(str(team)) or {}).get("opr")
+            or 0.0
+            for team in teams
+        }
+        optimizer = AllianceSelectionOptimizer(
+            ranked_teams,
+            alliances,
+            strength,
+            matchups,
+            plan,
+            shrink_alpha=SIMULATION_SHRINK_ALPHA,
+            n_sims=n_sims,
+            seed=seed,
+            batch_size=SIMULATION_BATCH_SIZE,
+        )
+        alliance_index, pick, candidates = optimizer.optimize(beam_width)
+
+        result = AllianceSelectionResult(
+            event_key=event_key,
+            alliance_number=alliance_index + 1,
+            pick_number=pick,
+            exact=optimizer.exact,
+            candidates=candidates,
+            lineups_evaluated=optimizer.lineups_evaluated,
+            model_evaluations=matchups.model_evaluations - evaluations_before,
+        )
+        self.result_cache.set(cache_key, result)
+        return result
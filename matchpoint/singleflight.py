@@ -0,0 +1,101 @@
+# bbe/matchpoint/singleflight.py
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from . import metrics
+
+
+class _Flight:
+    __slots__ = ("future", "callers")
+
+    def __init__(self, future):
+        self.future = future
+        self.callers = 1
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller runs the
+    call and callers that arrive while it is in flight wait for its result
+    (or its exception) instead of repeating it. Nothing is kept once the
+    call finishes; caching is left to the caller.
+
+    Threads use `do`, coroutines `do_async` (one event loop per process);
+    the two do not wait on each other. The number of callers that shared
+    each call is observed into the histogram `singleflight_<name>` (see
+    matchpoint.metrics), so its count is the number of calls made and
+    sum - count the number of calls saved.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.callers = metrics.histogram(f"singleflight_{name}", metrics.powers_of_two(1024))
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Returns fn(*args), sharing the call with concurrent callers of `key`.
+
+        Raises:
+            Exception: Whatever fn raised, in every caller that shared the call.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(Future())
+            else:
+                flight.callers += 1
+        if not leader:
+            return flight.future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            flight.future.set_exception(e)
+            raise
+        else:
+            flight.future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+            self.callers.observe(flight.callers)
+
+    async def do_async(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Awaits fn(*args), sharing the call with concurrent coroutines awaiting `key`.
+
+        The call runs as its own task, so a caller that is cancelled (e.g.
+        its RPC ended) does not cancel it for the others.
+
+        Raises:
+            Exception: Whatever fn raised, in every caller that shared the call.
+        """
+        flight = self._async_flights.get(key)
+        if flight is not None:
+            flight.callers += 1
+        else:
+            flight = self._async_flights[key] = _Flight(asyncio.ensure_future(fn(*args)))
+            flight.future.add_done_callback(lambda task: self._landed(key, flight, task))
+        return await asyncio.shield(flight.future)
+
+    def _landed(self, key: Hashable, flight: _Flight, task: asyncio.Future) -> None:
+        del self._async_flights[key]
+        self.callers.observe(flight.callers)
+        if not task.cancelled():
+            task.exception()  # Retrieved here too, in case every caller was cancelled
+
+    def stats(self) -> Dict[str, int]:
+        """Calls made, calls saved by sharing and calls in flight."""
+        snapshot = self.callers.snapshot()
+        with self._lock:
+            in_flight = len(self._flights) + len(self._async_flights)
+        return {
+            "calls": snapshot["count"],
+            "coalesced": int(snapshot["sum"]) - snapshot["count"],
+            "in_flight": in_flight,
+        }
@@ -1,2 +1,8 @@
-from .fetcher import Fetcher
-from .statbotics import SBService
\ No newline at end of file
+from .._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AsyncFetcher": ".async_clients",
+    "EventSnapshot": ".event_snapshot",
+    "Fetcher": ".fetcher",
+    "SBService": ".statbotics",
+})
@@ -0,0 +1,410 @@
+# bbe/matchpoint/third_parties/async_clients.py
+import asyncio
+import functools
+import json
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional, Tuple
+import aiohttp
+import numpy as np
+from ..config import (
+    TBA_BASE_URL,
+    TBA_HEADER,
+    STATBOTICS_BASE_URL,
+    UPSTREAM_TIMEOUT,
+    TBA_MAX_CONCURRENCY,
+    STATBOTICS_MAX_CONCURRENCY,
+    STATBOTICS_PAGE_SIZE,
+)
+from ..domain.features import FEATURE_SCHEMA
+from ..singleflight import SingleFlight
+from .event_snapshot import SNAPSHOT_PARTS, EventSnapshot, EventSnapshotLoader, event_snapshots
+from .fetcher import Fetcher
+from .statbotics import SBService
+from .tba import TBAService
+from .upstream import HTTPCache, UpstreamStats, endpoint_of, http_cache, statbotics_client, tba_client
+
+
+class BoundedSession:
+    """
+    An aiohttp session with one upstream API that lets at most `limit`
+    requests be in flight.
+
+    Callers beyond the limit wait on a semaphore, as coroutines, instead of
+    opening more connections to the upstream. Cached responses are
+    revalidated like UpstreamClient's (same HTTPCache), and counted in
+    `stats` (by default the matching UpstreamClient's, see upstream_stats). Concurrent
+    requests for the same URL share one download through `flights`. The
+    session is opened on first use, inside the running event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        limit: int,
+        headers: Optional[Dict[str, Optional[str]]] = None,
+        cache: Optional[HTTPCache] = http_cache,
+        stats: Optional[UpstreamStats] = None,
+        flights: Optional[SingleFlight] = None,
+    ):
+        self.base_url = base_url
+        self.limit = max(int(limit), 1)
+        self.headers = {k: v for k, v in (headers or {}).items() if v is not None}
+        self.cache = cache
+        self.stats = stats or UpstreamStats()
+        self.flights = flights or SingleFlight("upstream")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _open(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._semaphore = asyncio.Semaphore(self.limit)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=UPSTREAM_TIMEOUT),
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                raise_for_status=True,
+            )
+        return self._session
+
+    async def get_json(self, path: str) -> Any:
+        """
+        GETs `base_url + path` and decodes its JSON body, revalidating a
+        cached copy if there is one. Callers asking for a URL already being
+        downloaded await that download and share its body.
+
+        Raises:
+            aiohttp.ClientError: If the request fails or returns an error status.
+            asyncio.TimeoutError: If it takes longer than UPSTREAM_TIMEOUT.
+        """
+        url = f"{self.base_url}{path}"
+        return await self.flights.do_async(url, self._get_json, url, path)
+
+    async def _get_json(self, url: str, path: str) -> Any:
+        endpoint = endpoint_of(path)
+        # The disk cache is synchronous, so it is read and written off the loop
+        entry = await asyncio.to_thread(self.cache.get, url) if self.cache is not None else None
+        session = self._open()
+        try:
+            async with self._semaphore:
+                async with session.get(url, headers=HTTPCache.conditional_headers(entry)) as response:
+                    if response.status == 304 and entry is not None:
+                        self.stats.record(endpoint, "hits")
+                        return entry.data
+                    body = await response.read()
+                    data = json.loads(body)
+                    etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            self.stats.record(endpoint, "errors")
+            raise
+
+        self.stats.record(endpoint, "misses", len(body))
+        if self.cache is not None and (etag or last_modified):
+            await asyncio.to_thread(self.cache.set, url, etag, last_modified, data)
+        return data
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncTBAService:
+    """
+    Non-blocking counterpart of TBAService for the grpc.aio server.
+
+    Responses are parsed by the same helpers as TBAService, so both return
+    the same structures.
+    """
+
+    def __init__(self, session: Optional[BoundedSession] = None):
+        self.session = session or BoundedSession(
+            TBA_BASE_URL, TBA_MAX_CONCURRENCY, headers=TBA_HEADER,
+            stats=tba_client.stats, flights=tba_client.flights,
+        )
+
+    async def get_match_simple(self, match_key: str) -> dict:
+        """
+        Fetches a match in TBA's simple format.
+
+        Raises:
+            aiohttp.ClientError: If the request fails.
+        """
+        return await self.session.get_json(f"/match/{match_key}/simple")
+
+    async def get_tba_oprs_event(self, event_key: str) -> dict:
+        """
+        Fetches OPRs and component OPRs for an entire event, both at once.
+
+        Returns:
+            dict: See TBAService.get_tba_oprs_event; empty if TBA is unreachable.
+        """
+        try:
+            oprs_res, coprs_res = await asyncio.gather(
+                self.session.get_json(f"/event/{event_key}/oprs"),
+                self.session.get_json(f"/event/{event_key}/coprs"),
+            )
+        except aiohttp.ClientConnectionError as e:
+            print(e)
+            return {}
+        return TBAService._combine_oprs(oprs_res or {}, coprs_res or {})
+
+    async def get_event_week(self, event_key: str) -> int | None:
+        """
+        Fetches the competition week number for a given event.
+
+        Returns:
+            int | None: The week number (0 for Week 1, etc.) or None on error.
+        """
+        try:
+            res = await self.session.get_json(f"/event/{event_key}")
+        except aiohttp.ClientConnectionError as e:
+            print(f"Error fetching {event_key} week:\n{e}")
+            return None
+        return (res or {}).get('week')
+
+    async def get_event_matches(self, event_key: str) -> list[dict]:
+        """
+        Fetches every match of an event (played or not) in TBA's simple format.
+
+        Raises:
+            aiohttp.ClientError: If the request fails.
+        """
+        return await self.session.get_json(f"/event/{event_key}/matches/simple") or []
+
+    async def get_event_team_keys(self, event_key: str) -> Tuple[str, ...]:
+        """
+        Fetches the team numbers (e.g. ('254', '1114', ...)) of an event.
+
+        Raises:
+            aiohttp.ClientError: If the request fails.
+        """
+        keys = await self.session.get_json(f"/event/{event_key}/teams/keys") or []
+        return tuple(key[3:] for key in keys)
+
+    async def get_all_tba_stats_for_event_from_single_call(
+        self, event_key: str, team_keys: Tuple[str, ...]
+    ) -> Dict[str, Dict[str, Any]]:
+        """See TBAService.get_all_tba_stats_for_event_from_single_call."""
+        event_oprs = await self.get_tba_oprs_event(event_key)
+        return TBAService._team_stats_from_event_oprs(event_oprs, team_keys)
+
+
+class AsyncEventSnapshotLoader:
+    """
+    Non-blocking counterpart of EventSnapshotLoader: the requests of a
+    snapshot are awaited together through `session`. Snapshots are stored
+    in `loader`, so both server modes (and Fetcher) share them.
+    """
+
+    def __init__(self, session: BoundedSession, loader: EventSnapshotLoader = event_snapshots):
+        self.session = session
+        self.loader = loader
+
+    async def _get_part(self, path: str, optional: bool) -> Any:
+        try:
+            return await self.session.get_json(path)
+        except aiohttp.ClientResponseError as e:
+            if optional and e.status == 404:
+                return None
+            raise
+
+    async def load(self, event_key: str) -> EventSnapshot:
+        """
+        See EventSnapshotLoader.load.
+
+        Raises:
+            aiohttp.ClientError: If a request fails (other than an optional part not existing yet).
+            asyncio.TimeoutError: If a request takes longer than UPSTREAM_TIMEOUT.
+        """
+        responses = await asyncio.gather(*(
+            self._get_part(path.format(event_key), optional)
+            for path, optional in SNAPSHOT_PARTS.values()
+        ))
+        return self.loader._build(event_key, dict(zip(SNAPSHOT_PARTS, responses)))
+
+    async def get(self, event_key: str) -> EventSnapshot:
+        """
+        See EventSnapshotLoader.get; stale snapshots are reloaded by a task on the loop.
+
+        Raises:
+            aiohttp.ClientError: If the event has to be loaded and that fails.
+            asyncio.TimeoutError: Likewise, on a timeout.
+        """
+        return await self.loader._snapshots.get_or_load_async(
+            event_key, functools.partial(self.load, event_key)
+        )
+
+
+class AsyncSBService:
+    """
+    Non-blocking counterpart of SBService for the grpc.aio server.
+
+    API lookups go through a bounded aiohttp session; lookups in the local
+    CSV (the source the predictions use) run on `executor`, off the loop.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, session: Optional[BoundedSession] = None):
+        self.executor = executor
+        self.session = session or BoundedSession(
+            STATBOTICS_BASE_URL, STATBOTICS_MAX_CONCURRENCY,
+            stats=statbotics_client.stats, flights=statbotics_client.flights,
+        )
+        self.sync = SBService()
+
+    async def get_sb_team_stats_event_from_api(self, team: str, event_key: str) -> dict:
+        """
+        Fetches statistics for a team at an event from the Statbotics API.
+
+        Raises:
+            aiohttp.ClientError: If the request fails.
+            KeyError: If the response JSON is missing expected keys.
+        """
+        team_dict = await self.session.get_json(f"/team_event/{str(team)}/{event_key}")
+        return SBService._team_info_from_api(team_dict, event_key)
+
+    async def get_event_sb_stats_from_api(self, event_key: str) -> Dict[str, dict]:
+        """
+        See SBService.get_event_sb_stats_from_api; both share the per-event cache
+        (stale entries are refetched by a task on the loop).
+
+        Raises:
+            aiohttp.ClientError: If a request fails.
+        """
+        return await SBService._event_cache.get_or_load_async(
+            event_key, functools.partial(self._fetch_event_sb_stats, event_key)
+        )
+
+    async def _fetch_event_sb_stats(self, event_key: str) -> Dict[str, dict]:
+        records = []
+        while True:
+            page = await self.session.get_json(SBService._team_events_path(event_key, len(records))) or []
+            records.extend(page)
+            if len(page) < STATBOTICS_PAGE_SIZE:
+                break
+        return SBService._team_events_by_team(records, event_key)
+
+    async def get_all_sb_stats_for_event_concurrently_from_api(
+        self, event_key: str, team_keys: Tuple[str, ...]
+    ) -> dict:
+        """
+        See SBService.get_all_sb_stats_for_event_concurrently_from_api; the
+        teams missing from the bulk result are looked up concurrently and
+        left out if that fails.
+        """
+        try:
+            event_stats = await self.get_event_sb_stats_from_api(event_key)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"ERROR: Bulk Statbotics fetch for {event_key} failed, falling back to per-team requests: {e}")
+            event_stats = {}
+
+        all_team_stats = {}
+        missing = []
+        for team_key in team_keys:
+            team_info = event_stats.get(str(team_key))
+            if team_info is None:
+                missing.append(team_key)
+            else:
+                all_team_stats[team_key] = team_info
+
+        results = await asyncio.gather(
+            *(self.get_sb_team_stats_event_from_api(team_key, event_key) for team_key in missing),
+            return_exceptions=True,
+        )
+        for team_key, result in zip(missing, results):
+            if isinstance(result, Exception):
+                print(f"ERROR: Statbotics lookup for team {team_key} failed: {result}")
+            elif result:
+                all_team_stats[team_key] = result
+        return all_team_stats
+
+    async def get_all_sb_stats_for_event(self, event_key: str, team_keys: Tuple[str, ...]) -> dict:
+        """SBService.get_all_sb_stats_for_event, run on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.sync.get_all_sb_stats_for_event, event_key, team_keys
+        )
+
+    async def close(self) -> None:
+        await self.session.close()
+
+
+class AsyncFetcher:
+    """
+    Non-blocking counterpart of Fetcher: independent upstream requests of a
+    call are awaited together, and the features are written with the same
+    helpers, so the vectors match Fetcher's.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None):
+        self.tba = AsyncTBAService()
+        self.sb = AsyncSBService(executor)
+        self.events = AsyncEventSnapshotLoader(self.tba.session)
+
+    async def get_match_feature_vector(
+        self, match_key: str, out: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """
+        See Fetcher.get_match_feature_vector.
+
+        Returns:
+            Optional[np.ndarray]: The (1 x features) float32 matrix, or None if
+                                  the data could not be fetched or processed.
+        """
+        event_key = match_key.split("_")[0]
+
+        try:
+            event = await self.events.get(event_key)
+            match = event.match(match_key)
+            if match is None:
+                # Not in the snapshot (e.g. a playoff match created since it was loaded)
+                match = await self.tba.get_match_simple(match_key)
+            alliances = match["alliances"]
+            red_teams = [team[3:] for team in alliances["red"]["team_keys"]]
+            blue_teams = [team[3:] for team in alliances["blue"]["team_keys"]]
+
+            all_teams = tuple(red_teams + blue_teams)
+            event_week = event.week
+            sb_stats_dict = await self.sb.get_all_sb_stats_for_event(event_key, all_teams)
+            tba_stats_dict = event.tba_stats(all_teams)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching data for match {match_key}: {e}")
+            return None
+        except KeyError as e:
+            print(f"Error processing match {match_key}. Missing team or key?: {e}")
+            return None
+
+        features = FEATURE_SCHEMA.empty(1) if out is None else out
+        Fetcher.write_match_team_stats(
+            features[0], red_teams, blue_teams, event_week, sb_stats_dict, tba_stats_dict
+        )
+        return features
+
+    async def get_all_team_features_for_event(self, event_key: str) -> Dict[str, Dict[str, Any]]:
+        """
+        See Fetcher.get_all_team_features_for_event; both share the
+        "team_features" cache, and the features are merged on the executor.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Team number -> combined features, or an
+            empty dictionary on failure.
+        """
+        try:
+            event = await self.events.get(event_key)
+            return await Fetcher._team_features.get_or_load_async(
+                (event_key, event.version),
+                functools.partial(
+                    asyncio.get_running_loop().run_in_executor,
+                    self.sb.executor,
+                    Fetcher._merge_snapshot_team_features,
+                    event,
+                ),
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"ERROR: Network failure fetching team data for {event_key}: {e}")
+            return {}
+        except KeyError as e:
+            print(f"ERROR: Missing key while fetching team data for {event_key}: {e}")
+            return {}
+
+    async def close(self) -> None:
+        await asyncio.gather(self.tba.session.close(), self.sb.close())
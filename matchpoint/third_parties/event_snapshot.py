@@ -0,0 +1,204 @@
+# bbe/matchpoint/third_parties/event_snapshot.py
+import functools
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+import requests
+from .. import cache
+from ..cache import stable_hash
+from ..config import (
+    EVENT_SNAPSHOT_TTL,
+    EVENT_SNAPSHOT_STALE_TTL,
+    EVENT_SNAPSHOT_CACHE_SIZE,
+    EVENT_SNAPSHOT_CACHE_BYTES,
+)
+from .tba import TBAService
+from .upstream import UpstreamClient, tba_client
+
+# Part of a snapshot -> (TBA path, optional). Optional parts that TBA does not
+# have yet (404 or null, e.g. alliances before selection) are left empty.
+SNAPSHOT_PARTS: Dict[str, Tuple[str, bool]] = {
+    "info": ("/event/{}", False),
+    "team_keys": ("/event/{}/teams/keys", False),
+    "matches": ("/event/{}/matches/simple", False),
+    "oprs": ("/event/{}/oprs", False),
+    "coprs": ("/event/{}/coprs", True),
+    "alliances": ("/event/{}/alliances", True),
+    "rankings": ("/event/{}/rankings", True),
+}
+
+
+@dataclass(frozen=True)
+class EventSnapshot:
+    """
+    Everything TBA knows about an event that the predictor, the fetcher and
+    the simulator use, fetched together and never modified afterwards.
+
+    Consumers that read several parts (e.g. the alliances and the OPRs of a
+    playoff simulation) take them from the same snapshot, so they always
+    describe the same moment. The contents are shared between requests and
+    must be treated as read-only.
+
+    Attributes:
+        event_key (str): The event key.
+        version (int): Starts at 1 and grows each time a reload finds
+                       different data for the event.
+        digest (str): stable_hash of the TBA responses it was built from.
+        fetched_at (float): Unix time of the load.
+        info (dict): The /event/{key} response.
+        team_keys (Tuple[str, ...]): Team numbers (e.g. ('254', '1114', ...)).
+        matches (Tuple[dict, ...]): Every match in TBA's simple format; unplayed ones score -1.
+        oprs (dict): OPR and COPR maps, see TBAService.get_tba_oprs_event.
+        alliances (Tuple[Tuple[int, ...], ...]): Playoff alliances (captain and two
+                                                  picks); empty before selection.
+        rankings (dict): See TBAService.get_event_rankings; empty before quals.
+    """
+
+    event_key: str
+    version: int
+    digest: str
+    fetched_at: float
+    info: Dict[str, Any]
+    team_keys: Tuple[str, ...]
+    matches: Tuple[dict, ...]
+    oprs: Dict[str, Dict[str, float]]
+    alliances: Tuple[Tuple[int, ...], ...]
+    rankings: Dict[int, Dict[str, Any]]
+
+    @property
+    def week(self) -> Optional[int]:
+        """The competition week (0 for Week 1, etc.), None if TBA has none."""
+        return self.info.get("week")
+
+    @property
+    def alliance_teams(self) -> Tuple[int, ...]:
+        """Every team of the alliances, flattened in alliance order."""
+        return tuple(team for alliance in self.alliances for team in alliance)
+
+    def match(self, match_key: str) -> Optional[dict]:
+        """The match with key `match_key`, or None if it is not in the snapshot."""
+        for match in self.matches:
+            if match.get("key") == match_key:
+                return match
+        return None
+
+    def tba_stats(self, team_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-team OPRs of `team_keys`, as TBAService.get_all_tba_stats_for_event_from_single_call
+        returns them (0.0 for teams without data).
+        """
+        return TBAService._team_stats_from_event_oprs(self.oprs, team_keys)
+
+
+class EventSnapshotLoader:
+    """
+    Loads EventSnapshots with every TBA request of an event in flight at
+    once, so a cold request costs roughly one round trip instead of one per
+    endpoint.
+
+    Snapshots live in the "event_snapshots" cache namespace: fresh for
+    `ttl` seconds, then served for up to `stale_ttl` more while a background
+    reload replaces them, so requests only wait on TBA for events not seen
+    recently. Concurrent loads of an event are shared, and a failed
+    background reload leaves the stale snapshot in place. The async loader
+    (async_clients.AsyncEventSnapshotLoader) shares the same store.
+    """
+
+    def __init__(
+        self,
+        client: UpstreamClient = tba_client,
+        ttl: float = EVENT_SNAPSHOT_TTL,
+        stale_ttl: float = EVENT_SNAPSHOT_STALE_TTL,
+        maxsize: int = EVENT_SNAPSHOT_CACHE_SIZE,
+        max_bytes: int = EVENT_SNAPSHOT_CACHE_BYTES,
+    ):
+        self.client = client
+        self._snapshots = cache.namespace("event_snapshots", maxsize, ttl, stale_ttl, max_bytes)
+        # Event key -> (digest, version) of its latest snapshot, kept past eviction
+        # so versions never repeat within the process
+        self._versions: Dict[str, Tuple[str, int]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _build(self, event_key: str, responses: Dict[str, Any]) -> EventSnapshot:
+        """Builds the snapshot of an event from its TBA responses, numbering its version."""
+        digest = stable_hash(responses)
+        with self._lock:
+            previous_digest, version = self._versions.get(event_key, (None, 0))
+            if digest != previous_digest:
+                version += 1
+                self._versions[event_key] = (digest, version)
+        return EventSnapshot(
+            event_key=event_key,
+            version=version,
+            digest=digest,
+            fetched_at=time.time(),
+            info=responses["info"] or {},
+            team_keys=tuple(key[3:] for key in responses["team_keys"] or []),
+            matches=tuple(responses["matches"] or []),
+            oprs=TBAService._combine_oprs(responses["oprs"] or {}, responses["coprs"] or {}),
+            alliances=tuple(map(tuple, TBAService._alliances_from_api(responses["alliances"] or []))),
+            rankings=TBAService._rankings_from_api(responses["rankings"] or {}),
+        )
+
+    def _get_part(self, path: str, optional: bool) -> Any:
+        try:
+            return self.client.get_json(path)
+        except requests.HTTPError as e:
+            if optional and e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    def load(self, event_key: str) -> EventSnapshot:
+        """
+        Fetches a new snapshot of an event, all of its parts concurrently,
+        without storing it (see get and refresh).
+
+        Raises:
+            requests.RequestException: If a request fails (other than an optional part not existing yet).
+        """
+        with self._lock:
+            if self._executor is None:
+                # Created on first use, after a pre-forking parent has forked
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(SNAPSHOT_PARTS), thread_name_prefix="event-snapshot"
+                )
+        futures = {
+            part: self._executor.submit(self._get_part, path.format(event_key), optional)
+            for part, (path, optional) in SNAPSHOT_PARTS.items()
+        }
+        return self._build(event_key, {part: future.result() for part, future in futures.items()})
+
+    def get(self, event_key: str) -> EventSnapshot:
+        """
+        The snapshot of an event; loaded first if there is none (or it is
+        past its stale window), reloaded in the background if it is stale.
+
+        Raises:
+            requests.RequestException: If the event has to be loaded and that fails.
+        """
+        return self._snapshots.get_or_load(event_key, functools.partial(self.load, event_key))
+
+    def refresh(self, event_key: str) -> EventSnapshot:
+        """
+        Loads and stores a new snapshot of an event now.
+
+        Raises:
+            requests.RequestException: If loading fails; the stored snapshot is kept.
+        """
+        snapshot = self.load(event_key)
+        self._snapshots.set(event_key, snapshot)
+        return snapshot
+
+    @staticmethod
+    def invalidate(event_key: str) -> int:
+        """
+        Drops the event's snapshot and everything cached from it (see
+        cache.invalidate_event). Returns the number of entries dropped.
+        """
+        return cache.invalidate_event(event_key)
+
+
+event_snapshots = EventSnapshotLoader()
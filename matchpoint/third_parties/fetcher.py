@@ -2,10 +2,20 @@ from textwrap import indent
 import requests
 from .tba import TBAService
 from .statbotics import SBService
-from ..config import TBA_BASE_URL, TBA_HEADER, FEATURE_ORDER
+from .event_snapshot import EventSnapshot, event_snapshots
+from .upstream import tba_client
+from .. import cache
+from ..domain.features import FEATURE_SCHEMA, TeamStatsMatrix
+from ..config import (
+    TEAM_FEATURES_TTL,
+    TEAM_FEATURES_STALE_TTL,
+    TEAM_FEATURES_CACHE_SIZE,
+    TEAM_FEATURES_CACHE_BYTES,
+)
 import functools
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
+import numpy as np
 
 class Fetcher:
     """
@@ -18,15 +28,21 @@ class Fetcher:
 
     sb = SBService()
     tba = TBAService()
+    events = event_snapshots
+    # Keyed by (event key, snapshot version); shared with AsyncFetcher
+    _team_features = cache.namespace(
+        "team_features", TEAM_FEATURES_CACHE_SIZE, TEAM_FEATURES_TTL, TEAM_FEATURES_STALE_TTL, TEAM_FEATURES_CACHE_BYTES
+    )
+    _team_stats = cache.namespace(
+        "team_stats", TEAM_FEATURES_CACHE_SIZE, TEAM_FEATURES_TTL, TEAM_FEATURES_STALE_TTL, TEAM_FEATURES_CACHE_BYTES
+    )
 
     @staticmethod
     def get_match_features(match_key: str) -> dict | None:
         """
         Fetches and compiles a feature set for a specific match.
 
-        This method retrieves team information for a given match, fetches statistics
-        for each participating team from both Statbotics and TBA, combines them,
-        and then orders them according to the FEATURE_ORDER constant.
+        Dict form of get_match_feature_vector, keyed by FEATURE_ORDER names.
 
         Args:
             match_key (str): The key for the match (e.g., '2023cada_qm1').
@@ -36,23 +52,49 @@ class Fetcher:
                         Returns None if an error occurs during data fetching
                         or processing.
         """
+        features = Fetcher.get_match_feature_vector(match_key)
+        if features is None:
+            return None
+        return FEATURE_SCHEMA.to_dict(features[0])
+
+    @staticmethod
+    def get_match_feature_vector(
+        match_key: str, out: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Fetches the features of a specific match as a float32 vector.
+
+        This method retrieves team information for a given match, fetches statistics
+        for each participating team from both Statbotics and TBA and writes them
+        straight into their FEATURE_ORDER columns (see FeatureSchema). Features
+        without data are 0.0. The match, the week and the OPRs come from the
+        event's snapshot (see EventSnapshotLoader).
+
+        Args:
+            match_key (str): The key for the match (e.g., '2023cada_qm1').
+            out (Optional[np.ndarray]): A (1 x features) buffer to fill, as
+                                        created by FEATURE_SCHEMA.empty. A new
+                                        one is allocated when omitted.
+
+        Returns:
+            Optional[np.ndarray]: The (1 x features) float32 matrix, ready for
+                                  inference. Returns None if an error occurs
+                                  during data fetching or processing.
+        """
         event_key = match_key.split("_")[0]
 
         try:
-            req = requests.get(
-                f"{TBA_BASE_URL}/match/{match_key}/simple",
-                TBA_HEADER,
-            )
-            req.raise_for_status()
-            alliances = req.json()["alliances"]
+            event = Fetcher.events.get(event_key)
+            match = event.match(match_key)
+            if match is None:
+                # Not in the snapshot (e.g. a playoff match created since it was loaded)
+                match = tba_client.get_json(f"/match/{match_key}/simple")
+            alliances = match["alliances"]
 
             red_teams = [team[3:] for team in alliances["red"]["team_keys"]]
             blue_teams = [team[3:] for team in alliances["blue"]["team_keys"]]
 
-            event_week = Fetcher.tba.get_event_week(event_key)
-
-            raw_features = {}
-            raw_features["week"] = 8 if event_week is None else event_week
+            event_week = event.week
 
             all_teams = red_teams + blue_teams
 
@@ -60,36 +102,13 @@ class Fetcher:
             sb_stats_dict = Fetcher.sb.get_all_sb_stats_for_event(
                 event_key, tuple(all_teams)
             )
-            tba_stats_dict = Fetcher.tba.get_all_tba_stats_for_event_from_single_call(
-                event_key, tuple(all_teams)
-            )
-
-            for i in range(3):
-                red_team = red_teams[i]
-                blue_team = blue_teams[i]
-
-                # Combine Statbotics and TBA stats for each team
-                red_team_stats = (sb_stats_dict.get(red_team, {}) or {}) | (
-                    tba_stats_dict.get(red_team, {}) or {}
-                )
-                blue_team_stats = (sb_stats_dict.get(blue_team, {}) or {}) | (
-                    tba_stats_dict.get(blue_team, {}) or {}
-                )
-
-                for stat_name, value in red_team_stats.items():
-                    if stat_name not in ["team", "event"]:
-                        raw_features[f"red{i+1}_{stat_name}"] = value
-
-                for stat_name, value in blue_team_stats.items():
-                    if stat_name not in ["team", "event"]:
-                        raw_features[f"blue{i+1}_{stat_name}"] = value
+            tba_stats_dict = event.tba_stats(all_teams)
 
-            # Ensure all features from FEATURE_ORDER are present, defaulting to 0.0
-            ordered_match_features = {
-                feature: raw_features.get(feature, 0.0) for feature in FEATURE_ORDER
-            }
-
-            return ordered_match_features
+            features = FEATURE_SCHEMA.empty(1) if out is None else out
+            Fetcher.write_match_team_stats(
+                features[0], red_teams, blue_teams, event_week, sb_stats_dict, tba_stats_dict
+            )
+            return features
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching data for match {match_key}: {e}")
@@ -98,6 +117,38 @@ class Fetcher:
             print(f"Error processing match {match_key}. Missing team or key?: {e}")
             return None
 
+    @staticmethod
+    def write_match_team_stats(
+        out: np.ndarray,
+        red_teams: list[str],
+        blue_teams: list[str],
+        event_week: Optional[int],
+        sb_stats: dict,
+        tba_stats: dict,
+    ) -> np.ndarray:
+        """
+        Writes a fetched match into a feature row (overwritten entirely).
+        Teams without stats leave their features at 0.0.
+
+        Args:
+            out (np.ndarray): The row to fill.
+            red_teams (list[str]): Red alliance team numbers, in position order.
+            blue_teams (list[str]): Blue alliance team numbers, in position order.
+            event_week (Optional[int]): Week of the event; None is written as 8.
+            sb_stats (dict): Statbotics stats by team number.
+            tba_stats (dict): TBA stats by team number.
+
+        Returns:
+            np.ndarray: `out`, for chaining.
+        """
+        FEATURE_SCHEMA.write_match(out, 8 if event_week is None else event_week, [], [])
+        for color, teams in (("red", red_teams), ("blue", blue_teams)):
+            for position, team in enumerate(teams[:3], start=1):
+                # TBA stats take precedence over Statbotics ones with the same name
+                FEATURE_SCHEMA.write_team(out, color, position, sb_stats.get(team, {}) or {})
+                FEATURE_SCHEMA.write_team(out, color, position, tba_stats.get(team, {}) or {})
+        return out
+
     @staticmethod
     def get_match_features_from_prefetched_data(
         red_teams: list[int],
@@ -109,52 +160,87 @@ class Fetcher:
         """
         Assembles the feature vector for a match using pre-fetched data.
         This function performs NO network requests and is very fast.
+
+        Dict form of write_match_features_from_prefetched_data.
         """
-        raw_features = {"week": event_week}
+        row = FEATURE_SCHEMA.empty(1)[0]
+        Fetcher.write_match_features_from_prefetched_data(
+            row, red_teams, blue_teams, event_week, all_sb_stats, all_tba_stats
+        )
+        return FEATURE_SCHEMA.to_dict(row)
 
-        for i in range(3):
-            red_team = red_teams[i]
-            blue_team = blue_teams[i]
+    @staticmethod
+    def write_match_features_from_prefetched_data(
+        out: np.ndarray,
+        red_teams: list[int],
+        blue_teams: list[int],
+        event_week: int,
+        all_sb_stats: dict,
+        all_tba_stats: dict,
+    ) -> np.ndarray:
+        """
+        Writes the features of a match into a row of a feature buffer using
+        pre-fetched data. No network requests and no intermediate dicts, so
+        many pairings can be assembled into one FEATURE_SCHEMA.empty(n) matrix
+        and scored with a single model call.
 
-            # Look up stats from the pre-fetched dictionaries
-            red_team_sb_stats = all_sb_stats.get(red_team, {}) or {}
-            red_team_tba_stats = all_tba_stats.get(str(red_team), {}) or {}
-            # print("RED TEAM STATS:", red_team, all_tba_stats[str(red_team)])
-            blue_team_sb_stats = all_sb_stats.get(blue_team, {}) or {}
-            blue_team_tba_stats = all_tba_stats.get(str(blue_team), {}) or {}
+        Args:
+            out (np.ndarray): The row to fill (overwritten entirely).
+            red_teams (list[int]): Red alliance, in position order.
+            blue_teams (list[int]): Blue alliance, in position order.
+            event_week (int): Week of the event.
+            all_sb_stats (dict): Statbotics stats by team number.
+            all_tba_stats (dict): TBA stats by team number as a string.
 
-            # Combine Statbotics and TBA stats for each team using the dictionary union operator
-            red_team_stats = red_team_sb_stats | red_team_tba_stats
-            blue_team_stats = blue_team_sb_stats | blue_team_tba_stats
+        Raises:
+            ValueError: If a feature of the match has no value.
 
-            for stat_name, value in red_team_stats.items():
-                if stat_name not in ["team", "event"]:
-                    raw_features[f"red{i+1}_{stat_name}"] = value
+        Returns:
+            np.ndarray: `out`, for chaining.
+        """
+        FEATURE_SCHEMA.write_match(out, event_week, [], [])
+        for color, teams in (("red", red_teams), ("blue", blue_teams)):
+            for position in range(1, 4):
+                team = teams[position - 1]
+                # TBA stats take precedence over Statbotics ones with the same name
+                FEATURE_SCHEMA.write_team(out, color, position, all_sb_stats.get(team, {}) or {})
+                FEATURE_SCHEMA.write_team(out, color, position, all_tba_stats.get(str(team), {}) or {})
+
+        if np.isnan(out).any():
+            raise ValueError(
+                f"Missing required features in match features: {FEATURE_SCHEMA.missing(out)}")
 
-            for stat_name, value in blue_team_stats.items():
-                if stat_name not in ["team", "event"]:
-                    raw_features[f"blue{i+1}_{stat_name}"] = value
-                    
-        # print("FEATURES", json.dumps(raw_features, indent=4))
+        return out
 
-        # Ensure all features from FEATURE_ORDER are present, defaulting to 0.0
-        ordered_match_features = {
-            feature: raw_features.get(feature, 0.0) for feature in FEATURE_ORDER
-        }
-        
-        missing_features = [
-            feature
-            for feature in FEATURE_ORDER
-            if feature not in ordered_match_features
-            or ordered_match_features[feature] is None
-        ]
-        if missing_features:
-            # print(json.dumps(ordered_match_features, indent=4))
-            # print(f"Missing required features in match features: {blue_teams} {missing_features}")
-            raise ValueError(
-                f"Missing required features in match features: {missing_features}")
+    @staticmethod
+    def gather_match_features(
+        team_stats: TeamStatsMatrix, team_rows: np.ndarray, event_week: int
+    ) -> np.ndarray:
+        """
+        Vectorized write_match_features_from_prefetched_data: the feature
+        matrix of many matches with one gather from the event's team-stats
+        matrix (see FeatureSchema.gather).
 
-        return ordered_match_features
+        Args:
+            team_stats (TeamStatsMatrix): Stats of the event's teams.
+            team_rows (np.ndarray): (matches x 6) rows of team_stats, red1..red3
+                                    then blue1..blue3 (TeamStatsMatrix.rows).
+            event_week (int): Week of the event.
+
+        Raises:
+            ValueError: If a feature of some match has no value.
+
+        Returns:
+            np.ndarray: The (matches x features) float32 matrix.
+        """
+        features = FEATURE_SCHEMA.gather(team_stats, team_rows, event_week)
+        missing = FEATURE_SCHEMA.missing_rows(features)
+        if missing.any():
+            first = int(np.flatnonzero(missing)[0])
+            raise ValueError(
+                f"Missing required features in {int(missing.sum())} matches, "
+                f"e.g. {FEATURE_SCHEMA.missing(features[first])}")
+        return features
 
     @staticmethod
     def get_team_features(team: str, event_key: str) -> dict:
@@ -171,20 +257,20 @@ class Fetcher:
         """
         team = str(team)
         sb_stats = Fetcher.sb.get_sb_team_stats_event(team, event_key)
-        tba_stats = Fetcher.tba.get_tba_oprs_team_event(team, event_key)
+        tba_stats = Fetcher.events.get(event_key).tba_stats((team,))[team]
 
         return sb_stats | tba_stats
 
     
     @staticmethod
-    @functools.lru_cache(maxsize=16)
     def get_all_team_features_for_event(event_key: str) -> Dict[str, Dict[str, Any]]:
         """
         Fetches all features for every team participating in a given event.
 
-        This method is cached to avoid redundant API calls for the same event. It
-        retrieves a list of all teams at an event and then concurrently fetches
-        their stats from both Statbotics and TBA.
+        It takes the teams and their OPRs from the event's snapshot and looks
+        up their Statbotics stats. Results are cached per snapshot version
+        (see team_features_of_snapshot), so a new snapshot is never served
+        with features built from an older one.
 
         Args:
             event_key (str): The key for the event (e.g., '2023cada').
@@ -195,36 +281,76 @@ class Fetcher:
             empty dictionary on failure.
         """
         try:
-            req = requests.get(
-                f"{TBA_BASE_URL}/event/{event_key}/teams/keys", headers=TBA_HEADER
-            )
-            req.raise_for_status()
-
-            # Creates a tuple of team numbers (e.g., ('254', '1114', ...))
-            team_keys = tuple(key[3:] for key in req.json())
-
-            all_sb_stats = Fetcher.sb.get_all_sb_stats_for_event(event_key, team_keys)
-            all_tba_stats = Fetcher.tba.get_all_tba_stats_for_event_from_single_call(
-                event_key, team_keys
-            )
+            return Fetcher.team_features_of_snapshot(Fetcher.events.get(event_key))
+        except requests.exceptions.RequestException as e:
+            print(f"ERROR: Network failure fetching team data for {event_key}: {e}")
+            return {}
+        except KeyError as e:
+            print(f"ERROR: Missing key while fetching team data for {event_key}: {e}")
+            return {}
 
-            all_team_features = {}
-            for team_key in team_keys:
-                sb_stats = all_sb_stats.get(team_key, {}) or {}
+    @staticmethod
+    def team_features_of_snapshot(event: EventSnapshot) -> Dict[str, Dict[str, Any]]:
+        """
+        The merged features of the teams of an event snapshot, kept in the
+        "team_features" cache namespace under (event key, snapshot version)
+        for TEAM_FEATURES_TTL seconds and refreshed in the background after
+        that (the Statbotics dataset may have changed).
 
-                tba_stats = {
-                    stat: data.get(f"frc{team_key}", 0.0)
-                    for stat, data in all_tba_stats.items()
-                }
+        Raises:
+            KeyError: If the data is missing expected keys.
+        """
+        return Fetcher._team_features.get_or_load(
+            (event.event_key, event.version), functools.partial(Fetcher._merge_snapshot_team_features, event)
+        )
 
-                all_team_features[team_key] = sb_stats | tba_stats
+    @staticmethod
+    def _merge_snapshot_team_features(event: EventSnapshot) -> Dict[str, Dict[str, Any]]:
+        team_keys = event.team_keys
+        all_sb_stats = Fetcher.sb.get_all_sb_stats_for_event(event.event_key, team_keys)
+        all_tba_stats = event.tba_stats(team_keys)
 
-            print(f"--- Data fetched for {len(all_team_features)} teams. ---")
-            return all_team_features
+        all_team_features = Fetcher.merge_team_features(team_keys, all_sb_stats, all_tba_stats)
+        print(f"--- Data fetched for {len(all_team_features)} teams. ---")
+        return all_team_features
 
+    @staticmethod
+    def get_event_team_stats(event_key: str) -> TeamStatsMatrix:
+        """
+        get_all_team_features_for_event as a TeamStatsMatrix, ready for
+        FeatureSchema.gather. Cached per snapshot version like the dicts it
+        is built from; empty on failure.
+        """
+        try:
+            event = Fetcher.events.get(event_key)
+            return Fetcher._team_stats.get_or_load(
+                (event_key, event.version),
+                lambda: TeamStatsMatrix.from_team_stats(Fetcher.team_features_of_snapshot(event)),
+            )
         except requests.exceptions.RequestException as e:
             print(f"ERROR: Network failure fetching team data for {event_key}: {e}")
-            return {}
         except KeyError as e:
             print(f"ERROR: Missing key while fetching team data for {event_key}: {e}")
-            return {}
+        return TeamStatsMatrix.from_team_stats({})
+
+    @staticmethod
+    def merge_team_features(
+        team_keys: tuple, all_sb_stats: dict, all_tba_stats: dict
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Merges the per-team Statbotics and TBA stats of an event.
+
+        Args:
+            team_keys (tuple): Team numbers as strings.
+            all_sb_stats (dict): Statbotics stats by team number.
+            all_tba_stats (dict): TBA stats by team number, as returned by
+                                  get_all_tba_stats_for_event_from_single_call.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Team number -> combined features; TBA
+            stats take precedence over Statbotics ones with the same name.
+        """
+        return {
+            team_key: (all_sb_stats.get(team_key, {}) or {}) | (all_tba_stats.get(team_key, {}) or {})
+            for team_key in team_keys
+        }
@@ -1,12 +1,32 @@
 import functools
-import requests
-from ..config import STATBOTICS_BASE_URL
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict
+import requests
+from .. import cache
+from ..config import (
+    STATBOTICS_PAGE_SIZE,
+    STATBOTICS_FALLBACK_WORKERS,
+    STATBOTICS_EVENT_CACHE_SIZE,
+    STATBOTICS_EVENT_CACHE_TTL,
+    STATBOTICS_EVENT_STALE_TTL,
+    STATBOTICS_EVENT_CACHE_BYTES,
+)
+from .upstream import statbotics_client
+from .statbotics_dataset import statbotics_dataset
 
 class SBService:
     """
     A service class to interact with the Statbotics API and local CSV data.
     """
+
+    # Parsed bulk API results by event, shared by every instance (and AsyncSBService)
+    _event_cache = cache.namespace(
+        "statbotics_events",
+        maxsize=STATBOTICS_EVENT_CACHE_SIZE,
+        ttl=STATBOTICS_EVENT_CACHE_TTL,
+        stale_ttl=STATBOTICS_EVENT_STALE_TTL,
+        max_bytes=STATBOTICS_EVENT_CACHE_BYTES,
+    )
     
     def get_sb_team_stats_event_from_api(self, team: str, event_key: str) -> dict:
         """
@@ -24,41 +44,98 @@ class SBService:
             dict: A dictionary containing the team's statistics for the event.
         """
         try:
-            url = f"{STATBOTICS_BASE_URL}/team_event/{str(team)}/{event_key[:4]}"
-            req = requests.get(url)
-            
-            if req.status_code != 200:
-                raise requests.ConnectionError(f"\nError fetching statbotics stats {team}, {event_key}\nStatus code: {req.status_code}")
-            
-            team_dict = req.json()
-            
-            team_info = {
-                "event": event_key,
-                "team": team_dict["team"],
-                "epa": team_dict["epa"]["norm"],
-                "total_points": team_dict["epa"]["breakdown"]["total_points"],
-                "auto_points": team_dict["epa"]["breakdown"]["auto_points"],
-                "teleop_points": team_dict["epa"]["breakdown"]["teleop_points"],
-                "endgame_points": team_dict["epa"]["breakdown"]["endgame_points"],
-                "winrate": team_dict["record"]["winrate"],
-                "rank": team_dict["epa"]["ranks"]["total"]["rank"],
-            }
+            try:
+                team_dict = statbotics_client.get_json(f"/team_event/{str(team)}/{event_key}")
+            except requests.HTTPError as e:
+                raise requests.ConnectionError(f"\nError fetching statbotics stats {team}, {event_key}\nStatus code: {e.response.status_code}")
             
-            return team_info
-        except requests.ConnectionError as e:
+            return self._team_info_from_api(team_dict, event_key)
+        except requests.RequestException as e:
             raise requests.ConnectionError(f"{e}")
         except KeyError as e:
             print(f"Key Error fetching statbotics stats {team}, {event_key}\n")
             raise KeyError(f"{e}")
         
-    @functools.lru_cache(maxsize=32)
+    @staticmethod
+    def _team_info_from_api(team_dict: dict, event_key: str) -> dict:
+        """
+        Picks the stats the features use out of a Statbotics team_event response.
+
+        Raises:
+            KeyError: If the response is missing expected keys.
+        """
+        return {
+            "event": event_key,
+            "team": team_dict["team"],
+            "epa": team_dict["epa"]["norm"],
+            "total_points": team_dict["epa"]["breakdown"]["total_points"],
+            "auto_points": team_dict["epa"]["breakdown"]["auto_points"],
+            "teleop_points": team_dict["epa"]["breakdown"]["teleop_points"],
+            "endgame_points": team_dict["epa"]["breakdown"]["endgame_points"],
+            "winrate": team_dict["record"]["winrate"],
+            "rank": team_dict["epa"]["ranks"]["total"]["rank"],
+        }
+
+    @staticmethod
+    def _team_events_path(event_key: str, offset: int) -> str:
+        """Path of one page of the bulk team_events endpoint."""
+        return f"/team_events?event={event_key}&limit={STATBOTICS_PAGE_SIZE}&offset={offset}"
+
+    @staticmethod
+    def _team_events_by_team(records: list, event_key: str) -> Dict[str, dict]:
+        """
+        Parses team_events records into _team_info_from_api dicts keyed by
+        team number (as str); malformed records are skipped.
+        """
+        event_stats = {}
+        for record in records:
+            try:
+                team_info = SBService._team_info_from_api(record, event_key)
+            except (KeyError, TypeError) as e:
+                print(f"Key Error parsing statbotics stats of a team at {event_key}: {e}")
+                continue
+            event_stats[str(team_info["team"])] = team_info
+        return event_stats
+
+    def get_event_sb_stats_from_api(self, event_key: str) -> Dict[str, dict]:
+        """
+        Fetches the Statbotics stats of every team at an event with the bulk
+        team_events endpoint, STATBOTICS_PAGE_SIZE records per request.
+
+        The parsed result is kept for STATBOTICS_EVENT_CACHE_TTL seconds, then
+        served for up to STATBOTICS_EVENT_STALE_TTL more while it is refetched
+        in the background; concurrent callers for an event that is not cached
+        share one fetch.
+
+        Args:
+            event_key (str): The event key (e.g., '2023cada').
+
+        Raises:
+            requests.RequestException: If a request fails.
+
+        Returns:
+            Dict[str, dict]: Team number (as str) -> the team's statistics, in
+                             the shape of get_sb_team_stats_event_from_api.
+        """
+        return self._event_cache.get_or_load(event_key, functools.partial(self._fetch_event_sb_stats, event_key))
+
+    @staticmethod
+    def _fetch_event_sb_stats(event_key: str) -> Dict[str, dict]:
+        records = []
+        while True:
+            page = statbotics_client.get_json(SBService._team_events_path(event_key, len(records))) or []
+            records.extend(page)
+            if len(page) < STATBOTICS_PAGE_SIZE:
+                break
+        return SBService._team_events_by_team(records, event_key)
+
     def get_all_sb_stats_for_event_concurrently_from_api(self, event_key: str, team_keys: tuple[str]) -> dict:
         """
-        Fetches all Statbotics stats for a list of teams at an event concurrently.
+        Fetches all Statbotics stats for a list of teams at an event.
 
-        This method uses a thread pool to make multiple API requests in parallel,
-        significantly speeding up data retrieval for an entire event. The results
-        are cached.
+        The whole event comes from get_event_sb_stats_from_api (one or two
+        requests, cached per event); teams it does not include are looked up
+        one by one on a thread pool of STATBOTICS_FALLBACK_WORKERS.
 
         Args:
             event_key (str): The event key (e.g., '2023cada').
@@ -67,113 +144,80 @@ class SBService:
         Returns:
             dict: A dictionary mapping each team key to its fetched statistics.
         """
+        try:
+            event_stats = self.get_event_sb_stats_from_api(event_key)
+        except requests.RequestException as e:
+            print(f"ERROR: Bulk Statbotics fetch for {event_key} failed, falling back to per-team requests: {e}")
+            event_stats = {}
+
         all_team_stats = {}
-        # Using a reasonable number of workers to avoid overwhelming the API.
-        # 8 to 16 is usually a good starting point.
-        MAX_WORKERS = 10 
-
-        # print(f"Fetching Statbotics data for {len(team_keys)} teams using {MAX_WORKERS} workers...")
-
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            # Create a future for each API call
-            # Use a dictionary to map the future back to the team key
-            future_to_team = {
-                executor.submit(self.get_sb_team_stats_event_from_api, team_key, event_key): team_key
-                for team_key in team_keys
-            }
-
-            for future in as_completed(future_to_team):
-                team_key = future_to_team[future]
-                try:
-                    result = future.result()
-                    if result:
-                        all_team_stats[team_key] = result
-                except Exception as exc:
-                    print(f"ERROR: Worker for team {team_key} generated an exception: {exc}")
-        
+        missing = []
+        for team_key in team_keys:
+            team_info = event_stats.get(str(team_key))
+            if team_info is None:
+                missing.append(team_key)
+            else:
+                all_team_stats[team_key] = team_info
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(STATBOTICS_FALLBACK_WORKERS, len(missing))) as executor:
+                future_to_team = {
+                    executor.submit(self.get_sb_team_stats_event_from_api, team_key, event_key): team_key
+                    for team_key in missing
+                }
+                for future in as_completed(future_to_team):
+                    team_key = future_to_team[future]
+                    try:
+                        all_team_stats[team_key] = future.result()
+                    except Exception as exc:
+                        print(f"ERROR: Could not fetch Statbotics stats for team {team_key}: {exc}")
+
         print("Statbotics data fetching complete.")
         return all_team_stats
-        
+
     def get_sb_team_stats_event(self, team: str, event_key: str) -> dict:
         """
-        Retrieves Statbotics stats for a team at an event from a local CSV file.
+        Retrieves Statbotics stats for a team at an event from the local dataset.
 
-        The path to the CSV is determined by the 'TESTING' environment variable.
+        The CSV at STATBOTICS_DATASET_PATH is read through its memory-mapped
+        copy (see StatboticsDataset).
 
         Args:
             team (str): The team number.
             event_key (str): The event key (used for context in the returned dict).
 
         Raises:
-            KeyError: If the team is not found in the CSV file.
-            Exception: If there's an error reading or processing the CSV file.
+            KeyError: If the team is not found in the dataset or it cannot be read.
 
         Returns:
             dict: A dictionary containing the team's statistics.
         """
         try:
-            import pandas as pd
-            import os
-            
-            # Determine the CSV path based on the TESTING environment variable
-            testing = os.getenv('TESTING', 'true').lower() == 'true'
-            if testing:
-                csv_path = "/Users/armando/Progra/ai/bbe/matchpoint/data/dataset.csv"
-            else:
-                csv_path = "/app/matchpoint/data/dataset.csv"
-            
-            df = pd.read_csv(csv_path)
-            
-            team_data = df[df['num'] == int(team)]
-            
-            if team_data.empty:
-                raise KeyError(f"Team {team} not found in CSV")
-            
-            row = team_data.iloc[0]
-            
-            team_info = {
-                "event": event_key,
-                "team": int(row['num']),
-                "epa": float(row['norm_epa']) if pd.notna(row['norm_epa']) else None,
-                "total_points": float(row['total_epa']) if pd.notna(row['total_epa']) else None,
-                "auto_points": float(row['auto_epa']) if pd.notna(row['auto_epa']) else None,
-                "teleop_points": float(row['teleop_epa']) if pd.notna(row['teleop_epa']) else None,
-                "endgame_points": float(row['endgame_epa']) if pd.notna(row['endgame_epa']) else None,
-                "winrate": float(row['winrate']) if pd.notna(row['winrate']) else None,
-                "rank": int(row["epa_rank"]) if pd.notna(row["epa_rank"]) else None
-            }
-            
-            return team_info
-            
+            team_info = statbotics_dataset.team_stats((team,), event_key).get(team)
         except Exception as e:
             print(f"Error reading CSV for team {team}, event {event_key}: {e}")
             raise KeyError(f"{e}")
+        if team_info is None:
+            raise KeyError(f"Team {team} not found in CSV")
+        return team_info
     
     def get_all_sb_stats_for_event(self, event_key: str, team_keys: tuple[str]) -> dict:
         """
-        Retrieves all Statbotics stats for a list of teams at an event from a local CSV.
+        Retrieves all Statbotics stats for a list of teams at an event from the local dataset.
 
-        This method iterates through the provided team keys and fetches data for each
-        one by one from the CSV file.
+        All teams are looked up at once with one vectorized gather (see
+        StatboticsDataset.lookup).
 
         Args:
             event_key (str): The event key.
             team_keys (tuple[str]): A tuple of team numbers to fetch data for.
 
         Returns:
-            dict: A dictionary mapping each team key to its statistics from the CSV.
+            dict: A dictionary mapping each team key to its statistics; teams
+                  missing from the dataset are left out.
         """
-        all_team_stats = {}
-        
-        # print(f"Fetching Statbotics data from CSV for {len(team_keys)} teams...")
-        
-        for team_key in team_keys:
-            try:
-                result = self.get_sb_team_stats_event(team_key, event_key)
-                if result:
-                    all_team_stats[team_key] = result
-            except Exception as exc:
-                print(f"ERROR: Could not get data for team {team_key}: {exc}")
-        
-        # print("Statbotics CSV data fetching complete.")
-        return all_team_stats
\ No newline at end of file
+        try:
+            return statbotics_dataset.team_stats(team_keys, event_key)
+        except Exception as exc:
+            print(f"ERROR: Could not read the Statbotics dataset: {exc}")
+            return {}
@@ -0,0 +1,227 @@
+# bbe/matchpoint/third_parties/statbotics_dataset.py
+"""
+Columnar, memory-mapped copy of the local Statbotics export (dataset.csv).
+
+    python -m matchpoint.third_parties.statbotics_dataset
+
+converts the CSV ahead of time; otherwise it is converted on first use.
+"""
+import csv
+import json
+import math
+import os
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+import numpy as np
+from ..config import STATBOTICS_DATASET_PATH, STATBOTICS_DATASET_CHECK_INTERVAL
+
+# Stat name -> CSV column, in the column order of the stats matrix
+STAT_COLUMNS: Dict[str, str] = {
+    "epa": "norm_epa",
+    "total_points": "total_epa",
+    "auto_points": "auto_epa",
+    "teleop_points": "teleop_epa",
+    "endgame_points": "endgame_epa",
+    "winrate": "winrate",
+    "rank": "epa_rank",
+}
+TEAM_COLUMN = "num"
+_FORMAT_VERSION = 1
+
+
+class _Snapshot(NamedTuple):
+    source: Tuple[int, int]  # (mtime_ns, size) of the CSV it was converted from
+    teams: np.ndarray  # Sorted team numbers (int64)
+    stats: np.ndarray  # (teams x STAT_COLUMNS) float64, NaN where the CSV has no value
+
+
+class StatboticsDataset:
+    """
+    The Statbotics CSV converted once into two .npy files next to it: the
+    sorted team numbers (the index) and a team x stat float64 matrix. Both
+    are memory-mapped, so pre-forked workers share the pages, and a lookup
+    for many teams is one searchsorted plus one gather.
+
+    The CSV's modification time and size are checked at most every
+    `check_interval` seconds; when they change the files are rebuilt and
+    remapped. Requests keep using the snapshot they started with.
+    """
+
+    def __init__(self, csv_path: str, check_interval: float = STATBOTICS_DATASET_CHECK_INTERVAL):
+        self.csv_path = csv_path
+        self.check_interval = check_interval
+        stem = os.path.splitext(csv_path)[0]
+        self.teams_path = f"{stem}.teams.npy"
+        self.stats_path = f"{stem}.stats.npy"
+        self.meta_path = f"{stem}.meta.json"
+        self._snapshot: Optional[_Snapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _source(self) -> Tuple[int, int]:
+        stat = os.stat(self.csv_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_meta(self) -> Optional[dict]:
+        try:
+            with open(self.meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def convert(self) -> Tuple[int, int]:
+        """
+        Converts the CSV into the .npy files. The first row of a team wins,
+        as with the per-team lookup it replaces. Files are written under
+        temporary names and renamed, so readers never see a partial file.
+
+        Raises:
+            OSError: If the CSV cannot be read.
+            KeyError: If a required column is missing.
+
+        Returns:
+            Tuple[int, int]: The (mtime_ns, size) of the converted CSV.
+        """
+        source = self._source()
+        rows: Dict[int, list] = {}
+        with open(self.csv_path, newline="") as f:
+            reader = csv.DictReader(f)
+            missing = [c for c in (TEAM_COLUMN, *STAT_COLUMNS.values()) if c not in (reader.fieldnames or [])]
+            if missing:
+                raise KeyError(f"Columns {missing} not found in {self.csv_path}")
+            for record in reader:
+                try:
+                    team = int(float(record[TEAM_COLUMN]))
+                except ValueError:
+                    continue
+                if team not in rows:
+                    rows[team] = [_to_float(record[column]) for column in STAT_COLUMNS.values()]
+
+        teams = np.array(sorted(rows), dtype=np.int64)
+        stats = np.array([rows[team] for team in teams.tolist()], dtype=np.float64).reshape(-1, len(STAT_COLUMNS))
+
+        pid = os.getpid()
+        for path, array in ((self.teams_path, teams), (self.stats_path, stats)):
+            tmp = f"{path}.{pid}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp, path)
+        meta = {"version": _FORMAT_VERSION, "source": list(source), "columns": list(STAT_COLUMNS)}
+        tmp = f"{self.meta_path}.{pid}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, self.meta_path)
+        return source
+
+    def _load(self) -> _Snapshot:
+        """Maps the .npy files, converting the CSV first if they are stale."""
+        source = self._source()
+        meta = self._read_meta()
+        fresh = (
+            meta is not None
+            and meta.get("version") == _FORMAT_VERSION
+            and tuple(meta.get("source", ())) == source
+            and meta.get("columns") == list(STAT_COLUMNS)
+            and os.path.exists(self.teams_path)
+            and os.path.exists(self.stats_path)
+        )
+        if not fresh:
+            started = time.perf_counter()
+            source = self.convert()
+            print(f"Converted {self.csv_path} in {(time.perf_counter() - started) * 1e3:.0f} ms.")
+        return _Snapshot(
+            source,
+            np.load(self.teams_path, mmap_mode="r"),
+            np.load(self.stats_path, mmap_mode="r"),
+        )
+
+    def snapshot(self) -> _Snapshot:
+        """
+        The current mapping, reloaded if the CSV changed since it was made.
+
+        Raises:
+            OSError: If the CSV does not exist and nothing was loaded before.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return snapshot
+        with self._lock:
+            if self._snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return self._snapshot
+            try:
+                if self._snapshot is None or self._source() != self._snapshot.source:
+                    self._snapshot = self._load()
+            except OSError as e:
+                if self._snapshot is None:
+                    raise
+                print(f"WARN: Could not reload {self.csv_path}, keeping the loaded copy: {e}")
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def load(self) -> int:
+        """Maps the dataset now (e.g. at startup). Returns the number of teams."""
+        return len(self.snapshot().teams)
+
+    def lookup(self, teams: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized lookup of many teams.
+
+        Args:
+            teams (Iterable): Team numbers (int or numeric str).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: A boolean mask of the teams found and
+            their (teams x STAT_COLUMNS) stats; rows of teams not found are NaN.
+        """
+        snapshot = self.snapshot()
+        numbers = np.array([int(team) for team in teams], dtype=np.int64)
+        if len(snapshot.teams) == 0:
+            return np.zeros(len(numbers), dtype=bool), np.full((len(numbers), len(STAT_COLUMNS)), np.nan)
+        rows = np.minimum(np.searchsorted(snapshot.teams, numbers), len(snapshot.teams) - 1)
+        found = snapshot.teams[rows] == numbers
+        stats = np.where(found[:, None], snapshot.stats[rows], np.nan)
+        return found, stats
+
+    def team_stats(self, team_keys: Iterable, event_key: str) -> Dict:
+        """
+        Stats of many teams as SBService dicts, keyed like `team_keys`;
+        teams that are not in the dataset (or not numeric) are left out.
+        """
+        keys, numbers = [], []
+        for team_key in team_keys:
+            try:
+                numbers.append(int(team_key))
+                keys.append(team_key)
+            except (TypeError, ValueError):
+                print(f"ERROR: Could not get data for team {team_key}: not a team number")
+        found, stats = self.lookup(numbers)
+
+        out = {}
+        for team_key, number, ok, values in zip(keys, numbers, found.tolist(), stats.tolist()):
+            if not ok:
+                print(f"ERROR: Could not get data for team {team_key}: Team {number} not found in CSV")
+                continue
+            info = {"event": event_key, "team": number}
+            for stat, value in zip(STAT_COLUMNS, values):
+                info[stat] = None if math.isnan(value) else value
+            if info["rank"] is not None:
+                info["rank"] = int(info["rank"])
+            out[team_key] = info
+        return out
+
+
+def _to_float(value: str) -> float:
+    try:
+        return float(value) if value not in (None, "") else math.nan
+    except ValueError:
+        return math.nan
+
+
+statbotics_dataset = StatboticsDataset(STATBOTICS_DATASET_PATH)
+
+
+if __name__ == "__main__":
+    statbotics_dataset.convert()
+    print(f"{statbotics_dataset.csv_path}: {statbotics_dataset.load()} teams -> "
+          f"{statbotics_dataset.teams_path}, {statbotics_dataset.stats_path}")
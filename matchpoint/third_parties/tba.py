@@ -1,6 +1,8 @@
 from typing import Any, Dict, Iterable, Tuple
 import requests
-from ..config import TBA_BASE_URL, TBA_HEADER
+from .upstream import tba_client
+from .. import cache
+from ..config import EVENT_SNAPSHOT_TTL, EVENT_SNAPSHOT_STALE_TTL, TBA_OPRS_CACHE_SIZE
 import functools
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -8,6 +10,11 @@ class TBAService:
     """
     A service class for interacting with The Blue Alliance (TBA) API.
     """
+
+    # Event OPRs, refreshed like the event snapshots
+    _oprs_cache = cache.namespace(
+        "tba_oprs", maxsize=TBA_OPRS_CACHE_SIZE, ttl=EVENT_SNAPSHOT_TTL, stale_ttl=EVENT_SNAPSHOT_STALE_TTL
+    )
     
     @staticmethod
     def _normalize_team_key(team: str) -> str:
@@ -20,6 +27,9 @@ class TBAService:
         """
         Fetches OPRs (Offensive Power Rating) and component OPRs for an entire event.
 
+        Results are cached per event for EVENT_SNAPSHOT_TTL seconds, then
+        served while they are refetched in the background.
+
         Args:
             event_key (str): The event key (e.g., '2023cada').
 
@@ -30,41 +40,43 @@ class TBAService:
             dict: A dictionary containing various OPRs and COPRs for the event.
         """
         try:
-            req = requests.get(f"{TBA_BASE_URL}/event/{event_key}/oprs", TBA_HEADER)
-            req.raise_for_status()
-            oprs_res = req.json()
-            
-            # This endpoint for COPRs might be specific to certain years (e.g., 2024)
-            req = requests.get(
-                f"{TBA_BASE_URL}/event/{event_key}/coprs",
-                TBA_HEADER,
+            return TBAService._oprs_cache.get_or_load(
+                event_key, functools.partial(TBAService._fetch_tba_oprs_event, event_key)
             )
-            req.raise_for_status()
-            coprs_res = req.json()
-
-            final_oprs = {
-                "opr": oprs_res.get('oprs', {}), 
-                "ccwm": oprs_res.get('ccwms', {}),
-                "l3_count": coprs_res.get("L3 Coral Count", {}), 
-                "l4_count": coprs_res.get("L4 Coral Count", {}),
-                "coral_count": coprs_res.get("Total Coral Count", {}),
-                "algae_count": coprs_res.get("Total Algae Count", {})
-            }
-            
-            return final_oprs
         except requests.ConnectionError as e:
             print(e)
             return {}
         except KeyError as e:
             raise KeyError(f"Key Error fetching TBA stats {event_key}\n{e}")
     
+    @staticmethod
+    def _fetch_tba_oprs_event(event_key: str) -> dict:
+        oprs_res = tba_client.get_json(f"/event/{event_key}/oprs") or {}
+
+        # This endpoint for COPRs might be specific to certain years (e.g., 2024)
+        coprs_res = tba_client.get_json(f"/event/{event_key}/coprs") or {}
+
+        return TBAService._combine_oprs(oprs_res, coprs_res)
+
+    @staticmethod
+    def _combine_oprs(oprs_res: dict, coprs_res: dict) -> dict:
+        """Picks the OPR and COPR maps the features use out of the two responses."""
+        return {
+            "opr": oprs_res.get('oprs', {}), 
+            "ccwm": oprs_res.get('ccwms', {}),
+            "l3_count": coprs_res.get("L3 Coral Count", {}), 
+            "l4_count": coprs_res.get("L4 Coral Count", {}),
+            "coral_count": coprs_res.get("Total Coral Count", {}),
+            "algae_count": coprs_res.get("Total Algae Count", {})
+        }
+
     @staticmethod 
-    @functools.lru_cache(maxsize=64)
     def get_tba_oprs_team_event(team: str, event_key: str) -> dict:
         """
         Extracts TBA OPR stats for a single team from the event-wide OPR data.
 
-        This method is cached to avoid refetching data for the same team-event pair.
+        The event-wide data is cached (see get_tba_oprs_event), so teams of
+        the same event do not refetch it.
 
         Args:
             team (str): The team number (e.g., '254').
@@ -95,14 +107,83 @@ class TBAService:
             int | None: The week number (0 for Week 1, etc.) or None on error.
         """
         try:
-            req = requests.get(f"{TBA_BASE_URL}/event/{event_key}", TBA_HEADER)
-            req.raise_for_status()
-            res = req.json()
+            res = tba_client.get_json(f"/event/{event_key}") or {}
             return res.get('week')
         except requests.ConnectionError as e:
             print(f"Error fetching {event_key} week:\n{e}")
             return None
     
+    @staticmethod
+    def get_event_matches(event_key: str) -> list[dict]:
+        """
+        Fetches every match of an event (played or not) in TBA's simple format.
+
+        Args:
+            event_key (str): The event key.
+
+        Raises:
+            requests.RequestException: If the request fails.
+
+        Returns:
+            list[dict]: The matches; unplayed matches have a score of -1.
+        """
+        return tba_client.get_json(f"/event/{event_key}/matches/simple") or []
+
+    @staticmethod
+    def get_event_rankings(event_key: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetches the current qualification rankings of an event.
+
+        Total ranking points come from the "Total Ranking Points" extra stat
+        when TBA provides it, otherwise from the ranking score (average RP,
+        the first sort order) times matches played.
+
+        Args:
+            event_key (str): The event key.
+
+        Raises:
+            requests.RequestException: If the request fails.
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Team number -> {'rank', 'ranking_score',
+            'total_rp', 'matches_played', 'wins', 'losses', 'ties'}. Empty
+            before the first qualification match is played.
+        """
+        return TBAService._rankings_from_api(tba_client.get_json(f"/event/{event_key}/rankings") or {})
+
+    @staticmethod
+    def _rankings_from_api(res: dict) -> Dict[int, Dict[str, Any]]:
+        """Parses an /event/{key}/rankings response, see get_event_rankings."""
+        extra_stats_names = [info.get("name") for info in res.get("extra_stats_info") or []]
+        total_rp_index = (
+            extra_stats_names.index("Total Ranking Points")
+            if "Total Ranking Points" in extra_stats_names
+            else None
+        )
+
+        rankings: Dict[int, Dict[str, Any]] = {}
+        for entry in res.get("rankings") or []:
+            matches_played = entry.get("matches_played") or 0
+            sort_orders = entry.get("sort_orders") or [0.0]
+            extra_stats = entry.get("extra_stats") or []
+            record = entry.get("record") or {}
+
+            if total_rp_index is not None and total_rp_index < len(extra_stats):
+                total_rp = float(extra_stats[total_rp_index])
+            else:
+                total_rp = float(sort_orders[0]) * matches_played
+
+            rankings[int(entry["team_key"][3:])] = {
+                "rank": entry.get("rank") or 0,
+                "ranking_score": float(sort_orders[0]),
+                "total_rp": total_rp,
+                "matches_played": matches_played,
+                "wins": record.get("wins", 0),
+                "losses": record.get("losses", 0),
+                "ties": record.get("ties", 0),
+            }
+        return rankings
+
     @staticmethod
     def get_alliances(event_key: str):
         """
@@ -117,19 +198,24 @@ class TBAService:
 
         """
         try:
-            req = requests.get(f"{TBA_BASE_URL}/event/{event_key}/alliances", TBA_HEADER)
-            
-            res = req.json()
-            alliances_numbers = []
-            for  alliance in res:
-                alliances_numbers.append(alliance["picks"][0:3])
-                
-            for i, numbers in enumerate(alliances_numbers): 
-                for j, team in enumerate(numbers):
-                    alliances_numbers[i][j] = int(alliances_numbers[i][j][3:])
+            alliances_numbers = TBAService._alliances_from_api(
+                tba_client.get_json(f"/event/{event_key}/alliances") or []
+            )
             return tuple(sum(alliances_numbers, [])), alliances_numbers
         except requests.ConnectionError as e:
             raise e
+
+    @staticmethod
+    def _alliances_from_api(res: list) -> list[list[int]]:
+        """Team numbers of each alliance (captain and first two picks) in an /event/{key}/alliances response."""
+        alliances_numbers = []
+        for  alliance in res:
+            alliances_numbers.append(alliance["picks"][0:3])
+
+        for i, numbers in enumerate(alliances_numbers): 
+            for j, team in enumerate(numbers):
+                alliances_numbers[i][j] = int(alliances_numbers[i][j][3:])
+        return alliances_numbers
             
     
     @staticmethod
@@ -145,7 +231,15 @@ class TBAService:
 
         # 1 llamada para todo el evento
         event_oprs = TBAService.get_tba_oprs_event(event_key)
+        return TBAService._team_stats_from_event_oprs(event_oprs, team_keys)
+
+    @staticmethod
+    def _team_stats_from_event_oprs(event_oprs: dict, team_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Reparte el resultado de get_tba_oprs_event por equipo (0.0 si falta).
 
+        Devuelve: {'5887': {'opr':..,'ccwm':..,..}, '3478': {...}}
+        """
         out: Dict[str, Dict[str, Any]] = {}
         for t in team_keys:
             norm = TBAService._normalize_team_key(t)   # 'frcNNN'
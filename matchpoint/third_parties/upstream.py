@@ -0,0 +1,280 @@
+# bbe/matchpoint/third_parties/upstream.py
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, NamedTuple, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from ..singleflight import SingleFlight
+from ..config import (
+    TBA_BASE_URL,
+    TBA_HEADER,
+    STATBOTICS_BASE_URL,
+    UPSTREAM_CACHE_DIR,
+    UPSTREAM_CACHE_MAX_AGE,
+    UPSTREAM_CACHE_MAX_BYTES,
+    UPSTREAM_POOL_SIZE,
+    UPSTREAM_TIMEOUT,
+)
+
+_KEY_SEGMENT = re.compile(r"[^/]*\d[^/]*")
+
+
+def endpoint_of(path: str) -> str:
+    """
+    The endpoint a request path belongs to, for the stats: path segments
+    holding keys or numbers become {}, e.g. /event/2024casj/oprs -> /event/{}/oprs.
+    """
+    return _KEY_SEGMENT.sub("{}", path.split("?", 1)[0])
+
+
+class CachedResponse(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: Any
+
+
+class HTTPCache:
+    """
+    On-disk cache of JSON responses and their validators (ETag /
+    Last-Modified), one file per URL.
+
+    Entries are never served without asking the upstream: the validators
+    are sent as If-None-Match / If-Modified-Since and the stored body is
+    used when the answer is 304 Not Modified. Files are written under a
+    temporary name and renamed, so concurrent processes never read a
+    partial entry.
+
+    A file's modification time is its last use (reads touch it). After
+    every max_bytes / 16 bytes written, the directory is pruned: files
+    unused for max_age seconds are deleted, then the least recently used
+    ones until the rest fit in max_bytes. Temporary files count toward
+    max_bytes, and are deleted once TMP_GRACE_PERIOD old (left by a write
+    that crashed).
+    """
+
+    TMP_GRACE_PERIOD = 60.0  # Seconds a write may take before its temporary file is considered abandoned
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = UPSTREAM_CACHE_MAX_BYTES,
+        max_age: float = UPSTREAM_CACHE_MAX_AGE,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._prune_every = max(max_bytes // 16, 1)
+        # Prunes on the first write, which also catches what earlier runs left
+        self._written = self._prune_every
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.blake2b(url.encode(), digest_size=16).hexdigest() + ".json")
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        path = self._path(url)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url:
+            return None
+        return CachedResponse(entry.get("etag"), entry.get("last_modified"), entry.get("data"))
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str], data: Any) -> None:
+        path = self._path(url)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump({"url": url, "etag": etag, "last_modified": last_modified, "data": data}, f)
+                n_bytes = f.tell()
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"WARN: Could not write the HTTP cache entry for {url}: {e}")
+            return
+
+        with self._lock:
+            self._written += n_bytes
+            if self._written < self._prune_every:
+                return
+            self._written = 0
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Deletes abandoned temporary files and the files unused for max_age
+        seconds, then the least recently used ones until everything left
+        (temporary files of writes in progress included) fits in max_bytes.
+
+        Returns:
+            int: The number of files deleted.
+        """
+        try:
+            files, tmp_files = [], []
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith((".json", ".tmp")):
+                        stat = entry.stat()
+                        found = tmp_files if entry.name.endswith(".tmp") else files
+                        found.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            print(f"WARN: Could not list the HTTP cache: {e}")
+            return 0
+
+        now = time.time()
+        total = sum(size for _, size, _ in files) + sum(size for _, size, _ in tmp_files)
+        deleted = 0
+        for mtime, size, path in tmp_files:
+            if mtime < now - self.TMP_GRACE_PERIOD and self._remove(path):
+                deleted += 1
+                total -= size
+
+        files.sort()
+        expired_before = now - self.max_age
+        for mtime, size, path in files:
+            if mtime >= expired_before and total <= self.max_bytes:
+                break
+            if self._remove(path):
+                deleted += 1
+                total -= size
+        return deleted
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """Deletes a cache file; False if it could not be (already gone counts as deleted)."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # Already pruned by another process
+        except OSError as e:
+            print(f"WARN: Could not delete the HTTP cache entry {path}: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CachedResponse]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers revalidating `entry`."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+
+class UpstreamStats:
+    """
+    Per-endpoint request counters: `hits` (304, served from the cache),
+    `misses` (full downloads), `errors` and `bytes` downloaded.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "errors": 0, "bytes": 0}
+        )
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, outcome: str, n_bytes: int = 0) -> None:
+        with self._lock:
+            counters = self._counters[endpoint]
+            counters[outcome] += 1
+            counters["bytes"] += n_bytes
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {endpoint: dict(counters) for endpoint, counters in self._counters.items()}
+
+
+class UpstreamClient:
+    """
+    A keep-alive session with one upstream API, shared by every caller.
+
+    Connections are pooled (up to `pool_size` per host), so requests reuse
+    TLS connections instead of opening one each. JSON responses carrying an
+    ETag or Last-Modified header are stored in `cache` and revalidated on
+    the next request, which turns repeated downloads into 304s. Concurrent
+    requests for the same URL share one download (see SingleFlight).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        headers: Optional[Dict[str, Optional[str]]] = None,
+        cache: Optional[HTTPCache] = None,
+        pool_size: int = UPSTREAM_POOL_SIZE,
+        timeout: float = UPSTREAM_TIMEOUT,
+    ):
+        self.name = name
+        self.base_url = base_url
+        self.cache = cache
+        self.timeout = timeout
+        self.stats = UpstreamStats()
+        self.flights = SingleFlight(name)
+        self.session = requests.Session()
+        self.session.headers.update({k: v for k, v in (headers or {}).items() if v is not None})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get_json(self, path: str) -> Any:
+        """
+        GETs `base_url + path` and decodes its JSON body, revalidating a
+        cached copy if there is one. Callers asking for a URL already being
+        downloaded wait for that download and share its body.
+
+        Raises:
+            requests.RequestException: If the request fails or returns an error status.
+
+        Returns:
+            Any: The decoded body (the cached one on 304 Not Modified).
+        """
+        url = f"{self.base_url}{path}"
+        return self.flights.do(url, self._get_json, url, path)
+
+    def _get_json(self, url: str, path: str) -> Any:
+        endpoint = endpoint_of(path)
+        entry = self.cache.get(url) if self.cache is not None else None
+        try:
+            response = self.session.get(
+                url, headers=HTTPCache.conditional_headers(entry), timeout=self.timeout
+            )
+            if response.status_code == 304 and entry is not None:
+                self.stats.record(endpoint, "hits")
+                return entry.data
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError):
+            self.stats.record(endpoint, "errors")
+            raise
+
+        self.stats.record(endpoint, "misses", len(response.content))
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if self.cache is not None and (etag or last_modified):
+            self.cache.set(url, etag, last_modified, data)
+        return data
+
+
+http_cache = HTTPCache(UPSTREAM_CACHE_DIR) if UPSTREAM_CACHE_DIR else None
+tba_client = UpstreamClient("tba", TBA_BASE_URL, headers=TBA_HEADER, cache=http_cache)
+statbotics_client = UpstreamClient("statbotics", STATBOTICS_BASE_URL, cache=http_cache)
+
+
+def upstream_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """
+    Per-endpoint hit/miss counters of the shared clients, plus their
+    coalesced requests under "singleflight".
+    """
+    return {
+        client.name: {**client.stats.snapshot(), "singleflight": client.flights.stats()}
+        for client in (tba_client, statbotics_client)
+    }
@@ -28,7 +28,8 @@ type EventPredictionRequest struct {
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	EventKey string `protobuf:"bytes,1,opt,name=event_key,json=eventKey,proto3" json:"event_key,omitempty"`
+	EventKey    string `protobuf:"bytes,1,opt,name=event_key,json=eventKey,proto3" json:"event_key,omitempty"`
+	IncludeShap bool   `protobuf:"varint,2,opt,name=include_shap,json=includeShap,proto3" json:"include_shap,omitempty"` // Adjunta el análisis SHAP de cada partido (una sola llamada por evento)
 }
 
 func (x *EventPredictionRequest) Reset() {
@@ -70,6 +71,13 @@ func (x *EventPredictionRequest) GetEventKey() string {
 	return ""
 }
 
+func (x *EventPredictionRequest) GetIncludeShap() bool {
+	if x != nil {
+		return x.IncludeShap
+	}
+	return false
+}
+
 type EventPredictionResponse struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -440,6 +448,9 @@ type SimulationResult struct {
 	EventKey           string                               `protobuf:"bytes,1,opt,name=event_key,json=eventKey,proto3" json:"event_key,omitempty"`
 	SimulationMetadata *SimulationResult_SimulationMetadata `protobuf:"bytes,2,opt,name=simulation_metadata,json=simulationMetadata,proto3" json:"simulation_metadata,omitempty"`
 	Results            []*SimulationResult_Results          `protobuf:"bytes,3,rep,name=results,proto3" json:"results,omitempty"`
+	RoundNames         []string                             `protobuf:"bytes,4,rep,name=round_names,json=roundNames,proto3" json:"round_names,omitempty"`
+	// Enfrentamientos de la final, del más al menos frecuente. Sólo en Monte Carlo.
+	FinalMatchups []*SimulationResult_FinalMatchup `protobuf:"bytes,5,rep,name=final_matchups,json=finalMatchups,proto3" json:"final_matchups,omitempty"`
 }
 
 func (x *SimulationResult) Reset() {
@@ -495,6 +506,20 @@ func (x *SimulationResult) GetResults() []*SimulationResult_Results {
 	return nil
 }
 
+func (x *SimulationResult) GetRoundNames() []string {
+	if x != nil {
+		return x.RoundNames
+	}
+	return nil
+}
+
+func (x *SimulationResult) GetFinalMatchups() []*SimulationResult_FinalMatchup {
+	if x != nil {
+		return x.FinalMatchups
+	}
+	return nil
+}
+
 type SimulationRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -502,6 +527,16 @@ type SimulationRequest struct {
 
 	EventKey string `protobuf:"bytes,1,opt,name=event_key,json=eventKey,proto3" json:"event_key,omitempty"`
 	NSims    uint32 `protobuf:"varint,2,opt,name=n_sims,json=nSims,proto3" json:"n_sims,omitempty"`
+	// Semilla para reproducir la simulación. Si no se envía se usa entropía del sistema.
+	Seed *uint64 `protobuf:"varint,3,opt,name=seed,proto3,oneof" json:"seed,omitempty"`
+	// Formato de llaves (p. ej. "double_elim_8", "ladder_bo3_8"). Vacío = según número de alianzas.
+	BracketFormat string `protobuf:"bytes,4,opt,name=bracket_format,json=bracketFormat,proto3" json:"bracket_format,omitempty"`
+	// Calcula las probabilidades exactas en lugar de simular n_sims veces.
+	Exact bool `protobuf:"varint,5,opt,name=exact,proto3" json:"exact,omitempty"`
+	// Ancho máximo de intervalo de confianza para detenerse antes (0 = nunca).
+	Tolerance float64 `protobuf:"fixed64,6,opt,name=tolerance,proto3" json:"tolerance,omitempty"`
+	// Simulaciones entre resultados parciales en StreamSimulatePlayoffs (0 = valor por defecto).
+	SnapshotInterval uint32 `protobuf:"varint,7,opt,name=snapshot_interval,json=snapshotInterval,proto3" json:"snapshot_interval,omitempty"`
 }
 
 func (x *SimulationRequest) Reset() {
@@ -550,17 +585,56 @@ func (x *SimulationRequest) GetNSims() uint32 {
 	return 0
 }
 
-type SimulationResult_SimulationMetadata struct {
+func (x *SimulationRequest) GetSeed() uint64 {
+	if x != nil && x.Seed != nil {
+		return *x.Seed
+	}
+	return 0
+}
+
+func (x *SimulationRequest) GetBracketFormat() string {
+	if x != nil {
+		return x.BracketFormat
+	}
+	return ""
+}
+
+func (x *SimulationRequest) GetExact() bool {
+	if x != nil {
+		return x.Exact
+	}
+	return false
+}
+
+func (x *SimulationRequest) GetTolerance() float64 {
+	if x != nil {
+		return x.Tolerance
+	}
+	return 0
+}
+
+func (x *SimulationRequest) GetSnapshotInterval() uint32 {
+	if x != nil {
+		return x.SnapshotInterval
+	}
+	return 0
+}
+
+type QualificationSimulationRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	TotalSimulationsRun uint32                 `protobuf:"varint,1,opt,name=total_simulations_run,json=totalSimulationsRun,proto3" json:"total_simulations_run,omitempty"`
-	TimestampUtc        *timestamppb.Timestamp `protobuf:"bytes,2,opt,name=timestamp_utc,json=timestampUtc,proto3" json:"timestamp_utc,omitempty"`
+	EventKey string `protobuf:"bytes,1,opt,name=event_key,json=eventKey,proto3" json:"event_key,omitempty"`
+	NSims    uint32 `protobuf:"varint,2,opt,name=n_sims,json=nSims,proto3" json:"n_sims,omitempty"`
+	// Semilla para reproducir la simulación. Si no se envía se usa entropía del sistema.
+	Seed *uint64 `protobuf:"varint,3,opt,name=seed,proto3,oneof" json:"seed,omitempty"`
+	// Corte para top_n_probability (0 = 8, los capitanes de alianza).
+	TopN uint32 `protobuf:"varint,4,opt,name=top_n,json=topN,proto3" json:"top_n,omitempty"`
 }
 
-func (x *SimulationResult_SimulationMetadata) Reset() {
-	*x = SimulationResult_SimulationMetadata{}
+func (x *QualificationSimulationRequest) Reset() {
+	*x = QualificationSimulationRequest{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_protos_prediction_proto_msgTypes[9]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -568,13 +642,13 @@ func (x *SimulationResult_SimulationMetadata) Reset() {
 	}
 }
 
-func (x *SimulationResult_SimulationMetadata) String() string {
+func (x *QualificationSimulationRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SimulationResult_SimulationMetadata) ProtoMessage() {}
+func (*QualificationSimulationRequest) ProtoMessage() {}
 
-func (x *SimulationResult_SimulationMetadata) ProtoReflect() protoreflect.Message {
+func (x *QualificationSimulationRequest) ProtoReflect() protoreflect.Message {
 	mi := &file_protos_prediction_proto_msgTypes[9]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -586,38 +660,54 @@ func (x *SimulationResult_SimulationMetadata) ProtoReflect() protoreflect.Messag
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SimulationResult_SimulationMetadata.ProtoReflect.Descriptor instead.
-func (*SimulationResult_SimulationMetadata) Descriptor() ([]byte, []int) {
-	return file_protos_prediction_proto_rawDescGZIP(), []int{7, 0}
+// Deprecated: Use QualificationSimulationRequest.ProtoReflect.Descriptor instead.
+func (*QualificationSimulationRequest) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{9}
 }
 
-func (x *SimulationResult_SimulationMetadata) GetTotalSimulationsRun() uint32 {
+func (x *QualificationSimulationRequest) GetEventKey() string {
 	if x != nil {
-		return x.TotalSimulationsRun
+		return x.EventKey
+	}
+	return ""
+}
+
+func (x *QualificationSimulationRequest) GetNSims() uint32 {
+	if x != nil {
+		return x.NSims
 	}
 	return 0
 }
 
-func (x *SimulationResult_SimulationMetadata) GetTimestampUtc() *timestamppb.Timestamp {
+func (x *QualificationSimulationRequest) GetSeed() uint64 {
+	if x != nil && x.Seed != nil {
+		return *x.Seed
+	}
+	return 0
+}
+
+func (x *QualificationSimulationRequest) GetTopN() uint32 {
 	if x != nil {
-		return x.TimestampUtc
+		return x.TopN
 	}
-	return nil
+	return 0
 }
 
-type SimulationResult_Results struct {
+type QualificationSimulationResult struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	AllianceNumber uint32   `protobuf:"varint,1,opt,name=alliance_number,json=allianceNumber,proto3" json:"alliance_number,omitempty"`
-	Teams          []uint32 `protobuf:"varint,2,rep,packed,name=teams,proto3" json:"teams,omitempty"`
-	Wins           uint32   `protobuf:"varint,3,opt,name=wins,proto3" json:"wins,omitempty"`
-	WinProbability float64  `protobuf:"fixed64,4,opt,name=win_probability,json=winProbability,proto3" json:"win_probability,omitempty"`
+	EventKey           string                               `protobuf:"bytes,1,opt,name=event_key,json=eventKey,proto3" json:"event_key,omitempty"`
+	SimulationMetadata *SimulationResult_SimulationMetadata `protobuf:"bytes,2,opt,name=simulation_metadata,json=simulationMetadata,proto3" json:"simulation_metadata,omitempty"`
+	RemainingMatches   uint32                               `protobuf:"varint,3,opt,name=remaining_matches,json=remainingMatches,proto3" json:"remaining_matches,omitempty"`
+	TopN               uint32                               `protobuf:"varint,4,opt,name=top_n,json=topN,proto3" json:"top_n,omitempty"`
+	// Ordenados por posición esperada.
+	Rankings []*QualificationSimulationResult_TeamRanking `protobuf:"bytes,5,rep,name=rankings,proto3" json:"rankings,omitempty"`
 }
 
-func (x *SimulationResult_Results) Reset() {
-	*x = SimulationResult_Results{}
+func (x *QualificationSimulationResult) Reset() {
+	*x = QualificationSimulationResult{}
 	if protoimpl.UnsafeEnabled {
 		mi := &file_protos_prediction_proto_msgTypes[10]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -625,13 +715,13 @@ func (x *SimulationResult_Results) Reset() {
 	}
 }
 
-func (x *SimulationResult_Results) String() string {
+func (x *QualificationSimulationResult) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*SimulationResult_Results) ProtoMessage() {}
+func (*QualificationSimulationResult) ProtoMessage() {}
 
-func (x *SimulationResult_Results) ProtoReflect() protoreflect.Message {
+func (x *QualificationSimulationResult) ProtoReflect() protoreflect.Message {
 	mi := &file_protos_prediction_proto_msgTypes[10]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -643,219 +733,1068 @@ func (x *SimulationResult_Results) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use SimulationResult_Results.ProtoReflect.Descriptor instead.
-func (*SimulationResult_Results) Descriptor() ([]byte, []int) {
-	return file_protos_prediction_proto_rawDescGZIP(), []int{7, 1}
+// Deprecated: Use QualificationSimulationResult.ProtoReflect.Descriptor instead.
+func (*QualificationSimulationResult) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{10}
 }
 
-func (x *SimulationResult_Results) GetAllianceNumber() uint32 {
+func (x *QualificationSimulationResult) GetEventKey() string {
 	if x != nil {
-		return x.AllianceNumber
+		return x.EventKey
+	}
+	return ""
+}
+
+func (x *QualificationSimulationResult) GetSimulationMetadata() *SimulationResult_SimulationMetadata {
+	if x != nil {
+		return x.SimulationMetadata
+	}
+	return nil
+}
+
+func (x *QualificationSimulationResult) GetRemainingMatches() uint32 {
+	if x != nil {
+		return x.RemainingMatches
 	}
 	return 0
 }
 
-func (x *SimulationResult_Results) GetTeams() []uint32 {
+func (x *QualificationSimulationResult) GetTopN() uint32 {
+	if x != nil {
+		return x.TopN
+	}
+	return 0
+}
+
+func (x *QualificationSimulationResult) GetRankings() []*QualificationSimulationResult_TeamRanking {
+	if x != nil {
+		return x.Rankings
+	}
+	return nil
+}
+
+type AllianceLineup struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// Capitán primero, luego las elecciones en orden.
+	Teams []uint32 `protobuf:"varint,1,rep,packed,name=teams,proto3" json:"teams,omitempty"`
+}
+
+func (x *AllianceLineup) Reset() {
+	*x = AllianceLineup{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_protos_prediction_proto_msgTypes[11]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *AllianceLineup) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AllianceLineup) ProtoMessage() {}
+
+func (x *AllianceLineup) ProtoReflect() protoreflect.Message {
+	mi := &file_protos_prediction_proto_msgTypes[11]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use AllianceLineup.ProtoReflect.Descriptor instead.
+func (*AllianceLineup) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{11}
+}
+
+func (x *AllianceLineup) GetTeams() []uint32 {
 	if x != nil {
 		return x.Teams
 	}
 	return nil
 }
 
-func (x *SimulationResult_Results) GetWins() uint32 {
+type AllianceSelectionRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	EventKey string `protobuf:"bytes,1,opt,name=event_key,json=eventKey,proto3" json:"event_key,omitempty"`
+	// Equipos en orden de ranking de clasificación. Vacío = rankings actuales de TBA.
+	RankedTeams []uint32 `protobuf:"varint,2,rep,packed,name=ranked_teams,json=rankedTeams,proto3" json:"ranked_teams,omitempty"`
+	// Alianzas formadas hasta ahora, en orden de seed. Se evalúa la siguiente elección del draft.
+	Alliances []*AllianceLineup `protobuf:"bytes,3,rep,name=alliances,proto3" json:"alliances,omitempty"`
+	// Formato de llaves. Vacío = doble eliminación de 8 alianzas.
+	BracketFormat string `protobuf:"bytes,4,opt,name=bracket_format,json=bracketFormat,proto3" json:"bracket_format,omitempty"`
+	// Alineaciones conservadas al refinar las elecciones futuras del capitán (0 = 1, greedy).
+	BeamWidth uint32 `protobuf:"varint,5,opt,name=beam_width,json=beamWidth,proto3" json:"beam_width,omitempty"`
+	// Simulaciones Monte Carlo por alineación (0 = probabilidades exactas).
+	NSims uint32  `protobuf:"varint,6,opt,name=n_sims,json=nSims,proto3" json:"n_sims,omitempty"`
+	Seed  *uint64 `protobuf:"varint,7,opt,name=seed,proto3,oneof" json:"seed,omitempty"`
+}
+
+func (x *AllianceSelectionRequest) Reset() {
+	*x = AllianceSelectionRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_protos_prediction_proto_msgTypes[12]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *AllianceSelectionRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AllianceSelectionRequest) ProtoMessage() {}
+
+func (x *AllianceSelectionRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_protos_prediction_proto_msgTypes[12]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use AllianceSelectionRequest.ProtoReflect.Descriptor instead.
+func (*AllianceSelectionRequest) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{12}
+}
+
+func (x *AllianceSelectionRequest) GetEventKey() string {
 	if x != nil {
-		return x.Wins
+		return x.EventKey
+	}
+	return ""
+}
+
+func (x *AllianceSelectionRequest) GetRankedTeams() []uint32 {
+	if x != nil {
+		return x.RankedTeams
+	}
+	return nil
+}
+
+func (x *AllianceSelectionRequest) GetAlliances() []*AllianceLineup {
+	if x != nil {
+		return x.Alliances
+	}
+	return nil
+}
+
+func (x *AllianceSelectionRequest) GetBracketFormat() string {
+	if x != nil {
+		return x.BracketFormat
+	}
+	return ""
+}
+
+func (x *AllianceSelectionRequest) GetBeamWidth() uint32 {
+	if x != nil {
+		return x.BeamWidth
 	}
 	return 0
 }
 
-func (x *SimulationResult_Results) GetWinProbability() float64 {
+func (x *AllianceSelectionRequest) GetNSims() uint32 {
 	if x != nil {
-		return x.WinProbability
+		return x.NSims
 	}
 	return 0
 }
 
-var File_protos_prediction_proto protoreflect.FileDescriptor
+func (x *AllianceSelectionRequest) GetSeed() uint64 {
+	if x != nil && x.Seed != nil {
+		return *x.Seed
+	}
+	return 0
+}
 
-var file_protos_prediction_proto_rawDesc = []byte{
-	0x0a, 0x17, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x73, 0x2f, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74,
-	0x69, 0x6f, 0x6e, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x12, 0x0a, 0x6d, 0x61, 0x74, 0x63, 0x68,
-	0x70, 0x6f, 0x69, 0x6e, 0x74, 0x1a, 0x1f, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2f, 0x70, 0x72,
-	0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2f, 0x74, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70,
-	0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x22, 0x35, 0x0a, 0x16, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x50,
-	0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
-	0x12, 0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f, 0x6b, 0x65, 0x79, 0x18, 0x01, 0x20,
-	0x01, 0x28, 0x09, 0x52, 0x08, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x4b, 0x65, 0x79, 0x22, 0x60, 0x0a,
-	0x17, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e,
-	0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x45, 0x0a, 0x0b, 0x70, 0x72, 0x65, 0x64,
-	0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x23, 0x2e,
-	0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x4d, 0x61, 0x74, 0x63, 0x68,
-	0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
-	0x73, 0x65, 0x52, 0x0b, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x22,
-	0x35, 0x0a, 0x16, 0x4d, 0x61, 0x74, 0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69,
-	0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x6d, 0x61, 0x74,
-	0x63, 0x68, 0x5f, 0x6b, 0x65, 0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x6d, 0x61,
-	0x74, 0x63, 0x68, 0x4b, 0x65, 0x79, 0x22, 0xad, 0x02, 0x0a, 0x17, 0x4d, 0x61, 0x74, 0x63, 0x68,
-	0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
-	0x73, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x5f, 0x6b, 0x65, 0x79, 0x18,
-	0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x4b, 0x65, 0x79, 0x12,
-	0x29, 0x0a, 0x10, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x65, 0x64, 0x5f, 0x77, 0x69, 0x6e,
-	0x6e, 0x65, 0x72, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0f, 0x70, 0x72, 0x65, 0x64, 0x69,
-	0x63, 0x74, 0x65, 0x64, 0x57, 0x69, 0x6e, 0x6e, 0x65, 0x72, 0x12, 0x43, 0x0a, 0x0f, 0x77, 0x69,
-	0x6e, 0x5f, 0x70, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x18, 0x03, 0x20,
-	0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74,
-	0x2e, 0x57, 0x69, 0x6e, 0x50, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x52,
-	0x0e, 0x77, 0x69, 0x6e, 0x50, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x12,
-	0x46, 0x0a, 0x10, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x65, 0x64, 0x5f, 0x73, 0x63, 0x6f,
-	0x72, 0x65, 0x73, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1b, 0x2e, 0x6d, 0x61, 0x74, 0x63,
-	0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x65, 0x64,
-	0x53, 0x63, 0x6f, 0x72, 0x65, 0x73, 0x52, 0x0f, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x65,
-	0x64, 0x53, 0x63, 0x6f, 0x72, 0x65, 0x73, 0x12, 0x3d, 0x0a, 0x0d, 0x73, 0x68, 0x61, 0x70, 0x5f,
-	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x18, 0x05, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x18,
-	0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x68, 0x61, 0x70,
-	0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x52, 0x0c, 0x73, 0x68, 0x61, 0x70, 0x41, 0x6e,
-	0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x22, 0x8d, 0x01, 0x0a, 0x0c, 0x53, 0x68, 0x61, 0x70, 0x41,
-	0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x12, 0x1d, 0x0a, 0x0a, 0x62, 0x61, 0x73, 0x65, 0x5f,
-	0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x02, 0x52, 0x09, 0x62, 0x61, 0x73,
-	0x65, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x16, 0x0a, 0x06, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x73,
-	0x18, 0x02, 0x20, 0x03, 0x28, 0x02, 0x52, 0x06, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x73, 0x12, 0x23,
-	0x0a, 0x0d, 0x66, 0x65, 0x61, 0x74, 0x75, 0x72, 0x65, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x73, 0x18,
-	0x03, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0c, 0x66, 0x65, 0x61, 0x74, 0x75, 0x72, 0x65, 0x4e, 0x61,
-	0x6d, 0x65, 0x73, 0x12, 0x21, 0x0a, 0x0c, 0x66, 0x65, 0x61, 0x74, 0x75, 0x72, 0x65, 0x5f, 0x64,
-	0x61, 0x74, 0x61, 0x18, 0x04, 0x20, 0x03, 0x28, 0x02, 0x52, 0x0b, 0x66, 0x65, 0x61, 0x74, 0x75,
-	0x72, 0x65, 0x44, 0x61, 0x74, 0x61, 0x22, 0x36, 0x0a, 0x0e, 0x57, 0x69, 0x6e, 0x50, 0x72, 0x6f,
-	0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x12, 0x10, 0x0a, 0x03, 0x72, 0x65, 0x64, 0x18,
-	0x01, 0x20, 0x01, 0x28, 0x02, 0x52, 0x03, 0x72, 0x65, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x62, 0x6c,
-	0x75, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x02, 0x52, 0x04, 0x62, 0x6c, 0x75, 0x65, 0x22, 0x37,
-	0x0a, 0x0f, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x65, 0x64, 0x53, 0x63, 0x6f, 0x72, 0x65,
-	0x73, 0x12, 0x10, 0x0a, 0x03, 0x72, 0x65, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x03,
-	0x72, 0x65, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x62, 0x6c, 0x75, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28,
-	0x05, 0x52, 0x04, 0x62, 0x6c, 0x75, 0x65, 0x22, 0xe7, 0x03, 0x0a, 0x10, 0x53, 0x69, 0x6d, 0x75,
-	0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x1b, 0x0a, 0x09,
-	0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f, 0x6b, 0x65, 0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
-	0x08, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x4b, 0x65, 0x79, 0x12, 0x61, 0x0a, 0x13, 0x73, 0x69, 0x6d,
-	0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x6d, 0x65, 0x74, 0x61, 0x64, 0x61, 0x74, 0x61,
-	0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x30, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f,
-	0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65,
-	0x73, 0x75, 0x6c, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x5f,
-	0x6d, 0x65, 0x74, 0x61, 0x64, 0x61, 0x74, 0x61, 0x52, 0x12, 0x73, 0x69, 0x6d, 0x75, 0x6c, 0x61,
-	0x74, 0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x74, 0x61, 0x64, 0x61, 0x74, 0x61, 0x12, 0x3e, 0x0a, 0x07,
-	0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x24, 0x2e,
-	0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c,
-	0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x2e, 0x52, 0x65, 0x73, 0x75,
-	0x6c, 0x74, 0x73, 0x52, 0x07, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x1a, 0x8a, 0x01, 0x0a,
-	0x13, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x6d, 0x65, 0x74, 0x61,
-	0x64, 0x61, 0x74, 0x61, 0x12, 0x32, 0x0a, 0x15, 0x74, 0x6f, 0x74, 0x61, 0x6c, 0x5f, 0x73, 0x69,
-	0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x5f, 0x72, 0x75, 0x6e, 0x18, 0x01, 0x20,
-	0x01, 0x28, 0x0d, 0x52, 0x13, 0x74, 0x6f, 0x74, 0x61, 0x6c, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61,
-	0x74, 0x69, 0x6f, 0x6e, 0x73, 0x52, 0x75, 0x6e, 0x12, 0x3f, 0x0a, 0x0d, 0x74, 0x69, 0x6d, 0x65,
-	0x73, 0x74, 0x61, 0x6d, 0x70, 0x5f, 0x75, 0x74, 0x63, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32,
-	0x1a, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75,
-	0x66, 0x2e, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x52, 0x0c, 0x74, 0x69, 0x6d,
-	0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x55, 0x74, 0x63, 0x1a, 0x85, 0x01, 0x0a, 0x07, 0x52, 0x65,
-	0x73, 0x75, 0x6c, 0x74, 0x73, 0x12, 0x27, 0x0a, 0x0f, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63,
-	0x65, 0x5f, 0x6e, 0x75, 0x6d, 0x62, 0x65, 0x72, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x0e,
-	0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x4e, 0x75, 0x6d, 0x62, 0x65, 0x72, 0x12, 0x14,
-	0x0a, 0x05, 0x74, 0x65, 0x61, 0x6d, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0d, 0x52, 0x05, 0x74,
-	0x65, 0x61, 0x6d, 0x73, 0x12, 0x12, 0x0a, 0x04, 0x77, 0x69, 0x6e, 0x73, 0x18, 0x03, 0x20, 0x01,
-	0x28, 0x0d, 0x52, 0x04, 0x77, 0x69, 0x6e, 0x73, 0x12, 0x27, 0x0a, 0x0f, 0x77, 0x69, 0x6e, 0x5f,
-	0x70, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x18, 0x04, 0x20, 0x01, 0x28,
-	0x01, 0x52, 0x0e, 0x77, 0x69, 0x6e, 0x50, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74,
-	0x79, 0x22, 0x47, 0x0a, 0x11, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52,
-	0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f,
-	0x6b, 0x65, 0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x65, 0x76, 0x65, 0x6e, 0x74,
-	0x4b, 0x65, 0x79, 0x12, 0x15, 0x0a, 0x06, 0x6e, 0x5f, 0x73, 0x69, 0x6d, 0x73, 0x18, 0x02, 0x20,
-	0x01, 0x28, 0x0d, 0x52, 0x05, 0x6e, 0x53, 0x69, 0x6d, 0x73, 0x32, 0xa5, 0x02, 0x0a, 0x0a, 0x4d,
-	0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x12, 0x5f, 0x0a, 0x12, 0x47, 0x65, 0x74,
-	0x4d, 0x61, 0x74, 0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x12,
-	0x22, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x4d, 0x61, 0x74,
-	0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75,
-	0x65, 0x73, 0x74, 0x1a, 0x23, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74,
-	0x2e, 0x4d, 0x61, 0x74, 0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e,
-	0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x22, 0x00, 0x12, 0x63, 0x0a, 0x16, 0x50, 0x72,
-	0x65, 0x64, 0x69, 0x63, 0x74, 0x41, 0x6c, 0x6c, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x4d, 0x61, 0x74,
-	0x63, 0x68, 0x65, 0x73, 0x12, 0x22, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e,
-	0x74, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f,
-	0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x23, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68,
-	0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x50, 0x72, 0x65, 0x64, 0x69,
-	0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x22, 0x00, 0x12,
-	0x51, 0x0a, 0x10, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x65, 0x50, 0x6c, 0x61, 0x79, 0x6f,
-	0x66, 0x66, 0x73, 0x12, 0x1d, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74,
-	0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65,
-	0x73, 0x74, 0x1a, 0x1c, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e,
-	0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74,
-	0x22, 0x00, 0x42, 0x1b, 0x5a, 0x19, 0x62, 0x6c, 0x75, 0x65, 0x2d, 0x62, 0x61, 0x6e, 0x6e, 0x65,
-	0x72, 0x2d, 0x65, 0x6e, 0x67, 0x69, 0x6e, 0x65, 0x2f, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x73, 0x62,
-	0x06, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x33,
+type AllianceSelectionResult struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	EventKey       string `protobuf:"bytes,1,opt,name=event_key,json=eventKey,proto3" json:"event_key,omitempty"`
+	AllianceNumber uint32 `protobuf:"varint,2,opt,name=alliance_number,json=allianceNumber,proto3" json:"alliance_number,omitempty"`
+	PickNumber     uint32 `protobuf:"varint,3,opt,name=pick_number,json=pickNumber,proto3" json:"pick_number,omitempty"`
+	Exact          bool   `protobuf:"varint,4,opt,name=exact,proto3" json:"exact,omitempty"`
+	// Ordenados de mayor a menor probabilidad de campeonato.
+	Candidates       []*AllianceSelectionResult_Candidate `protobuf:"bytes,5,rep,name=candidates,proto3" json:"candidates,omitempty"`
+	LineupsEvaluated uint32                               `protobuf:"varint,6,opt,name=lineups_evaluated,json=lineupsEvaluated,proto3" json:"lineups_evaluated,omitempty"`
+	// Enfrentamientos nuevos que tuvo que evaluar el modelo (el resto venía del cache).
+	ModelEvaluations uint32 `protobuf:"varint,7,opt,name=model_evaluations,json=modelEvaluations,proto3" json:"model_evaluations,omitempty"`
 }
 
-var (
-	file_protos_prediction_proto_rawDescOnce sync.Once
-	file_protos_prediction_proto_rawDescData = file_protos_prediction_proto_rawDesc
-)
+func (x *AllianceSelectionResult) Reset() {
+	*x = AllianceSelectionResult{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_protos_prediction_proto_msgTypes[13]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
 
-func file_protos_prediction_proto_rawDescGZIP() []byte {
-	file_protos_prediction_proto_rawDescOnce.Do(func() {
-		file_protos_prediction_proto_rawDescData = protoimpl.X.CompressGZIP(file_protos_prediction_proto_rawDescData)
-	})
-	return file_protos_prediction_proto_rawDescData
+func (x *AllianceSelectionResult) String() string {
+	return protoimpl.X.MessageStringOf(x)
 }
 
-var file_protos_prediction_proto_msgTypes = make([]protoimpl.MessageInfo, 11)
-var file_protos_prediction_proto_goTypes = []interface{}{
-	(*EventPredictionRequest)(nil),              // 0: matchpoint.EventPredictionRequest
-	(*EventPredictionResponse)(nil),             // 1: matchpoint.EventPredictionResponse
-	(*MatchPredictionRequest)(nil),              // 2: matchpoint.MatchPredictionRequest
-	(*MatchPredictionResponse)(nil),             // 3: matchpoint.MatchPredictionResponse
-	(*ShapAnalysis)(nil),                        // 4: matchpoint.ShapAnalysis
-	(*WinProbability)(nil),                      // 5: matchpoint.WinProbability
-	(*PredictedScores)(nil),                     // 6: matchpoint.PredictedScores
-	(*SimulationResult)(nil),                    // 7: matchpoint.SimulationResult
-	(*SimulationRequest)(nil),                   // 8: matchpoint.SimulationRequest
-	(*SimulationResult_SimulationMetadata)(nil), // 9: matchpoint.SimulationResult.Simulation_metadata
-	(*SimulationResult_Results)(nil),            // 10: matchpoint.SimulationResult.Results
-	(*timestamppb.Timestamp)(nil),               // 11: google.protobuf.Timestamp
+func (*AllianceSelectionResult) ProtoMessage() {}
+
+func (x *AllianceSelectionResult) ProtoReflect() protoreflect.Message {
+	mi := &file_protos_prediction_proto_msgTypes[13]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
 }
-var file_protos_prediction_proto_depIdxs = []int32{
-	3,  // 0: matchpoint.EventPredictionResponse.predictions:type_name -> matchpoint.MatchPredictionResponse
-	5,  // 1: matchpoint.MatchPredictionResponse.win_probability:type_name -> matchpoint.WinProbability
-	6,  // 2: matchpoint.MatchPredictionResponse.predicted_scores:type_name -> matchpoint.PredictedScores
-	4,  // 3: matchpoint.MatchPredictionResponse.shap_analysis:type_name -> matchpoint.ShapAnalysis
-	9,  // 4: matchpoint.SimulationResult.simulation_metadata:type_name -> matchpoint.SimulationResult.Simulation_metadata
-	10, // 5: matchpoint.SimulationResult.results:type_name -> matchpoint.SimulationResult.Results
-	11, // 6: matchpoint.SimulationResult.Simulation_metadata.timestamp_utc:type_name -> google.protobuf.Timestamp
-	2,  // 7: matchpoint.Matchpoint.GetMatchPrediction:input_type -> matchpoint.MatchPredictionRequest
-	0,  // 8: matchpoint.Matchpoint.PredictAllEventMatches:input_type -> matchpoint.EventPredictionRequest
-	8,  // 9: matchpoint.Matchpoint.SimulatePlayoffs:input_type -> matchpoint.SimulationRequest
-	3,  // 10: matchpoint.Matchpoint.GetMatchPrediction:output_type -> matchpoint.MatchPredictionResponse
-	1,  // 11: matchpoint.Matchpoint.PredictAllEventMatches:output_type -> matchpoint.EventPredictionResponse
-	7,  // 12: matchpoint.Matchpoint.SimulatePlayoffs:output_type -> matchpoint.SimulationResult
-	10, // [10:13] is the sub-list for method output_type
-	7,  // [7:10] is the sub-list for method input_type
-	7,  // [7:7] is the sub-list for extension type_name
-	7,  // [7:7] is the sub-list for extension extendee
-	0,  // [0:7] is the sub-list for field type_name
+
+// Deprecated: Use AllianceSelectionResult.ProtoReflect.Descriptor instead.
+func (*AllianceSelectionResult) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{13}
 }
 
-func init() { file_protos_prediction_proto_init() }
-func file_protos_prediction_proto_init() {
-	if File_protos_prediction_proto != nil {
-		return
+func (x *AllianceSelectionResult) GetEventKey() string {
+	if x != nil {
+		return x.EventKey
 	}
-	if !protoimpl.UnsafeEnabled {
-		file_protos_prediction_proto_msgTypes[0].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*EventPredictionRequest); i {
-			case 0:
-				return &v.state
-			case 1:
-				return &v.sizeCache
-			case 2:
-				return &v.unknownFields
-			default:
-				return nil
-			}
-		}
+	return ""
+}
+
+func (x *AllianceSelectionResult) GetAllianceNumber() uint32 {
+	if x != nil {
+		return x.AllianceNumber
+	}
+	return 0
+}
+
+func (x *AllianceSelectionResult) GetPickNumber() uint32 {
+	if x != nil {
+		return x.PickNumber
+	}
+	return 0
+}
+
+func (x *AllianceSelectionResult) GetExact() bool {
+	if x != nil {
+		return x.Exact
+	}
+	return false
+}
+
+func (x *AllianceSelectionResult) GetCandidates() []*AllianceSelectionResult_Candidate {
+	if x != nil {
+		return x.Candidates
+	}
+	return nil
+}
+
+func (x *AllianceSelectionResult) GetLineupsEvaluated() uint32 {
+	if x != nil {
+		return x.LineupsEvaluated
+	}
+	return 0
+}
+
+func (x *AllianceSelectionResult) GetModelEvaluations() uint32 {
+	if x != nil {
+		return x.ModelEvaluations
+	}
+	return 0
+}
+
+type SimulationResult_SimulationMetadata struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	TotalSimulationsRun uint32                 `protobuf:"varint,1,opt,name=total_simulations_run,json=totalSimulationsRun,proto3" json:"total_simulations_run,omitempty"`
+	TimestampUtc        *timestamppb.Timestamp `protobuf:"bytes,2,opt,name=timestamp_utc,json=timestampUtc,proto3" json:"timestamp_utc,omitempty"`
+	// true si las probabilidades son exactas (no Monte Carlo).
+	Exact bool `protobuf:"varint,3,opt,name=exact,proto3" json:"exact,omitempty"`
+	// Vacío en resultados parciales; "converged", "deadline" o "max_sims" en el último.
+	StopReason string `protobuf:"bytes,4,opt,name=stop_reason,json=stopReason,proto3" json:"stop_reason,omitempty"`
+}
+
+func (x *SimulationResult_SimulationMetadata) Reset() {
+	*x = SimulationResult_SimulationMetadata{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_protos_prediction_proto_msgTypes[14]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SimulationResult_SimulationMetadata) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SimulationResult_SimulationMetadata) ProtoMessage() {}
+
+func (x *SimulationResult_SimulationMetadata) ProtoReflect() protoreflect.Message {
+	mi := &file_protos_prediction_proto_msgTypes[14]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SimulationResult_SimulationMetadata.ProtoReflect.Descriptor instead.
+func (*SimulationResult_SimulationMetadata) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{7, 0}
+}
+
+func (x *SimulationResult_SimulationMetadata) GetTotalSimulationsRun() uint32 {
+	if x != nil {
+		return x.TotalSimulationsRun
+	}
+	return 0
+}
+
+func (x *SimulationResult_SimulationMetadata) GetTimestampUtc() *timestamppb.Timestamp {
+	if x != nil {
+		return x.TimestampUtc
+	}
+	return nil
+}
+
+func (x *SimulationResult_SimulationMetadata) GetExact() bool {
+	if x != nil {
+		return x.Exact
+	}
+	return false
+}
+
+func (x *SimulationResult_SimulationMetadata) GetStopReason() string {
+	if x != nil {
+		return x.StopReason
+	}
+	return ""
+}
+
+type SimulationResult_Results struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	AllianceNumber uint32   `protobuf:"varint,1,opt,name=alliance_number,json=allianceNumber,proto3" json:"alliance_number,omitempty"`
+	Teams          []uint32 `protobuf:"varint,2,rep,packed,name=teams,proto3" json:"teams,omitempty"`
+	Wins           uint32   `protobuf:"varint,3,opt,name=wins,proto3" json:"wins,omitempty"`
+	WinProbability float64  `protobuf:"fixed64,4,opt,name=win_probability,json=winProbability,proto3" json:"win_probability,omitempty"`
+	// Probabilidad de superar cada ronda, alineada con round_names.
+	RoundAdvancement []float64 `protobuf:"fixed64,5,rep,packed,name=round_advancement,json=roundAdvancement,proto3" json:"round_advancement,omitempty"`
+	// Intervalo de confianza (Wilson) de win_probability. Sólo en Monte Carlo.
+	CiLow  float64 `protobuf:"fixed64,6,opt,name=ci_low,json=ciLow,proto3" json:"ci_low,omitempty"`
+	CiHigh float64 `protobuf:"fixed64,7,opt,name=ci_high,json=ciHigh,proto3" json:"ci_high,omitempty"`
+	// Veces que la alianza llegó a la final. Sólo en Monte Carlo.
+	FinalistCount uint32 `protobuf:"varint,8,opt,name=finalist_count,json=finalistCount,proto3" json:"finalist_count,omitempty"`
+	// Veces eliminada en cada ronda (alineado con round_names) + una última entrada de campeonatos.
+	EliminationRoundCounts []uint32 `protobuf:"varint,9,rep,packed,name=elimination_round_counts,json=eliminationRoundCounts,proto3" json:"elimination_round_counts,omitempty"`
+}
+
+func (x *SimulationResult_Results) Reset() {
+	*x = SimulationResult_Results{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_protos_prediction_proto_msgTypes[15]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SimulationResult_Results) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SimulationResult_Results) ProtoMessage() {}
+
+func (x *SimulationResult_Results) ProtoReflect() protoreflect.Message {
+	mi := &file_protos_prediction_proto_msgTypes[15]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SimulationResult_Results.ProtoReflect.Descriptor instead.
+func (*SimulationResult_Results) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{7, 1}
+}
+
+func (x *SimulationResult_Results) GetAllianceNumber() uint32 {
+	if x != nil {
+		return x.AllianceNumber
+	}
+	return 0
+}
+
+func (x *SimulationResult_Results) GetTeams() []uint32 {
+	if x != nil {
+		return x.Teams
+	}
+	return nil
+}
+
+func (x *SimulationResult_Results) GetWins() uint32 {
+	if x != nil {
+		return x.Wins
+	}
+	return 0
+}
+
+func (x *SimulationResult_Results) GetWinProbability() float64 {
+	if x != nil {
+		return x.WinProbability
+	}
+	return 0
+}
+
+func (x *SimulationResult_Results) GetRoundAdvancement() []float64 {
+	if x != nil {
+		return x.RoundAdvancement
+	}
+	return nil
+}
+
+func (x *SimulationResult_Results) GetCiLow() float64 {
+	if x != nil {
+		return x.CiLow
+	}
+	return 0
+}
+
+func (x *SimulationResult_Results) GetCiHigh() float64 {
+	if x != nil {
+		return x.CiHigh
+	}
+	return 0
+}
+
+func (x *SimulationResult_Results) GetFinalistCount() uint32 {
+	if x != nil {
+		return x.FinalistCount
+	}
+	return 0
+}
+
+func (x *SimulationResult_Results) GetEliminationRoundCounts() []uint32 {
+	if x != nil {
+		return x.EliminationRoundCounts
+	}
+	return nil
+}
+
+type SimulationResult_FinalMatchup struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	RedAlliance  uint32  `protobuf:"varint,1,opt,name=red_alliance,json=redAlliance,proto3" json:"red_alliance,omitempty"`
+	BlueAlliance uint32  `protobuf:"varint,2,opt,name=blue_alliance,json=blueAlliance,proto3" json:"blue_alliance,omitempty"`
+	Count        uint32  `protobuf:"varint,3,opt,name=count,proto3" json:"count,omitempty"`
+	Probability  float64 `protobuf:"fixed64,4,opt,name=probability,proto3" json:"probability,omitempty"`
+}
+
+func (x *SimulationResult_FinalMatchup) Reset() {
+	*x = SimulationResult_FinalMatchup{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_protos_prediction_proto_msgTypes[16]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SimulationResult_FinalMatchup) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SimulationResult_FinalMatchup) ProtoMessage() {}
+
+func (x *SimulationResult_FinalMatchup) ProtoReflect() protoreflect.Message {
+	mi := &file_protos_prediction_proto_msgTypes[16]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SimulationResult_FinalMatchup.ProtoReflect.Descriptor instead.
+func (*SimulationResult_FinalMatchup) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{7, 2}
+}
+
+func (x *SimulationResult_FinalMatchup) GetRedAlliance() uint32 {
+	if x != nil {
+		return x.RedAlliance
+	}
+	return 0
+}
+
+func (x *SimulationResult_FinalMatchup) GetBlueAlliance() uint32 {
+	if x != nil {
+		return x.BlueAlliance
+	}
+	return 0
+}
+
+func (x *SimulationResult_FinalMatchup) GetCount() uint32 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+func (x *SimulationResult_FinalMatchup) GetProbability() float64 {
+	if x != nil {
+		return x.Probability
+	}
+	return 0
+}
+
+type QualificationSimulationResult_TeamRanking struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Team uint32 `protobuf:"varint,1,opt,name=team,proto3" json:"team,omitempty"`
+	// Posición actual en TBA (0 si todavía no tiene ranking).
+	CurrentRank         uint32  `protobuf:"varint,2,opt,name=current_rank,json=currentRank,proto3" json:"current_rank,omitempty"`
+	CurrentRankingScore float64 `protobuf:"fixed64,3,opt,name=current_ranking_score,json=currentRankingScore,proto3" json:"current_ranking_score,omitempty"`
+	MeanRank            float64 `protobuf:"fixed64,4,opt,name=mean_rank,json=meanRank,proto3" json:"mean_rank,omitempty"`
+	TopNProbability     float64 `protobuf:"fixed64,5,opt,name=top_n_probability,json=topNProbability,proto3" json:"top_n_probability,omitempty"`
+	// Probabilidad de terminar en cada posición (índice 0 = primer lugar).
+	RankProbabilities    []float64 `protobuf:"fixed64,6,rep,packed,name=rank_probabilities,json=rankProbabilities,proto3" json:"rank_probabilities,omitempty"`
+	ExpectedRankingScore float64   `protobuf:"fixed64,7,opt,name=expected_ranking_score,json=expectedRankingScore,proto3" json:"expected_ranking_score,omitempty"`
+}
+
+func (x *QualificationSimulationResult_TeamRanking) Reset() {
+	*x = QualificationSimulationResult_TeamRanking{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_protos_prediction_proto_msgTypes[17]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *QualificationSimulationResult_TeamRanking) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*QualificationSimulationResult_TeamRanking) ProtoMessage() {}
+
+func (x *QualificationSimulationResult_TeamRanking) ProtoReflect() protoreflect.Message {
+	mi := &file_protos_prediction_proto_msgTypes[17]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use QualificationSimulationResult_TeamRanking.ProtoReflect.Descriptor instead.
+func (*QualificationSimulationResult_TeamRanking) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{10, 0}
+}
+
+func (x *QualificationSimulationResult_TeamRanking) GetTeam() uint32 {
+	if x != nil {
+		return x.Team
+	}
+	return 0
+}
+
+func (x *QualificationSimulationResult_TeamRanking) GetCurrentRank() uint32 {
+	if x != nil {
+		return x.CurrentRank
+	}
+	return 0
+}
+
+func (x *QualificationSimulationResult_TeamRanking) GetCurrentRankingScore() float64 {
+	if x != nil {
+		return x.CurrentRankingScore
+	}
+	return 0
+}
+
+func (x *QualificationSimulationResult_TeamRanking) GetMeanRank() float64 {
+	if x != nil {
+		return x.MeanRank
+	}
+	return 0
+}
+
+func (x *QualificationSimulationResult_TeamRanking) GetTopNProbability() float64 {
+	if x != nil {
+		return x.TopNProbability
+	}
+	return 0
+}
+
+func (x *QualificationSimulationResult_TeamRanking) GetRankProbabilities() []float64 {
+	if x != nil {
+		return x.RankProbabilities
+	}
+	return nil
+}
+
+func (x *QualificationSimulationResult_TeamRanking) GetExpectedRankingScore() float64 {
+	if x != nil {
+		return x.ExpectedRankingScore
+	}
+	return 0
+}
+
+type AllianceSelectionResult_Candidate struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Team           uint32  `protobuf:"varint,1,opt,name=team,proto3" json:"team,omitempty"`
+	WinProbability float64 `protobuf:"fixed64,2,opt,name=win_probability,json=winProbability,proto3" json:"win_probability,omitempty"`
+	// Alianza final con la que se obtuvo win_probability.
+	ProjectedAlliance []uint32 `protobuf:"varint,3,rep,packed,name=projected_alliance,json=projectedAlliance,proto3" json:"projected_alliance,omitempty"`
+}
+
+func (x *AllianceSelectionResult_Candidate) Reset() {
+	*x = AllianceSelectionResult_Candidate{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_protos_prediction_proto_msgTypes[18]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *AllianceSelectionResult_Candidate) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AllianceSelectionResult_Candidate) ProtoMessage() {}
+
+func (x *AllianceSelectionResult_Candidate) ProtoReflect() protoreflect.Message {
+	mi := &file_protos_prediction_proto_msgTypes[18]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use AllianceSelectionResult_Candidate.ProtoReflect.Descriptor instead.
+func (*AllianceSelectionResult_Candidate) Descriptor() ([]byte, []int) {
+	return file_protos_prediction_proto_rawDescGZIP(), []int{13, 0}
+}
+
+func (x *AllianceSelectionResult_Candidate) GetTeam() uint32 {
+	if x != nil {
+		return x.Team
+	}
+	return 0
+}
+
+func (x *AllianceSelectionResult_Candidate) GetWinProbability() float64 {
+	if x != nil {
+		return x.WinProbability
+	}
+	return 0
+}
+
+func (x *AllianceSelectionResult_Candidate) GetProjectedAlliance() []uint32 {
+	if x != nil {
+		return x.ProjectedAlliance
+	}
+	return nil
+}
+
+var File_protos_prediction_proto protoreflect.FileDescriptor
+
+var file_protos_prediction_proto_rawDesc = []byte{
+	0x0a, 0x17, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x73, 0x2f, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74,
+	0x69, 0x6f, 0x6e, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x12, 0x0a, 0x6d, 0x61, 0x74, 0x63, 0x68,
+	0x70, 0x6f, 0x69, 0x6e, 0x74, 0x1a, 0x1f, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2f, 0x70, 0x72,
+	0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2f, 0x74, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70,
+	0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x22, 0x58, 0x0a, 0x16, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x50,
+	0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
+	0x12, 0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f, 0x6b, 0x65, 0x79, 0x18, 0x01, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x08, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x4b, 0x65, 0x79, 0x12, 0x21, 0x0a,
+	0x0c, 0x69, 0x6e, 0x63, 0x6c, 0x75, 0x64, 0x65, 0x5f, 0x73, 0x68, 0x61, 0x70, 0x18, 0x02, 0x20,
+	0x01, 0x28, 0x08, 0x52, 0x0b, 0x69, 0x6e, 0x63, 0x6c, 0x75, 0x64, 0x65, 0x53, 0x68, 0x61, 0x70,
+	0x22, 0x60, 0x0a, 0x17, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74,
+	0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x45, 0x0a, 0x0b, 0x70,
+	0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b,
+	0x32, 0x23, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x4d, 0x61,
+	0x74, 0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x52, 0x0b, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f,
+	0x6e, 0x73, 0x22, 0x35, 0x0a, 0x16, 0x4d, 0x61, 0x74, 0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69,
+	0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09,
+	0x6d, 0x61, 0x74, 0x63, 0x68, 0x5f, 0x6b, 0x65, 0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
+	0x08, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x4b, 0x65, 0x79, 0x22, 0xad, 0x02, 0x0a, 0x17, 0x4d, 0x61,
+	0x74, 0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x5f, 0x6b,
+	0x65, 0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x4b,
+	0x65, 0x79, 0x12, 0x29, 0x0a, 0x10, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x65, 0x64, 0x5f,
+	0x77, 0x69, 0x6e, 0x6e, 0x65, 0x72, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0f, 0x70, 0x72,
+	0x65, 0x64, 0x69, 0x63, 0x74, 0x65, 0x64, 0x57, 0x69, 0x6e, 0x6e, 0x65, 0x72, 0x12, 0x43, 0x0a,
+	0x0f, 0x77, 0x69, 0x6e, 0x5f, 0x70, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79,
+	0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f,
+	0x69, 0x6e, 0x74, 0x2e, 0x57, 0x69, 0x6e, 0x50, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69,
+	0x74, 0x79, 0x52, 0x0e, 0x77, 0x69, 0x6e, 0x50, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69,
+	0x74, 0x79, 0x12, 0x46, 0x0a, 0x10, 0x70, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x65, 0x64, 0x5f,
+	0x73, 0x63, 0x6f, 0x72, 0x65, 0x73, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1b, 0x2e, 0x6d,
+	0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63,
+	0x74, 0x65, 0x64, 0x53, 0x63, 0x6f, 0x72, 0x65, 0x73, 0x52, 0x0f, 0x70, 0x72, 0x65, 0x64, 0x69,
+	0x63, 0x74, 0x65, 0x64, 0x53, 0x63, 0x6f, 0x72, 0x65, 0x73, 0x12, 0x3d, 0x0a, 0x0d, 0x73, 0x68,
+	0x61, 0x70, 0x5f, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x18, 0x05, 0x20, 0x01, 0x28,
+	0x0b, 0x32, 0x18, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53,
+	0x68, 0x61, 0x70, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x52, 0x0c, 0x73, 0x68, 0x61,
+	0x70, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x22, 0x8d, 0x01, 0x0a, 0x0c, 0x53, 0x68,
+	0x61, 0x70, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x12, 0x1d, 0x0a, 0x0a, 0x62, 0x61,
+	0x73, 0x65, 0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x02, 0x52, 0x09,
+	0x62, 0x61, 0x73, 0x65, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x16, 0x0a, 0x06, 0x76, 0x61, 0x6c,
+	0x75, 0x65, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x02, 0x52, 0x06, 0x76, 0x61, 0x6c, 0x75, 0x65,
+	0x73, 0x12, 0x23, 0x0a, 0x0d, 0x66, 0x65, 0x61, 0x74, 0x75, 0x72, 0x65, 0x5f, 0x6e, 0x61, 0x6d,
+	0x65, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0c, 0x66, 0x65, 0x61, 0x74, 0x75, 0x72,
+	0x65, 0x4e, 0x61, 0x6d, 0x65, 0x73, 0x12, 0x21, 0x0a, 0x0c, 0x66, 0x65, 0x61, 0x74, 0x75, 0x72,
+	0x65, 0x5f, 0x64, 0x61, 0x74, 0x61, 0x18, 0x04, 0x20, 0x03, 0x28, 0x02, 0x52, 0x0b, 0x66, 0x65,
+	0x61, 0x74, 0x75, 0x72, 0x65, 0x44, 0x61, 0x74, 0x61, 0x22, 0x36, 0x0a, 0x0e, 0x57, 0x69, 0x6e,
+	0x50, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x12, 0x10, 0x0a, 0x03, 0x72,
+	0x65, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x02, 0x52, 0x03, 0x72, 0x65, 0x64, 0x12, 0x12, 0x0a,
+	0x04, 0x62, 0x6c, 0x75, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x02, 0x52, 0x04, 0x62, 0x6c, 0x75,
+	0x65, 0x22, 0x37, 0x0a, 0x0f, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x65, 0x64, 0x53, 0x63,
+	0x6f, 0x72, 0x65, 0x73, 0x12, 0x10, 0x0a, 0x03, 0x72, 0x65, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28,
+	0x05, 0x52, 0x03, 0x72, 0x65, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x62, 0x6c, 0x75, 0x65, 0x18, 0x02,
+	0x20, 0x01, 0x28, 0x05, 0x52, 0x04, 0x62, 0x6c, 0x75, 0x65, 0x22, 0xe0, 0x07, 0x0a, 0x10, 0x53,
+	0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12,
+	0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f, 0x6b, 0x65, 0x79, 0x18, 0x01, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x08, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x4b, 0x65, 0x79, 0x12, 0x61, 0x0a, 0x13,
+	0x73, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x6d, 0x65, 0x74, 0x61, 0x64,
+	0x61, 0x74, 0x61, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x30, 0x2e, 0x6d, 0x61, 0x74, 0x63,
+	0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69,
+	0x6f, 0x6e, 0x5f, 0x6d, 0x65, 0x74, 0x61, 0x64, 0x61, 0x74, 0x61, 0x52, 0x12, 0x73, 0x69, 0x6d,
+	0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x74, 0x61, 0x64, 0x61, 0x74, 0x61, 0x12,
+	0x3e, 0x0a, 0x07, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x0b,
+	0x32, 0x24, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69,
+	0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x2e, 0x52,
+	0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x52, 0x07, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x12,
+	0x1f, 0x0a, 0x0b, 0x72, 0x6f, 0x75, 0x6e, 0x64, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x73, 0x18, 0x04,
+	0x20, 0x03, 0x28, 0x09, 0x52, 0x0a, 0x72, 0x6f, 0x75, 0x6e, 0x64, 0x4e, 0x61, 0x6d, 0x65, 0x73,
+	0x12, 0x50, 0x0a, 0x0e, 0x66, 0x69, 0x6e, 0x61, 0x6c, 0x5f, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x75,
+	0x70, 0x73, 0x18, 0x05, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x29, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68,
+	0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e,
+	0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x2e, 0x46, 0x69, 0x6e, 0x61, 0x6c, 0x4d, 0x61, 0x74, 0x63,
+	0x68, 0x75, 0x70, 0x52, 0x0d, 0x66, 0x69, 0x6e, 0x61, 0x6c, 0x4d, 0x61, 0x74, 0x63, 0x68, 0x75,
+	0x70, 0x73, 0x1a, 0xc1, 0x01, 0x0a, 0x13, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x5f, 0x6d, 0x65, 0x74, 0x61, 0x64, 0x61, 0x74, 0x61, 0x12, 0x32, 0x0a, 0x15, 0x74, 0x6f,
+	0x74, 0x61, 0x6c, 0x5f, 0x73, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x5f,
+	0x72, 0x75, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x13, 0x74, 0x6f, 0x74, 0x61, 0x6c,
+	0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x52, 0x75, 0x6e, 0x12, 0x3f,
+	0x0a, 0x0d, 0x74, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x5f, 0x75, 0x74, 0x63, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70,
+	0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d,
+	0x70, 0x52, 0x0c, 0x74, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x55, 0x74, 0x63, 0x12,
+	0x14, 0x0a, 0x05, 0x65, 0x78, 0x61, 0x63, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x08, 0x52, 0x05,
+	0x65, 0x78, 0x61, 0x63, 0x74, 0x12, 0x1f, 0x0a, 0x0b, 0x73, 0x74, 0x6f, 0x70, 0x5f, 0x72, 0x65,
+	0x61, 0x73, 0x6f, 0x6e, 0x18, 0x04, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x74, 0x6f, 0x70,
+	0x52, 0x65, 0x61, 0x73, 0x6f, 0x6e, 0x1a, 0xc3, 0x02, 0x0a, 0x07, 0x52, 0x65, 0x73, 0x75, 0x6c,
+	0x74, 0x73, 0x12, 0x27, 0x0a, 0x0f, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x5f, 0x6e,
+	0x75, 0x6d, 0x62, 0x65, 0x72, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x0e, 0x61, 0x6c, 0x6c,
+	0x69, 0x61, 0x6e, 0x63, 0x65, 0x4e, 0x75, 0x6d, 0x62, 0x65, 0x72, 0x12, 0x14, 0x0a, 0x05, 0x74,
+	0x65, 0x61, 0x6d, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0d, 0x52, 0x05, 0x74, 0x65, 0x61, 0x6d,
+	0x73, 0x12, 0x12, 0x0a, 0x04, 0x77, 0x69, 0x6e, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0d, 0x52,
+	0x04, 0x77, 0x69, 0x6e, 0x73, 0x12, 0x27, 0x0a, 0x0f, 0x77, 0x69, 0x6e, 0x5f, 0x70, 0x72, 0x6f,
+	0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0e,
+	0x77, 0x69, 0x6e, 0x50, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x12, 0x2b,
+	0x0a, 0x11, 0x72, 0x6f, 0x75, 0x6e, 0x64, 0x5f, 0x61, 0x64, 0x76, 0x61, 0x6e, 0x63, 0x65, 0x6d,
+	0x65, 0x6e, 0x74, 0x18, 0x05, 0x20, 0x03, 0x28, 0x01, 0x52, 0x10, 0x72, 0x6f, 0x75, 0x6e, 0x64,
+	0x41, 0x64, 0x76, 0x61, 0x6e, 0x63, 0x65, 0x6d, 0x65, 0x6e, 0x74, 0x12, 0x15, 0x0a, 0x06, 0x63,
+	0x69, 0x5f, 0x6c, 0x6f, 0x77, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x05, 0x63, 0x69, 0x4c,
+	0x6f, 0x77, 0x12, 0x17, 0x0a, 0x07, 0x63, 0x69, 0x5f, 0x68, 0x69, 0x67, 0x68, 0x18, 0x07, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x06, 0x63, 0x69, 0x48, 0x69, 0x67, 0x68, 0x12, 0x25, 0x0a, 0x0e, 0x66,
+	0x69, 0x6e, 0x61, 0x6c, 0x69, 0x73, 0x74, 0x5f, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x08, 0x20,
+	0x01, 0x28, 0x0d, 0x52, 0x0d, 0x66, 0x69, 0x6e, 0x61, 0x6c, 0x69, 0x73, 0x74, 0x43, 0x6f, 0x75,
+	0x6e, 0x74, 0x12, 0x38, 0x0a, 0x18, 0x65, 0x6c, 0x69, 0x6d, 0x69, 0x6e, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x5f, 0x72, 0x6f, 0x75, 0x6e, 0x64, 0x5f, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x73, 0x18, 0x09,
+	0x20, 0x03, 0x28, 0x0d, 0x52, 0x16, 0x65, 0x6c, 0x69, 0x6d, 0x69, 0x6e, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x52, 0x6f, 0x75, 0x6e, 0x64, 0x43, 0x6f, 0x75, 0x6e, 0x74, 0x73, 0x1a, 0x8e, 0x01, 0x0a,
+	0x0c, 0x46, 0x69, 0x6e, 0x61, 0x6c, 0x4d, 0x61, 0x74, 0x63, 0x68, 0x75, 0x70, 0x12, 0x21, 0x0a,
+	0x0c, 0x72, 0x65, 0x64, 0x5f, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x18, 0x01, 0x20,
+	0x01, 0x28, 0x0d, 0x52, 0x0b, 0x72, 0x65, 0x64, 0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65,
+	0x12, 0x23, 0x0a, 0x0d, 0x62, 0x6c, 0x75, 0x65, 0x5f, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63,
+	0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x0c, 0x62, 0x6c, 0x75, 0x65, 0x41, 0x6c, 0x6c,
+	0x69, 0x61, 0x6e, 0x63, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x03,
+	0x20, 0x01, 0x28, 0x0d, 0x52, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x20, 0x0a, 0x0b, 0x70,
+	0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x0b, 0x70, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x22, 0xf1, 0x01,
+	0x0a, 0x11, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75,
+	0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f, 0x6b, 0x65, 0x79,
+	0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x4b, 0x65, 0x79,
+	0x12, 0x15, 0x0a, 0x06, 0x6e, 0x5f, 0x73, 0x69, 0x6d, 0x73, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0d,
+	0x52, 0x05, 0x6e, 0x53, 0x69, 0x6d, 0x73, 0x12, 0x17, 0x0a, 0x04, 0x73, 0x65, 0x65, 0x64, 0x18,
+	0x03, 0x20, 0x01, 0x28, 0x04, 0x48, 0x00, 0x52, 0x04, 0x73, 0x65, 0x65, 0x64, 0x88, 0x01, 0x01,
+	0x12, 0x25, 0x0a, 0x0e, 0x62, 0x72, 0x61, 0x63, 0x6b, 0x65, 0x74, 0x5f, 0x66, 0x6f, 0x72, 0x6d,
+	0x61, 0x74, 0x18, 0x04, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0d, 0x62, 0x72, 0x61, 0x63, 0x6b, 0x65,
+	0x74, 0x46, 0x6f, 0x72, 0x6d, 0x61, 0x74, 0x12, 0x14, 0x0a, 0x05, 0x65, 0x78, 0x61, 0x63, 0x74,
+	0x18, 0x05, 0x20, 0x01, 0x28, 0x08, 0x52, 0x05, 0x65, 0x78, 0x61, 0x63, 0x74, 0x12, 0x1c, 0x0a,
+	0x09, 0x74, 0x6f, 0x6c, 0x65, 0x72, 0x61, 0x6e, 0x63, 0x65, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x09, 0x74, 0x6f, 0x6c, 0x65, 0x72, 0x61, 0x6e, 0x63, 0x65, 0x12, 0x2b, 0x0a, 0x11, 0x73,
+	0x6e, 0x61, 0x70, 0x73, 0x68, 0x6f, 0x74, 0x5f, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c,
+	0x18, 0x07, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x10, 0x73, 0x6e, 0x61, 0x70, 0x73, 0x68, 0x6f, 0x74,
+	0x49, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x42, 0x07, 0x0a, 0x05, 0x5f, 0x73, 0x65, 0x65,
+	0x64, 0x22, 0x8b, 0x01, 0x0a, 0x1e, 0x51, 0x75, 0x61, 0x6c, 0x69, 0x66, 0x69, 0x63, 0x61, 0x74,
+	0x69, 0x6f, 0x6e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f, 0x6b, 0x65,
+	0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x4b, 0x65,
+	0x79, 0x12, 0x15, 0x0a, 0x06, 0x6e, 0x5f, 0x73, 0x69, 0x6d, 0x73, 0x18, 0x02, 0x20, 0x01, 0x28,
+	0x0d, 0x52, 0x05, 0x6e, 0x53, 0x69, 0x6d, 0x73, 0x12, 0x17, 0x0a, 0x04, 0x73, 0x65, 0x65, 0x64,
+	0x18, 0x03, 0x20, 0x01, 0x28, 0x04, 0x48, 0x00, 0x52, 0x04, 0x73, 0x65, 0x65, 0x64, 0x88, 0x01,
+	0x01, 0x12, 0x13, 0x0a, 0x05, 0x74, 0x6f, 0x70, 0x5f, 0x6e, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0d,
+	0x52, 0x04, 0x74, 0x6f, 0x70, 0x4e, 0x42, 0x07, 0x0a, 0x05, 0x5f, 0x73, 0x65, 0x65, 0x64, 0x22,
+	0xdd, 0x04, 0x0a, 0x1d, 0x51, 0x75, 0x61, 0x6c, 0x69, 0x66, 0x69, 0x63, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c,
+	0x74, 0x12, 0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f, 0x6b, 0x65, 0x79, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x4b, 0x65, 0x79, 0x12, 0x61,
+	0x0a, 0x13, 0x73, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x6d, 0x65, 0x74,
+	0x61, 0x64, 0x61, 0x74, 0x61, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x30, 0x2e, 0x6d, 0x61,
+	0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74,
+	0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61,
+	0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x6d, 0x65, 0x74, 0x61, 0x64, 0x61, 0x74, 0x61, 0x52, 0x12, 0x73,
+	0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x4d, 0x65, 0x74, 0x61, 0x64, 0x61, 0x74,
+	0x61, 0x12, 0x2b, 0x0a, 0x11, 0x72, 0x65, 0x6d, 0x61, 0x69, 0x6e, 0x69, 0x6e, 0x67, 0x5f, 0x6d,
+	0x61, 0x74, 0x63, 0x68, 0x65, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x10, 0x72, 0x65,
+	0x6d, 0x61, 0x69, 0x6e, 0x69, 0x6e, 0x67, 0x4d, 0x61, 0x74, 0x63, 0x68, 0x65, 0x73, 0x12, 0x13,
+	0x0a, 0x05, 0x74, 0x6f, 0x70, 0x5f, 0x6e, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x04, 0x74,
+	0x6f, 0x70, 0x4e, 0x12, 0x51, 0x0a, 0x08, 0x72, 0x61, 0x6e, 0x6b, 0x69, 0x6e, 0x67, 0x73, 0x18,
+	0x05, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x35, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69,
+	0x6e, 0x74, 0x2e, 0x51, 0x75, 0x61, 0x6c, 0x69, 0x66, 0x69, 0x63, 0x61, 0x74, 0x69, 0x6f, 0x6e,
+	0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74,
+	0x2e, 0x54, 0x65, 0x61, 0x6d, 0x52, 0x61, 0x6e, 0x6b, 0x69, 0x6e, 0x67, 0x52, 0x08, 0x72, 0x61,
+	0x6e, 0x6b, 0x69, 0x6e, 0x67, 0x73, 0x1a, 0xa6, 0x02, 0x0a, 0x0b, 0x54, 0x65, 0x61, 0x6d, 0x52,
+	0x61, 0x6e, 0x6b, 0x69, 0x6e, 0x67, 0x12, 0x12, 0x0a, 0x04, 0x74, 0x65, 0x61, 0x6d, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x0d, 0x52, 0x04, 0x74, 0x65, 0x61, 0x6d, 0x12, 0x21, 0x0a, 0x0c, 0x63, 0x75,
+	0x72, 0x72, 0x65, 0x6e, 0x74, 0x5f, 0x72, 0x61, 0x6e, 0x6b, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0d,
+	0x52, 0x0b, 0x63, 0x75, 0x72, 0x72, 0x65, 0x6e, 0x74, 0x52, 0x61, 0x6e, 0x6b, 0x12, 0x32, 0x0a,
+	0x15, 0x63, 0x75, 0x72, 0x72, 0x65, 0x6e, 0x74, 0x5f, 0x72, 0x61, 0x6e, 0x6b, 0x69, 0x6e, 0x67,
+	0x5f, 0x73, 0x63, 0x6f, 0x72, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x13, 0x63, 0x75,
+	0x72, 0x72, 0x65, 0x6e, 0x74, 0x52, 0x61, 0x6e, 0x6b, 0x69, 0x6e, 0x67, 0x53, 0x63, 0x6f, 0x72,
+	0x65, 0x12, 0x1b, 0x0a, 0x09, 0x6d, 0x65, 0x61, 0x6e, 0x5f, 0x72, 0x61, 0x6e, 0x6b, 0x18, 0x04,
+	0x20, 0x01, 0x28, 0x01, 0x52, 0x08, 0x6d, 0x65, 0x61, 0x6e, 0x52, 0x61, 0x6e, 0x6b, 0x12, 0x2a,
+	0x0a, 0x11, 0x74, 0x6f, 0x70, 0x5f, 0x6e, 0x5f, 0x70, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c,
+	0x69, 0x74, 0x79, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0f, 0x74, 0x6f, 0x70, 0x4e, 0x50,
+	0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x12, 0x2d, 0x0a, 0x12, 0x72, 0x61,
+	0x6e, 0x6b, 0x5f, 0x70, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x69, 0x65, 0x73,
+	0x18, 0x06, 0x20, 0x03, 0x28, 0x01, 0x52, 0x11, 0x72, 0x61, 0x6e, 0x6b, 0x50, 0x72, 0x6f, 0x62,
+	0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x69, 0x65, 0x73, 0x12, 0x34, 0x0a, 0x16, 0x65, 0x78, 0x70,
+	0x65, 0x63, 0x74, 0x65, 0x64, 0x5f, 0x72, 0x61, 0x6e, 0x6b, 0x69, 0x6e, 0x67, 0x5f, 0x73, 0x63,
+	0x6f, 0x72, 0x65, 0x18, 0x07, 0x20, 0x01, 0x28, 0x01, 0x52, 0x14, 0x65, 0x78, 0x70, 0x65, 0x63,
+	0x74, 0x65, 0x64, 0x52, 0x61, 0x6e, 0x6b, 0x69, 0x6e, 0x67, 0x53, 0x63, 0x6f, 0x72, 0x65, 0x22,
+	0x26, 0x0a, 0x0e, 0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x4c, 0x69, 0x6e, 0x65, 0x75,
+	0x70, 0x12, 0x14, 0x0a, 0x05, 0x74, 0x65, 0x61, 0x6d, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0d,
+	0x52, 0x05, 0x74, 0x65, 0x61, 0x6d, 0x73, 0x22, 0x93, 0x02, 0x0a, 0x18, 0x41, 0x6c, 0x6c, 0x69,
+	0x61, 0x6e, 0x63, 0x65, 0x53, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x5f, 0x6b, 0x65,
+	0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x4b, 0x65,
+	0x79, 0x12, 0x21, 0x0a, 0x0c, 0x72, 0x61, 0x6e, 0x6b, 0x65, 0x64, 0x5f, 0x74, 0x65, 0x61, 0x6d,
+	0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0d, 0x52, 0x0b, 0x72, 0x61, 0x6e, 0x6b, 0x65, 0x64, 0x54,
+	0x65, 0x61, 0x6d, 0x73, 0x12, 0x38, 0x0a, 0x09, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65,
+	0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1a, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70,
+	0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x4c, 0x69, 0x6e,
+	0x65, 0x75, 0x70, 0x52, 0x09, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x73, 0x12, 0x25,
+	0x0a, 0x0e, 0x62, 0x72, 0x61, 0x63, 0x6b, 0x65, 0x74, 0x5f, 0x66, 0x6f, 0x72, 0x6d, 0x61, 0x74,
+	0x18, 0x04, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0d, 0x62, 0x72, 0x61, 0x63, 0x6b, 0x65, 0x74, 0x46,
+	0x6f, 0x72, 0x6d, 0x61, 0x74, 0x12, 0x1d, 0x0a, 0x0a, 0x62, 0x65, 0x61, 0x6d, 0x5f, 0x77, 0x69,
+	0x64, 0x74, 0x68, 0x18, 0x05, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x09, 0x62, 0x65, 0x61, 0x6d, 0x57,
+	0x69, 0x64, 0x74, 0x68, 0x12, 0x15, 0x0a, 0x06, 0x6e, 0x5f, 0x73, 0x69, 0x6d, 0x73, 0x18, 0x06,
+	0x20, 0x01, 0x28, 0x0d, 0x52, 0x05, 0x6e, 0x53, 0x69, 0x6d, 0x73, 0x12, 0x17, 0x0a, 0x04, 0x73,
+	0x65, 0x65, 0x64, 0x18, 0x07, 0x20, 0x01, 0x28, 0x04, 0x48, 0x00, 0x52, 0x04, 0x73, 0x65, 0x65,
+	0x64, 0x88, 0x01, 0x01, 0x42, 0x07, 0x0a, 0x05, 0x5f, 0x73, 0x65, 0x65, 0x64, 0x22, 0xb8, 0x03,
+	0x0a, 0x17, 0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x53, 0x65, 0x6c, 0x65, 0x63, 0x74,
+	0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x65, 0x76, 0x65,
+	0x6e, 0x74, 0x5f, 0x6b, 0x65, 0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x65, 0x76,
+	0x65, 0x6e, 0x74, 0x4b, 0x65, 0x79, 0x12, 0x27, 0x0a, 0x0f, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e,
+	0x63, 0x65, 0x5f, 0x6e, 0x75, 0x6d, 0x62, 0x65, 0x72, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0d, 0x52,
+	0x0e, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x4e, 0x75, 0x6d, 0x62, 0x65, 0x72, 0x12,
+	0x1f, 0x0a, 0x0b, 0x70, 0x69, 0x63, 0x6b, 0x5f, 0x6e, 0x75, 0x6d, 0x62, 0x65, 0x72, 0x18, 0x03,
+	0x20, 0x01, 0x28, 0x0d, 0x52, 0x0a, 0x70, 0x69, 0x63, 0x6b, 0x4e, 0x75, 0x6d, 0x62, 0x65, 0x72,
+	0x12, 0x14, 0x0a, 0x05, 0x65, 0x78, 0x61, 0x63, 0x74, 0x18, 0x04, 0x20, 0x01, 0x28, 0x08, 0x52,
+	0x05, 0x65, 0x78, 0x61, 0x63, 0x74, 0x12, 0x4d, 0x0a, 0x0a, 0x63, 0x61, 0x6e, 0x64, 0x69, 0x64,
+	0x61, 0x74, 0x65, 0x73, 0x18, 0x05, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x2d, 0x2e, 0x6d, 0x61, 0x74,
+	0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65,
+	0x53, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x2e,
+	0x43, 0x61, 0x6e, 0x64, 0x69, 0x64, 0x61, 0x74, 0x65, 0x52, 0x0a, 0x63, 0x61, 0x6e, 0x64, 0x69,
+	0x64, 0x61, 0x74, 0x65, 0x73, 0x12, 0x2b, 0x0a, 0x11, 0x6c, 0x69, 0x6e, 0x65, 0x75, 0x70, 0x73,
+	0x5f, 0x65, 0x76, 0x61, 0x6c, 0x75, 0x61, 0x74, 0x65, 0x64, 0x18, 0x06, 0x20, 0x01, 0x28, 0x0d,
+	0x52, 0x10, 0x6c, 0x69, 0x6e, 0x65, 0x75, 0x70, 0x73, 0x45, 0x76, 0x61, 0x6c, 0x75, 0x61, 0x74,
+	0x65, 0x64, 0x12, 0x2b, 0x0a, 0x11, 0x6d, 0x6f, 0x64, 0x65, 0x6c, 0x5f, 0x65, 0x76, 0x61, 0x6c,
+	0x75, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x18, 0x07, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x10, 0x6d,
+	0x6f, 0x64, 0x65, 0x6c, 0x45, 0x76, 0x61, 0x6c, 0x75, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x1a,
+	0x77, 0x0a, 0x09, 0x43, 0x61, 0x6e, 0x64, 0x69, 0x64, 0x61, 0x74, 0x65, 0x12, 0x12, 0x0a, 0x04,
+	0x74, 0x65, 0x61, 0x6d, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x04, 0x74, 0x65, 0x61, 0x6d,
+	0x12, 0x27, 0x0a, 0x0f, 0x77, 0x69, 0x6e, 0x5f, 0x70, 0x72, 0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c,
+	0x69, 0x74, 0x79, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0e, 0x77, 0x69, 0x6e, 0x50, 0x72,
+	0x6f, 0x62, 0x61, 0x62, 0x69, 0x6c, 0x69, 0x74, 0x79, 0x12, 0x2d, 0x0a, 0x12, 0x70, 0x72, 0x6f,
+	0x6a, 0x65, 0x63, 0x74, 0x65, 0x64, 0x5f, 0x61, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x18,
+	0x03, 0x20, 0x03, 0x28, 0x0d, 0x52, 0x11, 0x70, 0x72, 0x6f, 0x6a, 0x65, 0x63, 0x74, 0x65, 0x64,
+	0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x32, 0xd8, 0x04, 0x0a, 0x0a, 0x4d, 0x61, 0x74,
+	0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x12, 0x5f, 0x0a, 0x12, 0x47, 0x65, 0x74, 0x4d, 0x61,
+	0x74, 0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x12, 0x22, 0x2e,
+	0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x4d, 0x61, 0x74, 0x63, 0x68,
+	0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x1a, 0x23, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x4d,
+	0x61, 0x74, 0x63, 0x68, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65,
+	0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x22, 0x00, 0x12, 0x63, 0x0a, 0x16, 0x50, 0x72, 0x65, 0x64,
+	0x69, 0x63, 0x74, 0x41, 0x6c, 0x6c, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x4d, 0x61, 0x74, 0x63, 0x68,
+	0x65, 0x73, 0x12, 0x22, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e,
+	0x45, 0x76, 0x65, 0x6e, 0x74, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52,
+	0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x23, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f,
+	0x69, 0x6e, 0x74, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x50, 0x72, 0x65, 0x64, 0x69, 0x63, 0x74,
+	0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x22, 0x00, 0x12, 0x51, 0x0a,
+	0x10, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x65, 0x50, 0x6c, 0x61, 0x79, 0x6f, 0x66, 0x66,
+	0x73, 0x12, 0x1d, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53,
+	0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
+	0x1a, 0x1c, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69,
+	0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x22, 0x00,
+	0x12, 0x59, 0x0a, 0x16, 0x53, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61,
+	0x74, 0x65, 0x50, 0x6c, 0x61, 0x79, 0x6f, 0x66, 0x66, 0x73, 0x12, 0x1d, 0x2e, 0x6d, 0x61, 0x74,
+	0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69,
+	0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1c, 0x2e, 0x6d, 0x61, 0x74, 0x63,
+	0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x22, 0x00, 0x30, 0x01, 0x12, 0x71, 0x0a, 0x16, 0x53,
+	0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x65, 0x51, 0x75, 0x61, 0x6c, 0x69, 0x66, 0x69, 0x63, 0x61,
+	0x74, 0x69, 0x6f, 0x6e, 0x73, 0x12, 0x2a, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69,
+	0x6e, 0x74, 0x2e, 0x51, 0x75, 0x61, 0x6c, 0x69, 0x66, 0x69, 0x63, 0x61, 0x74, 0x69, 0x6f, 0x6e,
+	0x53, 0x69, 0x6d, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x1a, 0x29, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x51,
+	0x75, 0x61, 0x6c, 0x69, 0x66, 0x69, 0x63, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x53, 0x69, 0x6d, 0x75,
+	0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x22, 0x00, 0x12, 0x63,
+	0x0a, 0x14, 0x4f, 0x70, 0x74, 0x69, 0x6d, 0x69, 0x7a, 0x65, 0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e,
+	0x63, 0x65, 0x50, 0x69, 0x63, 0x6b, 0x12, 0x24, 0x2e, 0x6d, 0x61, 0x74, 0x63, 0x68, 0x70, 0x6f,
+	0x69, 0x6e, 0x74, 0x2e, 0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x53, 0x65, 0x6c, 0x65,
+	0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x23, 0x2e, 0x6d,
+	0x61, 0x74, 0x63, 0x68, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x2e, 0x41, 0x6c, 0x6c, 0x69, 0x61, 0x6e,
+	0x63, 0x65, 0x53, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c,
+	0x74, 0x22, 0x00, 0x42, 0x1b, 0x5a, 0x19, 0x62, 0x6c, 0x75, 0x65, 0x2d, 0x62, 0x61, 0x6e, 0x6e,
+	0x65, 0x72, 0x2d, 0x65, 0x6e, 0x67, 0x69, 0x6e, 0x65, 0x2f, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x73,
+	0x62, 0x06, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x33,
+}
+
+var (
+	file_protos_prediction_proto_rawDescOnce sync.Once
+	file_protos_prediction_proto_rawDescData = file_protos_prediction_proto_rawDesc
+)
+
+func file_protos_prediction_proto_rawDescGZIP() []byte {
+	file_protos_prediction_proto_rawDescOnce.Do(func() {
+		file_protos_prediction_proto_rawDescData = protoimpl.X.CompressGZIP(file_protos_prediction_proto_rawDescData)
+	})
+	return file_protos_prediction_proto_rawDescData
+}
+
+var file_protos_prediction_proto_msgTypes = make([]protoimpl.MessageInfo, 19)
+var file_protos_prediction_proto_goTypes = []interface{}{
+	(*EventPredictionRequest)(nil),                    // 0: matchpoint.EventPredictionRequest
+	(*EventPredictionResponse)(nil),                   // 1: matchpoint.EventPredictionResponse
+	(*MatchPredictionRequest)(nil),                    // 2: matchpoint.MatchPredictionRequest
+	(*MatchPredictionResponse)(nil),                   // 3: matchpoint.MatchPredictionResponse
+	(*ShapAnalysis)(nil),                              // 4: matchpoint.ShapAnalysis
+	(*WinProbability)(nil),                            // 5: matchpoint.WinProbability
+	(*PredictedScores)(nil),                           // 6: matchpoint.PredictedScores
+	(*SimulationResult)(nil),                          // 7: matchpoint.SimulationResult
+	(*SimulationRequest)(nil),                         // 8: matchpoint.SimulationRequest
+	(*QualificationSimulationRequest)(nil),            // 9: matchpoint.QualificationSimulationRequest
+	(*QualificationSimulationResult)(nil),             // 10: matchpoint.QualificationSimulationResult
+	(*AllianceLineup)(nil),                            // 11: matchpoint.AllianceLineup
+	(*AllianceSelectionRequest)(nil),                  // 12: matchpoint.AllianceSelectionRequest
+	(*AllianceSelectionResult)(nil),                   // 13: matchpoint.AllianceSelectionResult
+	(*SimulationResult_SimulationMetadata)(nil),       // 14: matchpoint.SimulationResult.Simulation_metadata
+	(*SimulationResult_Results)(nil),                  // 15: matchpoint.SimulationResult.Results
+	(*SimulationResult_FinalMatchup)(nil),             // 16: matchpoint.SimulationResult.FinalMatchup
+	(*QualificationSimulationResult_TeamRanking)(nil), // 17: matchpoint.QualificationSimulationResult.TeamRanking
+	(*AllianceSelectionResult_Candidate)(nil),         // 18: matchpoint.AllianceSelectionResult.Candidate
+	(*timestamppb.Timestamp)(nil),                     // 19: google.protobuf.Timestamp
+}
+var file_protos_prediction_proto_depIdxs = []int32{
+	3,  // 0: matchpoint.EventPredictionResponse.predictions:type_name -> matchpoint.MatchPredictionResponse
+	5,  // 1: matchpoint.MatchPredictionResponse.win_probability:type_name -> matchpoint.WinProbability
+	6,  // 2: matchpoint.MatchPredictionResponse.predicted_scores:type_name -> matchpoint.PredictedScores
+	4,  // 3: matchpoint.MatchPredictionResponse.shap_analysis:type_name -> matchpoint.ShapAnalysis
+	14, // 4: matchpoint.SimulationResult.simulation_metadata:type_name -> matchpoint.SimulationResult.Simulation_metadata
+	15, // 5: matchpoint.SimulationResult.results:type_name -> matchpoint.SimulationResult.Results
+	16, // 6: matchpoint.SimulationResult.final_matchups:type_name -> matchpoint.SimulationResult.FinalMatchup
+	14, // 7: matchpoint.QualificationSimulationResult.simulation_metadata:type_name -> matchpoint.SimulationResult.Simulation_metadata
+	17, // 8: matchpoint.QualificationSimulationResult.rankings:type_name -> matchpoint.QualificationSimulationResult.TeamRanking
+	11, // 9: matchpoint.AllianceSelectionRequest.alliances:type_name -> matchpoint.AllianceLineup
+	18, // 10: matchpoint.AllianceSelectionResult.candidates:type_name -> matchpoint.AllianceSelectionResult.Candidate
+	19, // 11: matchpoint.SimulationResult.Simulation_metadata.timestamp_utc:type_name -> google.protobuf.Timestamp
+	2,  // 12: matchpoint.Matchpoint.GetMatchPrediction:input_type -> matchpoint.MatchPredictionRequest
+	0,  // 13: matchpoint.Matchpoint.PredictAllEventMatches:input_type -> matchpoint.EventPredictionRequest
+	8,  // 14: matchpoint.Matchpoint.SimulatePlayoffs:input_type -> matchpoint.SimulationRequest
+	8,  // 15: matchpoint.Matchpoint.StreamSimulatePlayoffs:input_type -> matchpoint.SimulationRequest
+	9,  // 16: matchpoint.Matchpoint.SimulateQualifications:input_type -> matchpoint.QualificationSimulationRequest
+	12, // 17: matchpoint.Matchpoint.OptimizeAlliancePick:input_type -> matchpoint.AllianceSelectionRequest
+	3,  // 18: matchpoint.Matchpoint.GetMatchPrediction:output_type -> matchpoint.MatchPredictionResponse
+	1,  // 19: matchpoint.Matchpoint.PredictAllEventMatches:output_type -> matchpoint.EventPredictionResponse
+	7,  // 20: matchpoint.Matchpoint.SimulatePlayoffs:output_type -> matchpoint.SimulationResult
+	7,  // 21: matchpoint.Matchpoint.StreamSimulatePlayoffs:output_type -> matchpoint.SimulationResult
+	10, // 22: matchpoint.Matchpoint.SimulateQualifications:output_type -> matchpoint.QualificationSimulationResult
+	13, // 23: matchpoint.Matchpoint.OptimizeAlliancePick:output_type -> matchpoint.AllianceSelectionResult
+	18, // [18:24] is the sub-list for method output_type
+	12, // [12:18] is the sub-list for method input_type
+	12, // [12:12] is the sub-list for extension type_name
+	12, // [12:12] is the sub-list for extension extendee
+	0,  // [0:12] is the sub-list for field type_name
+}
+
+func init() { file_protos_prediction_proto_init() }
+func file_protos_prediction_proto_init() {
+	if File_protos_prediction_proto != nil {
+		return
+	}
+	if !protoimpl.UnsafeEnabled {
+		file_protos_prediction_proto_msgTypes[0].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*EventPredictionRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
 		file_protos_prediction_proto_msgTypes[1].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*EventPredictionResponse); i {
 			case 0:
@@ -953,7 +1892,7 @@ func file_protos_prediction_proto_init() {
 			}
 		}
 		file_protos_prediction_proto_msgTypes[9].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*SimulationResult_SimulationMetadata); i {
+			switch v := v.(*QualificationSimulationRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -965,6 +1904,66 @@ func file_protos_prediction_proto_init() {
 			}
 		}
 		file_protos_prediction_proto_msgTypes[10].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*QualificationSimulationResult); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_protos_prediction_proto_msgTypes[11].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*AllianceLineup); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_protos_prediction_proto_msgTypes[12].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*AllianceSelectionRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_protos_prediction_proto_msgTypes[13].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*AllianceSelectionResult); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_protos_prediction_proto_msgTypes[14].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SimulationResult_SimulationMetadata); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_protos_prediction_proto_msgTypes[15].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*SimulationResult_Results); i {
 			case 0:
 				return &v.state
@@ -976,14 +1975,53 @@ func file_protos_prediction_proto_init() {
 				return nil
 			}
 		}
+		file_protos_prediction_proto_msgTypes[16].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*SimulationResult_FinalMatchup); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_protos_prediction_proto_msgTypes[17].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*QualificationSimulationResult_TeamRanking); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_protos_prediction_proto_msgTypes[18].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*AllianceSelectionResult_Candidate); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
 	}
+	file_protos_prediction_proto_msgTypes[8].OneofWrappers = []interface{}{}
+	file_protos_prediction_proto_msgTypes[9].OneofWrappers = []interface{}{}
+	file_protos_prediction_proto_msgTypes[12].OneofWrappers = []interface{}{}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: file_protos_prediction_proto_rawDesc,
 			NumEnums:      0,
-			NumMessages:   11,
+			NumMessages:   19,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
@@ -26,6 +26,14 @@ type MatchpointClient interface {
 	GetMatchPrediction(ctx context.Context, in *MatchPredictionRequest, opts ...grpc.CallOption) (*MatchPredictionResponse, error)
 	PredictAllEventMatches(ctx context.Context, in *EventPredictionRequest, opts ...grpc.CallOption) (*EventPredictionResponse, error)
 	SimulatePlayoffs(ctx context.Context, in *SimulationRequest, opts ...grpc.CallOption) (*SimulationResult, error)
+	// Igual que SimulatePlayoffs, pero envía resultados parciales cada snapshot_interval
+	// simulaciones y se detiene al converger o antes de vencer el deadline.
+	StreamSimulatePlayoffs(ctx context.Context, in *SimulationRequest, opts ...grpc.CallOption) (Matchpoint_StreamSimulatePlayoffsClient, error)
+	// Simula los partidos de clasificación restantes y predice el ranking final.
+	SimulateQualifications(ctx context.Context, in *QualificationSimulationRequest, opts ...grpc.CallOption) (*QualificationSimulationResult, error)
+	// Evalúa cada equipo que el siguiente capitán puede elegir por la probabilidad
+	// de campeonato que le deja a su alianza.
+	OptimizeAlliancePick(ctx context.Context, in *AllianceSelectionRequest, opts ...grpc.CallOption) (*AllianceSelectionResult, error)
 }
 
 type matchpointClient struct {
@@ -63,6 +71,56 @@ func (c *matchpointClient) SimulatePlayoffs(ctx context.Context, in *SimulationR
 	return out, nil
 }
 
+func (c *matchpointClient) StreamSimulatePlayoffs(ctx context.Context, in *SimulationRequest, opts ...grpc.CallOption) (Matchpoint_StreamSimulatePlayoffsClient, error) {
+	stream, err := c.cc.NewStream(ctx, &Matchpoint_ServiceDesc.Streams[0], "/matchpoint.Matchpoint/StreamSimulatePlayoffs", opts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &matchpointStreamSimulatePlayoffsClient{stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+type Matchpoint_StreamSimulatePlayoffsClient interface {
+	Recv() (*SimulationResult, error)
+	grpc.ClientStream
+}
+
+type matchpointStreamSimulatePlayoffsClient struct {
+	grpc.ClientStream
+}
+
+func (x *matchpointStreamSimulatePlayoffsClient) Recv() (*SimulationResult, error) {
+	m := new(SimulationResult)
+	if err := x.ClientStream.RecvMsg(m); err != nil {
+		return nil, err
+	}
+	return m, nil
+}
+
+func (c *matchpointClient) SimulateQualifications(ctx context.Context, in *QualificationSimulationRequest, opts ...grpc.CallOption) (*QualificationSimulationResult, error) {
+	out := new(QualificationSimulationResult)
+	err := c.cc.Invoke(ctx, "/matchpoint.Matchpoint/SimulateQualifications", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *matchpointClient) OptimizeAlliancePick(ctx context.Context, in *AllianceSelectionRequest, opts ...grpc.CallOption) (*AllianceSelectionResult, error) {
+	out := new(AllianceSelectionResult)
+	err := c.cc.Invoke(ctx, "/matchpoint.Matchpoint/OptimizeAlliancePick", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // MatchpointServer is the server API for Matchpoint service.
 // All implementations must embed UnimplementedMatchpointServer
 // for forward compatibility
@@ -71,6 +129,14 @@ type MatchpointServer interface {
 	GetMatchPrediction(context.Context, *MatchPredictionRequest) (*MatchPredictionResponse, error)
 	PredictAllEventMatches(context.Context, *EventPredictionRequest) (*EventPredictionResponse, error)
 	SimulatePlayoffs(context.Context, *SimulationRequest) (*SimulationResult, error)
+	// Igual que SimulatePlayoffs, pero envía resultados parciales cada snapshot_interval
+	// simulaciones y se detiene al converger o antes de vencer el deadline.
+	StreamSimulatePlayoffs(*SimulationRequest, Matchpoint_StreamSimulatePlayoffsServer) error
+	// Simula los partidos de clasificación restantes y predice el ranking final.
+	SimulateQualifications(context.Context, *QualificationSimulationRequest) (*QualificationSimulationResult, error)
+	// Evalúa cada equipo que el siguiente capitán puede elegir por la probabilidad
+	// de campeonato que le deja a su alianza.
+	OptimizeAlliancePick(context.Context, *AllianceSelectionRequest) (*AllianceSelectionResult, error)
 	mustEmbedUnimplementedMatchpointServer()
 }
 
@@ -87,6 +153,15 @@ func (UnimplementedMatchpointServer) PredictAllEventMatches(context.Context, *Ev
 func (UnimplementedMatchpointServer) SimulatePlayoffs(context.Context, *SimulationRequest) (*SimulationResult, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method SimulatePlayoffs not implemented")
 }
+func (UnimplementedMatchpointServer) StreamSimulatePlayoffs(*SimulationRequest, Matchpoint_StreamSimulatePlayoffsServer) error {
+	return status.Errorf(codes.Unimplemented, "method StreamSimulatePlayoffs not implemented")
+}
+func (UnimplementedMatchpointServer) SimulateQualifications(context.Context, *QualificationSimulationRequest) (*QualificationSimulationResult, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method SimulateQualifications not implemented")
+}
+func (UnimplementedMatchpointServer) OptimizeAlliancePick(context.Context, *AllianceSelectionRequest) (*AllianceSelectionResult, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method OptimizeAlliancePick not implemented")
+}
 func (UnimplementedMatchpointServer) mustEmbedUnimplementedMatchpointServer() {}
 
 // UnsafeMatchpointServer may be embedded to opt out of forward compatibility for this service.
@@ -154,6 +229,63 @@ func _Matchpoint_SimulatePlayoffs_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _Matchpoint_StreamSimulatePlayoffs_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(SimulationRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(MatchpointServer).StreamSimulatePlayoffs(m, &matchpointStreamSimulatePlayoffsServer{stream})
+}
+
+type Matchpoint_StreamSimulatePlayoffsServer interface {
+	Send(*SimulationResult) error
+	grpc.ServerStream
+}
+
+type matchpointStreamSimulatePlayoffsServer struct {
+	grpc.ServerStream
+}
+
+func (x *matchpointStreamSimulatePlayoffsServer) Send(m *SimulationResult) error {
+	return x.ServerStream.SendMsg(m)
+}
+
+func _Matchpoint_SimulateQualifications_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(QualificationSimulationRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(MatchpointServer).SimulateQualifications(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/matchpoint.Matchpoint/SimulateQualifications",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(MatchpointServer).SimulateQualifications(ctx, req.(*QualificationSimulationRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _Matchpoint_OptimizeAlliancePick_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(AllianceSelectionRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(MatchpointServer).OptimizeAlliancePick(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/matchpoint.Matchpoint/OptimizeAlliancePick",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(MatchpointServer).OptimizeAlliancePick(ctx, req.(*AllianceSelectionRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // Matchpoint_ServiceDesc is the grpc.ServiceDesc for Matchpoint service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -173,7 +305,21 @@ var Matchpoint_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "SimulatePlayoffs",
 			Handler:    _Matchpoint_SimulatePlayoffs_Handler,
 		},
+		{
+			MethodName: "SimulateQualifications",
+			Handler:    _Matchpoint_SimulateQualifications_Handler,
+		},
+		{
+			MethodName: "OptimizeAlliancePick",
+			Handler:    _Matchpoint_OptimizeAlliancePick_Handler,
+		},
+	},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "StreamSimulatePlayoffs",
+			Handler:       _Matchpoint_StreamSimulatePlayoffs_Handler,
+			ServerStreams: true,
+		},
 	},
-	Streams:  []grpc.StreamDesc{},
 	Metadata: "protos/prediction.proto",
 }